@@ -6,25 +6,50 @@ File watcher controller for autoPyrseia
 
 import threading
 import time
-from pathlib import Path
+from collections import deque
 from app.utils.path_manager import get_path_manager
+from app.utils.file_operations import wait_for_stable_file
+from app.utils.downloads_snapshot import get_downloads_snapshot
+from app.controllers.watch_backends import create_watch_backend
 
 
 class FileWatcher:
     """File watcher for monitoring downloads folder"""
     
+    SIGNAL_PDF = "pyrseia_server.pdf"
+    
+    # Γεγονότα που φτάνουν μέσα σε αυτό το διάστημα ομαδοποιούνται (π.χ. PDF + συνημμένα)
+    DEBOUNCE_SECONDS = 0.3
+    MAX_DEBOUNCE_SECONDS = 2.0
+    # Περιοδικός έλεγχος ασφαλείας όταν υπάρχει backend γεγονότων
+    RECONCILE_INTERVAL = 5.0
+    POLL_INTERVAL = 1.0
+    # Το PDF θεωρείται πλήρες όταν δεν αλλάζει για QUIET_SECONDS (και δεν υπάρχουν λήψεις σε εξέλιξη)
+    QUIET_SECONDS = 0.5
+    STABILIZE_TIMEOUT = 30.0
+    
     def __init__(self, app_instance):
         self.app = app_instance
         self.running = False
         self.thread = None
-        # Memory optimization - limit stored file references
-        self._max_file_history = 1000  # Limit to prevent memory leak
+        self.backend_name = None
+        
+        # Καθυστέρηση ανίχνευσης (από την τελευταία εγγραφή του PDF έως τη μεταφορά στην ουρά,
+        # μαζί με την αναμονή ολοκλήρωσης της λήψης)
+        self._latency_samples = deque(maxlen=200)
+        
+        # Κατάσταση φακέλου από τον τελευταίο έλεγχο
+        self._last_files = set()
+        self._last_pdf_existed = False
+        self._dispatched_pdf = None
+        self._stabilizing = False
+        self._dispatch_lock = threading.Lock()
     
     def start(self):
         """Start the file watcher"""
         if not self.running:
             self.running = True
-            self.thread = threading.Thread(target=self._watch_downloads, daemon=True)
+            self.thread = threading.Thread(target=self._run, daemon=True)
             self.thread.start()
     
     def stop(self):
@@ -33,57 +58,199 @@ class FileWatcher:
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2.0)  # Wait for clean shutdown
     
-    def _watch_downloads(self):
-        """Watch downloads folder for changes"""
-        path_manager = get_path_manager()
-        downloads_path = path_manager.downloads_folder
-        last_files = set()
-        last_pdf_existed = False
-        file_history = []  # Track file changes history
+    def _run(self):
+        """Επιλογή backend γεγονότων ή polling"""
+        downloads_path = get_path_manager().downloads_folder
+        snapshot = get_downloads_snapshot()
         
         while self.running:
+            backend = create_watch_backend(downloads_path)
+            if backend is None:
+                # Δεν υπάρχει backend για το σύστημα ή ο φάκελος λείπει
+                self.backend_name = "polling"
+                snapshot.set_watched(False)
+                self._watch_downloads(downloads_path)
+                return
+            
+            self.backend_name = backend.name
+            print(f"File watcher: παρακολούθηση downloads με {backend.name}")
+            snapshot.set_watched(True)
             try:
-                if downloads_path.exists():
-                    current_files = set(f.name for f in downloads_path.glob("*") if f.is_file())
-                    
-                    # Έλεγχος για pyrseia_server.pdf
-                    pdf_files = list(downloads_path.glob("pyrseia_server.pdf"))
-                    pdf_exists = bool(pdf_files)
-                    
-                    # Έλεγχος για νέο pyrseia_server.pdf
-                    if pdf_exists and not self.app.current_signal_data:
-                        self.app.safe_schedule_ui_update(self.app.handle_new_signal)
-                    
-                    # Έλεγχος για διαγραφή του pyrseia_server.pdf
-                    if last_pdf_existed and not pdf_exists and self.app.current_signal_data:
-                        self.app.safe_schedule_ui_update(self.app.handle_pdf_deletion)
-                    
-                    # Έλεγχος για αλλαγές στα αρχεία (νέα συνημμένα)
-                    if current_files != last_files and self.app.current_signal_data:
-                        # Ενημέρωση των indicators για συνημμένα
-                        self.app.safe_schedule_ui_update(self.app.update_attachment_indicators)
-                    
-                    # Memory management - cleanup old file history
-                    if len(file_history) > self._max_file_history:
-                        file_history = file_history[-self._max_file_history//2:]  # Keep only recent half
-                    
-                    # Store current state
-                    file_history.append({
-                        'timestamp': time.time(),
-                        'files': current_files.copy(),
-                        'pdf_exists': pdf_exists
-                    })
-                    
-                    last_files = current_files
-                    last_pdf_existed = pdf_exists
+                self._watch_events(backend, downloads_path)
+            finally:
+                snapshot.set_watched(False)
+                backend.close()
+            
+            if self.running:
+                # Ο φάκελος διαγράφηκε/μετακινήθηκε - νέα προσπάθεια
+                time.sleep(1)
+    
+    def _watch_events(self, backend, downloads_path):
+        """Παρακολούθηση με γεγονότα λειτουργικού (debounce και ακριβή dispatch)"""
+        snapshot = get_downloads_snapshot()
+        self._reconcile(downloads_path)
+        
+        while self.running:
+            try:
+                events = backend.read_events(self.RECONCILE_INTERVAL)
+                if not events:
+                    # Κανένα γεγονός - έλεγχος για αλλαγές που δεν φάνηκαν
+                    self._reconcile(downloads_path)
+                    continue
+                
+                # Η κοινή λίστα του downloads ανανεώνεται αμέσως (όχι μετά το debounce)
+                snapshot.invalidate()
                 
-                time.sleep(1)  # Μειώνουμε το interval για πιο γρήγορη ανίχνευση
+                # Συλλογή της ριπής γεγονότων μέχρι να ησυχάσει ο φάκελος
+                burst_start = time.time()
+                while self.running and time.time() - burst_start < self.MAX_DEBOUNCE_SECONDS:
+                    more_events = backend.read_events(self.DEBOUNCE_SECONDS)
+                    if not more_events:
+                        break
+                    snapshot.invalidate()
+                    events.extend(more_events)
                 
+                if any(action == 'invalidated' for action, _ in events):
+                    return
+                
+                if any(action == 'rescan' for action, _ in events):
+                    self._reconcile(downloads_path)
+                else:
+                    self._dispatch_events(events, downloads_path)
+            
+            except Exception as e:
+                print(f"Σφάλμα στο file watcher: {e}")
+                time.sleep(2)
+    
+    def _dispatch_events(self, events, downloads_path):
+        """Αποστολή των κατάλληλων handlers για μια ομάδα γεγονότων"""
+        pdf_events = {action for action, name in events if name == self.SIGNAL_PDF}
+        changed_names = {name for _, name in events if name}
+        
+        pdf_path = downloads_path / self.SIGNAL_PDF
+        pdf_exists = pdf_path.is_file()
+        
+        if pdf_exists and pdf_events & {'created', 'modified'}:
+            self._check_new_signal(pdf_path)
+        elif not pdf_exists and self._last_pdf_existed:
+            self._pdf_removed()
+        
+        if changed_names - {self.SIGNAL_PDF}:
+            self._attachments_changed()
+        
+        self._last_pdf_existed = pdf_exists
+        for action, name in events:
+            if action == 'deleted':
+                self._last_files.discard(name)
+            elif name:
+                self._last_files.add(name)
+    
+    def _reconcile(self, downloads_path):
+        """Πλήρης έλεγχος του φακέλου με ένα μόνο scandir (κοινή λίστα downloads)"""
+        snapshot = get_downloads_snapshot()
+        snapshot.refresh()
+        current_files = set(snapshot.names())
+        
+        pdf_exists = self.SIGNAL_PDF in current_files
+        if pdf_exists:
+            self._check_new_signal(downloads_path / self.SIGNAL_PDF)
+        elif self._last_pdf_existed:
+            self._pdf_removed()
+        
+        if current_files - {self.SIGNAL_PDF} != self._last_files - {self.SIGNAL_PDF}:
+            self._attachments_changed()
+        
+        self._last_files = current_files
+        self._last_pdf_existed = pdf_exists
+    
+    def _attachments_changed(self):
+        """Νέα/διαγραμμένα αρχεία εκτός του PDF: συνημμένα για το πιο πρόσφατο σήμα της ουράς"""
+        if not self.app.intake_queue.claim_late_attachments() and self.app.current_signal_data:
+            self.app.safe_schedule_ui_update(self.app.update_attachment_indicators)
+    
+    def _check_new_signal(self, pdf_path):
+        """Νέο σήμα για την ουρά, αν δεν έχει ήδη σταλεί το ίδιο PDF"""
+        try:
+            stat = pdf_path.stat()
+        except OSError:
+            return
+        
+        fingerprint = (stat.st_size, stat.st_mtime_ns)
+        with self._dispatch_lock:
+            if fingerprint == self._dispatched_pdf or self._stabilizing:
+                # Ήδη στάλθηκε ή ο stabilizer παρακολουθεί ήδη την εγγραφή
+                return
+            self._stabilizing = True
+        
+        threading.Thread(target=self._stabilize_and_dispatch, args=(pdf_path,), daemon=True).start()
+    
+    def _stabilize_and_dispatch(self, pdf_path):
+        """Αναμονή ολοκλήρωσης της λήψης (PDF και συνημμένα) και μεταφορά στην ουρά μία φορά"""
+        try:
+            stable, waited = wait_for_stable_file(
+                pdf_path,
+                quiet_seconds=self.QUIET_SECONDS,
+                timeout=self.STABILIZE_TIMEOUT,
+                should_continue=lambda: self.running and pdf_path.exists()
+            )
+            if not pdf_path.exists() or not self.running:
+                return
+            if not stable:
+                print(f"Το PDF δεν σταθεροποιήθηκε σε {waited:.1f}s - επεξεργασία με την τρέχουσα μορφή")
+            
+            stat = pdf_path.stat()
+            fingerprint = (stat.st_size, stat.st_mtime_ns)
+            with self._dispatch_lock:
+                if fingerprint == self._dispatched_pdf:
+                    return
+                self._dispatched_pdf = fingerprint
+            
+            # Το PDF φεύγει από το downloads - το επόμενο σήμα μπορεί να κατέβει αμέσως
+            if not self.app.intake_queue.claim(pdf_path):
+                with self._dispatch_lock:
+                    self._dispatched_pdf = None
+                return
+            
+            latency_ms = max(0.0, (time.time() - stat.st_mtime) * 1000)
+            self._latency_samples.append(latency_ms)
+            print(f"Νέο σήμα ανιχνεύθηκε σε {latency_ms:.0f} ms "
+                  f"({self.backend_name}, αναμονή ολοκλήρωσης {waited:.2f}s)")
+        
+        except Exception as e:
+            print(f"Σφάλμα στη σταθεροποίηση του PDF: {e}")
+        finally:
+            self._stabilizing = False
+    
+    def _pdf_removed(self):
+        """Το PDF έφυγε από το downloads (μεταφέρθηκε στην ουρά ή διαγράφηκε)"""
+        with self._dispatch_lock:
+            self._dispatched_pdf = None
+    
+    def _watch_downloads(self, downloads_path):
+        """Polling fallback όταν δεν υπάρχει backend γεγονότων"""
+        while self.running:
+            try:
+                self._reconcile(downloads_path)
+                time.sleep(self.POLL_INTERVAL)
+            
             except Exception as e:
                 # Αν υπάρχει σφάλμα, συνεχίζουμε το loop χωρίς να σταματήσουμε
                 print(f"Σφάλμα στο file watcher: {e}")
                 time.sleep(2)  # Περιμένουμε λίγο παραπάνω σε περίπτωση σφάλματος
+    
+    def get_latency_stats(self):
+        """Στατιστικά καθυστέρησης ανίχνευσης νέου σήματος (ms)"""
+        samples = sorted(self._latency_samples)
+        if not samples:
+            return {'backend': self.backend_name, 'count': 0}
+        
+        def percentile(p):
+            return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
         
-        # Cleanup on exit
-        file_history.clear()
-        last_files.clear()
+        return {
+            'backend': self.backend_name,
+            'count': len(samples),
+            'p50_ms': percentile(50),
+            'p95_ms': percentile(95),
+            'max_ms': samples[-1]
+        }
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Signal intake queue for autoPyrseia
+
+Κάθε νέο pyrseia_server.pdf μετακινείται αμέσως σε δικό του φάκελο
+temp/intake/NNNN μαζί με τα συνημμένα του, ώστε το downloads να είναι
+ελεύθερο για το επόμενο σήμα. Η ανάλυση των PDF γίνεται μπροστά στο
+στάδιο "parse" του SignalPipeline και ο χειριστής επιβεβαιώνει τα σήματα
+το ένα μετά το άλλο.
+"""
+
+import os
+import shutil
+import threading
+import time
+from app.utils.path_manager import get_path_manager
+from app.utils.downloads_snapshot import get_downloads_snapshot, get_folder_snapshot, drop_folder_snapshot
+from app.utils.file_operations import IN_FLIGHT_SUFFIXES, is_pdf_complete, wait_for_stable_file
+
+
+class IntakeQueue:
+    """Ουρά εισερχόμενων σημάτων με ανάλυση εκ των προτέρων"""
+    
+    SIGNAL_PDF = "pyrseia_server.pdf"
+    
+    # Κατάσταση στοιχείου ουράς
+    PARSING = 'parsing'
+    READY = 'ready'
+    MANUAL = 'manual'
+    PROCESSING = 'processing'
+    ERROR = 'error'
+    
+    # Μέγιστες προσπάθειες ανάλυσης όταν το PDF φαίνεται ελλιπές
+    PARSE_ATTEMPTS = 3
+    
+    def __init__(self, app_instance):
+        self.app = app_instance
+        self.intake_folder = get_path_manager().temp_folder / "intake"
+        
+        self._lock = threading.RLock()
+        self._entries = []
+        self._sequence = 0
+        
+        # Μετρήσεις ανάλυσης PDF (για τον υπολογισμό της χαμένης δουλειάς)
+        self.parse_stats = {
+            'signals': 0,
+            'attempts': 0,
+            'retries': 0,
+            'failures': 0,
+            'wasted_seconds': 0.0
+        }
+        self._parse_stats_lock = threading.Lock()
+    
+    def start(self):
+        """Επαναφορά σημάτων που έμειναν από προηγούμενη εκτέλεση και έναρξη του parser"""
+        self.intake_folder.mkdir(parents=True, exist_ok=True)
+        
+        restored = []
+        for folder in sorted(self.intake_folder.iterdir()):
+            if not folder.is_dir() or not folder.name.isdigit():
+                continue
+            self._sequence = max(self._sequence, int(folder.name))
+            if (folder / self.SIGNAL_PDF).exists():
+                restored.append(self._add_entry(folder, claimed=False))
+            else:
+                shutil.rmtree(folder, ignore_errors=True)
+        
+        if restored:
+            print(f"Ουρά σημάτων: επαναφορά {len(restored)} σημάτων από προηγούμενη εκτέλεση")
+            # Πολλά σήματα μπορεί να γεμίσουν το στάδιο parse - η αναμονή δεν γίνεται στο Tk thread
+            threading.Thread(target=lambda: [self._submit_parse(entry) for entry in restored],
+                             daemon=True).start()
+            self._notify()
+    
+    def claim(self, pdf_path):
+        """Μετακίνηση ενός νέου PDF σήματος σε δικό του φάκελο (True αν πέτυχε)"""
+        with self._lock:
+            self._sequence += 1
+            folder = self.intake_folder / f"{self._sequence:04d}"
+            try:
+                folder.mkdir(parents=True)
+                os.replace(pdf_path, folder / self.SIGNAL_PDF)
+            except OSError as e:
+                print(f"Σφάλμα στη μεταφορά του σήματος στην ουρά: {e}")
+                shutil.rmtree(folder, ignore_errors=True)
+                return False
+            
+            get_downloads_snapshot().invalidate()
+            entry = self._add_entry(folder, claimed=True)
+            pending = len(self._entries)
+        
+        print(f"Ουρά σημάτων: νέο σήμα #{entry['id']} ({pending} στην ουρά)")
+        self._notify()
+        # Εκτός lock: αν το στάδιο parse είναι γεμάτο, περιμένει μόνο ο file watcher
+        self._submit_parse(entry)
+        return True
+    
+    def _add_entry(self, folder, claimed):
+        entry = {
+            'id': int(folder.name),
+            'folder': folder,
+            'pdf_path': folder / self.SIGNAL_PDF,
+            'status': self.PARSING,
+            'signal_data': None,
+            # Αποτέλεσμα του SignalPipeline.signal_checks (διπλότυπα, πλάνο συνημμένων)
+            'checks': None,
+            'error': None,
+            'claimed_at': time.time(),
+            'parsed_at': None,
+            # Μόνο το πιο πρόσφατο σήμα παίρνει συνημμένα που φτάνουν αργότερα
+            'open': claimed
+        }
+        with self._lock:
+            for other in self._entries:
+                other['open'] = False
+            self._entries.append(entry)
+        return entry
+    
+    def _submit_parse(self, entry):
+        self.app.signal_pipeline.submit('parse', {'entry': entry})
+    
+    def parse_entry(self, entry):
+        """Ανάλυση ενός PDF της ουράς (στάδιο parse, με τη σειρά άφιξης)"""
+        with self._lock:
+            if entry not in self._entries:
+                return
+        
+        try:
+            signal_data = self.parse_signal_pdf(entry['pdf_path'])
+            signal_data['source_folder'] = entry['folder']
+            signal_data['intake_id'] = entry['id']
+            
+            with self._lock:
+                entry['signal_data'] = signal_data
+                self._claim_attachments(entry)
+            
+            # Διπλότυπα και συνημμένα ελέγχονται εδώ - η εμφάνιση δεν σαρώνει τίποτα
+            checks = None
+            if not signal_data.get('manual_input'):
+                try:
+                    checks = self.app.signal_pipeline.signal_checks(signal_data)
+                except Exception as e:
+                    # Το PDF αναλύθηκε σωστά - το tab δείχνει placeholders και ξανατρέχει τους ελέγχους
+                    print(f"Σφάλμα στους ελέγχους του σήματος #{entry['id']}: {e}")
+            
+            with self._lock:
+                entry['checks'] = checks
+                entry['status'] = self.MANUAL if signal_data.get('manual_input') else self.READY
+                entry['parsed_at'] = time.time()
+        
+        except Exception as e:
+            print(f"Σφάλμα στην ανάλυση του σήματος #{entry['id']}: {e}")
+            with self._lock:
+                entry['status'] = self.ERROR
+                entry['error'] = str(e)
+        
+        self._notify()
+    
+    def parse_signal_pdf(self, pdf_path):
+        """Ανάλυση του PDF με επανάληψη αν φαίνεται ελλιπές (λήψη σε εξέλιξη)
+        
+        Νέα προσπάθεια γίνεται μόνο αν το αρχείο άλλαξε ή δεν είχε γραφτεί ολόκληρο.
+        Κάθε αποτυχημένη προσπάθεια καταγράφεται στο parse_stats ως χαμένη δουλειά.
+        Το PDF δεν ανοίγει εδώ - ανοίγει όταν εμφανιστεί το σήμα για χειροκίνητη εισαγωγή.
+        """
+        with self._parse_stats_lock:
+            self.parse_stats['signals'] += 1
+        
+        for attempt in range(1, self.PARSE_ATTEMPTS + 1):
+            fingerprint = self._file_fingerprint(pdf_path)
+            start_time = time.time()
+            error = None
+            signal_data = None
+            try:
+                signal_data = self.app.pdf_processor.process_pdf(pdf_path, open_for_manual_input=False)
+            except Exception as e:
+                error = e
+            elapsed = time.time() - start_time
+            
+            # Χωρίς κείμενο ή σφάλμα: ίσως το αρχείο γράφεται ακόμα
+            incomplete = error is not None or bool(signal_data and signal_data.get('manual_input'))
+            with self._parse_stats_lock:
+                self.parse_stats['attempts'] += 1
+                if attempt > 1:
+                    self.parse_stats['retries'] += 1
+            
+            if not incomplete or attempt == self.PARSE_ATTEMPTS:
+                break
+            
+            stable, _ = wait_for_stable_file(pdf_path, timeout=5.0 * attempt)
+            if stable and self._file_fingerprint(pdf_path) == fingerprint and is_pdf_complete(pdf_path):
+                # Το PDF ήταν ήδη πλήρες - το αποτέλεσμα ισχύει (π.χ. σαρωμένο χωρίς κείμενο)
+                break
+            
+            with self._parse_stats_lock:
+                self.parse_stats['wasted_seconds'] += elapsed
+            print(f"Ανάλυση PDF: προσπάθεια {attempt} σε ελλιπές αρχείο - επανάληψη")
+        
+        if attempt > 1:
+            print(f"Ανάλυση PDF: {attempt} προσπάθειες - σύνολο: {self.get_parse_stats()}")
+        
+        if error is not None:
+            with self._parse_stats_lock:
+                self.parse_stats['failures'] += 1
+            raise error
+        return signal_data
+    
+    def _file_fingerprint(self, file_path):
+        """Μέγεθος και mtime αρχείου (None αν δεν υπάρχει)"""
+        try:
+            stat = os.stat(file_path)
+            return stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+    
+    def get_parse_stats(self):
+        """Αντίγραφο των μετρήσεων ανάλυσης PDF"""
+        with self._parse_stats_lock:
+            return dict(self.parse_stats)
+    
+    def _claim_attachments(self, entry, only_missing=False):
+        """Μετακίνηση των συνημμένων του σήματος από το downloads στον φάκελό του
+        
+        Επιστρέφει τον αριθμό αρχείων που μετακινήθηκαν.
+        """
+        signal_data = entry['signal_data']
+        if not signal_data:
+            return 0
+        
+        downloads_snapshot = get_downloads_snapshot()
+        folder_snapshot = get_folder_snapshot(entry['folder'])
+        
+        if signal_data.get('manual_input'):
+            # Χωρίς κείμενο δεν ξέρουμε τα συνημμένα - ανήκουν όλα τα αρχεία του downloads
+            file_names = [name for name in downloads_snapshot.names()
+                          if name != self.SIGNAL_PDF and not name.lower().endswith(IN_FLIGHT_SUFFIXES)]
+        else:
+            attachments = signal_data.get('attachments', [])
+            if only_missing:
+                folder_plan = folder_snapshot.resolve_attachments(attachments)
+                attachments = [name for name in attachments if not folder_plan[name]['source']]
+            if not attachments:
+                return 0
+            plan = downloads_snapshot.resolve_attachments(attachments)
+            file_names = list(dict.fromkeys(
+                entry_plan['file_name'] for entry_plan in plan.values()
+                if entry_plan['file_name'] and entry_plan['file_name'] != self.SIGNAL_PDF
+            ))
+        
+        moved = 0
+        for file_name in file_names:
+            try:
+                os.replace(downloads_snapshot.folder / file_name, entry['folder'] / file_name)
+                moved += 1
+            except OSError as e:
+                print(f"Σφάλμα στη μεταφορά του συνημμένου {file_name}: {e}")
+        
+        if moved:
+            downloads_snapshot.invalidate()
+            folder_snapshot.invalidate()
+        if signal_data.get('manual_input'):
+            signal_data['attachments'] = self.app.pdf_processor.get_all_downloads_files(entry['folder'])
+        return moved
+    
+    def claim_late_attachments(self):
+        """Συνημμένα που έφτασαν μετά το PDF πηγαίνουν στο πιο πρόσφατο σήμα"""
+        with self._lock:
+            open_entries = [entry for entry in self._entries
+                            if entry['open'] and entry['status'] in (self.READY, self.MANUAL)]
+            moved = sum(self._claim_attachments(entry, only_missing=True) for entry in open_entries)
+        
+        if moved:
+            self._notify()
+        return moved
+    
+    def claim_missing_attachments(self, signal_data):
+        """Τελευταία αναζήτηση στο downloads για συνημμένα που λείπουν (πριν την επεξεργασία)"""
+        entry = self.get_entry(signal_data.get('intake_id'))
+        if entry is None:
+            return 0
+        with self._lock:
+            return self._claim_attachments(entry, only_missing=True)
+    
+    def get_entry(self, entry_id):
+        """Στοιχείο της ουράς με βάση το id (ή None)"""
+        with self._lock:
+            for entry in self._entries:
+                if entry['id'] == entry_id:
+                    return entry
+        return None
+    
+    def entries(self):
+        """Αντίγραφο της ουράς με τη σειρά άφιξης"""
+        with self._lock:
+            return [dict(entry) for entry in self._entries]
+    
+    def next_entry(self, exclude_id=None):
+        """Το παλαιότερο σήμα που έχει αναλυθεί (έτοιμο, χειροκίνητο ή με σφάλμα)"""
+        with self._lock:
+            for entry in self._entries:
+                if entry['id'] != exclude_id and entry['status'] in (self.READY, self.MANUAL, self.ERROR):
+                    return entry
+        return None
+    
+    def set_status(self, entry_id, status):
+        """Αλλαγή κατάστασης (π.χ. σε επεξεργασία - δεν δέχεται πλέον νέα συνημμένα)"""
+        entry = self.get_entry(entry_id)
+        if entry is not None:
+            entry['status'] = status
+            self._notify()
+    
+    def remove(self, entry_id):
+        """Αφαίρεση σήματος από την ουρά μαζί με τον φάκελό του"""
+        with self._lock:
+            entry = self.get_entry(entry_id)
+            if entry is None:
+                return False
+            self._entries.remove(entry)
+        
+        if entry['folder'].exists():
+            shutil.rmtree(entry['folder'], ignore_errors=True)
+        drop_folder_snapshot(entry['folder'])
+        self._notify()
+        return True
+    
+    def pending_count(self):
+        """Σήματα στην ουρά"""
+        with self._lock:
+            return len(self._entries)
+    
+    def _notify(self):
+        self.app.safe_schedule_ui_update(self.app.handle_intake_update)
@@ -4,11 +4,11 @@
 Signal processing controller for autoPyrseia
 """
 
-import threading
 import tkinter as tk
+from pathlib import Path
 from app.ui.dialogs.manual_input import ManualInputDialog
 from app.ui.dialogs.missing_attachments import MissingAttachmentsDialog
-from app.utils.file_operations import check_attachment_exists
+from app.controllers.intake_queue import IntakeQueue
 
 
 class SignalController:
@@ -16,41 +16,44 @@ class SignalController:
     
     def __init__(self, app_instance):
         self.app = app_instance
+        
+        # Σήμα σε επεξεργασία - το επόμενο της ουράς εμφανίζεται μόλις ολοκληρωθεί
+        self.processing = False
     
     def handle_new_signal(self):
-        """Χειρισμός νέου σήματος"""
-        # Hide processing results when new signal is detected
+        """Εμφάνιση του επόμενου σήματος της ουράς (αν δεν εμφανίζεται ήδη κάποιο)"""
+        while not self.app.current_signal_data and not self.processing:
+            entry = self.app.intake_queue.next_entry()
+            if entry is None:
+                return
+            
+            if entry['status'] == IntakeQueue.ERROR:
+                # Το PDF δεν αναλύθηκε - αφαιρείται από την ουρά όπως πριν καθαριζόταν το downloads
+                self.app.intake_queue.remove(entry['id'])
+                self.handle_pdf_error(entry['error'])
+                continue
+            
+            self.show_intake_entry(entry['id'])
+            return
+    
+    def show_intake_entry(self, entry_id):
+        """Εμφάνιση ενός σήματος της ουράς (ανάλυση και έλεγχοι έχουν ήδη γίνει στο background)"""
+        entry = self.app.intake_queue.get_entry(entry_id)
+        if entry is None or self.processing or entry['status'] not in (IntakeQueue.READY, IntakeQueue.MANUAL):
+            return
+        
+        # Hide processing results when new signal is shown
         self.app.hide_processing_results()
         
         # Switch to first tab (Signal Processing) when new signal detected
-        self.app.root.after(0, lambda: self.app.notebook.select(0))
+        self.app.notebook.select(0)
         
-        # Start progress operation
         self.app.progress_manager.start_operation(
-            "signal_detection", 
-            "Ανιχνεύθηκε νέο σήμα - Επεξεργασία...", 
+            "signal_detection",
+            f"Σήμα #{entry['id']} από την ουρά - Φόρτωση...",
             5
         )
-        
-        def process_in_thread():
-            try:
-                self.app.root.after(0, lambda: self.app.progress_manager.smooth_progress("signal_detection", 15, 200))
-                self.app.root.after(200, lambda: self.app.progress_manager.update_message("signal_detection", "Άνοιγμα PDF αρχείου..."))
-                
-                self.app.root.after(400, lambda: self.app.progress_manager.smooth_progress("signal_detection", 40, 300))
-                self.app.root.after(700, lambda: self.app.progress_manager.update_message("signal_detection", "Ανάλυση περιεχομένου PDF..."))
-                
-                signal_data = self.app.pdf_processor.process_pdf("downloads/pyrseia_server.pdf")
-                
-                self.app.root.after(0, lambda: self.app.progress_manager.smooth_progress("signal_detection", 85, 200))
-                self.app.root.after(200, lambda: self.app.progress_manager.update_message("signal_detection", "Ολοκλήρωση επεξεργασίας..."))
-                
-                self.app.root.after(400, lambda: self.app.display_signal_data(signal_data))
-            except Exception as e:
-                error_msg = str(e)
-                self.app.root.after(0, lambda: self.handle_pdf_error(error_msg))
-        
-        threading.Thread(target=process_in_thread, daemon=True).start()
+        self.app.display_signal_data(entry['signal_data'], entry.get('checks'))
     
     def handle_manual_input_required(self, signal_data):
         """Χειρισμός manual input requirement"""
@@ -58,6 +61,11 @@ class SignalController:
         self.app.progress_manager.complete_operation("signal_detection", "Απαιτείται χειροκίνητη εισαγωγή στοιχείων και επιλογή παραληπτών")
         self.app.root.after(800, lambda: self.app.progress_manager.reset_progress("signal_detection"))
         
+        # Άνοιγμα του PDF ώστε ο χρήστης να μπορεί να το δει
+        source_folder = signal_data.get('source_folder')
+        pdf_path = self._signal_pdf_path(signal_data)
+        self.app.pdf_processor.open_pdf_with_default_program(pdf_path)
+        
         # Εμφάνιση dialog για manual input
         dialog = ManualInputDialog(self.app.root, signal_data.get('attachments', []))
         if dialog.result:
@@ -65,9 +73,18 @@ class SignalController:
             manual_signal_data = self.app.pdf_processor.create_manual_signal_data(
                 dialog.result['id'], 
                 dialog.result['fm'], 
-                "downloads/pyrseia_server.pdf"
+                pdf_path,
+                source_folder
             )
             
+            # Το σήμα μένει συνδεδεμένο με τον φάκελό του στην ουρά
+            manual_signal_data['source_folder'] = source_folder
+            manual_signal_data['intake_id'] = signal_data.get('intake_id')
+            entry = self.app.intake_queue.get_entry(signal_data.get('intake_id'))
+            if entry is not None:
+                entry['signal_data'] = manual_signal_data
+                entry['status'] = IntakeQueue.READY
+            
             # Update theme if provided by user
             if dialog.result.get('theme'):
                 manual_signal_data['theme'] = dialog.result['theme']
@@ -88,200 +105,101 @@ class SignalController:
             # Ο χρήστης ακύρωσε - επαναφορά στην αρχική κατάσταση
             self.app.progress_manager.reset_progress("signal_detection", "Ακυρώθηκε η εισαγωγή στοιχείων")
     
+    def _signal_pdf_path(self, signal_data):
+        """Το PDF του σήματος (στον φάκελο της ουράς ή στο downloads)"""
+        source_folder = signal_data.get('source_folder')
+        if source_folder:
+            return str(Path(source_folder) / IntakeQueue.SIGNAL_PDF)
+        return str(self.app.path_manager.downloads_folder / IntakeQueue.SIGNAL_PDF)
+    
     def process_signal(self):
-        """Επεξεργασία του σήματος"""
-        if not self.app.current_signal_data:
+        """Επεξεργασία του σήματος
+        
+        Οι παραλήπτες διαβάζονται εδώ (Tk thread) και το σήμα περνάει στα στάδια
+        του SignalPipeline - έλεγχος συνημμένων, εκδόσεις, αντιγραφή, ιστορικό.
+        """
+        if not self.app.current_signal_data or self.processing:
+            return
+        
+        signal_data = self.app.current_signal_data
+        selected_recipients = self.app.get_selected_recipients()
+        if not selected_recipients:
+            self.app.progress_manager.reset_progress("signal_processing", "Δεν επιλέχθηκαν παραλήπτες")
             return
         
+        # Το σήμα δεν δέχεται πλέον συνημμένα που φτάνουν αργότερα
+        self.processing = True
+        self.app.intake_queue.set_status(signal_data.get('intake_id'), IntakeQueue.PROCESSING)
+        
         # Start signal processing operation
         self.app.progress_manager.start_operation("signal_processing", "Επεξεργασία σήματος...", 5)
         
-        def process_in_thread():
-            try:
-                # Έλεγχος συνημμένων
-                self.app.root.after(0, lambda: self.app.progress_manager.smooth_progress("signal_processing", 15, 200))
-                self.app.root.after(200, lambda: self.app.progress_manager.update_message("signal_processing", "Έλεγχος συνημμένων αρχείων..."))
-                
-                attachments = self.app.current_signal_data.get('attachments', [])
-                missing_attachments = [att for att in attachments if not check_attachment_exists(att)]
-                
-                if missing_attachments:
-                    # Show missing attachments dialog and let user decide
-                    user_choice = [None]  # Use list to modify from lambda
-                    
-                    def show_missing_dialog():
-                        dialog = MissingAttachmentsDialog(
-                            self.app.root, 
-                            missing_attachments, 
-                            len(attachments)
-                        )
-                        user_choice[0] = dialog.result
-                    
-                    # Show dialog on main thread and wait for result
-                    self.app.root.after(0, show_missing_dialog)
-                    
-                    # Wait for user decision (poll until dialog is closed)
-                    import time
-                    while user_choice[0] is None:
-                        time.sleep(0.1)
-                        self.app.root.update()
-                    
-                    if not user_choice[0]:  # User chose to cancel
-                        self.app.root.after(0, lambda: self.app.progress_manager.reset_progress(
-                            "signal_processing", 
-                            f"Επεξεργασία ακυρώθηκε - λείπουν {len(missing_attachments)} συνημμένα"
-                        ))
-                        return
-                    
-                    # User chose to continue - update attachments list to only include existing ones
-                    existing_attachments = [att for att in attachments if check_attachment_exists(att)]
-                    self.app.current_signal_data['attachments'] = existing_attachments
-                    attachments = existing_attachments  # Update local variable too
-                
-                # Λήψη επιλεγμένων παραληπτών από checkboxes
-                self.app.root.after(400, lambda: self.app.progress_manager.smooth_progress("signal_processing", 35, 200))
-                self.app.root.after(600, lambda: self.app.progress_manager.update_message("signal_processing", "Προετοιμασία παραληπτών..."))
-                
-                selected_recipients = self.app.get_selected_recipients()
-                
-                if not selected_recipients:
-                    self.app.root.after(0, lambda: self.app.progress_manager.reset_progress("signal_processing", "Δεν επιλέχθηκαν παραλήπτες"))
-                    return
-                
-                # Επεξεργασία με τον signal manager
-                self.app.root.after(800, lambda: self.app.progress_manager.smooth_progress("signal_processing", 60, 300))
-                self.app.root.after(1100, lambda: self.app.progress_manager.update_message("signal_processing", "Αποθήκευση σήματος..."))
-                
-                # Handle duplicate signal processing with versioning
-                current_signal_data = self.app.current_signal_data
-                signal_id = current_signal_data.get('id', '')
-                fm = current_signal_data.get('fm', '')
-                serial_number = current_signal_data.get('serial_number', None)
-                
-                versioned_signal_data = current_signal_data.copy()
-                
-                # Process each recipient to handle different cases
-                final_recipients = []
-                for recipient in selected_recipients:
-                    if isinstance(recipient, dict):
-                        recipient_name = recipient.get('name', str(recipient))
-                        is_temporary = recipient.get('is_temporary', False)
-                        folder_path = recipient.get('folder_path', None)
-                    else:
-                        recipient_name = str(recipient)
-                        is_temporary = False
-                        folder_path = None
-                    
-                    # Check if this recipient already has this exact signal (same serial)
-                    recipients_with_signal = []
-                    if serial_number is not None:
-                        recipients_with_signal = self.app.duplicate_manager.get_recipients_with_signal(signal_id, fm, serial_number)
-                    
-                    if recipient_name in recipients_with_signal:
-                        # This is a duplicate for this recipient - create versioned ID
-                        version_number = self.app.duplicate_manager.get_next_version_number(signal_id, fm, recipient_name, serial_number)
-                        versioned_id = self.app.duplicate_manager.get_versioned_signal_id(signal_id, version_number)
-                        
-                        # Register the new version
-                        self.app.duplicate_manager.register_version(signal_id, fm, recipient_name, version_number, serial_number)
-                        
-                        # Create a copy of signal data with versioned ID for this recipient
-                        recipient_signal_data = versioned_signal_data.copy()
-                        recipient_signal_data['id'] = versioned_id
-                        recipient_signal_data['original_id'] = signal_id
-                        recipient_signal_data['version_number'] = version_number
-                        
-                        # Process this recipient with versioned signal - preserve temporary recipient info
-                        final_recipients.append({
-                            'name': recipient_name,
-                            'signal_data': recipient_signal_data,
-                            'is_temporary': is_temporary,
-                            'folder_path': folder_path
-                        })
-                    else:
-                        # Check for folder conflict with different signal (same ID, different FM)
-                        folder_version = 0
-                        if serial_number is not None:
-                            folder_version = self.app.duplicate_manager.check_folder_conflict_and_get_version(signal_id, fm, recipient_name, serial_number)
-                        
-                        if folder_version > 0:
-                            # Folder conflict exists - use versioned ID
-                            versioned_id = self.app.duplicate_manager.get_versioned_signal_id(signal_id, folder_version)
-                            
-                            # Create a copy of signal data with versioned ID for this recipient
-                            recipient_signal_data = versioned_signal_data.copy()
-                            recipient_signal_data['id'] = versioned_id
-                            recipient_signal_data['original_id'] = signal_id
-                            recipient_signal_data['folder_conflict_version'] = folder_version
-                            
-                            # Process this recipient with versioned signal - preserve temporary recipient info
-                            final_recipients.append({
-                                'name': recipient_name,
-                                'signal_data': recipient_signal_data,
-                                'is_temporary': is_temporary,
-                                'folder_path': folder_path
-                            })
-                        else:
-                            # No conflict - use original signal - preserve temporary recipient info
-                            final_recipients.append({
-                                'name': recipient_name,
-                                'signal_data': versioned_signal_data,
-                                'is_temporary': is_temporary,
-                                'folder_path': folder_path
-                            })
-                
-                # Now process the recipients with their appropriate signal data
-                result = self.app.signal_manager.process_signal_with_versions(final_recipients)
-                
-                self.app.root.after(0, lambda: self.app.progress_manager.smooth_progress("signal_processing", 90, 200))
-                self.app.root.after(200, lambda: self.app.progress_manager.update_message("signal_processing", "Ολοκλήρωση επεξεργασίας..."))
-                
-                # Add detailed information to result for success message
-                result['attachments_count'] = len(attachments)
-                result['attachments_copied'] = len(attachments)  # For display purposes
-                
-                # Add processing time
-                from datetime import datetime
-                result['processing_time'] = datetime.now().strftime("%H:%M:%S")
-                
-                # Extract just the recipient names for history logging
-                recipient_names = []
-                processed_recipients = []
-                
-                for recipient_info in final_recipients:
-                    recipient_name = recipient_info['name']
-                    recipient_names.append(recipient_name)
-                    processed_recipients.append(recipient_name)
-                
-                # Register the signal with selected recipients in duplicate manager
-                if serial_number is not None:
-                    self.app.duplicate_manager.register_signal(signal_id, fm, processed_recipients, serial_number)
-                
-                result['selected_recipients'] = recipient_names
-                
-                # Add verification flags for success message
-                result['pdf_copied_to_all'] = result.get('success', False) and len(result.get('failed_recipients', [])) == 0
-                result['attachments_copied_to_all'] = result['pdf_copied_to_all']  # If PDF copied successfully, attachments were too
-                result['history_updated'] = True  # Will be updated after this point
-                result['downloads_cleaned'] = True  # Will be cleaned after success
-                
-                # Complete the progress and then call signal_processed_successfully
-                self.app.root.after(400, lambda: self.app.progress_manager.complete_operation("signal_processing", "Επεξεργασία σήματος ολοκληρώθηκε"))
-                self.app.root.after(600, lambda: self.app.signal_processed_successfully(result, versioned_signal_data))
-                
-            except Exception as e:
-                error_msg = str(e)
-                self.app.root.after(0, lambda: self.app.progress_manager.reset_progress("signal_processing", f"Σφάλμα: {error_msg}"))
+        job = {
+            'signal_data': signal_data,
+            'selected_recipients': selected_recipients,
+            'progress': self._report_progress,
+            'confirm_missing': self._confirm_missing_attachments,
+            'on_success': self._job_succeeded,
+            'on_failure': self._job_failed
+        }
+        if not self.app.signal_pipeline.submit('attachments', job, block=False):
+            self._job_failed(job, "Σφάλμα: Η ουρά επεξεργασίας είναι γεμάτη - δοκιμάστε ξανά")
+    
+    def _report_progress(self, percent, message):
+        """Πρόοδος από τα στάδια του pipeline (ο ProgressManager είναι thread-safe)"""
+        self.app.progress_manager.update_progress("signal_processing", percent, message)
+    
+    def _confirm_missing_attachments(self, job, missing_attachments):
+        """Dialog για τα συνημμένα που λείπουν - το job συνεχίζει με την απάντηση"""
+        dispatcher = self.app.dispatcher
+        answer = dispatcher.ask(lambda: MissingAttachmentsDialog(
+            self.app.root,
+            missing_attachments,
+            len(job['signal_data'].get('attachments', []))
+        ))
+        dispatcher.then(
+            answer,
+            on_done=lambda proceed: self.app.signal_pipeline.resume_with_missing(job, proceed),
+            on_error=lambda e: self._job_failed(job, f"Σφάλμα: {e}")
+        )
+    
+    def _job_succeeded(self, job):
+        """Το σήμα αποθηκεύτηκε σε όλους τους παραλήπτες (από το στάδιο record)"""
+        result = job['result']
+        signal_data = job['signal_data']
+        
+        def finish():
+            self.processing = False
+            self.app.signal_processed_successfully(result, signal_data)
         
-        threading.Thread(target=process_in_thread, daemon=True).start()
+        # Τα αποτελέσματα εμφανίζονται μόλις ολοκληρωθεί η αποθήκευση
+        self.app.dispatcher.call_soon(finish)
+    
+    def _job_failed(self, job, message, cancelled=False):
+        """Ακύρωση ή σφάλμα σε κάποιο στάδιο - το σήμα μένει στην ουρά για νέα προσπάθεια"""
+        intake_id = job['signal_data'].get('intake_id')
+        
+        def reset():
+            self.processing = False
+            self.app.progress_manager.reset_progress("signal_processing", message)
+            self.app.intake_queue.set_status(intake_id, IntakeQueue.READY)
+        self.app.dispatcher.call_soon(reset)
+    
+    def get_pipeline_stats(self):
+        """Βάθος ουράς και χρόνοι ανά στάδιο επεξεργασίας"""
+        return self.app.signal_pipeline.get_stats()
+    
+    def signal_completed(self, signal_data):
+        """Το σήμα αποθηκεύτηκε - αφαίρεση από την ουρά και εμφάνιση του επόμενου"""
+        if signal_data and signal_data.get('intake_id') is not None:
+            # Ο φάκελος του σήματος έχει ήδη καθαριστεί από τον SignalManager
+            self.app.intake_queue.remove(signal_data['intake_id'])
+        self.handle_new_signal()
     
     def handle_pdf_error(self, error_message):
         """Χειρισμός σφάλματος PDF"""
         self.app.progress_manager.reset_progress("signal_detection", "Σφάλμα στην επεξεργασία του PDF")
-        
-        # Διαγραφή του downloads folder
-        from app.utils.file_operations import clear_downloads_folder
-        clear_downloads_folder()
+        print(f"Σφάλμα PDF σήματος: {error_message}")
         
         # Ενημέρωση χρήστη
         if hasattr(self.app, 'attachments_frame'):
@@ -292,9 +210,18 @@ class SignalController:
                                   fg='red', font=('Arial', 10, 'bold'))
             error_label.pack()
     
-    def handle_pdf_deletion(self):
-        """Χειρισμός διαγραφής του pyrseia_server.pdf από τον χρήστη"""
-        self.app.progress_manager.global_message("Το PDF σήματος διαγράφηκε - Καθαρισμός δεδομένων...")
+    def discard_signal(self, entry_id):
+        """Αφαίρεση σήματος από την ουρά (και από την οθόνη αν εμφανίζεται)"""
+        if self.processing:
+            return False
+        
+        current = self.app.current_signal_data
+        is_current = bool(current) and current.get('intake_id') == entry_id
+        self.app.intake_queue.remove(entry_id)
+        if not is_current:
+            return True
+        
+        self.app.progress_manager.global_message("Το σήμα αφαιρέθηκε - Καθαρισμός δεδομένων...")
         
         # Καθαρισμός των εξαγμένων δεδομένων
         self.app.current_signal_data = None
@@ -306,5 +233,7 @@ class SignalController:
         if hasattr(self.app, 'process_button'):
             self.app.process_button.config(state='disabled')
         
-        # Ενημέρωση status
+        # Ενημέρωση status και εμφάνιση του επόμενου σήματος της ουράς
         self.app.progress_manager.global_message("Έτοιμο για νέο σήμα")
+        self.handle_new_signal()
+        return True
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Signal processing pipeline for autoPyrseia
+
+Η διαδρομή ενός σήματος χωρίζεται σε στάδια με δικούς τους workers:
+  parse       - ανάλυση του PDF της ουράς intake (PDFProcessor)
+  attachments - τελευταία αναζήτηση και επίλυση των συνημμένων
+  precheck    - έλεγχος διπλοτύπων και εκδόσεις ανά παραλήπτη (DuplicateManager)
+  fanout      - αντιγραφή σε όλους τους παραλήπτες (SignalManager)
+  record      - καταχώρηση στα διπλότυπα και στο ημερήσιο ιστορικό
+
+Τα στάδια συνδέονται με φραγμένες ουρές (βλ. app.services.pipeline).
+Ο αριθμός workers και η χωρητικότητα κάθε σταδίου ρυθμίζονται από το
+config.json (ρύθμιση "pipeline"). Το UI δεν περιμένει ποτέ κάποιο στάδιο -
+τα αποτελέσματα επιστρέφουν με callbacks του job.
+"""
+
+import threading
+from datetime import datetime
+from app.services.pipeline import Pipeline
+from app.utils.file_operations import resolve_attachments
+
+
+class SignalPipeline:
+    """Στάδια επεξεργασίας σημάτων από την ανάλυση μέχρι το ιστορικό"""
+    
+    # Προεπιλογές - η ανάλυση μένει σε έναν worker ώστε τα συνημμένα να
+    # μοιράζονται στα σήματα με τη σειρά άφιξης
+    DEFAULT_STAGES = {
+        'parse': {'workers': 1, 'capacity': 16},
+        'attachments': {'workers': 1, 'capacity': 8},
+        'precheck': {'workers': 2, 'capacity': 8},
+        'fanout': {'workers': 2, 'capacity': 4},
+        'record': {'workers': 1, 'capacity': 16}
+    }
+    
+    def __init__(self, app_instance):
+        self.app = app_instance
+        
+        # Το DuplicateManager δεν είναι thread-safe
+        self._duplicates_lock = threading.Lock()
+        # Αυξάνεται σε κάθε καταχώρηση - έλεγχοι με παλιότερη τιμή δεν ισχύουν πια
+        self.duplicates_generation = 0
+        
+        # Δύο σήματα με το ίδιο ID δεν περνούν ταυτόχρονα από εκδόσεις/αντιγραφή
+        self._signals_in_flight = set()
+        self._signals_condition = threading.Condition()
+        
+        self.pipeline = Pipeline(error_handler=self._stage_failed)
+        stage_settings = self._stage_settings()
+        for name, handler in (('parse', self._parse),
+                              ('attachments', self._check_attachments),
+                              ('precheck', self._precheck),
+                              ('fanout', self._fanout),
+                              ('record', self._record)):
+            settings = stage_settings[name]
+            self.pipeline.add_stage(name, handler, settings['workers'], settings['capacity'])
+    
+    def _stage_settings(self):
+        """Workers/χωρητικότητα ανά στάδιο (config.json → "pipeline")"""
+        configured = {}
+        config_manager = getattr(self.app, 'config_manager', None)
+        if config_manager is not None:
+            configured = config_manager.get_setting('pipeline', {}) or {}
+        
+        settings = {}
+        for name, defaults in self.DEFAULT_STAGES.items():
+            stage_config = configured.get(name, {}) if isinstance(configured, dict) else {}
+            settings[name] = dict(defaults)
+            for key in ('workers', 'capacity'):
+                try:
+                    if key in stage_config:
+                        settings[name][key] = max(1, int(stage_config[key]))
+                except (TypeError, ValueError):
+                    print(f"Μη έγκυρη ρύθμιση pipeline.{name}.{key}: {stage_config[key]!r}")
+        return settings
+    
+    def start(self):
+        self.pipeline.start()
+    
+    def stop(self):
+        self.pipeline.stop()
+    
+    def submit(self, stage_name, job, block=True, timeout=None):
+        """Είσοδος job σε στάδιο (False αν η ουρά του είναι γεμάτη)"""
+        return self.pipeline.submit(stage_name, job, block=block, timeout=timeout)
+    
+    def get_stats(self):
+        """Βάθος ουράς και χρόνοι ανά στάδιο"""
+        return self.pipeline.get_stats()
+    
+    def format_stats(self):
+        return self.pipeline.format_stats()
+    
+    # ------------------------------------------------------------------
+    # Στάδια
+    # ------------------------------------------------------------------
+    
+    def _parse(self, job):
+        """Ανάλυση ενός PDF της ουράς intake - το σήμα περιμένει μετά τον χειριστή"""
+        self.app.intake_queue.parse_entry(job['entry'])
+        return None
+    
+    def _check_attachments(self, job):
+        """Συνημμένα που έμειναν στο downloads και ένα πλάνο για έλεγχο και αντιγραφή"""
+        signal_data = job['signal_data']
+        self._report(job, 15, "Έλεγχος συνημμένων αρχείων...")
+        
+        # Συνημμένα που έμειναν στο downloads περνούν στον φάκελο του σήματος
+        intake_queue = getattr(self.app, 'intake_queue', None)
+        if intake_queue is not None:
+            intake_queue.claim_missing_attachments(signal_data)
+        
+        attachments = signal_data.get('attachments', [])
+        attachment_plan = resolve_attachments(attachments, signal_data.get('source_folder'))
+        job['attachment_plan'] = attachment_plan
+        
+        missing_attachments = [att for att in attachments if not attachment_plan[att]['source']]
+        if missing_attachments:
+            # Η απόφαση (dialog ή κανόνας) συνεχίζει το job με resume_with_missing
+            job['missing_attachments'] = missing_attachments
+            job['confirm_missing'](job, missing_attachments)
+            return None
+        return job
+    
+    def resume_with_missing(self, job, proceed, block=False):
+        """Συνέχεια μετά την απόφαση για τα συνημμένα που λείπουν
+        
+        Από το Tk thread δεν περιμένουμε ποτέ (block=False) - αν το στάδιο είναι
+        γεμάτο το σήμα μένει για νέα προσπάθεια.
+        """
+        if not proceed:
+            missing_count = len(job.get('missing_attachments', []))
+            self._finish_failed(job, f"Επεξεργασία ακυρώθηκε - λείπουν {missing_count} συνημμένα", cancelled=True)
+            return False
+        
+        # Συνέχεια μόνο με τα συνημμένα που υπάρχουν
+        signal_data = job['signal_data']
+        attachment_plan = job['attachment_plan']
+        signal_data['attachments'] = [att for att in signal_data.get('attachments', [])
+                                      if attachment_plan[att]['source']]
+        
+        if not self.submit('precheck', job, block=block):
+            self._finish_failed(job, "Σφάλμα: Η ουρά επεξεργασίας είναι γεμάτη - δοκιμάστε ξανά")
+            return False
+        return True
+    
+    def _precheck(self, job):
+        """Εκδόσεις ανά παραλήπτη για σήματα που υπάρχουν ήδη"""
+        signal_data = job['signal_data']
+        signal_id = signal_data.get('id', '')
+        self._report(job, 35, "Προετοιμασία παραληπτών...")
+        
+        self._acquire_signal(job, signal_id)
+        with self._duplicates_lock:
+            job['final_recipients'] = self._versioned_recipients(signal_data, job['selected_recipients'])
+        return job
+    
+    def recipients_with_signal(self, signal_data):
+        """Παραλήπτες που έχουν ήδη το σήμα (ίδιο ID, Φ.Μ. και serial)"""
+        serial_number = signal_data.get('serial_number', None)
+        if serial_number is None:
+            return []
+        with self._duplicates_lock:
+            return self.app.duplicate_manager.get_recipients_with_signal(
+                signal_data.get('id', ''), signal_data.get('fm', ''), serial_number)
+    
+    def signal_checks(self, signal_data):
+        """Έλεγχοι για την εμφάνιση ενός σήματος (εκτός Tk thread)
+        
+        Η σάρωση του DATA για διπλότυπα και η επίλυση των συνημμένων γίνονται
+        εδώ και η καρτέλα παίρνει μόνο το αποτέλεσμα.
+        """
+        # Διαβάζεται πριν τη σάρωση: καταχώρηση στο μεταξύ κάνει τους ελέγχους παλιούς
+        generation = self.duplicates_generation
+        recipients_with_signal = self.recipients_with_signal(signal_data)
+        return {
+            'generation': generation,
+            'is_duplicate': bool(recipients_with_signal),
+            'recipients_with_signal': recipients_with_signal,
+            'attachment_plan': resolve_attachments(signal_data.get('attachments', []),
+                                                   signal_data.get('source_folder'))
+        }
+    
+    def checks_stale(self, checks):
+        """Καταχωρήθηκε σήμα στα διπλότυπα μετά τους ελέγχους;"""
+        return checks.get('generation') != self.duplicates_generation
+    
+    def _versioned_recipients(self, signal_data, selected_recipients):
+        """Παραλήπτες με τα δεδομένα σήματος (ίσως με έκδοση) που θα πάρει ο καθένας"""
+        duplicate_manager = self.app.duplicate_manager
+        signal_id = signal_data.get('id', '')
+        fm = signal_data.get('fm', '')
+        serial_number = signal_data.get('serial_number', None)
+        
+        versioned_signal_data = signal_data.copy()
+        
+        final_recipients = []
+        for recipient in selected_recipients:
+            if isinstance(recipient, dict):
+                recipient_name = recipient.get('name', str(recipient))
+                is_temporary = recipient.get('is_temporary', False)
+                folder_path = recipient.get('folder_path', None)
+            else:
+                recipient_name = str(recipient)
+                is_temporary = False
+                folder_path = None
+            
+            # Check if this recipient already has this exact signal (same serial)
+            recipients_with_signal = []
+            if serial_number is not None:
+                recipients_with_signal = duplicate_manager.get_recipients_with_signal(signal_id, fm, serial_number)
+            
+            recipient_signal_data = versioned_signal_data
+            if recipient_name in recipients_with_signal:
+                # This is a duplicate for this recipient - create versioned ID
+                version_number = duplicate_manager.get_next_version_number(signal_id, fm, recipient_name, serial_number)
+                versioned_id = duplicate_manager.get_versioned_signal_id(signal_id, version_number)
+                
+                # Register the new version
+                duplicate_manager.register_version(signal_id, fm, recipient_name, version_number, serial_number)
+                
+                recipient_signal_data = versioned_signal_data.copy()
+                recipient_signal_data['id'] = versioned_id
+                recipient_signal_data['original_id'] = signal_id
+                recipient_signal_data['version_number'] = version_number
+            else:
+                # Check for folder conflict with different signal (same ID, different FM)
+                folder_version = 0
+                if serial_number is not None:
+                    folder_version = duplicate_manager.check_folder_conflict_and_get_version(signal_id, fm, recipient_name, serial_number)
+                
+                if folder_version > 0:
+                    versioned_id = duplicate_manager.get_versioned_signal_id(signal_id, folder_version)
+                    
+                    recipient_signal_data = versioned_signal_data.copy()
+                    recipient_signal_data['id'] = versioned_id
+                    recipient_signal_data['original_id'] = signal_id
+                    recipient_signal_data['folder_conflict_version'] = folder_version
+            
+            # Preserve temporary recipient info
+            final_recipients.append({
+                'name': recipient_name,
+                'signal_data': recipient_signal_data,
+                'is_temporary': is_temporary,
+                'folder_path': folder_path
+            })
+        
+        return final_recipients
+    
+    def _fanout(self, job):
+        """Αντιγραφή σε όλους τους παραλήπτες (ή σε κανέναν - rollback)"""
+        self._report(job, 40, "Αποθήκευση σήματος...")
+        
+        # Πραγματική πρόοδος αντιγραφής (βήματα και bytes) στο διάστημα 40-90%
+        def fanout_progress(event):
+            self._report(job, 40 + 50 * event.fraction, event.message or "Αποθήκευση σήματος...")
+        
+        result = self.app.signal_manager.process_signal_with_versions(
+            job['final_recipients'], job['attachment_plan'], progress_callback=fanout_progress
+        )
+        if not result.get('success', False):
+            # Έγινε rollback σε όλους τους παραλήπτες - το σήμα μένει για νέα προσπάθεια
+            error_msg = result.get('error', 'Αποτυχία επεξεργασίας')
+            raise RuntimeError(f"{error_msg} - Δεν αποθηκεύτηκε σε κανέναν παραλήπτη")
+        
+        job['result'] = result
+        return job
+    
+    def _record(self, job):
+        """Καταχώρηση στα διπλότυπα και στο ιστορικό (εκτός Tk thread)"""
+        signal_data = job['signal_data']
+        result = job['result']
+        self._report(job, 90, "Ολοκλήρωση επεξεργασίας...")
+        
+        signal_id = signal_data.get('id', '')
+        fm = signal_data.get('fm', '')
+        serial_number = signal_data.get('serial_number', None)
+        attachments = signal_data.get('attachments', [])
+        recipient_names = [recipient_info['name'] for recipient_info in job['final_recipients']]
+        
+        try:
+            # Register the signal with selected recipients in duplicate manager
+            if serial_number is not None:
+                with self._duplicates_lock:
+                    self.app.duplicate_manager.register_signal(signal_id, fm, recipient_names, serial_number)
+                    self.duplicates_generation += 1
+        finally:
+            self._release_signal(job)
+        
+        history_updated = False
+        daily_history = getattr(self.app, 'daily_history', None)
+        if daily_history is not None:
+            recipients_for_log = recipient_names if recipient_names else ['(Δεν επιλέχθηκαν)']
+            daily_history.add_processed_signal(signal_id or 'N/A', fm or 'N/A', recipients_for_log)
+            history_updated = True
+        
+        # Add detailed information to result for success message
+        result['attachments_count'] = len(attachments)
+        result['attachments_copied'] = len(attachments)  # For display purposes
+        result['processing_time'] = datetime.now().strftime("%H:%M:%S")
+        result['selected_recipients'] = recipient_names
+        
+        # Add verification flags for success message
+        result['pdf_copied_to_all'] = result.get('success', False) and len(result.get('failed_recipients', [])) == 0
+        result['attachments_copied_to_all'] = result['pdf_copied_to_all']  # If PDF copied successfully, attachments were too
+        result['history_updated'] = history_updated
+        result['history_recorded'] = history_updated
+        result['downloads_cleaned'] = True
+        
+        job['on_success'](job)
+        return None
+    
+    # ------------------------------------------------------------------
+    # Βοηθητικά
+    # ------------------------------------------------------------------
+    
+    def _acquire_signal(self, job, signal_id):
+        """Αναμονή όσο άλλο job με το ίδιο ID είναι σε εκδόσεις/αντιγραφή"""
+        with self._signals_condition:
+            while signal_id in self._signals_in_flight:
+                self._signals_condition.wait()
+            self._signals_in_flight.add(signal_id)
+        job['_signal_key'] = signal_id
+    
+    def _release_signal(self, job):
+        if '_signal_key' not in job:
+            return
+        with self._signals_condition:
+            self._signals_in_flight.discard(job.pop('_signal_key'))
+            self._signals_condition.notify_all()
+    
+    def _report(self, job, percent, message):
+        progress = job.get('progress')
+        if progress is not None:
+            progress(percent, message)
+    
+    def _stage_failed(self, stage_name, job, error):
+        self._finish_failed(job, f"Σφάλμα: {error}")
+    
+    def _finish_failed(self, job, message, cancelled=False):
+        self._release_signal(job)
+        on_failure = job.get('on_failure')
+        if on_failure is not None:
+            on_failure(job, message, cancelled)
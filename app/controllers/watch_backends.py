@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OS file-event backends for the downloads watcher
+
+Κάθε backend παρακολουθεί έναν φάκελο (χωρίς υποφακέλους) και επιστρέφει
+λίστα από (action, filename) με action 'created', 'modified' ή 'deleted'.
+Η ενέργεια 'rescan' σημαίνει ότι χάθηκαν γεγονότα (overflow) και ο watcher
+πρέπει να ξαναδιαβάσει τον φάκελο, ενώ 'invalidated' ότι ο ίδιος ο φάκελος
+διαγράφηκε ή μετακινήθηκε.
+"""
+
+import os
+import select
+import struct
+import sys
+
+
+def create_watch_backend(folder):
+    """Επιστρέφει το κατάλληλο backend για το λειτουργικό ή None (polling)"""
+    folder = str(folder)
+    if not os.path.isdir(folder):
+        return None
+    
+    if sys.platform.startswith('linux'):
+        candidates = [InotifyBackend]
+    elif sys.platform == 'win32':
+        candidates = [WindowsBackend]
+    elif hasattr(select, 'kqueue'):
+        candidates = [KqueueBackend]
+    else:
+        candidates = []
+    
+    for backend_class in candidates:
+        try:
+            return backend_class(folder)
+        except Exception as e:
+            print(f"Το {backend_class.name} δεν είναι διαθέσιμο ({e}) - χρήση polling")
+    return None
+
+
+class InotifyBackend:
+    """Linux inotify μέσω ctypes (χωρίς εξωτερικές εξαρτήσεις)"""
+    
+    name = "inotify"
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    
+    _EVENT_HEADER = struct.Struct('iIII')
+    
+    def __init__(self, folder):
+        import ctypes
+        import ctypes.util
+        
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        
+        mask = (self.IN_CREATE | self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_FROM |
+                self.IN_MOVED_TO | self.IN_DELETE | self.IN_DELETE_SELF | self.IN_MOVE_SELF)
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(folder), mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, "inotify_add_watch failed")
+    
+    def read_events(self, timeout):
+        """Αναμονή έως timeout δευτερόλεπτα για γεγονότα"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        
+        events = []
+        offset = 0
+        while offset + self._EVENT_HEADER.size <= len(data):
+            _, mask, _, name_length = self._EVENT_HEADER.unpack_from(data, offset)
+            offset += self._EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b'\0').decode('utf-8', errors='surrogateescape')
+            offset += name_length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                events.append(('rescan', None))
+            elif mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF | self.IN_IGNORED):
+                events.append(('invalidated', None))
+            elif mask & self.IN_ISDIR:
+                continue
+            elif mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                events.append(('created', name))
+            elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                events.append(('deleted', name))
+            elif mask & (self.IN_MODIFY | self.IN_CLOSE_WRITE):
+                events.append(('modified', name))
+        
+        return events
+    
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class WindowsBackend:
+    """Windows ReadDirectoryChangesW (overlapped I/O μέσω pywin32)"""
+    
+    name = "ReadDirectoryChangesW"
+    
+    FILE_LIST_DIRECTORY = 0x0001
+    _ACTIONS = {1: 'created', 2: 'deleted', 3: 'modified', 4: 'deleted', 5: 'created'}
+    
+    def __init__(self, folder):
+        import pywintypes
+        import win32con
+        import win32event
+        import win32file
+        
+        self.win32event = win32event
+        self.win32file = win32file
+        
+        self.handle = win32file.CreateFile(
+            folder,
+            self.FILE_LIST_DIRECTORY,
+            win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+            None,
+            win32con.OPEN_EXISTING,
+            win32con.FILE_FLAG_BACKUP_SEMANTICS | win32con.FILE_FLAG_OVERLAPPED,
+            None
+        )
+        self.overlapped = pywintypes.OVERLAPPED()
+        self.overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        self.buffer = win32file.AllocateReadBuffer(64 * 1024)
+        self.notify_filter = (win32con.FILE_NOTIFY_CHANGE_FILE_NAME |
+                              win32con.FILE_NOTIFY_CHANGE_SIZE |
+                              win32con.FILE_NOTIFY_CHANGE_LAST_WRITE)
+        self._start_read()
+    
+    def _start_read(self):
+        self.win32file.ReadDirectoryChangesW(self.handle, self.buffer, False, self.notify_filter, self.overlapped)
+    
+    def read_events(self, timeout):
+        """Αναμονή έως timeout δευτερόλεπτα για γεγονότα"""
+        result = self.win32event.WaitForSingleObject(self.overlapped.hEvent, int(timeout * 1000))
+        if result != self.win32event.WAIT_OBJECT_0:
+            return []
+        
+        try:
+            byte_count = self.win32file.GetOverlappedResult(self.handle, self.overlapped, True)
+        except Exception:
+            # Ο φάκελος διαγράφηκε ή η λαβή δεν ισχύει πλέον
+            return [('invalidated', None)]
+        
+        if byte_count == 0:
+            # Ο buffer γέμισε - τα γεγονότα χάθηκαν
+            events = [('rescan', None)]
+        else:
+            events = [(self._ACTIONS.get(action, 'modified'), name)
+                      for action, name in self.win32file.FILE_NOTIFY_INFORMATION(self.buffer, byte_count)]
+        
+        self.win32event.ResetEvent(self.overlapped.hEvent)
+        self._start_read()
+        return events
+    
+    def close(self):
+        try:
+            self.win32file.CancelIo(self.handle)
+            self.handle.Close()
+        except Exception:
+            pass
+
+
+class KqueueBackend:
+    """macOS/BSD kqueue - ο φάκελος ειδοποιεί για αλλαγή, τα ονόματα βγαίνουν από diff"""
+    
+    name = "kqueue"
+    
+    def __init__(self, folder):
+        self.folder = folder
+        self.dir_fd = os.open(folder, os.O_RDONLY)
+        self.kqueue = select.kqueue()
+        self.kevent = select.kevent(
+            self.dir_fd,
+            filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND | select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME
+        )
+        self.snapshot = self._scan()
+    
+    def _scan(self):
+        snapshot = {}
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+    
+    def read_events(self, timeout):
+        """Αναμονή έως timeout δευτερόλεπτα για γεγονότα"""
+        triggered = self.kqueue.control([self.kevent], 1, timeout)
+        if not triggered:
+            return []
+        if triggered[0].fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME):
+            return [('invalidated', None)]
+        
+        current = self._scan()
+        events = [('created', name) for name in current if name not in self.snapshot]
+        events += [('deleted', name) for name in self.snapshot if name not in current]
+        events += [('modified', name) for name, state in current.items()
+                   if name in self.snapshot and self.snapshot[name] != state]
+        self.snapshot = current
+        return events
+    
+    def close(self):
+        try:
+            self.kqueue.close()
+            os.close(self.dir_fd)
+        except OSError:
+            pass
@@ -2,33 +2,31 @@
 # -*- coding: utf-8 -*-
 """
 Core application module for autoPyrseia
+
+Τα services δημιουργούνται στην πρώτη χρήση (LazyService) και οι εργασίες
+background ξεκινούν αφού εμφανιστεί το παράθυρο.
 """
 
 import tkinter as tk
 from tkinter import ttk
-import threading
 
 # Import path manager first to ensure directories
 from app.utils.path_manager import ensure_app_directories
-
-# Import managers
-from app.services.pdf_processor import PDFProcessor
-from app.services.signal_manager import SignalManager
-from app.services.usb_extractor import USBExtractor
-from app.services.recipients_manager import RecipientsManager
-from app.services.config_manager import ConfigManager
-from app.services.duplicate_manager import DuplicateManager
-from app.services.daily_history import DailyHistoryManager
+from app.utils.startup import LazyService, get_startup_profiler
 
 # Import UI components
 from app.ui.widgets.status_bar import StatusBar
 from app.ui.utils.keyboard_handlers import KeyboardHandlerMixin
 from app.ui.utils.tooltips import create_tooltip
+from app.ui.dialogs.search_dialog import SearchDialog
 from app.utils.progress_manager import ProgressManager
+from app.utils.dispatcher import UIDispatcher
 
 # Import controllers
 from app.controllers.file_watcher import FileWatcher
 from app.controllers.signal_controller import SignalController
+from app.controllers.intake_queue import IntakeQueue
+from app.controllers.signal_pipeline import SignalPipeline
 
 # Import tab modules
 from app.ui.tabs.signal_processing import SignalProcessingTab
@@ -37,51 +35,99 @@ from app.ui.tabs.recipients_mgmt import RecipientsManagementTab
 from app.ui.tabs.daily_history import DailyHistoryTab
 
 
+def _create_config_manager(app):
+    from app.services.config_manager import ConfigManager
+    return ConfigManager()
+
+
+def _create_pdf_processor(app):
+    # PyMuPDF φορτώνεται μόνο όταν διαβαστεί το πρώτο PDF
+    from app.services.pdf_processor import PDFProcessor
+    return PDFProcessor()
+
+
+def _create_signal_manager(app):
+    from app.services.signal_manager import SignalManager
+    return SignalManager()
+
+
+def _create_usb_extractor(app):
+    from app.services.usb_extractor import USBExtractor
+    usb_extractor = USBExtractor(app.config_manager, app.__dict__.get('progress_manager'))
+    usb_extractor.set_signal_manager(app.signal_manager)
+    usb_extractor.set_backup_archiver(app.backup_archiver)
+    return usb_extractor
+
+
+def _create_recipients_manager(app):
+    from app.services.recipients_manager import RecipientsManager
+    return RecipientsManager()
+
+
+def _create_duplicate_manager(app):
+    from app.services.duplicate_manager import DuplicateManager
+    return DuplicateManager()
+
+
+def _create_daily_history(app):
+    from app.services.daily_history import DailyHistoryManager
+    return DailyHistoryManager()
+
+
+def _create_backup_archiver(app):
+    # Compaction of old BACK UP DATA file-number folders into indexed archives
+    from app.services.backup_archiver import BackupArchiver
+    return BackupArchiver(app.config_manager, app.signal_manager.search_index)
+
+
 class AutoPyrseiaApp(KeyboardHandlerMixin):
     """Main application class"""
     
+    # Managers - δημιουργούνται στην πρώτη χρήση
+    config_manager = LazyService(_create_config_manager)
+    pdf_processor = LazyService(_create_pdf_processor)
+    signal_manager = LazyService(_create_signal_manager)
+    usb_extractor = LazyService(_create_usb_extractor)
+    recipients_manager = LazyService(_create_recipients_manager)
+    duplicate_manager = LazyService(_create_duplicate_manager)
+    daily_history = LazyService(_create_daily_history)
+    backup_archiver = LazyService(_create_backup_archiver)
+    
+    # Καθυστέρηση (ms) των βαριών εργασιών background μετά το time to interactive
+    WARM_UP_DELAY_MS = 1500
+    
     def __init__(self):
+        profiler = get_startup_profiler()
+        
         # Ensure all application directories exist before anything else
-        self.path_manager = ensure_app_directories()
+        with profiler.phase("paths"):
+            self.path_manager = ensure_app_directories()
         
-        self.root = tk.Tk()
-        self.root.title("autoPyrseia v2.0 - Διαχείριση Σημάτων")
-        self.root.geometry("800x700")
-        self.root.minsize(700, 550)
-        self.root.configure(bg='#f0f0f0')
+        with profiler.phase("window"):
+            self.root = tk.Tk()
+            self.root.title("autoPyrseia v2.0 - Διαχείριση Σημάτων")
+            self.root.geometry("800x700")
+            self.root.minsize(700, 550)
+            self.root.configure(bg='#f0f0f0')
         
-        # Initialize managers
-        self._init_managers()
+        # Background εργασίες και ενημερώσεις UI από workers περνούν από εδώ
+        self.dispatcher = UIDispatcher(self.root)
         
         # Initialize variables
-        self._init_variables()
+        with profiler.phase("variables"):
+            self._init_variables()
         
         # Initialize controllers
-        self._init_controllers()
+        with profiler.phase("controllers"):
+            self._init_controllers()
         
         # Create UI
-        self.create_ui()
+        with profiler.phase("ui"):
+            self.create_ui()
         
         # Setup keyboard bindings after UI creation
         self.setup_keyboard_bindings()
-        
-        # Start background tasks
-        self._start_background_tasks()
-    
-    def _init_managers(self):
-        """Initialize all manager instances"""
-        self.config_manager = ConfigManager()
-        self.pdf_processor = PDFProcessor()
-        self.signal_manager = SignalManager()
-        self.usb_extractor = USBExtractor(self.config_manager)
-        self.recipients_manager = RecipientsManager()
-        self.duplicate_manager = DuplicateManager()
-        
-        # Initialize daily history manager
-        self.daily_history = DailyHistoryManager()
-        
-        # Connect managers
-        self.usb_extractor.set_signal_manager(self.signal_manager)
+        profiler.mark("ui created")
     
     def _init_variables(self):
         """Initialize application variables"""
@@ -106,26 +152,41 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
         """Initialize controllers"""
         self.file_watcher = FileWatcher(self)
         self.signal_controller = SignalController(self)
+        self.intake_queue = IntakeQueue(self)
+        self.signal_pipeline = SignalPipeline(self)
     
     def _start_background_tasks(self):
-        """Start background tasks"""
-        # Scan for JSON files on startup (silently in background)
-        self.scan_missing_json_on_startup()
+        """Start background tasks (μετά την εμφάνιση του παραθύρου)"""
+        # Processing stages (parse, attachments, precheck, fanout, record)
+        self.signal_pipeline.start()
+        
+        # Signals left in the intake queue are parsed again before the watcher claims new ones
+        self.intake_queue.start()
         
         # Start file watcher
         self.file_watcher.start()
+        
+        # Οι σαρώσεις δίσκου ξεκινούν λίγο αργότερα για να μην ανταγωνίζονται τον χειριστή
+        self.root.after(self.WARM_UP_DELAY_MS, self._start_warm_up)
+    
+    def _start_warm_up(self):
+        """Βαριές εργασίες background: σάρωση JSON, συμπίεση backups, ευρετήριο αναζήτησης"""
+        # Scan for JSON files on startup (silently in background)
+        self.scan_missing_json_on_startup()
+        
+        # Compact old backups (at most once a day, in background)
+        self.backup_archiver.compact_in_background()
+        
+        # Bring the search index up to date with DATA / BACK UP DATA (in background)
+        self.signal_manager.search_index.sync_in_background()
     
     def scan_missing_json_on_startup(self):
         """Σάρωση για JSON αρχεία κατά την εκκίνηση της εφαρμογής"""
-        def scan_in_background():
-            try:
-                # Σιωπηλή σάρωση όλων των παραληπτών
-                self.signal_manager.scan_and_generate_missing_json_files()
-            except Exception as e:
-                print(f"Σφάλμα στη σάρωση JSON κατά την εκκίνηση: {e}")
-        
-        # Εκτέλεση σε background thread για να μην παγώσει το UI
-        threading.Thread(target=scan_in_background, daemon=True).start()
+        try:
+            # Σιωπηλή σάρωση όλων των παραληπτών στο background worker για να μην παγώσει το UI
+            self.signal_manager.request_json_scan()
+        except Exception as e:
+            print(f"Σφάλμα στη σάρωση JSON κατά την εκκίνηση: {e}")
     
     def create_ui(self):
         """Create the main user interface"""
@@ -136,10 +197,11 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
         self.status_bar = StatusBar(self.root)
         
         # Initialize progress manager for coordinated progress updates
-        self.progress_manager = ProgressManager(self.status_bar, self.root)
+        self.progress_manager = ProgressManager(self.status_bar, self.root, self.dispatcher)
         
-        # Connect progress manager to USB extractor
-        self.usb_extractor.progress_manager = self.progress_manager
+        # Connect progress manager to USB extractor (αν έχει ήδη δημιουργηθεί)
+        if LazyService.is_created(self, 'usb_extractor'):
+            self.usb_extractor.progress_manager = self.progress_manager
         
         # Configure notebook styling
         self._configure_notebook_style()
@@ -160,6 +222,18 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
         title_label = tk.Label(header_frame, text="autoPyrseia - Διαχείριση Σημάτων", 
                               font=('Arial', 16, 'bold'), bg='#2c3e50', fg='white')
         title_label.pack(pady=15)
+        
+        search_button = tk.Button(header_frame, text="🔍 Αναζήτηση", command=self.open_search_dialog,
+                                  font=('Arial', 10, 'bold'), bg='#34495e', fg='white',
+                                  activebackground='#3d566e', activeforeground='white',
+                                  relief='flat', cursor='hand2', padx=10)
+        search_button.place(relx=1.0, rely=0.5, x=-15, anchor='e')
+        self.create_tooltip(search_button, "Αναζήτηση σε DATA και BACK UP DATA (Ctrl+F)")
+    
+    def open_search_dialog(self, event=None):
+        """Open the full-text signal search dialog"""
+        SearchDialog(self.root, self.signal_manager.search_index)
+        return 'break'
     
     def _configure_notebook_style(self):
         """Configure notebook tab styling"""
@@ -179,29 +253,27 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
     
     def _create_tabs(self):
         """Create all application tabs"""
+        profiler = get_startup_profiler()
+        
         # Signal Processing Tab
-        self.signal_tab = SignalProcessingTab(self.notebook, self)
+        with profiler.phase("tab signal_processing"):
+            self.signal_tab = SignalProcessingTab(self.notebook, self)
         
         # USB Extraction Tab
-        self.usb_tab = USBExtractionTab(self.notebook, self)
+        with profiler.phase("tab usb_extraction"):
+            self.usb_tab = USBExtractionTab(self.notebook, self)
         
         # Recipients Management Tab
-        self.recipients_tab = RecipientsManagementTab(self.notebook, self)
+        with profiler.phase("tab recipients_mgmt"):
+            self.recipients_tab = RecipientsManagementTab(self.notebook, self)
         
         # Daily History Tab
-        self.history_tab = DailyHistoryTab(self.notebook, self)
+        with profiler.phase("tab daily_history"):
+            self.history_tab = DailyHistoryTab(self.notebook, self)
     
     def safe_schedule_ui_update(self, callback):
         """Safely schedule UI update from background thread"""
-        try:
-            if self.root and self.root.winfo_exists():
-                self.root.after(0, callback)
-        except tk.TclError:
-            # Main window has been closed, ignore the update
-            pass
-        except RuntimeError:
-            # Main thread is not in main loop, ignore the update
-            pass
+        self.dispatcher.call_soon(callback)
     
     def create_tooltip(self, widget, text):
         """Create tooltip for a widget - wrapper for UI utility"""
@@ -212,6 +284,14 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
         """Handle new signal detection"""
         self.signal_controller.handle_new_signal()
     
+    def handle_intake_update(self):
+        """Intake queue changed - refresh the queue view and show the next signal if idle"""
+        self.signal_tab.refresh_intake_queue()
+        if self.current_signal_data:
+            self.update_attachment_indicators()
+        else:
+            self.signal_controller.handle_new_signal()
+    
     def handle_manual_input_required(self, signal_data):
         """Handle manual input requirement"""
         self.signal_controller.handle_manual_input_required(signal_data)
@@ -224,14 +304,14 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
         """Handle PDF processing error"""
         self.signal_controller.handle_pdf_error(error_message)
     
-    def handle_pdf_deletion(self):
-        """Handle PDF deletion"""
-        self.signal_controller.handle_pdf_deletion()
+    def discard_signal(self, entry_id):
+        """Remove a signal from the intake queue"""
+        return self.signal_controller.discard_signal(entry_id)
     
     # These methods will be delegated to appropriate tab classes
-    def display_signal_data(self, signal_data):
+    def display_signal_data(self, signal_data, checks=None):
         """Display signal data - delegated to signal tab"""
-        self.signal_tab.display_signal_data(signal_data)
+        self.signal_tab.display_signal_data(signal_data, checks)
     
     def clear_signal_display(self):
         """Clear signal display - delegated to signal tab"""
@@ -250,6 +330,8 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
         self.signal_tab.signal_processed_successfully(result, signal_data)
         # Also refresh USB extraction list
         self.usb_tab.refresh_extraction_list()
+        # Next signal from the intake queue (already parsed)
+        self.signal_controller.signal_completed(signal_data)
     
     def show_processing_results(self, result):
         """Show processing results - delegated to signal tab"""
@@ -267,19 +349,49 @@ class AutoPyrseiaApp(KeyboardHandlerMixin):
         """Extract to USB - delegated to USB tab"""
         self.usb_tab.extract_to_usb()
     
+    def _on_window_shown(self):
+        """Πρώτο idle του mainloop: φόρτωση λιστών και μετά οι εργασίες background"""
+        profiler = get_startup_profiler()
+        profiler.mark("window shown")
+        
+        # Load initial data
+        with profiler.phase("initial lists"):
+            self.refresh_recipients_list()
+            self.refresh_extraction_list()
+        
+        self.root.after_idle(self._on_interactive)
+    
+    def _on_interactive(self):
+        """Το UI είναι έτοιμο για τον χειριστή"""
+        profiler = get_startup_profiler()
+        time_to_interactive = profiler.mark("interactive")
+        print(f"autoPyrseia έτοιμο σε {time_to_interactive:.2f}s")
+        
+        with profiler.phase("background start"):
+            self._start_background_tasks()
+        
+        if profiler.enabled:
+            print(profiler.report())
+            profiler.save(self.path_manager.project_root / "logs" / "startup_profile.txt")
+    
     def refresh_recipients_list(self):
         """Refresh recipients list - delegated to recipients tab"""
         self.recipients_tab.refresh_recipients_list()
     
     def run(self):
         """Start the application"""
-        # Load initial data
-        self.refresh_recipients_list()
-        self.refresh_extraction_list()
+        # Το παράθυρο εμφανίζεται πρώτα - δεδομένα και εργασίες background μετά
+        self.root.after_idle(self._on_window_shown)
         
         # Start main loop
         try:
+            # Ενημερώσεις που ζητήθηκαν πριν το mainloop
+            self.dispatcher.start()
             self.root.mainloop()
         finally:
             # Stop file watcher when application closes
             self.file_watcher.stop()
+            self.dispatcher.shutdown()
+            # Ρυθμίσεις που δεν έχουν γραφτεί ακόμα (write-behind)
+            if LazyService.is_created(self, 'config_manager'):
+                self.config_manager.close()
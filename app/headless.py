@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+autoPyrseia - Headless service mode
+Δημιουργός: Σωτήριος Μπαλατσιάς
+
+Επεξεργασία σημάτων χωρίς Tk: ο file watcher, η ουρά intake και τα στάδια
+του SignalPipeline τρέχουν όπως στο GUI, αλλά οι παραλήπτες επιλέγονται
+αυτόματα με κανόνες (ρύθμιση "headless" στο config.json). Κάθε σήμα
+καταγράφεται ως μία γραμμή JSON στο logs/headless_results.jsonl.
+
+Χρήση:
+    python main.py --headless                      # συνεχής λειτουργία (Ctrl+C για τέλος)
+    python main.py --headless --exit-when-idle 30  # backlog / μέτρηση throughput
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from app.utils.path_manager import ensure_app_directories
+from app.services.pdf_processor import PDFProcessor
+from app.services.signal_manager import SignalManager
+from app.services.recipients_manager import RecipientsManager
+from app.services.config_manager import ConfigManager
+from app.services.duplicate_manager import DuplicateManager
+from app.services.daily_history import DailyHistoryManager
+from app.controllers.file_watcher import FileWatcher
+from app.controllers.intake_queue import IntakeQueue
+from app.controllers.signal_pipeline import SignalPipeline
+
+
+class HeadlessApp:
+    """Η εφαρμογή χωρίς γραφικό περιβάλλον - ίδιοι managers και controllers με το GUI"""
+    
+    # Κανόνες επιλογής παραληπτών (υπερισχύει η ρύθμιση "headless" του config.json)
+    DEFAULT_RULES = {
+        # Μόνο παραλήπτες της λίστας χρήσιμων παραληπτών (όπως τα checkboxes του GUI)
+        'known_recipients_only': True,
+        # Όσοι έχουν ήδη το σήμα παραλείπονται (στο GUI εμφανίζονται χωρίς τσεκ)
+        'skip_recipients_with_signal': True,
+        # Παραλήπτες που προστίθενται/αφαιρούνται πάντα
+        'always_include': [],
+        'exclude': [],
+        # 'skip': το σήμα μένει στην ουρά για τον χειριστή, 'process': συνέχεια με όσα υπάρχουν
+        'missing_attachments': 'skip'
+    }
+    
+    STATS_INTERVAL = 60.0
+    
+    def __init__(self, results_file=None, exit_when_idle=None, stats_interval=None):
+        self.path_manager = ensure_app_directories()
+        
+        self.config_manager = ConfigManager()
+        self.pdf_processor = PDFProcessor()
+        self.signal_manager = SignalManager()
+        self.recipients_manager = RecipientsManager()
+        self.duplicate_manager = DuplicateManager()
+        self.daily_history = DailyHistoryManager()
+        
+        # Στο headless δεν εμφανίζεται ποτέ σήμα - όλα περνούν από την ουρά
+        self.current_signal_data = None
+        
+        self.rules = dict(self.DEFAULT_RULES)
+        self.rules.update(self.config_manager.get_setting('headless', {}) or {})
+        
+        self.results_file = Path(results_file) if results_file else self.path_manager.project_root / "logs" / "headless_results.jsonl"
+        self.results_file.parent.mkdir(parents=True, exist_ok=True)
+        self._results_lock = threading.Lock()
+        
+        self.exit_when_idle = exit_when_idle
+        self.stats_interval = stats_interval if stats_interval is not None else self.STATS_INTERVAL
+        
+        self.file_watcher = FileWatcher(self)
+        self.intake_queue = IntakeQueue(self)
+        self.signal_pipeline = SignalPipeline(self)
+        
+        # Σήματα που έχουν ήδη σταλεί στο pipeline ή αφέθηκαν για τον χειριστή
+        self._dispatched = set()
+        self._wake = threading.Event()
+        self._running = False
+        
+        self.counts = {'processed': 0, 'failed': 0, 'skipped': 0, 'manual': 0, 'error': 0}
+        self._counts_lock = threading.Lock()
+        self._in_progress = 0
+        self.started_at = None
+    
+    # ------------------------------------------------------------------
+    # Interface που περιμένουν οι controllers (στο GUI το παρέχει το AutoPyrseiaApp)
+    # ------------------------------------------------------------------
+    
+    def safe_schedule_ui_update(self, callback):
+        """Χωρίς Tk thread: το callback εκτελείται αμέσως"""
+        try:
+            callback()
+        except Exception as e:
+            print(f"Σφάλμα στο headless callback: {e}")
+    
+    def handle_intake_update(self):
+        """Η ουρά άλλαξε - ο dispatcher ελέγχει για σήματα έτοιμα για επεξεργασία"""
+        self._wake.set()
+    
+    def update_attachment_indicators(self):
+        pass
+    
+    # ------------------------------------------------------------------
+    # Κύριος βρόχος
+    # ------------------------------------------------------------------
+    
+    def run(self):
+        """Συνεχής επεξεργασία μέχρι Ctrl+C (ή μέχρι να μείνει αδρανής η ουρά)"""
+        print(f"autoPyrseia headless - αποτελέσματα στο {self.results_file}")
+        print(f"Κανόνες παραληπτών: {self.rules}")
+        
+        self.started_at = time.time()
+        self._running = True
+        self.signal_pipeline.start()
+        self.intake_queue.start()
+        self.file_watcher.start()
+        
+        idle_since = None
+        last_stats = time.time()
+        try:
+            while self._running:
+                self._wake.wait(timeout=1.0)
+                self._wake.clear()
+                self._dispatch_ready()
+                
+                now = time.time()
+                if self.stats_interval and now - last_stats >= self.stats_interval:
+                    last_stats = now
+                    self.print_stats()
+                
+                if self.exit_when_idle is not None:
+                    if self._is_idle():
+                        idle_since = idle_since or now
+                        if now - idle_since >= self.exit_when_idle:
+                            print(f"Καμία δραστηριότητα για {self.exit_when_idle:.0f}s - τερματισμός")
+                            break
+                    else:
+                        idle_since = None
+        except KeyboardInterrupt:
+            print("Διακοπή από τον χρήστη - ολοκλήρωση των σημάτων σε εξέλιξη...")
+        finally:
+            self.shutdown()
+        return 0 if self.counts['failed'] == 0 and self.counts['error'] == 0 else 1
+    
+    def shutdown(self, timeout=120.0):
+        """Τέλος παρακολούθησης και αναμονή για όσα σήματα είναι ήδη στο pipeline"""
+        self._running = False
+        self.file_watcher.stop()
+        
+        deadline = time.time() + timeout
+        while self._in_progress and time.time() < deadline:
+            time.sleep(0.2)
+        if self._in_progress:
+            print(f"Προσοχή: {self._in_progress} σήματα δεν ολοκληρώθηκαν - παραμένουν στην ουρά")
+        
+        self.config_manager.close()
+        self.print_stats()
+    
+    def _is_idle(self):
+        """Χωρίς σήματα σε εξέλιξη, στα στάδια ή στην ουρά προς επεξεργασία"""
+        if self._in_progress:
+            return False
+        if any(stats['depth'] or stats['in_flight'] for stats in self.signal_pipeline.get_stats()):
+            return False
+        if (self.path_manager.downloads_folder / IntakeQueue.SIGNAL_PDF).exists():
+            return False
+        return all(entry['id'] in self._dispatched or entry['status'] == IntakeQueue.PROCESSING
+                   for entry in self.intake_queue.entries())
+    
+    def _dispatch_ready(self):
+        """Τα σήματα που αναλύθηκαν περνούν στο pipeline με τη σειρά άφιξης"""
+        for entry in self.intake_queue.entries():
+            if entry['id'] in self._dispatched:
+                continue
+            
+            status = entry['status']
+            if status == IntakeQueue.PARSING or status == IntakeQueue.PROCESSING:
+                continue
+            
+            self._dispatched.add(entry['id'])
+            if status == IntakeQueue.ERROR:
+                # Όπως στο GUI: PDF που δεν αναλύεται αφαιρείται από την ουρά
+                self._log_result('error', entry, error=entry['error'])
+                self.intake_queue.remove(entry['id'])
+            elif status == IntakeQueue.MANUAL:
+                # Χωρίς κείμενο δεν υπάρχουν παραλήπτες - μένει για τον χειριστή στο GUI
+                self._log_result('manual', entry, error="Το PDF χρειάζεται χειροκίνητη εισαγωγή")
+            else:
+                self._submit(entry)
+    
+    def select_recipients(self, signal_data):
+        """Παραλήπτες του σήματος σύμφωνα με τους κανόνες"""
+        detected = signal_data.get('recipients', [])
+        if self.rules.get('known_recipients_only', True):
+            try:
+                detected = self.recipients_manager.filter_recipients(detected)
+            except Exception:
+                pass
+        
+        exclude = set(self.rules.get('exclude') or [])
+        if self.rules.get('skip_recipients_with_signal', True):
+            exclude.update(self.signal_pipeline.recipients_with_signal(signal_data))
+        
+        selected = []
+        for recipient in list(detected) + list(self.rules.get('always_include') or []):
+            if recipient not in exclude and recipient not in selected:
+                selected.append(recipient)
+        return [{'name': recipient, 'is_temporary': False} for recipient in selected]
+    
+    def _submit(self, entry):
+        signal_data = entry['signal_data']
+        selected_recipients = self.select_recipients(signal_data)
+        if not selected_recipients:
+            self._log_result('skipped', entry, error="Δεν επιλέχθηκαν παραλήπτες")
+            return
+        
+        self.intake_queue.set_status(entry['id'], IntakeQueue.PROCESSING)
+        job = {
+            'signal_data': signal_data,
+            'selected_recipients': selected_recipients,
+            'entry': entry,
+            'submitted_at': time.time(),
+            'confirm_missing': self._confirm_missing_attachments,
+            'on_success': self._job_succeeded,
+            'on_failure': self._job_failed
+        }
+        with self._counts_lock:
+            self._in_progress += 1
+        # Backpressure: ο dispatcher περιμένει όσο το στάδιο είναι γεμάτο
+        self.signal_pipeline.submit('attachments', job)
+    
+    # ------------------------------------------------------------------
+    # Callbacks των σταδίων
+    # ------------------------------------------------------------------
+    
+    def _confirm_missing_attachments(self, job, missing_attachments):
+        proceed = self.rules.get('missing_attachments', 'skip') == 'process'
+        self.signal_pipeline.resume_with_missing(job, proceed, block=True)
+    
+    def _job_succeeded(self, job):
+        entry = job['entry']
+        self._log_result('processed', entry, job=job)
+        # Ο φάκελος του σήματος έχει ήδη καθαριστεί από τον SignalManager
+        self.intake_queue.remove(entry['id'])
+        self._job_done()
+    
+    def _job_failed(self, job, message, cancelled=False):
+        entry = job['entry']
+        # Το σήμα μένει στην ουρά (στο GUI θα εμφανιστεί στον χειριστή)
+        self.intake_queue.set_status(entry['id'], IntakeQueue.READY)
+        self._log_result('skipped' if cancelled else 'failed', entry, job=job, error=message)
+        self._job_done()
+    
+    def _job_done(self):
+        with self._counts_lock:
+            self._in_progress -= 1
+        self._wake.set()
+    
+    # ------------------------------------------------------------------
+    # Αποτελέσματα
+    # ------------------------------------------------------------------
+    
+    def _log_result(self, status, entry, job=None, error=None):
+        """Μία γραμμή JSON ανά σήμα στο results_file"""
+        signal_data = entry.get('signal_data') or {}
+        record = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'status': status,
+            'intake_id': entry['id'],
+            'signal_id': signal_data.get('id'),
+            'fm': signal_data.get('fm'),
+            'serial_number': signal_data.get('serial_number'),
+            'attachments': len(signal_data.get('attachments', [])),
+            'error': error
+        }
+        
+        if job is not None:
+            record['recipients'] = [recipient['name'] for recipient in job.get('selected_recipients', [])]
+            if job.get('missing_attachments'):
+                record['missing_attachments'] = job['missing_attachments']
+            result = job.get('result') or {}
+            if result:
+                record['total_processed'] = result.get('total_processed')
+                record['failed_recipients'] = result.get('failed_recipients', [])
+            record['stage_seconds'] = {name: round(seconds, 4) for name, seconds in job.get('_timings', {}).items()}
+            if job.get('failed_stage'):
+                record['failed_stage'] = job['failed_stage']
+            record['pipeline_seconds'] = round(time.time() - job['submitted_at'], 4)
+        
+        if entry.get('claimed_at'):
+            record['latency_seconds'] = round(time.time() - entry['claimed_at'], 4)
+        
+        # Χρονικά σημεία (epoch) για μετρήσεις από έξω (signal_tester.py --replay)
+        for key in ('claimed_at', 'parsed_at'):
+            if entry.get(key):
+                record[key] = round(entry[key], 4)
+        record['completed_at'] = round(time.time(), 4)
+        
+        with self._counts_lock:
+            self.counts[status] = self.counts.get(status, 0) + 1
+        
+        line = json.dumps(record, ensure_ascii=False)
+        with self._results_lock:
+            try:
+                with open(self.results_file, 'a', encoding='utf-8') as f:
+                    f.write(line + "\n")
+            except Exception as e:
+                print(f"Σφάλμα στην καταγραφή αποτελέσματος: {e}")
+        
+        print(f"[{status}] #{entry['id']} {record['signal_id'] or ''} {error or ''}".rstrip())
+    
+    def print_stats(self):
+        """Σύνοψη throughput και μετρήσεις ανά στάδιο"""
+        elapsed = time.time() - self.started_at if self.started_at else 0.0
+        with self._counts_lock:
+            counts = dict(self.counts)
+        
+        rate = counts['processed'] / elapsed * 60 if elapsed > 0 else 0.0
+        print(f"Headless: {counts} σε {elapsed:.0f}s ({rate:.1f} σήματα/λεπτό)")
+        for stats in self.signal_pipeline.get_stats():
+            print(f"  {stats['name']:<12} ουρά {stats['depth']:>3}/{stats['capacity']:<3} "
+                  f"σε εξέλιξη {stats['in_flight']} ολοκληρώθηκαν {stats['processed']} "
+                  f"αποτυχίες {stats['failed']} - αναμονή p95 {stats['wait_p95'] * 1000:.0f} ms, "
+                  f"εκτέλεση p50/p95 {stats['service_p50'] * 1000:.0f}/{stats['service_p95'] * 1000:.0f} ms")
+        parse_stats = self.intake_queue.get_parse_stats()
+        print(f"  ανάλυση PDF: {parse_stats}")
+
+
+def run_headless(results_file=None, exit_when_idle=None, stats_interval=None):
+    """Εκκίνηση της headless λειτουργίας (επιστρέφει exit code)"""
+    app = HeadlessApp(results_file=results_file, exit_when_idle=exit_when_idle, stats_interval=stats_interval)
+    return app.run()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Backup Archiver για autoPyrseia
+Δημιουργός: Σωτήριος Μπαλατσιάς
+
+Συμπίεση παλιών φακέλων Α.Φ. του BACK UP DATA σε ένα αρχείο zip ανά φάκελο,
+με ευρετήριο (index.json) για επαναφορά μεμονωμένου σήματος ή αρχείου
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from app.utils.path_manager import get_path_manager
+from app.services.search_index import ARCHIVE_SEPARATOR
+
+# Ήδη συμπιεσμένα αρχεία - αποθηκεύονται χωρίς νέα συμπίεση
+_STORED_EXTENSIONS = {
+    '.pdf', '.zip', '.rar', '.7z', '.gz', '.jpg', '.jpeg', '.png', '.gif',
+    '.mp3', '.mp4', '.avi', '.mkv', '.mov', '.docx', '.xlsx', '.pptx'
+}
+
+
+class BackupArchiver:
+    """Συμπίεση και επαναφορά φακέλων αριθμού φακέλου (Α.Φ.) του backup"""
+
+    ARCHIVE_SUFFIX = ".zip"
+    INDEX_SUFFIX = ".index.json"
+    # Φάκελος που συμπιέστηκε και περιμένει διαγραφή (.<Α.Φ.>.compacted)
+    COMPACTED_SUFFIX = ".compacted"
+    DEFAULT_ARCHIVE_AFTER_DAYS = 90
+
+    def __init__(self, config_manager=None, search_index=None):
+        self.config_manager = config_manager
+        self.search_index = search_index
+        self.path_manager = get_path_manager()
+        self.backup_folder = self.path_manager.backup_folder
+        self._lock = threading.Lock()
+
+    def get_archive_after_days(self):
+        """Ηλικία (ημέρες) μετά την οποία ένας φάκελος Α.Φ. συμπιέζεται"""
+        if self.config_manager:
+            return self.config_manager.get_setting('archive_after_days', self.DEFAULT_ARCHIVE_AFTER_DAYS)
+        return self.DEFAULT_ARCHIVE_AFTER_DAYS
+
+    def get_archive_paths(self, pack_folder):
+        """Διαδρομές zip και ευρετηρίου για έναν φάκελο Α.Φ."""
+        pack_folder = Path(pack_folder)
+        archive_path = pack_folder.with_name(pack_folder.name + self.ARCHIVE_SUFFIX)
+        index_path = pack_folder.with_name(pack_folder.name + self.INDEX_SUFFIX)
+        return archive_path, index_path
+
+    def find_compactable_folders(self, max_age_days=None):
+        """Φάκελοι Α.Φ. παλαιότεροι από το όριο που δεν έχουν συμπιεστεί"""
+        if max_age_days is None:
+            max_age_days = self.get_archive_after_days()
+        cutoff = time.time() - max_age_days * 86400
+
+        folders = []
+        if not self.backup_folder.exists():
+            return folders
+
+        for recipient_entry in os.scandir(self.backup_folder):
+            if not recipient_entry.is_dir() or recipient_entry.name.startswith('.'):
+                continue
+            for pack_entry in os.scandir(recipient_entry.path):
+                if not pack_entry.is_dir() or pack_entry.name.startswith('.'):
+                    continue
+                if pack_entry.stat().st_mtime < cutoff:
+                    folders.append(Path(pack_entry.path))
+
+        return sorted(folders)
+
+    def compact(self, max_age_days=None):
+        """Συμπίεση όλων των παλιών φακέλων Α.Φ."""
+        results = {'compacted': 0, 'failed': 0, 'files': 0}
+
+        with self._lock:
+            self._remove_compacted_leftovers()
+            for pack_folder in self.find_compactable_folders(max_age_days):
+                file_count = self.compact_folder(pack_folder)
+                if file_count is None:
+                    results['failed'] += 1
+                else:
+                    results['compacted'] += 1
+                    results['files'] += file_count
+
+        if results['compacted'] or results['failed']:
+            print(f"Συμπίεση backup: {results['compacted']} φάκελοι, "
+                  f"{results['files']} αρχεία, {results['failed']} αποτυχίες")
+        return results
+
+    def compact_in_background(self, callback=None):
+        """Συμπίεση σε background thread (μία φορά την ημέρα)"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        if self.config_manager:
+            if not self.config_manager.get_setting('archive_compaction_enabled', True):
+                return
+            if self.config_manager.get_setting('last_archive_compaction') == today:
+                return
+
+        def compact_in_thread():
+            try:
+                results = self.compact()
+                if self.config_manager:
+                    self.config_manager.set_setting('last_archive_compaction', today)
+                if callback:
+                    callback(results)
+            except Exception as e:
+                print(f"Σφάλμα στη συμπίεση του backup: {e}")
+
+        threading.Thread(target=compact_in_thread, daemon=True).start()
+
+    def compact_folder(self, pack_folder):
+        """Συμπίεση ενός φακέλου Α.Φ. - επιστρέφει τον αριθμό αρχείων ή None"""
+        pack_folder = Path(pack_folder)
+        archive_path, index_path = self.get_archive_paths(pack_folder)
+
+        if archive_path.exists():
+            print(f"Υπάρχει ήδη αρχείο συμπίεσης για {pack_folder} - παράλειψη")
+            return None
+
+        temp_archive = archive_path.with_name(archive_path.name + ".tmp")
+        index = {
+            'version': 1,
+            'recipient': pack_folder.parent.name,
+            'pack': pack_folder.name,
+            'archive': archive_path.name,
+            'created': datetime.now().isoformat(),
+            'source_mtime': pack_folder.stat().st_mtime,
+            'signals': {},
+            'files': []
+        }
+
+        committed = False
+        try:
+            with zipfile.ZipFile(temp_archive, 'w', allowZip64=True) as zf:
+                for file_path in sorted(pack_folder.rglob("*")):
+                    if not file_path.is_file():
+                        continue
+
+                    member = file_path.relative_to(pack_folder).as_posix()
+                    compress_type = zipfile.ZIP_STORED if file_path.suffix.lower() in _STORED_EXTENSIONS \
+                        else zipfile.ZIP_DEFLATED
+                    zf.write(file_path, member, compress_type=compress_type)
+
+                    file_entry = {'member': member, 'size': file_path.stat().st_size}
+                    parts = member.split('/')
+                    if len(parts) == 1:
+                        # Αρχεία στη ρίζα του Α.Φ. (π.χ. PDF λίστας εξαγωγής)
+                        index['files'].append(file_entry)
+                        continue
+
+                    signal = index['signals'].setdefault(parts[0], {'info': {}, 'files': []})
+                    signal['files'].append(file_entry)
+                    if len(parts) == 2 and parts[1] == "signal_info.json":
+                        try:
+                            with open(file_path, 'r', encoding='utf-8') as f:
+                                signal['info'] = json.load(f)
+                        except Exception:
+                            pass
+
+            # Επαλήθευση πριν διαγραφούν τα πρωτότυπα
+            if not self._verify_archive(temp_archive, index):
+                raise IOError("Η επαλήθευση του αρχείου συμπίεσης απέτυχε")
+
+            temp_index = index_path.with_name(index_path.name + ".tmp")
+            with open(temp_index, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, indent=2)
+            os.replace(temp_index, index_path)
+            os.replace(temp_archive, archive_path)
+            # Από εδώ το επαληθευμένο αρχείο συμπίεσης είναι το πρωτότυπο - δεν διαγράφεται ποτέ
+            committed = True
+
+            self._remove_compacted_folder(pack_folder)
+
+            # Τα σήματα μένουν αναζητήσιμα μέσα στο αρχείο συμπίεσης
+            if self.search_index:
+                for folder_name in index['signals']:
+                    self.search_index.relocate(pack_folder / folder_name,
+                                               f"{archive_path}{ARCHIVE_SEPARATOR}{folder_name}", 'ARCHIVE')
+                self.search_index.remove(pack_folder)
+
+            return sum(len(s['files']) for s in index['signals'].values()) + len(index['files'])
+
+        except Exception as e:
+            print(f"Σφάλμα στη συμπίεση του {pack_folder}: {e}")
+            if temp_archive.exists():
+                temp_archive.unlink()
+            if not committed:
+                # Το αρχείο συμπίεσης δεν ολοκληρώθηκε - ο φάκελος μένει όπως ήταν
+                index_path.with_name(index_path.name + ".tmp").unlink(missing_ok=True)
+                index_path.unlink(missing_ok=True)
+            return None
+
+    def _remove_compacted_folder(self, pack_folder):
+        """Διαγραφή του φακέλου μετά τη συμπίεση (πρώτα μετονομασία, ώστε μισή διαγραφή να μη φαίνεται ως Α.Φ.)"""
+        leftover = pack_folder.with_name(f".{pack_folder.name}{self.COMPACTED_SUFFIX}")
+        try:
+            os.rename(pack_folder, leftover)
+        except OSError as e:
+            print(f"Ο φάκελος {pack_folder} συμπιέστηκε αλλά δεν μετακινήθηκε για διαγραφή: {e}")
+            return
+
+        try:
+            shutil.rmtree(leftover)
+        except OSError as e:
+            print(f"Ο φάκελος {leftover} θα διαγραφεί στην επόμενη συμπίεση: {e}")
+
+    def _remove_compacted_leftovers(self):
+        """Φάκελοι που συμπιέστηκαν αλλά η διαγραφή τους δεν ολοκληρώθηκε (π.χ. κλειδωμένο αρχείο)"""
+        if not self.backup_folder.exists():
+            return
+        for recipient_entry in os.scandir(self.backup_folder):
+            if not recipient_entry.is_dir() or recipient_entry.name.startswith('.'):
+                continue
+            for entry in os.scandir(recipient_entry.path):
+                if entry.is_dir() and entry.name.startswith('.') and entry.name.endswith(self.COMPACTED_SUFFIX):
+                    try:
+                        shutil.rmtree(entry.path)
+                    except OSError as e:
+                        print(f"Σφάλμα στη διαγραφή του {entry.path}: {e}")
+
+    def _verify_archive(self, archive_path, index):
+        """Έλεγχος CRC και μεγεθών όλων των αρχείων του zip"""
+        expected = {entry['member']: entry['size'] for entry in index['files']}
+        for signal in index['signals'].values():
+            expected.update({entry['member']: entry['size'] for entry in signal['files']})
+
+        with zipfile.ZipFile(archive_path, 'r') as zf:
+            actual = {info.filename: info.file_size for info in zf.infolist()}
+            if actual != expected:
+                return False
+            return zf.testzip() is None
+
+    def load_index(self, archive_path):
+        """Φόρτωση του ευρετηρίου ενός αρχείου συμπίεσης"""
+        archive_path = Path(archive_path)
+        index_path = archive_path.with_name(archive_path.name[:-len(self.ARCHIVE_SUFFIX)] + self.INDEX_SUFFIX)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Σφάλμα στην ανάγνωση ευρετηρίου {index_path}: {e}")
+            return None
+
+    def list_archives(self, recipient_name=None):
+        """Λίστα αρχείων συμπίεσης (διαδρομή zip, ευρετήριο)"""
+        archives = []
+        if not self.backup_folder.exists():
+            return archives
+
+        pattern = f"*{self.INDEX_SUFFIX}"
+        recipient_folders = [self.backup_folder / recipient_name] if recipient_name else \
+            [p for p in self.backup_folder.iterdir() if p.is_dir()]
+
+        for recipient_folder in recipient_folders:
+            if not recipient_folder.exists():
+                continue
+            for index_path in sorted(recipient_folder.glob(pattern)):
+                archive_path = index_path.with_name(index_path.name[:-len(self.INDEX_SUFFIX)] + self.ARCHIVE_SUFFIX)
+                if archive_path.exists():
+                    archives.append(archive_path)
+
+        return archives
+
+    def find_archived_pack(self, recipient_name, pack_name):
+        """Αρχείο συμπίεσης για συγκεκριμένο φάκελο Α.Φ. (ή None)"""
+        archive_path, index_path = self.get_archive_paths(self.backup_folder / recipient_name / pack_name)
+        if archive_path.exists() and index_path.exists():
+            return archive_path
+        return None
+
+    def find_signal(self, signal_id):
+        """Αναζήτηση σήματος στα ευρετήρια - [(archive_path, signal_folder, info)]"""
+        matches = []
+        for archive_path in self.list_archives():
+            index = self.load_index(archive_path)
+            if not index:
+                continue
+            for folder_name, signal in index['signals'].items():
+                if folder_name == signal_id or signal.get('info', {}).get('id') == signal_id:
+                    matches.append((archive_path, folder_name, signal.get('info', {})))
+        return matches
+
+    def restore_signal(self, archive_path, signal_folder_name, target_folder):
+        """Επαναφορά ενός σήματος από το αρχείο χωρίς αποσυμπίεση όλου του πακέτου"""
+        index = self.load_index(archive_path)
+        if not index or signal_folder_name not in index['signals']:
+            return None
+
+        target_signal_folder = Path(target_folder) / signal_folder_name
+        members = [entry['member'] for entry in index['signals'][signal_folder_name]['files']]
+
+        with zipfile.ZipFile(archive_path, 'r') as zf:
+            for member in members:
+                relative = member.split('/', 1)[1]
+                self._extract_member(zf, member, target_signal_folder / relative)
+
+        return target_signal_folder
+
+    def restore_file(self, archive_path, member, target_path):
+        """Επαναφορά ενός αρχείου από το αρχείο συμπίεσης"""
+        with zipfile.ZipFile(archive_path, 'r') as zf:
+            self._extract_member(zf, member, Path(target_path))
+        return Path(target_path)
+
+    def _extract_member(self, zf, member, target_path):
+        """Εξαγωγή ενός member σε συγκεκριμένη διαδρομή"""
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        with zf.open(member) as src, open(target_path, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 1024 * 1024)
+
+    def delete_archive(self, archive_path):
+        """Διαγραφή αρχείου συμπίεσης και ευρετηρίου"""
+        archive_path = Path(archive_path)
+        index_path = archive_path.with_name(archive_path.name[:-len(self.ARCHIVE_SUFFIX)] + self.INDEX_SUFFIX)
+        archive_path.unlink(missing_ok=True)
+        index_path.unlink(missing_ok=True)
@@ -5,22 +5,50 @@ Config Manager για autoPyrseia
 Δημιουργός: Σωτήριος Μπαλατσιάς
 
 Διαχειρίζεται τις ρυθμίσεις της εφαρμογής
+
+Οι αναγνώσεις γίνονται μόνο από τη μνήμη. Οι αλλαγές σημαδεύουν τη μνήμη ως
+"dirty" και ένα background thread γράφει το config.json (write-behind),
+μαζεύοντας όσες αλλαγές γίνουν μέσα σε FLUSH_DELAY σε μία εγγραφή.
+Η εγγραφή γίνεται σε προσωρινό αρχείο και os.replace, ώστε μια διακοπή να
+μην αφήνει μισό config.json. Ό,τι εκκρεμεί γράφεται στο κλείσιμο (flush).
 """
 
+import atexit
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from app.utils.path_manager import get_path_manager
 
 class ConfigManager:
+    # Αλλαγές μέσα σε αυτό το διάστημα (δευτερόλεπτα) γράφονται μαζί
+    FLUSH_DELAY = 0.5
+    
+    # Προσπάθειες του os.replace (στα Windows το αρχείο μπορεί να είναι στιγμιαία ανοιχτό)
+    REPLACE_ATTEMPTS = 5
+    
     def __init__(self):
         # Use the centralized path manager instead of calculating paths manually
         self.path_manager = get_path_manager()
         self.config_file = self.path_manager.project_root / "config.json"
         
-        print(f"ConfigManager using config file: {self.config_file}")
+        # Write-behind κατάσταση
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._flush_condition = threading.Condition(self._lock)
+        self._dirty = False
+        self._dirty_since = None
+        self._flush_immediately = False
+        self._flusher = None
+        self._closed = False
+        self.writes = 0
         
         self.load_config()
+        
+        # Ό,τι δεν έχει γραφτεί γράφεται και αν η διεργασία τερματίσει χωρίς close()
+        atexit.register(self.flush)
     
     def load_config(self):
         """Φόρτωση των ρυθμίσεων"""
@@ -42,7 +70,9 @@ class ConfigManager:
                     "last_usb_path": "",
                     "auto_process": True,
                     "watch_downloads": True,
-                    "backup_enabled": True
+                    "backup_enabled": True,
+                    "archive_compaction_enabled": True,
+                    "archive_after_days": 90
                 }
                 self.save_config()
         except Exception as e:
@@ -61,13 +91,106 @@ class ConfigManager:
                 self.config["username_history"] = {}
             self.save_config()
     
-    def save_config(self):
-        """Αποθήκευση των ρυθμίσεων"""
+    def save_config(self, immediate=False):
+        """Αποθήκευση των ρυθμίσεων (write-behind - επιστρέφει αμέσως)
+        
+        immediate=True: ο flusher γράφει χωρίς να περιμένει άλλες αλλαγές
+        (π.χ. αριθμός φακέλου, που δεν πρέπει να χαθεί).
+        """
+        with self._lock:
+            if not self._dirty:
+                self._dirty = True
+                self._dirty_since = time.monotonic()
+            if immediate:
+                self._flush_immediately = True
+            
+            closed = self._closed
+            if not closed:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(target=self._flush_worker, name="config-flusher", daemon=True)
+                    self._flusher.start()
+                self._flush_condition.notify()
+        
+        if closed:
+            # Μετά το close() δεν υπάρχει flusher - εγγραφή εδώ
+            self.flush()
+    
+    def _flush_worker(self):
+        """Γράφει το config.json όταν υπάρχουν αλλαγές, μία φορά ανά FLUSH_DELAY"""
+        while True:
+            with self._lock:
+                while not self._dirty and not self._closed:
+                    self._flush_condition.wait()
+                if self._closed:
+                    return
+                
+                # Συγκέντρωση αλλαγών: αναμονή μέχρι να περάσει το FLUSH_DELAY από την πρώτη
+                while self._dirty and not self._flush_immediately and not self._closed:
+                    remaining = self.FLUSH_DELAY - (time.monotonic() - self._dirty_since)
+                    if remaining <= 0:
+                        break
+                    self._flush_condition.wait(remaining)
+            
+            self.flush()
+    
+    def flush(self):
+        """Άμεση εγγραφή των αλλαγών που εκκρεμούν (αν υπάρχουν)"""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                # Στιγμιότυπο υπό το lock - οι setters μπορούν να συνεχίσουν όσο γράφουμε
+                content = json.dumps(self.config, ensure_ascii=False, indent=2)
+                self._dirty = False
+                self._dirty_since = None
+                self._flush_immediately = False
+            
+            if self._write_atomic(content):
+                self.writes += 1
+                return True
+            
+            # Αποτυχία: οι αλλαγές μένουν για την επόμενη προσπάθεια
+            with self._lock:
+                if not self._dirty:
+                    self._dirty = True
+                    self._dirty_since = time.monotonic()
+            return False
+    
+    def _write_atomic(self, content):
+        """Εγγραφή σε προσωρινό αρχείο και os.replace στο config.json"""
+        temp_file = self.config_file.with_name(self.config_file.name + ".tmp")
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, ensure_ascii=False, indent=2)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            for attempt in range(self.REPLACE_ATTEMPTS):
+                try:
+                    os.replace(temp_file, self.config_file)
+                    return True
+                except PermissionError:
+                    if attempt == self.REPLACE_ATTEMPTS - 1:
+                        raise
+                    time.sleep(0.05 * (attempt + 1))
         except Exception as e:
             print(f"Σφάλμα στην αποθήκευση ρυθμίσεων: {e}")
+            try:
+                temp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
+        return False
+    
+    def close(self):
+        """Κλείσιμο: εγγραφή ό,τι εκκρεμεί και τερματισμός του flusher"""
+        with self._lock:
+            self._closed = True
+            self._flush_condition.notify_all()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=2.0)
+        self._flusher = None
+        return self.flush()
     
     def get_next_file_number(self):
         """Λήψη του επόμενου αριθμού φακέλου"""
@@ -75,23 +198,26 @@ class ConfigManager:
     
     def increment_file_number(self):
         """Αύξηση του αριθμού φακέλου κατά 1"""
-        current = self.get_next_file_number()
-        self.config["file_number"] = current + 1
-        self.save_config()
+        with self._lock:
+            current = self.get_next_file_number()
+            self.config["file_number"] = current + 1
+            self.save_config(immediate=True)
         return current
     
     def decrement_file_number(self):
         """Μείωση του αριθμού φακέλου κατά 1"""
-        current = self.get_next_file_number()
-        if current > 1:  # Prevent going below 1
-            self.config["file_number"] = current - 1
-            self.save_config()
+        with self._lock:
+            current = self.get_next_file_number()
+            if current > 1:  # Prevent going below 1
+                self.config["file_number"] = current - 1
+                self.save_config(immediate=True)
         return current
     
     def set_file_number(self, file_number):
         """Ορισμός του αριθμού φακέλου"""
-        self.config["file_number"] = file_number
-        self.save_config()
+        with self._lock:
+            self.config["file_number"] = file_number
+            self.save_config(immediate=True)
     
     def get_username(self):
         """Λήψη του ονόματος χρήστη"""
@@ -100,7 +226,9 @@ class ConfigManager:
     def set_username(self, username):
         """Ορισμός του ονόματος χρήστη με ενημέρωση ιστορικού"""
         username = username.strip()
-        if username:
+        if not username:
+            return
+        with self._lock:
             self.config["username"] = username
             # Update username history with current timestamp
             if "username_history" not in self.config:
@@ -116,10 +244,11 @@ class ConfigManager:
             return []
         
         # Clean old usernames first
-        self._cleanup_old_usernames()
+        with self._lock:
+            self._cleanup_old_usernames()
+            history = dict(self.config.get("username_history", {}))
         
         # Sort by most recent usage (reverse chronological)
-        history = self.config.get("username_history", {})
         suggestions = []
         
         for username, timestamp_str in history.items():
@@ -168,8 +297,9 @@ class ConfigManager:
     
     def set_organization_identity(self, org_identity):
         """Ορισμός της ταυτότητας του οργανισμού"""
-        self.config["organization_identity"] = org_identity
-        self.save_config()
+        with self._lock:
+            self.config["organization_identity"] = org_identity
+            self.save_config()
     
     def get_last_usb_path(self):
         """Λήψη της τελευταίας διαδρομής USB"""
@@ -177,8 +307,9 @@ class ConfigManager:
     
     def set_last_usb_path(self, path):
         """Ορισμός της τελευταίας διαδρομής USB"""
-        self.config["last_usb_path"] = path
-        self.save_config()
+        with self._lock:
+            self.config["last_usb_path"] = path
+            self.save_config()
     
     def get_setting(self, key, default=None):
         """Λήψη ρύθμισης"""
@@ -186,5 +317,6 @@ class ConfigManager:
     
     def set_setting(self, key, value):
         """Ορισμός ρύθμισης"""
-        self.config[key] = value
-        self.save_config()
+        with self._lock:
+            self.config[key] = value
+            self.save_config()
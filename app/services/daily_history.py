@@ -1,84 +1,196 @@
 """
 Multi-Day Daily History Manager - Keeps history for all days
+
+Το ιστορικό γράφεται σε append-only journal: ένα αρχείο JSONL ανά ημέρα
+(history/YYYY-MM-DD.jsonl), μία γραμμή ανά εγγραφή. Κάθε νέα εγγραφή είναι
+ένα append - όχι επανεγγραφή όλου του ιστορικού. Μόνο η σημερινή ημέρα
+φορτώνεται στην εκκίνηση, οι υπόλοιπες όταν ο χρήστης πλοηγηθεί σε αυτές.
+Οι παλιές ημέρες διαγράφονται ως ολόκληρα αρχεία.
 """
 import json
 import os
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from app.utils.path_manager import get_path_manager
+
 
 class DailyHistoryManager:
     """Multi-day history manager - preserves all days' history"""
     
-    def __init__(self):
-        self.history_file = Path("history.json")
+    # Ημέρες που κρατιούνται (τα παλαιότερα αρχεία διαγράφονται)
+    RETENTION_DAYS = 30
+    
+    # Έλεγχος διατήρησης κάθε τόσες εγγραφές
+    PRUNE_EVERY = 10
+    
+    SEGMENT_SUFFIX = ".jsonl"
+    
+    def __init__(self, history_folder=None):
+        project_root = get_path_manager().project_root
+        self.history_folder = Path(history_folder) if history_folder else project_root / "history"
+        self.legacy_history_file = project_root / "history.json"
+        # Παλαιότερες εκδόσεις έγραφαν το history.json στον τρέχοντα φάκελο εργασίας
+        self.legacy_history_files = list(dict.fromkeys([self.legacy_history_file, Path("history.json").absolute()]))
         self.today = datetime.now().strftime("%Y-%m-%d")
         self.current_viewing_date = self.today
         
-        # Load all history data
-        self.all_history = self._load_all_history()
+        # Το στάδιο record του pipeline γράφει από background thread
+        self._lock = threading.RLock()
+        
+        # Εγγραφές ανά ημέρα που έχουν ήδη φορτωθεί (οι παλιές ημέρες δεν αλλάζουν)
+        self._days = {}
+        self._segment_dates = set()
+        self._appended = 0
+        
+        self.history_folder.mkdir(parents=True, exist_ok=True)
+        
+        # Μία φορά: το παλιό history.json γίνεται αρχεία ημερών
+        for legacy_history_file in self.legacy_history_files:
+            self._migrate_legacy_history(legacy_history_file)
         
         # Clean up old history (keep only last 30 days)
         self._cleanup_old_history()
         
-        # Ensure today's entry exists
-        if self.today not in self.all_history:
-            self.all_history[self.today] = []
-    
-    def _load_all_history(self):
-        """Load all historical data from file"""
-        if not self.history_file.exists():
-            return {}
+        # Ημέρες με ιστορικό (από τα ονόματα των αρχείων - χωρίς ανάγνωση)
+        self._segment_dates = {path.stem for path in self.history_folder.glob(f"*{self.SEGMENT_SUFFIX}")}
         
-        try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        # Μόνο η σημερινή ημέρα φορτώνεται τώρα
+        self._load_day(self.today)
+    
+    def _segment_path(self, date):
+        return self.history_folder / f"{date}{self.SEGMENT_SUFFIX}"
+    
+    def _load_day(self, date):
+        """Εγγραφές μιας ημέρας (από τη μνήμη ή από το αρχείο της)"""
+        with self._lock:
+            if date in self._days:
+                return self._days[date]
             
-            # Check if this is old format (single day)
-            if 'date' in data and 'entries' in data:
-                # Convert old format to new multi-day format
-                old_date = data['date']
-                old_entries = data['entries']
-                return {old_date: old_entries} if old_entries else {}
+            entries = []
+            damaged = False
+            segment = self._segment_path(date)
+            if segment.exists():
+                try:
+                    with open(segment, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                    for line in content.splitlines():
+                        if not line.strip():
+                            continue
+                        try:
+                            entries.append(json.loads(line))
+                        except ValueError:
+                            # Μισή γραμμή από διακοπή κατά την εγγραφή
+                            damaged = True
+                    if content and not content.endswith("\n"):
+                        damaged = True
+                except Exception as e:
+                    print(f"Error loading history for {date}: {e}")
             
-            # New format - return as is
-            return data if isinstance(data, dict) else {}
+            # Το επόμενο append δεν πρέπει να κολλήσει σε μισή γραμμή
+            if damaged:
+                print(f"Compacting damaged history segment {segment.name}")
+                self._write_segment(date, entries)
             
+            self._days[date] = entries
+            return entries
+    
+    def _write_segment(self, date, entries):
+        """Επανεγγραφή ενός αρχείου ημέρας (προσωρινό αρχείο και os.replace)"""
+        segment = self._segment_path(date)
+        temp_file = segment.with_name(segment.name + ".tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_file, segment)
         except Exception as e:
-            print(f"Error loading history: {e}")
-            return {}
+            print(f"Error saving history for {date}: {e}")
+            temp_file.unlink(missing_ok=True)
+    
+    def _append_entry(self, entry):
+        """Προσθήκη μίας εγγραφής στο journal της σημερινής ημέρας"""
+        with self._lock:
+            entries = self._load_day(self.today)
+            entries.append(entry)
+            try:
+                with open(self._segment_path(self.today), 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._segment_dates.add(self.today)
+            except Exception as e:
+                print(f"Error saving history: {e}")
+            
+            # Periodically cleanup old history (every 10th entry to avoid performance impact)
+            self._appended += 1
+            if self._appended % self.PRUNE_EVERY == 0:
+                self._cleanup_old_history()
+    
+    @staticmethod
+    def _entry_key(date, entry):
+        """Ταυτότητα εγγραφής για τη συγχώνευση ιστορικού"""
+        return (entry.get('date', date), entry.get('time'), entry.get('type'),
+                entry.get('signal_id'), entry.get('recipient'))
     
-    def _save_all_history(self):
-        """Save all history data to file"""
+    def _migrate_legacy_history(self, legacy_history_file):
+        """Μεταφορά του history.json (όλες οι ημέρες σε ένα αρχείο) σε αρχεία ημερών"""
+        if not legacy_history_file.exists():
+            return
+        
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.all_history, f, ensure_ascii=False, indent=2)
+            with open(legacy_history_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            # Check if this is old format (single day)
+            if isinstance(data, dict) and 'date' in data and 'entries' in data:
+                data = {data['date']: data['entries']}
+            if not isinstance(data, dict):
+                data = {}
+            
+            for date, entries in data.items():
+                if not entries:
+                    continue
+                # Αρχείο ημέρας που υπάρχει ήδη (από άλλο history.json ή από μεταφορά
+                # που διακόπηκε): συγχώνευση χωρίς διπλές εγγραφές
+                existing = self._load_day(date) if self._segment_path(date).exists() else []
+                seen = {self._entry_key(date, entry) for entry in existing}
+                added = [entry for entry in entries if self._entry_key(date, entry) not in seen]
+                if not added:
+                    continue
+                merged = sorted(existing + added, key=lambda entry: entry.get('time', ''))
+                self._write_segment(date, merged)
+                self._days[date] = merged
+            
+            # Το παλιό αρχείο κρατιέται ως αντίγραφο
+            os.replace(legacy_history_file,
+                       legacy_history_file.with_name(legacy_history_file.name + ".migrated"))
+            print(f"History migrated from {legacy_history_file} to {self.history_folder} ({len(data)} days)")
+        
         except Exception as e:
-            print(f"Error saving history: {e}")
+            print(f"Error migrating history: {e}")
     
     def _cleanup_old_history(self):
-        """Remove history entries older than 30 days"""
+        """Remove history days older than 30 days (διαγραφή ολόκληρων αρχείων)"""
         try:
-            cutoff_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-            
-            # Get all dates in history
-            dates_to_remove = []
-            for date_str in self.all_history.keys():
-                if date_str < cutoff_date:
-                    dates_to_remove.append(date_str)
+            cutoff_date = (datetime.now() - timedelta(days=self.RETENTION_DAYS)).strftime("%Y-%m-%d")
             
-            # Remove old dates
-            removed_count = 0
-            for date_str in dates_to_remove:
-                removed_entries = len(self.all_history[date_str])
-                del self.all_history[date_str]
-                removed_count += removed_entries
+            removed_days = 0
+            with self._lock:
+                for segment in self.history_folder.glob(f"*{self.SEGMENT_SUFFIX}"):
+                    date_str = segment.stem
+                    if date_str < cutoff_date:
+                        segment.unlink(missing_ok=True)
+                        self._days.pop(date_str, None)
+                        self._segment_dates.discard(date_str)
+                        removed_days += 1
             
-            # Save cleaned history if anything was removed
-            if removed_count > 0:
-                print(f"Cleaned up {removed_count} old history entries from {len(dates_to_remove)} days")
-                self._save_all_history()
-                
+            if removed_days > 0:
+                print(f"Cleaned up history from {removed_days} days")
+        
         except Exception as e:
             print(f"Error during history cleanup: {e}")
     
@@ -92,16 +204,7 @@ class DailyHistoryManager:
             'fm': fm,
             'recipients': recipients if isinstance(recipients, str) else ', '.join(recipients)
         }
-        
-        if self.today not in self.all_history:
-            self.all_history[self.today] = []
-        
-        self.all_history[self.today].append(entry)
-        self._save_all_history()
-        
-        # Periodically cleanup old history (every 10th entry to avoid performance impact)
-        if len(self.all_history[self.today]) % 10 == 0:
-            self._cleanup_old_history()
+        self._append_entry(entry)
     
     def add_extracted_recipient(self, recipient, signal_count, file_number=None):
         """Add an extracted recipient entry to today's history"""
@@ -113,28 +216,28 @@ class DailyHistoryManager:
             'signal_count': signal_count,
             'file_number': file_number
         }
-        
-        if self.today not in self.all_history:
-            self.all_history[self.today] = []
-        
-        self.all_history[self.today].append(entry)
-        self._save_all_history()
+        self._append_entry(entry)
     
     def get_processed_signals(self, date=None):
         """Get processed signals for specified date (default: current viewing date)"""
         target_date = date or self.current_viewing_date
-        entries = self.all_history.get(target_date, [])
-        return [entry for entry in entries if entry.get('type') == 'processed']
+        with self._lock:
+            entries = self._load_day(target_date)
+            return [entry for entry in entries if entry.get('type') == 'processed']
     
     def get_extracted_recipients(self, date=None):
         """Get extracted recipients for specified date (default: current viewing date)"""
         target_date = date or self.current_viewing_date
-        entries = self.all_history.get(target_date, [])
-        return [entry for entry in entries if entry.get('type') == 'extracted']
+        with self._lock:
+            entries = self._load_day(target_date)
+            return [entry for entry in entries if entry.get('type') == 'extracted']
     
     def get_available_dates(self):
         """Get list of all available dates with history, sorted newest first"""
-        dates = [date for date, entries in self.all_history.items() if entries]
+        with self._lock:
+            dates = set(self._segment_dates)
+            # Αρχεία που άδειασαν μετά από επισκευή δεν εμφανίζονται
+            dates.difference_update(date for date, entries in self._days.items() if not entries)
         return sorted(dates, reverse=True)
     
     def set_viewing_date(self, date):
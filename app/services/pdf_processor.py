@@ -7,7 +7,6 @@ PDF Processor για autoPyrseia
 Επεξεργάζεται τα PDF σημάτων και εξάγει τις απαραίτητες πληροφορίες
 """
 
-import fitz  # PyMuPDF
 import re
 import os
 import hashlib
@@ -15,21 +14,28 @@ import subprocess
 import platform
 from pathlib import Path
 from app.utils.path_manager import get_path_manager
+from app.utils.downloads_snapshot import get_downloads_snapshot, get_folder_snapshot
+from app.utils.progress_manager import ProgressTracker
 
 class PDFProcessor:
     def __init__(self):
         # Use the centralized path manager instead of calculating paths manually
         self.path_manager = get_path_manager()
         self.downloads_path = self.path_manager.downloads_folder
-        
-        print(f"PDFProcessor using downloads folder: {self.downloads_path}")
     
-    def process_pdf(self, pdf_path):
-        """Επεξεργασία του PDF και εξαγωγή πληροφοριών"""
+    def process_pdf(self, pdf_path, open_for_manual_input=True, progress_callback=None):
+        """Επεξεργασία του PDF και εξαγωγή πληροφοριών
+        
+        progress_callback: δέχεται ProgressEvent - ένα βήμα ανά σελίδα και ένα για την ανάλυση.
+        """
         try:
+            # PyMuPDF φορτώνεται στο πρώτο PDF και όχι στην εκκίνηση
+            import fitz  # PyMuPDF
+            
             # Προσπάθεια εξαγωγής κειμένου με την κλασική μέθοδο
             doc = fitz.open(pdf_path)
             full_text = ""
+            tracker = ProgressTracker(progress_callback, total_steps=doc.page_count + 1)
             
             # Εξαγωγή κειμένου από όλες τις σελίδες με αφαίρεση headers/footers
             for page_num in range(doc.page_count):
@@ -40,6 +46,7 @@ class PDFProcessor:
                 page_text = self.extract_text_without_headers_footers(text_dict, page.rect)
                 
                 full_text += page_text + "\n"
+                tracker.advance(f"Ανάγνωση σελίδας {page_num + 1}/{doc.page_count}...")
             
             doc.close()
             
@@ -47,18 +54,19 @@ class PDFProcessor:
             if len(full_text.strip()) > 50:  # Meaningful content threshold
 
                 signal_data = self.extract_signal_info(full_text, pdf_path)
+                # Κείμενο σώματος για το ευρετήριο αναζήτησης (δεν αποθηκεύεται στο JSON)
+                signal_data['full_text'] = full_text
+                tracker.advance("Ανάλυση σήματος ολοκληρώθηκε")
                 return signal_data
             
+            tracker.advance("Δεν βρέθηκε κείμενο - απαιτείται χειροκίνητη εισαγωγή")
+            
             # Αν δεν βρέθηκε κείμενο, άνοιγμα PDF και αίτηση για manual input
 
             
             # Άνοιγμα του PDF ώστε ο χρήστης να μπορεί να το δει
-            pdf_opened = self.open_pdf_with_default_program(pdf_path)
-            if pdf_opened:
-                pass
-
-            else:
-                pass
+            if open_for_manual_input:
+                self.open_pdf_with_default_program(pdf_path)
             # Λήψη όλων των αρχείων από downloads (εκτός από pyrseia_server.pdf)
             attachment_files = self.get_all_downloads_files()
             
@@ -98,34 +106,31 @@ class PDFProcessor:
         except Exception as e:
             return False
     
-    def get_all_downloads_files(self):
-        """Λήψη όλων των αρχείων από το downloads folder (εκτός από pyrseia_server.pdf)"""
+    def get_all_downloads_files(self, folder=None):
+        """Λήψη όλων των αρχείων από το downloads folder (εκτός από pyrseia_server.pdf)
+        
+        folder: φάκελος του σήματος στην ουρά intake (προεπιλογή το downloads).
+        """
         try:
-            if not self.downloads_path.exists():
-                return []
-            
-            all_files = []
-            for file_path in self.downloads_path.iterdir():
-                if file_path.is_file() and file_path.name != 'pyrseia_server.pdf':
-                    all_files.append(file_path.name)
-            
-
+            snapshot = get_folder_snapshot(folder) if folder else get_downloads_snapshot()
+            all_files = [name for name in snapshot.names() if name != 'pyrseia_server.pdf']
             return sorted(all_files)
             
         except Exception as e:
             print(f"❌ Σφάλμα στη λήψη αρχείων: {e}")
             return []
     
-    def create_manual_signal_data(self, signal_id, fm, pdf_path):
+    def create_manual_signal_data(self, signal_id, fm, pdf_path, source_folder=None):
         """Δημιουργία signal data με manual input"""
         try:
-            # Λήψη όλων των αρχείων από downloads (εκτός από pyrseia_server.pdf)
-            attachment_files = self.get_all_downloads_files()
+            # Λήψη όλων των αρχείων από downloads ή τον φάκελο της ουράς (εκτός από pyrseia_server.pdf)
+            attachment_files = self.get_all_downloads_files(source_folder)
             
             # Προσπάθεια εξαγωγής του πλήρους περιεχομένου από το PDF για το serial number
             full_content = f"{signal_id}_{fm}"  # Fallback αν δεν μπορέσουμε να διαβάσουμε το PDF
             try:
                 if pdf_path and os.path.exists(pdf_path):
+                    import fitz  # PyMuPDF
                     doc = fitz.open(pdf_path)
                     pdf_text = ""
                     for page_num in range(doc.page_count):
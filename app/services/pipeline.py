@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Processing pipeline για autoPyrseia
+Δημιουργός: Σωτήριος Μπαλατσιάς
+
+Στάδια επεξεργασίας συνδεδεμένα με φραγμένες ουρές (bounded queues).
+Κάθε στάδιο έχει δικούς του workers. Όταν ένα στάδιο γεμίσει, το
+προηγούμενο περιμένει (backpressure) αντί να συσσωρεύει δουλειά στη μνήμη.
+Για κάθε στάδιο κρατιούνται βάθος ουράς και χρόνοι αναμονής/εκτέλεσης.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+# Τελευταίες μετρήσεις ανά στάδιο για τα percentiles
+LATENCY_WINDOW = 200
+
+_STOP = object()
+
+
+def _percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class PipelineStage:
+    """Στάδιο με φραγμένη ουρά εισόδου και σταθερό αριθμό workers
+    
+    Ο handler δέχεται ένα job (dict) και επιστρέφει το job για το επόμενο
+    στάδιο ή None αν το job τελείωσε (ή θα συνεχίσει αργότερα).
+    """
+    
+    def __init__(self, name, handler, workers=1, capacity=8):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.capacity = max(1, int(capacity))
+        self.next_stage = None
+        self.error_handler = None
+        
+        self._queue = queue.Queue(maxsize=self.capacity)
+        self._threads = []
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._processed = 0
+        self._failed = 0
+        self._blocked_seconds = 0.0
+        self._wait_times = deque(maxlen=LATENCY_WINDOW)
+        self._service_times = deque(maxlen=LATENCY_WINDOW)
+    
+    def start(self):
+        """Εκκίνηση των workers (μία φορά)"""
+        if self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"pipeline-{self.name}-{index + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def put(self, job, block=True, timeout=None):
+        """Είσοδος job στο στάδιο - περιμένει όσο η ουρά είναι γεμάτη (backpressure)
+        
+        Επιστρέφει False αν η ουρά έμεινε γεμάτη (block=False ή timeout).
+        """
+        job.setdefault('_timings', {})
+        start_time = time.monotonic()
+        try:
+            self._queue.put((job, start_time), block=block, timeout=timeout)
+        except queue.Full:
+            return False
+        
+        blocked = time.monotonic() - start_time
+        if blocked > 0.001:
+            with self._stats_lock:
+                self._blocked_seconds += blocked
+        return True
+    
+    def stop(self):
+        """Τερματισμός των workers αφού αδειάσει η ουρά"""
+        for _ in self._threads:
+            self._queue.put((_STOP, None))
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+    
+    def _run(self):
+        while True:
+            job, queued_at = self._queue.get()
+            if job is _STOP:
+                return
+            
+            started_at = time.monotonic()
+            with self._stats_lock:
+                self._in_flight += 1
+                self._wait_times.append(started_at - queued_at)
+            
+            failed = False
+            result = None
+            try:
+                result = self.handler(job)
+            except Exception as e:
+                failed = True
+                print(f"Σφάλμα στο στάδιο {self.name}: {e}")
+                job['error'] = str(e)
+                job['failed_stage'] = self.name
+                if self.error_handler is not None:
+                    try:
+                        self.error_handler(self.name, job, e)
+                    except Exception as handler_error:
+                        print(f"Σφάλμα στον χειρισμό αποτυχίας του σταδίου {self.name}: {handler_error}")
+            
+            elapsed = time.monotonic() - started_at
+            job['_timings'][self.name] = elapsed
+            with self._stats_lock:
+                self._in_flight -= 1
+                self._service_times.append(elapsed)
+                if failed:
+                    self._failed += 1
+                else:
+                    self._processed += 1
+            
+            # Backpressure: ο worker περιμένει μέχρι να χωρέσει το job στο επόμενο στάδιο
+            if result is not None and self.next_stage is not None:
+                self.next_stage.put(result)
+    
+    def get_stats(self):
+        """Βάθος ουράς, jobs σε εξέλιξη και χρόνοι (δευτερόλεπτα) του σταδίου"""
+        with self._stats_lock:
+            wait_times = list(self._wait_times)
+            service_times = list(self._service_times)
+            return {
+                'name': self.name,
+                'workers': self.workers,
+                'capacity': self.capacity,
+                'depth': self._queue.qsize(),
+                'in_flight': self._in_flight,
+                'saturated': self._queue.full(),
+                'processed': self._processed,
+                'failed': self._failed,
+                'blocked_seconds': self._blocked_seconds,
+                'wait_p50': _percentile(wait_times, 0.5),
+                'wait_p95': _percentile(wait_times, 0.95),
+                'service_p50': _percentile(service_times, 0.5),
+                'service_p95': _percentile(service_times, 0.95),
+                'service_max': max(service_times) if service_times else 0.0
+            }
+
+
+class Pipeline:
+    """Σειρά σταδίων - το αποτέλεσμα κάθε σταδίου περνάει στο επόμενο"""
+    
+    def __init__(self, error_handler=None):
+        self.error_handler = error_handler
+        self._stages = []
+        self._by_name = {}
+    
+    def add_stage(self, name, handler, workers=1, capacity=8):
+        """Προσθήκη σταδίου στο τέλος της σειράς"""
+        stage = PipelineStage(name, handler, workers, capacity)
+        stage.error_handler = self.error_handler
+        if self._stages:
+            self._stages[-1].next_stage = stage
+        self._stages.append(stage)
+        self._by_name[name] = stage
+        return stage
+    
+    def start(self):
+        for stage in self._stages:
+            stage.start()
+    
+    def stop(self):
+        for stage in self._stages:
+            stage.stop()
+    
+    def stage(self, name):
+        return self._by_name[name]
+    
+    def submit(self, stage_name, job, block=True, timeout=None):
+        """Είσοδος job σε ένα στάδιο (False αν η ουρά του είναι γεμάτη)"""
+        return self._by_name[stage_name].put(job, block=block, timeout=timeout)
+    
+    def get_stats(self):
+        """Μετρήσεις όλων των σταδίων με τη σειρά τους"""
+        return [stage.get_stats() for stage in self._stages]
+    
+    def format_stats(self):
+        """Σύντομη περιγραφή βάθους ουρών (π.χ. για τη γραμμή κατάστασης)"""
+        return ", ".join(
+            f"{stats['name']}: {stats['depth']}+{stats['in_flight']}"
+            for stats in self.get_stats()
+        )
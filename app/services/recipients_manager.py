@@ -17,8 +17,6 @@ class RecipientsManager:
         self.path_manager = get_path_manager()
         self.recipients_file = self.path_manager.project_root / "recipients.json"
         
-        print(f"RecipientsManager using project root: {self.path_manager.project_root}")
-        
         self.load_recipients()
     
     def load_recipients(self):
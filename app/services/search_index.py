@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Search Index για autoPyrseia
+Δημιουργός: Σωτήριος Μπαλατσιάς
+
+Ευρετήριο πλήρους κειμένου (SQLite FTS5) για τα σήματα του DATA, του
+BACK UP DATA και των συμπιεσμένων αρχείων, μαζί με τα συνημμένα κειμένου
+"""
+
+import json
+import os
+import queue
+import re
+import sqlite3
+import threading
+import unicodedata
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from app.utils.path_manager import get_path_manager
+
+# Συνημμένα από τα οποία εξάγεται κείμενο
+_TEXT_EXTENSIONS = {'.txt', '.csv', '.xml', '.html', '.htm', '.json', '.md', '.log', '.rtf'}
+_MAX_TEXT_PER_FILE = 200000
+
+# Διαχωριστικό ανάμεσα στο zip και τον φάκελο σήματος για συμπιεσμένα σήματα
+ARCHIVE_SEPARATOR = "#"
+
+
+def normalize_search_text(text):
+    """Πεζά χωρίς τόνους - ίδια κανονικοποίηση για ευρετήριο και αναζήτηση"""
+    if not text:
+        return ""
+    text = unicodedata.normalize('NFD', text)
+    text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
+    return text.casefold()
+
+
+class SearchIndex:
+    """Incremental ευρετήριο πλήρους κειμένου σημάτων"""
+    
+    def __init__(self, db_path=None):
+        self.path_manager = get_path_manager()
+        self.data_folder = self.path_manager.data_folder
+        self.backup_folder = self.path_manager.backup_folder
+        self.db_path = Path(db_path) if db_path else self.path_manager.project_root / "search_index.db"
+        
+        self._lock = threading.RLock()
+        self._queue = queue.Queue()
+        self._worker = None
+        
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.fts_enabled = self._create_schema()
+    
+    def _create_schema(self):
+        """Δημιουργία πινάκων - επιστρέφει False αν η SQLite δεν έχει FTS5"""
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS signals (
+                    path TEXT PRIMARY KEY,
+                    location TEXT,
+                    recipient TEXT,
+                    signal_id TEXT,
+                    fm TEXT,
+                    theme TEXT,
+                    mtime REAL,
+                    indexed_at TEXT,
+                    search_text TEXT
+                )
+            """)
+            try:
+                self.conn.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS signals_fts USING fts5(
+                        path UNINDEXED, signal_id, fm, theme, body, attachments
+                    )
+                """)
+                fts_enabled = True
+            except sqlite3.OperationalError:
+                # Χωρίς FTS5 η αναζήτηση γίνεται με LIKE στο search_text
+                print("Η SQLite δεν υποστηρίζει FTS5 - αναζήτηση χωρίς ευρετήριο πλήρους κειμένου")
+                fts_enabled = False
+            self.conn.commit()
+        return fts_enabled
+    
+    # ------------------------------------------------------------------ indexing
+    
+    def index_signal_folder(self, signal_folder, signal_data=None, body_text=None):
+        """Ευρετηρίαση ενός φακέλου σήματος (DATA ή BACK UP DATA)"""
+        signal_folder = Path(signal_folder)
+        if not signal_folder.is_dir():
+            return False
+        
+        try:
+            if signal_data is None:
+                signal_data = self._read_signal_info(signal_folder)
+            
+            pdf_file = self._find_signal_pdf(signal_folder, signal_data)
+            attachments_text = []
+            for file_path in sorted(signal_folder.iterdir()):
+                if not file_path.is_file() or file_path == pdf_file or file_path.name.endswith('_info.json'):
+                    continue
+                text = self._extract_file_text(file_path.name, file_path.read_bytes)
+                if text:
+                    attachments_text.append(f"{file_path.name}\n{text}")
+            
+            if body_text is None and pdf_file:
+                body_text = self._extract_file_text(pdf_file.name, pdf_file.read_bytes)
+            
+            self._write_document(
+                str(signal_folder), self._location_for(signal_folder), self._recipient_for(signal_folder),
+                signal_data, body_text or "", attachments_text, signal_folder.stat().st_mtime
+            )
+            return True
+        
+        except Exception as e:
+            print(f"Σφάλμα στην ευρετηρίαση του {signal_folder}: {e}")
+            return False
+    
+    def index_archive(self, archive_path, archive_index):
+        """Ευρετηρίαση των σημάτων ενός συμπιεσμένου φακέλου Α.Φ."""
+        archive_path = Path(archive_path)
+        try:
+            with zipfile.ZipFile(archive_path, 'r') as zf:
+                for folder_name, signal in archive_index.get('signals', {}).items():
+                    signal_data = signal.get('info', {})
+                    body_text = ""
+                    attachments_text = []
+                    for entry in signal.get('files', []):
+                        file_name = entry['member'].split('/')[-1]
+                        if file_name.endswith('_info.json'):
+                            continue
+                        text = self._extract_file_text(file_name, lambda m=entry['member']: zf.read(m))
+                        if not text:
+                            continue
+                        if not body_text and file_name.lower().endswith('.pdf'):
+                            body_text = text
+                        else:
+                            attachments_text.append(f"{file_name}\n{text}")
+                    
+                    self._write_document(
+                        f"{archive_path}{ARCHIVE_SEPARATOR}{folder_name}", 'ARCHIVE',
+                        archive_index.get('recipient', archive_path.parent.name),
+                        signal_data or {'id': folder_name}, body_text, attachments_text,
+                        archive_path.stat().st_mtime
+                    )
+            return True
+        except Exception as e:
+            print(f"Σφάλμα στην ευρετηρίαση του {archive_path}: {e}")
+            return False
+    
+    def _write_document(self, path, location, recipient, signal_data, body_text, attachments_text, mtime):
+        """Εγγραφή ενός σήματος στο ευρετήριο (αντικαθιστά την προηγούμενη)"""
+        signal_id = signal_data.get('id', Path(path).name)
+        fm = signal_data.get('fm', '')
+        theme = signal_data.get('theme', '')
+        attachments_joined = "\n".join(attachments_text)
+        
+        normalized = [normalize_search_text(value) for value in (signal_id, fm, theme, body_text, attachments_joined)]
+        with self._lock:
+            self.conn.execute("DELETE FROM signals WHERE path = ?", (path,))
+            self.conn.execute(
+                "INSERT INTO signals (path, location, recipient, signal_id, fm, theme, mtime, indexed_at, search_text) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (path, location, recipient, signal_id, fm, theme, mtime, datetime.now().isoformat(),
+                 None if self.fts_enabled else "\n".join(normalized))
+            )
+            if self.fts_enabled:
+                self.conn.execute("DELETE FROM signals_fts WHERE path = ?", (path,))
+                self.conn.execute(
+                    "INSERT INTO signals_fts (path, signal_id, fm, theme, body, attachments) VALUES (?, ?, ?, ?, ?, ?)",
+                    [path] + normalized
+                )
+            self.conn.commit()
+    
+    def remove(self, path):
+        """Αφαίρεση σήματος (ή όλων κάτω από έναν φάκελο) από το ευρετήριο"""
+        path = str(path)
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT path FROM signals WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                (path, self._like_prefix(path))
+            ).fetchall()
+            for (row_path,) in rows:
+                self.conn.execute("DELETE FROM signals WHERE path = ?", (row_path,))
+                if self.fts_enabled:
+                    self.conn.execute("DELETE FROM signals_fts WHERE path = ?", (row_path,))
+            self.conn.commit()
+        return len(rows)
+    
+    def relocate(self, old_path, new_path, location=None):
+        """Ενημέρωση διαδρομής μετά από μετακίνηση (π.χ. DATA → BACK UP DATA → zip)"""
+        old_path, new_path = str(old_path), str(new_path)
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT path FROM signals WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+                (old_path, self._like_prefix(old_path))
+            ).fetchall()
+            for (row_path,) in rows:
+                target = new_path + row_path[len(old_path):]
+                target_location = location or self._location_for(Path(target))
+                self.conn.execute("DELETE FROM signals WHERE path = ?", (target,))
+                self.conn.execute(
+                    "UPDATE signals SET path = ?, location = ?, recipient = ? WHERE path = ?",
+                    (target, target_location, self._recipient_for(Path(target.split(ARCHIVE_SEPARATOR)[0])), row_path)
+                )
+                if self.fts_enabled:
+                    self.conn.execute("DELETE FROM signals_fts WHERE path = ?", (target,))
+                    self.conn.execute("UPDATE signals_fts SET path = ? WHERE path = ?", (target, row_path))
+            self.conn.commit()
+        return len(rows)
+    
+    def index_in_background(self, signal_folder, signal_data=None, body_text=None):
+        """Ευρετηρίαση στο background worker (δεν καθυστερεί την επεξεργασία)"""
+        self._submit(('folder', signal_folder, signal_data, body_text))
+    
+    def sync_in_background(self):
+        """Πλήρης incremental συγχρονισμός στο background worker"""
+        self._submit(('sync', None, None, None))
+    
+    def _submit(self, task):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._index_worker, daemon=True)
+                self._worker.start()
+        self._queue.put(task)
+    
+    def _index_worker(self):
+        while True:
+            kind, signal_folder, signal_data, body_text = self._queue.get()
+            try:
+                if kind == 'sync':
+                    self.sync()
+                else:
+                    self.index_signal_folder(signal_folder, signal_data, body_text)
+            except Exception as e:
+                print(f"Σφάλμα στο search index worker: {e}")
+    
+    def sync(self):
+        """Incremental συγχρονισμός: νέοι/αλλαγμένοι φάκελοι και αρχεία zip, αφαίρεση όσων λείπουν"""
+        with self._lock:
+            known = dict(self.conn.execute("SELECT path, mtime FROM signals").fetchall())
+        
+        seen = set()
+        indexed_count = 0
+        
+        # DATA/<παραλήπτης>/<σήμα> και BACK UP DATA/<παραλήπτης>/<Α.Φ.>/<σήμα>
+        folders = list(self._iter_child_dirs(self.data_folder, depth=2))
+        folders += list(self._iter_child_dirs(self.backup_folder, depth=3))
+        for signal_folder, mtime in folders:
+            path = str(signal_folder)
+            seen.add(path)
+            if known.get(path) != mtime:
+                if self.index_signal_folder(signal_folder):
+                    indexed_count += 1
+        
+        # Συμπιεσμένοι φάκελοι Α.Φ.
+        if self.backup_folder.exists():
+            for index_path in self.backup_folder.glob("*/*.index.json"):
+                archive_path = index_path.with_name(index_path.name[:-len(".index.json")] + ".zip")
+                if not archive_path.exists():
+                    continue
+                try:
+                    with open(index_path, 'r', encoding='utf-8') as f:
+                        archive_index = json.load(f)
+                except Exception:
+                    continue
+                paths = [f"{archive_path}{ARCHIVE_SEPARATOR}{name}" for name in archive_index.get('signals', {})]
+                seen.update(paths)
+                if any(path not in known for path in paths):
+                    if self.index_archive(archive_path, archive_index):
+                        indexed_count += 1
+        
+        stale = [path for path in known if path not in seen]
+        for path in stale:
+            self.remove(path)
+        
+        if indexed_count or stale:
+            print(f"Search index: {indexed_count} νέα/αλλαγμένα, {len(stale)} αφαιρέθηκαν")
+        return indexed_count
+    
+    def _iter_child_dirs(self, base_folder, depth):
+        """Φάκελοι σε συγκεκριμένο βάθος με το mtime τους (os.scandir)"""
+        if not base_folder.exists():
+            return
+        stack = [(str(base_folder), 0)]
+        while stack:
+            folder, level = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if not entry.is_dir() or entry.name.startswith('.'):
+                            continue
+                        if level + 1 == depth:
+                            yield Path(entry.path), entry.stat().st_mtime
+                        else:
+                            stack.append((entry.path, level + 1))
+            except OSError:
+                continue
+    
+    # ------------------------------------------------------------------ search
+    
+    def search(self, query, limit=100):
+        """Αναζήτηση - λίστα από dict με διαδρομή για άνοιγμα κάθε αποτελέσματος"""
+        tokens = re.findall(r"\w+", normalize_search_text(query))
+        if not tokens:
+            return []
+        
+        with self._lock:
+            if self.fts_enabled:
+                match = " AND ".join(f'"{token}"*' for token in tokens)
+                rows = self.conn.execute("""
+                    SELECT s.path, s.location, s.recipient, s.signal_id, s.fm, s.theme,
+                           snippet(signals_fts, -1, '[', ']', '…', 12)
+                    FROM signals_fts
+                    JOIN signals s ON s.path = signals_fts.path
+                    WHERE signals_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                """, (match, limit)).fetchall()
+            else:
+                conditions = " AND ".join("search_text LIKE ?" for _ in tokens)
+                rows = self.conn.execute(
+                    f"SELECT path, location, recipient, signal_id, fm, theme, '' FROM signals "
+                    f"WHERE {conditions} LIMIT ?",
+                    [f"%{token}%" for token in tokens] + [limit]
+                ).fetchall()
+        
+        results = []
+        for path, location, recipient, signal_id, fm, theme, snippet in rows:
+            results.append({
+                'path': path,
+                'open_path': path.split(ARCHIVE_SEPARATOR)[0],
+                'location': location,
+                'recipient': recipient,
+                'signal_id': signal_id,
+                'fm': fm,
+                'theme': theme,
+                'snippet': snippet
+            })
+        return results
+    
+    # ------------------------------------------------------------------ helpers
+    
+    def _like_prefix(self, path):
+        escaped = path.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return escaped + os.sep.replace('\\', '\\\\') + '%' if not path.endswith(ARCHIVE_SEPARATOR) else escaped + '%'
+    
+    def _location_for(self, folder):
+        folder = Path(folder)
+        if self.backup_folder in folder.parents:
+            return 'BACKUP'
+        if self.data_folder in folder.parents:
+            return 'DATA'
+        return 'OTHER'
+    
+    def _recipient_for(self, folder):
+        folder = Path(folder)
+        for base in (self.data_folder, self.backup_folder):
+            if base in folder.parents:
+                return folder.relative_to(base).parts[0]
+        return ''
+    
+    def _read_signal_info(self, signal_folder):
+        json_file = signal_folder / "signal_info.json"
+        if not json_file.exists():
+            old_json_files = list(signal_folder.glob("*_info.json"))
+            json_file = old_json_files[0] if old_json_files else None
+        if json_file:
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception:
+                pass
+        return {'id': signal_folder.name}
+    
+    def _find_signal_pdf(self, signal_folder, signal_data):
+        candidates = [signal_data.get('pdf_filename'), f"{signal_data.get('id', '')}.pdf", f"{signal_folder.name}.pdf"]
+        for name in candidates:
+            if name and (signal_folder / name).exists():
+                return signal_folder / name
+        return None
+    
+    def _extract_file_text(self, file_name, read_bytes):
+        """Κείμενο από PDF, DOCX/ODT και απλά αρχεία κειμένου (αλλιώς κενό)"""
+        extension = os.path.splitext(file_name)[1].lower()
+        try:
+            if extension == '.pdf':
+                import fitz  # PyMuPDF
+                with fitz.open(stream=read_bytes(), filetype="pdf") as doc:
+                    text = "\n".join(page.get_text() for page in doc)
+            elif extension in ('.docx', '.odt'):
+                import io
+                member = 'word/document.xml' if extension == '.docx' else 'content.xml'
+                with zipfile.ZipFile(io.BytesIO(read_bytes())) as zf:
+                    xml = zf.read(member).decode('utf-8', errors='ignore')
+                text = re.sub(r'<[^>]+>', ' ', xml)
+            elif extension in _TEXT_EXTENSIONS:
+                data = read_bytes()
+                try:
+                    text = data.decode('utf-8')
+                except UnicodeDecodeError:
+                    text = data.decode('cp1253', errors='ignore')  # Ελληνικά Windows
+                if extension in ('.html', '.htm', '.xml'):
+                    text = re.sub(r'<[^>]+>', ' ', text)
+            else:
+                return ""
+        except Exception:
+            return ""
+        
+        return text[:_MAX_TEXT_PER_FILE]
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
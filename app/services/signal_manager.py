@@ -10,11 +10,22 @@ Signal Manager για autoPyrseia
 import json
 import shutil
 import os
+import queue
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from app.utils.path_manager import get_path_manager
+from app.utils.downloads_snapshot import get_downloads_snapshot, get_folder_snapshot, drop_folder_snapshot
+from app.utils.file_operations import resolve_attachments
+from app.utils.progress_manager import ProgressTracker
+from app.services.search_index import SearchIndex
 
 class SignalManager:
+    # Μέγιστος αριθμός παραληπτών που επεξεργάζονται ταυτόχρονα
+    FANOUT_WORKERS = 4
+    
     def __init__(self):
         # Use the centralized path manager instead of calculating paths manually
         self.path_manager = get_path_manager()
@@ -22,95 +33,113 @@ class SignalManager:
         self.downloads_folder = self.path_manager.downloads_folder
         self.backup_folder = self.path_manager.backup_folder
         
-        print(f"SignalManager using DATA folder: {self.data_folder}")
-        print(f"SignalManager using downloads folder: {self.downloads_folder}")
-        
         # Δημιουργία φακέλων αν δεν υπάρχουν (path manager should have done this, but just in case)
         self.data_folder.mkdir(parents=True, exist_ok=True)
         self.backup_folder.mkdir(parents=True, exist_ok=True)
+        
+        # Ευρετήριο πλήρους κειμένου για αναζήτηση σημάτων σε DATA και BACK UP DATA
+        self.search_index = SearchIndex()
+        
+        # Κατάσταση σάρωσης JSON (mtime ανά φάκελο σήματος) και background worker
+        self.scan_state_file = self.path_manager.project_root / "scan_state.json"
+        self._scan_state = None
+        self._scan_lock = threading.Lock()
+        self._scan_queue = queue.Queue()
+        self._scan_queue_lock = threading.Lock()
+        self._scan_worker = None
     
     def process_signal(self, signal_data, selected_recipients):
         """Επεξεργασία σήματος για τους επιλεγμένους παραλήπτες"""
-        try:
-            processed_recipients = []
-            failed_recipients = []
-            duplicate_recipients = []
-            
-            for recipient_data in selected_recipients:
-                # Handle both old format (string) and new format (dict)
-                if isinstance(recipient_data, str):
-                    recipient_name = recipient_data
-                    is_temporary = False
-                    folder_path = None
-                else:
-                    recipient_name = recipient_data['name']
-                    is_temporary = recipient_data.get('is_temporary', False)
-                    folder_path = recipient_data.get('folder_path', None)
-                
-                result = self.process_recipient(signal_data, recipient_name, is_temporary, folder_path)
-                if result['success']:
-                    processed_recipients.append({
-                        'name': recipient_name,
-                        'folder_path': result['folder_path']
-                    })
-                elif result['duplicate']:
-                    duplicate_recipients.append(recipient_name)
-                else:
-                    failed_recipients.append(recipient_name)
-            
-            if processed_recipients:
-                # Καθαρισμός του downloads folder μετά την επιτυχή επεξεργασία
-                self.clear_downloads_folder()
-            
-            return {
-                'success': len(processed_recipients) > 0,
-                'processed_recipients': processed_recipients,
-                'failed_recipients': failed_recipients,
-                'duplicate_recipients': duplicate_recipients,
-                'signal_id': signal_data['id'],
-                'total_processed': len(processed_recipients),
-                'total_failed': len(failed_recipients),
-                'total_duplicates': len(duplicate_recipients)
-            }
-            
-        except Exception as e:
-            print(f"Σφάλμα στην επεξεργασία σήματος: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'processed_recipients': [],
-                'failed_recipients': selected_recipients,
-                'duplicate_recipients': []
-            }
+        recipient_list = []
+        for recipient_data in selected_recipients:
+            # Handle both old format (string) and new format (dict)
+            if isinstance(recipient_data, str):
+                recipient_data = {'name': recipient_data}
+            
+            recipient_list.append({
+                'name': recipient_data['name'],
+                'signal_data': signal_data,
+                'is_temporary': recipient_data.get('is_temporary', False),
+                'folder_path': recipient_data.get('folder_path', None)
+            })
+        
+        return self.process_signal_with_versions(recipient_list)
     
-    def process_signal_with_versions(self, recipient_list):
-        """Process signal with different signal data per recipient"""
+    def process_signal_with_versions(self, recipient_list, attachment_plan=None, progress_callback=None):
+        """Process signal with different signal data per recipient
+        
+        Οι παραλήπτες επεξεργάζονται παράλληλα σε προσωρινούς φακέλους, που
+        μετονομάζονται στη θέση τους μόνο αν πετύχουν όλοι - αλλιώς rollback.
+        progress_callback: δέχεται ProgressEvent - βήματα (πηγές, παραλήπτες,
+        μετονομασία) και bytes που τοποθετήθηκαν στους φακέλους των παραληπτών.
+        """
+        staged = []
+        sources = None
+        tracker = ProgressTracker(progress_callback, total_steps=len(recipient_list) + 2)
         try:
-            processed_recipients = []
-            failed_recipients = []
-            duplicate_recipients = []
-            
+            # Συνημμένα όλων των εκδόσεων - επιλύονται μία φορά για όλους τους παραλήπτες
+            attachment_names = []
+            for recipient_info in recipient_list:
+                for attachment in recipient_info['signal_data'].get('attachments', []):
+                    if attachment not in attachment_names:
+                        attachment_names.append(attachment)
+            
+            # Φάκελος του σήματος στην ουρά intake (ή το downloads)
+            source_folder = recipient_list[0]['signal_data'].get('source_folder')
+            sources = self._prepare_sources(attachment_names, move_files=len(recipient_list) == 1,
+                                            attachment_plan=attachment_plan, source_folder=source_folder)
+            
+            # Οι τελικοί φάκελοι επιλέγονται σειριακά ώστε δύο προσωρινοί παραλήπτες
+            # στον ίδιο φάκελο να μην πάρουν το ίδιο όνομα
+            reserved_folders = set()
+            jobs = []
             for recipient_info in recipient_list:
-                recipient_name = recipient_info['name']
+                target_folder = self._get_target_folder(
+                    recipient_info['signal_data'],
+                    recipient_info['name'],
+                    recipient_info.get('is_temporary', False),
+                    recipient_info.get('folder_path', None),
+                    reserved_folders
+                )
+                jobs.append((recipient_info, target_folder))
+            
+            tracker.add_total(bytes_count=sum(
+                self._placed_size(recipient_info['signal_data'], sources) for recipient_info, _ in jobs
+            ))
+            tracker.advance("Αρχεία σήματος έτοιμα για αντιγραφή...")
+            
+            workers = max(1, min(self.FANOUT_WORKERS, len(jobs)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fanout") as executor:
+                futures = [
+                    executor.submit(self._stage_recipient, recipient_info['signal_data'], target_folder,
+                                    recipient_info.get('is_temporary', False), sources, tracker)
+                    for recipient_info, target_folder in jobs
+                ]
+                staged = [future.result() for future in futures]
+            
+            failed = [(recipient_info['name'], item['error'])
+                      for (recipient_info, _), item in zip(jobs, staged) if not item['success']]
+            if failed:
+                raise RuntimeError("; ".join(f"{name}: {error}" for name, error in failed))
+            
+            # Όλοι έτοιμοι - μετονομασία στη θέση τους
+            for item in staged:
+                self._commit_staged(item)
+            self._finish_commit(staged)
+            tracker.advance("Οι φάκελοι των παραληπτών αποθηκεύτηκαν")
+            
+            # Ευρετηρίαση με το κείμενο που έχει ήδη εξαχθεί από το PDF
+            for recipient_info, target_folder in jobs:
                 signal_data = recipient_info['signal_data']
-                is_temporary = recipient_info.get('is_temporary', False)
-                folder_path = recipient_info.get('folder_path', None)
-                
-                # Use the signal data specific to this recipient with preserved temporary info
-                result = self.process_recipient(signal_data, recipient_name, is_temporary, folder_path)
-                if result['success']:
-                    processed_recipients.append({
-                        'name': recipient_name,
-                        'folder_path': result['folder_path']
-                    })
-                elif result['duplicate']:
-                    duplicate_recipients.append(recipient_name)
-                else:
-                    failed_recipients.append(recipient_name)
-            
-            if processed_recipients:
-                # Καθαρισμός του downloads folder μετά την επιτυχή επεξεργασία
-                self.clear_downloads_folder()
+                self.search_index.index_in_background(target_folder, signal_data, signal_data.get('full_text'))
+            
+            processed_recipients = [
+                {'name': recipient_info['name'], 'folder_path': str(target_folder)}
+                for recipient_info, target_folder in jobs
+            ]
+            
+            # Καθαρισμός του φακέλου του σήματος μετά την επιτυχή επεξεργασία
+            self.clear_signal_source(source_folder)
             
             # Use the original signal ID for reporting
             original_id = recipient_list[0]['signal_data'].get('original_id', recipient_list[0]['signal_data']['id'])
@@ -118,16 +147,17 @@ class SignalManager:
             return {
                 'success': len(processed_recipients) > 0,
                 'processed_recipients': processed_recipients,
-                'failed_recipients': failed_recipients,
-                'duplicate_recipients': duplicate_recipients,
+                'failed_recipients': [],
+                'duplicate_recipients': [],
                 'signal_id': original_id,
                 'total_processed': len(processed_recipients),
-                'total_failed': len(failed_recipients),
-                'total_duplicates': len(duplicate_recipients)
+                'total_failed': 0,
+                'total_duplicates': 0
             }
             
         except Exception as e:
             print(f"Σφάλμα στην επεξεργασία σήματος με εκδόσεις: {e}")
+            self._rollback_staged(staged, sources)
             return {
                 'success': False,
                 'error': str(e),
@@ -136,80 +166,163 @@ class SignalManager:
                 'duplicate_recipients': []
             }
     
-    def process_recipient(self, signal_data, recipient, is_temporary=False, temp_folder_path=None):
+    def process_recipient(self, signal_data, recipient, is_temporary=False, temp_folder_path=None, sources=None):
         """Επεξεργασία σήματος για έναν παραλήπτη"""
+        staged = []
         try:
-            # Handle temporary recipients differently - no DATA folder involvement
-            if is_temporary:
-                if not temp_folder_path:
-                    print(f"Error: Temporary recipient '{recipient}' has no folder path specified")
-                    return {'success': False, 'duplicate': False, 'error': 'No folder path specified for temporary recipient'}
-                return self._process_temporary_recipient(signal_data, recipient, temp_folder_path)
-            
-            # Regular recipient processing in DATA folder
-            recipient_folder = self.data_folder / recipient
-            recipient_folder.mkdir(exist_ok=True)
-            
-            # Create signal folder using the signal ID (which may be versioned)
-            signal_id = signal_data['id']
-            signal_folder = recipient_folder / signal_id
-            signal_folder.mkdir(exist_ok=True)
-            
-            # Αντιγραφή του PDF σήματος
-            source_pdf = self.downloads_folder / "pyrseia_server.pdf"
-            # Use original signal ID for PDF filename if this is a versioned signal
-            original_id = signal_data.get('original_id', signal_id)
-            target_pdf = signal_folder / f"{original_id}.pdf"
-            shutil.copy2(source_pdf, target_pdf)
+            if sources is None:
+                sources = self._prepare_sources(signal_data.get('attachments', []),
+                                                source_folder=signal_data.get('source_folder'))
             
-            # Αντιγραφή συνημμένων αρχείων
-            self.copy_attachments(signal_data.get('attachments', []), signal_folder)
+            target_folder = self._get_target_folder(signal_data, recipient, is_temporary, temp_folder_path)
+            staged.append(self._stage_recipient(signal_data, target_folder, is_temporary, sources))
+            if not staged[0]['success']:
+                raise RuntimeError(staged[0]['error'])
             
-            # Create JSON file for regular recipients
-            self.create_signal_json(signal_data, signal_folder, signal_id)
+            self._commit_staged(staged[0])
+            self._finish_commit(staged)
+            self.search_index.index_in_background(target_folder, signal_data, signal_data.get('full_text'))
             
-            return {'success': True, 'duplicate': False, 'folder_path': str(signal_folder)}
+            return {'success': True, 'duplicate': False, 'folder_path': str(target_folder)}
             
         except Exception as e:
             print(f"Σφάλμα στην επεξεργασία παραλήπτη {recipient}: {e}")
+            self._rollback_staged(staged, sources)
             return {'success': False, 'duplicate': False, 'error': str(e)}
     
-    def _process_temporary_recipient(self, signal_data, recipient_name, temp_folder_path):
-        """Process temporary recipient - completely independent of DATA folder"""
+    def _get_target_folder(self, signal_data, recipient, is_temporary, temp_folder_path, reserved_folders=None):
+        """Τελικός φάκελος σήματος για έναν παραλήπτη"""
+        signal_id = signal_data['id']
+        
+        # Regular recipient processing in DATA folder (the signal ID may be versioned)
+        if not is_temporary:
+            return self.data_folder / recipient / signal_id
+        
+        # Temporary recipients - completely independent of DATA folder
+        if not temp_folder_path:
+            print(f"Error: Temporary recipient '{recipient}' has no folder path specified")
+            raise ValueError('No folder path specified for temporary recipient')
+        
+        reserved_folders = reserved_folders if reserved_folders is not None else set()
+        target_folder = Path(temp_folder_path)
+        signal_folder = target_folder / signal_id
+        
+        # If folder exists, create a unique variant
+        counter = 1
+        while signal_folder.exists() or signal_folder in reserved_folders:
+            signal_folder = target_folder / f"{signal_id}_{counter}"
+            counter += 1
+        
+        reserved_folders.add(signal_folder)
+        return signal_folder
+    
+    def _stage_recipient(self, signal_data, target_folder, is_temporary, sources, tracker=None):
+        """Προετοιμασία του φακέλου ενός παραλήπτη με προσωρινό όνομα"""
+        # Το staging πρέπει να είναι στον ίδιο δίσκο με τον τελικό φάκελο για atomic rename
+        if is_temporary:
+            staging_root = target_folder.parent
+        else:
+            staging_root = self.path_manager.temp_folder / "staging"
+        
+        item = {
+            'target_folder': target_folder,
+            'staging_folder': staging_root / f".{target_folder.name}.staging-{uuid.uuid4().hex[:8]}",
+            'backup_folder': None,
+            'created_parent': False,
+            'committed': False,
+            'success': False,
+            'error': None
+        }
+        
         try:
-            # Use the selected folder directly as the target
-            target_folder = Path(temp_folder_path)
-            target_folder.mkdir(parents=True, exist_ok=True)
+            staging_root.mkdir(parents=True, exist_ok=True)
+            item['staging_folder'].mkdir()
             
-            # Create a subfolder with the signal ID for organization
+            # Αντιγραφή του PDF σήματος
             signal_id = signal_data['id']
-            signal_folder = target_folder / signal_id
-            
-            # If folder exists, create a unique variant
-            counter = 1
-            original_signal_folder = signal_folder
-            while signal_folder.exists():
-                signal_folder = original_signal_folder.parent / f"{signal_id}_{counter}"
-                counter += 1
-            
-            signal_folder.mkdir(exist_ok=True)
-            
-            # Copy the PDF signal
-            source_pdf = self.downloads_folder / "pyrseia_server.pdf"
-            target_pdf = signal_folder / f"{signal_id}.pdf"
-            shutil.copy2(source_pdf, target_pdf)
+            if is_temporary:
+                pdf_name = f"{signal_id}.pdf"
+            else:
+                # Use original signal ID for PDF filename if this is a versioned signal
+                pdf_name = f"{signal_data.get('original_id', signal_id)}.pdf"
+            self._place_file(sources, sources['pdf'], item['staging_folder'] / pdf_name, tracker)
             
-            # Copy attachments
-            self.copy_attachments(signal_data.get('attachments', []), signal_folder)
+            # Αντιγραφή συνημμένων αρχείων
+            self.copy_attachments(signal_data.get('attachments', []), item['staging_folder'], sources, tracker=tracker)
             
-            # NO JSON file creation for temporary recipients
-            # NO involvement with DATA folder structure
+            # JSON μόνο για κανονικούς παραλήπτες (NO JSON for temporary recipients)
+            if not is_temporary:
+                self.create_signal_json(signal_data, item['staging_folder'], signal_id)
             
-            return {'success': True, 'duplicate': False, 'folder_path': str(signal_folder)}
+            item['success'] = True
+            if tracker is not None:
+                tracker.advance(f"Αντιγραφή στον φάκελο {target_folder.parent.name} ολοκληρώθηκε")
             
         except Exception as e:
-            print(f"Σφάλμα στην επεξεργασία προσωρινού παραλήπτη {recipient_name}: {e}")
-            return {'success': False, 'duplicate': False, 'error': str(e)}
+            print(f"Σφάλμα στην προετοιμασία του φακέλου {target_folder}: {e}")
+            item['error'] = str(e)
+        
+        return item
+    
+    def _commit_staged(self, item):
+        """Μετονομασία του προσωρινού φακέλου στην τελική του θέση"""
+        target_folder = item['target_folder']
+        
+        if not target_folder.parent.exists():
+            target_folder.parent.mkdir(parents=True)
+            item['created_parent'] = True
+        
+        # Υπάρχων φάκελος με το ίδιο όνομα κρατιέται μέχρι να πετύχουν όλοι
+        if target_folder.exists():
+            backup_folder = target_folder.with_name(f".{target_folder.name}.replaced-{uuid.uuid4().hex[:8]}")
+            self._rename_folder(target_folder, backup_folder)
+            item['backup_folder'] = backup_folder
+        
+        self._rename_folder(item['staging_folder'], target_folder)
+        item['committed'] = True
+    
+    def _finish_commit(self, staged):
+        """Διαγραφή των φακέλων που αντικαταστάθηκαν"""
+        for item in staged:
+            if item['backup_folder'] and item['backup_folder'].exists():
+                shutil.rmtree(item['backup_folder'], ignore_errors=True)
+    
+    def _rollback_staged(self, staged, sources):
+        """Αναίρεση όλων των παραληπτών του σήματος"""
+        for item in reversed(staged):
+            try:
+                if item['committed']:
+                    self._rename_folder(item['target_folder'], item['staging_folder'])
+                    item['committed'] = False
+                if item['backup_folder'] and item['backup_folder'].exists():
+                    self._rename_folder(item['backup_folder'], item['target_folder'])
+            except Exception as e:
+                print(f"Σφάλμα στην αναίρεση του φακέλου {item['target_folder']}: {e}")
+        
+        # Αρχεία που μετακινήθηκαν από το downloads επιστρέφουν πίσω
+        if sources:
+            for source_file, target_file in sources['placed'].items():
+                try:
+                    if target_file.exists() and not source_file.exists():
+                        shutil.move(str(target_file), str(source_file))
+                except Exception as e:
+                    print(f"Σφάλμα στην επαναφορά του {source_file.name}: {e}")
+        
+        for item in staged:
+            if item['staging_folder'].exists():
+                shutil.rmtree(item['staging_folder'], ignore_errors=True)
+            parent = item['target_folder'].parent
+            if item['created_parent'] and parent.exists() and not any(parent.iterdir()):
+                parent.rmdir()
+    
+    def _rename_folder(self, source_folder, target_folder):
+        """Atomic rename φακέλου (με fallback σε move αν είναι σε άλλον δίσκο)"""
+        try:
+            os.rename(source_folder, target_folder)
+        except OSError:
+            if target_folder.exists():
+                raise
+            shutil.move(str(source_folder), str(target_folder))
     
     def create_unique_id_folder(self, recipient_folder, signal_id):
         """Δημιουργία μοναδικού φακέλου ID"""
@@ -229,37 +342,115 @@ class SignalManager:
                 return new_folder
             counter += 1
     
-    def copy_attachments(self, attachments, target_folder):
+    def copy_attachments(self, attachments, target_folder, sources=None, source_folder=None, tracker=None):
         """Αντιγραφή συνημμένων αρχείων"""
+        if sources is None:
+            sources = self._prepare_sources(attachments, source_folder=source_folder)
+        
         for attachment in attachments:
-            source_file = self.downloads_folder / attachment
+            source_file = sources['attachments'].get(attachment)
             
-            # Έλεγχος αν υπάρχει το αρχείο
-            if source_file.exists():
+            if source_file:
                 target_file = target_folder / attachment
-                shutil.copy2(source_file, target_file)
+                self._place_file(sources, source_file, target_file, tracker)
             else:
-                # Αναζήτηση για παρόμοιο όνομα αρχείου
-                similar_file = self.find_similar_file(attachment)
-                if similar_file:
-                    target_file = target_folder / attachment
-                    shutil.copy2(similar_file, target_file)
-                else:
-                    print(f"Προειδοποίηση: Δεν βρέθηκε το συνημμένο αρχείο {attachment}")
-    
-    def find_similar_file(self, target_filename):
-        """Αναζήτηση για παρόμοιο όνομα αρχείου με βελτιωμένο fuzzy matching"""
-        # Πρώτα έλεγχος ακριβούς ονόματος
-        exact_file = self.downloads_folder / target_filename
-        if exact_file.exists():
-            return exact_file
+                print(f"Προειδοποίηση: Δεν βρέθηκε το συνημμένο αρχείο {attachment}")
+    
+    def _prepare_sources(self, attachments, move_files=False, attachment_plan=None, source_folder=None):
+        """Επίλυση των αρχείων πηγής του σήματος μία φορά για όλους τους παραλήπτες
+        
+        move_files=True (ένας παραλήπτης): τα αρχεία του downloads μετακινούνται.
+        Αλλιώς κάθε παραλήπτης παίρνει δικό του αντίγραφο απευθείας από την πηγή
+        (ανεξάρτητα αρχεία - μια αλλαγή σε έναν παραλήπτη δεν αγγίζει τους άλλους).
+        attachment_plan: το πλάνο του resolve_attachments από τον έλεγχο συνημμένων.
+        source_folder: φάκελος του σήματος στην ουρά intake (προεπιλογή το downloads).
+        """
+        sources = {'move': move_files, 'pdf': None, 'attachments': {}, 'placed': {}}
         
-        # Χρήση του προηγμένου fuzzy matching από file_operations
-        from app.utils.file_operations import find_similar_filename
-        similar_filename = find_similar_filename(target_filename, self.downloads_folder)
+        source_files = {}
+        source_folder = Path(source_folder) if source_folder else self.downloads_folder
+        source_pdf = source_folder / "pyrseia_server.pdf"
         
-        if similar_filename:
-            return self.downloads_folder / similar_filename
+        if attachment_plan is None:
+            # Μία ανάγνωση του φακέλου για όλα τα συνημμένα
+            get_folder_snapshot(source_folder).refresh()
+            attachment_plan = resolve_attachments(attachments, source_folder)
+        
+        for attachment in attachments:
+            entry = attachment_plan.get(attachment)
+            source_file = entry['source'] if entry else None
+            if source_file is None or not source_file.exists():
+                # Εκτός πλάνου ή το αρχείο άλλαξε από τον έλεγχο - νέα αναζήτηση
+                source_file = self.find_similar_file(attachment, source_folder)
+            if source_file:
+                source_files[attachment] = source_file
+        
+        sources['pdf'] = source_pdf
+        sources['attachments'] = source_files
+        return sources
+    
+    def _placed_size(self, signal_data, sources):
+        """Bytes που θα τοποθετηθούν στον φάκελο ενός παραλήπτη (PDF και συνημμένα)"""
+        files = [sources['pdf']]
+        files.extend(sources['attachments'][attachment] for attachment in signal_data.get('attachments', [])
+                     if attachment in sources['attachments'])
+        return sum(self._file_size(file_path) for file_path in files)
+    
+    def _file_size(self, file_path):
+        try:
+            return Path(file_path).stat().st_size
+        except (OSError, TypeError):
+            return 0
+    
+    def _place_file(self, sources, source_file, target_file, tracker=None):
+        """Τοποθέτηση αρχείου στον φάκελο παραλήπτη (αντιγραφή ή μετακίνηση)"""
+        if tracker is None:
+            return self._place_file_untracked(sources, source_file, target_file)
+        
+        # Το μέγεθος πριν την τοποθέτηση - η πηγή μπορεί να μετακινηθεί
+        size = self._file_size(source_file)
+        method = self._place_file_untracked(sources, source_file, target_file)
+        tracker.advance(f"Αντιγραφή {target_file.name}...", steps=0, bytes_count=size)
+        return method
+    
+    def _place_file_untracked(self, sources, source_file, target_file):
+        if not sources['move']:
+            shutil.copy2(source_file, target_file)
+            return 'copy'
+        
+        if target_file.exists():
+            target_file.unlink()
+        
+        previous_target = sources['placed'].get(source_file)
+        
+        # Hard link και το downloads καθαρίζεται μετά - ισοδυναμεί με μετακίνηση
+        # χωρίς να χάνεται η πηγή αν αποτύχει κάποιο επόμενο βήμα.
+        # Μόνο ένα link ανά πηγή: δύο αρχεία του φακέλου δεν μοιράζονται περιεχόμενο
+        if previous_target is None:
+            try:
+                os.link(source_file, target_file)
+                sources['placed'][source_file] = target_file
+                return 'link'
+            except OSError:
+                pass
+        
+        if previous_target is None and source_file.exists():
+            shutil.move(str(source_file), str(target_file))
+            sources['placed'][source_file] = target_file
+            return 'move'
+        
+        # Η πηγή μετακινήθηκε ήδη για άλλο συνημμένο με το ίδιο αρχείο
+        shutil.copy2(previous_target, target_file)
+        return 'copy'
+    
+    def find_similar_file(self, target_filename, source_folder=None):
+        """Αναζήτηση για παρόμοιο όνομα αρχείου με βελτιωμένο fuzzy matching"""
+        # Ακριβές όνομα, πεζά/κεφαλαία ή fuzzy matching πάνω στη λίστα του downloads (ή του φακέλου της ουράς)
+        source_folder = Path(source_folder) if source_folder else self.downloads_folder
+        file_name = get_folder_snapshot(source_folder).resolve(target_filename)
+        
+        if file_name:
+            return source_folder / file_name
         
         return None
     
@@ -285,12 +476,26 @@ class SignalManager:
     def clear_downloads_folder(self):
         """Καθαρισμός του φακέλου downloads"""
         try:
-            for file in self.downloads_folder.glob("*"):
-                if file.is_file():
-                    file.unlink()
+            get_downloads_snapshot().clear()
         except Exception as e:
             print(f"Σφάλμα στον καθαρισμό του φακέλου downloads: {e}")
     
+    def clear_signal_source(self, source_folder=None):
+        """Καθαρισμός των αρχείων πηγής ενός σήματος που αποθηκεύτηκε
+        
+        Σήματα της ουράς intake έχουν δικό τους φάκελο - το downloads μένει
+        ανέγγιχτο γιατί μπορεί να περιέχει ήδη το επόμενο σήμα.
+        """
+        if not source_folder or Path(source_folder) == self.downloads_folder:
+            self.clear_downloads_folder()
+            return
+        
+        try:
+            shutil.rmtree(source_folder, ignore_errors=True)
+            drop_folder_snapshot(source_folder)
+        except Exception as e:
+            print(f"Σφάλμα στον καθαρισμό του φακέλου {source_folder}: {e}")
+    
     def get_recipient_signals(self, recipient_name):
         """Λήψη όλων των σημάτων για έναν παραλήπτη"""
         recipient_folder = self.data_folder / recipient_name
@@ -322,6 +527,43 @@ class SignalManager:
         
         return signals
     
+    def count_recipient_signals(self):
+        """Πλήθος σημάτων ανά παραλήπτη (ταξινομημένο) χωρίς ανάγνωση των JSON
+        
+        Μετράει, όπως το get_recipient_signals, τους φακέλους σημάτων με αρχείο
+        πληροφοριών - μόνο από τις εγγραφές των φακέλων.
+        """
+        counts = {}
+        if not self.data_folder.exists():
+            return counts
+        
+        with os.scandir(self.data_folder) as recipient_entries:
+            for recipient_entry in recipient_entries:
+                if not recipient_entry.is_dir():
+                    continue
+                
+                signal_count = 0
+                try:
+                    with os.scandir(recipient_entry.path) as signal_entries:
+                        for signal_entry in signal_entries:
+                            if signal_entry.is_dir() and self._has_signal_info(signal_entry.path):
+                                signal_count += 1
+                except OSError as e:
+                    print(f"Σφάλμα στη μέτρηση σημάτων του {recipient_entry.name}: {e}")
+                counts[recipient_entry.name] = signal_count
+        
+        return dict(sorted(counts.items()))
+    
+    def _has_signal_info(self, signal_folder_path):
+        """Αν ο φάκελος σήματος έχει JSON πληροφοριών (νέο ή παλιό naming)"""
+        if os.path.exists(os.path.join(signal_folder_path, "signal_info.json")):
+            return True
+        try:
+            with os.scandir(signal_folder_path) as entries:
+                return any(entry.name.endswith("_info.json") for entry in entries)
+        except OSError:
+            return False
+    
     def get_all_recipients(self):
         """Λήψη όλων των παραληπτών που έχουν σήματα"""
         recipients = []
@@ -352,6 +594,7 @@ class SignalManager:
                 
                 if source_path.exists():
                     shutil.move(str(source_path), str(target_path))
+                    self.search_index.relocate(source_path, target_path)
             
             return True
             
@@ -366,6 +609,7 @@ class SignalManager:
                 folder_path = Path(signal_folder)
                 if folder_path.exists():
                     shutil.rmtree(folder_path)
+                self.search_index.remove(folder_path)
             
             # Έλεγχος αν ο φάκελος παραλήπτη είναι άδειος
             recipient_folder = self.data_folder / recipient_name
@@ -379,60 +623,153 @@ class SignalManager:
             return False
     
     def scan_and_generate_missing_json_files(self, recipient_names=None):
-        """Σάρωση και δημιουργία JSON αρχείων για σήματα που δεν έχουν"""
-        try:
-            generated_count = 0
-            
-            # Αν δεν δόθηκαν συγκεκριμένοι παραλήπτες, σαρώνουμε όλους
-            if recipient_names is None:
-                recipient_names = self.get_all_recipients()
-            
-            for recipient_name in recipient_names:
-                recipient_folder = self.data_folder / recipient_name
-                if not recipient_folder.exists():
-                    continue
+        """Σάρωση και δημιουργία JSON αρχείων για σήματα που δεν έχουν
+        
+        Φάκελοι σημάτων με ίδιο mtime από την προηγούμενη σάρωση παραλείπονται
+        (scan_state.json) - ελέγχονται μόνο όσοι άλλαξαν από τότε ή δεν είχαν
+        ολοκληρωθεί (αποτυχία JSON, PDF που έλειπε).
+        """
+        with self._scan_lock:
+            try:
+                generated_count = 0
+                state_changed = False
+                folders_state = self._load_scan_state()
                 
-                # Σάρωση όλων των φακέλων σημάτων του παραλήπτη
-                for signal_folder in recipient_folder.iterdir():
-                    if not signal_folder.is_dir():
+                # Αν δεν δόθηκαν συγκεκριμένοι παραλήπτες, σαρώνουμε όλους
+                if recipient_names is None:
+                    recipient_names = self.get_all_recipients()
+                
+                for recipient_name in recipient_names:
+                    recipient_folder = self.data_folder / recipient_name
+                    if not recipient_folder.exists():
                         continue
                     
-                    # Έλεγχος αν υπάρχει ήδη JSON αρχείο (νέο ή παλιό naming)
-                    json_file = signal_folder / "signal_info.json"
-                    old_json_files = list(signal_folder.glob("*_info.json")) if not json_file.exists() else []
-                    
-                    if json_file.exists() or old_json_files:
-                        # Έλεγχος αν το JSON είναι από manual input - αν ναι, δεν το αντικαθιστούμε
-                        try:
-                            existing_json_file = json_file if json_file.exists() else old_json_files[0]
-                            with open(existing_json_file, 'r', encoding='utf-8') as f:
-                                existing_json = json.load(f)
-                                if existing_json.get('manual_input', False):
-                                    continue  # Δεν αντικαθιστούμε manual input JSON
-                        except:
-                            pass  # Αν δεν μπορούμε να διαβάσουμε το JSON, συνεχίζουμε
-                        continue  # Υπάρχει ήδη JSON
+                    seen_keys = set()
                     
-                    # Αναζήτηση PDF αρχείου με το όνομα του φακέλου
-                    signal_id = signal_folder.name
-                    pdf_file = signal_folder / f"{signal_id}.pdf"
+                    # Σάρωση όλων των φακέλων σημάτων του παραλήπτη
+                    with os.scandir(recipient_folder) as entries:
+                        for entry in entries:
+                            if not entry.is_dir():
+                                continue
+                            
+                            key = f"{recipient_name}/{entry.name}"
+                            seen_keys.add(key)
+                            mtime_ns = entry.stat().st_mtime_ns
+                            
+                            known = folders_state.get(key)
+                            if known and known['mtime_ns'] == mtime_ns and known.get('complete'):
+                                continue  # Δεν άλλαξε από την τελευταία σάρωση
+                            
+                            signal_folder = Path(entry.path)
+                            generated, complete = self._ensure_signal_json(signal_folder)
+                            if generated:
+                                generated_count += 1
+                            
+                            # Νέο mtime μετά την εγγραφή του JSON
+                            folders_state[key] = {
+                                'mtime_ns': signal_folder.stat().st_mtime_ns,
+                                'complete': complete
+                            }
+                            state_changed = True
                     
-                    if not pdf_file.exists():
-                        continue  # Δεν υπάρχει το αναμενόμενο PDF
-                    
-                    # Δημιουργία JSON από το PDF
-                    if self.generate_json_from_pdf(pdf_file, signal_folder, signal_id):
-                        generated_count += 1
-            
-            if generated_count > 0:
-                pass
-
+                    # Φάκελοι που δεν υπάρχουν πια (π.χ. μετά από εξαγωγή)
+                    prefix = f"{recipient_name}/"
+                    for key in [k for k in folders_state if k.startswith(prefix) and k not in seen_keys]:
+                        del folders_state[key]
+                        state_changed = True
+                
+                if state_changed:
+                    self._save_scan_state()
+                
+                return generated_count
+                
+            except Exception as e:
+                print(f"Σφάλμα στη σάρωση JSON αρχείων: {e}")
+                return 0
+    
+    def _ensure_signal_json(self, signal_folder):
+        """Δημιουργία JSON για έναν φάκελο αν λείπει - επιστρέφει (generated, complete)"""
+        # Έλεγχος αν υπάρχει ήδη JSON αρχείο (νέο ή παλιό naming)
+        # Τα υπάρχοντα JSON (και τα manual input) δεν αντικαθίστανται ποτέ
+        json_file = signal_folder / "signal_info.json"
+        if json_file.exists() or any(signal_folder.glob("*_info.json")):
+            return False, True
+        
+        # Αναζήτηση PDF αρχείου με το όνομα του φακέλου
+        signal_id = signal_folder.name
+        pdf_file = signal_folder / f"{signal_id}.pdf"
+        
+        if not pdf_file.exists():
+            return False, False  # Δεν υπάρχει το αναμενόμενο PDF
+        
+        # Δημιουργία JSON από το PDF
+        generated = self.generate_json_from_pdf(pdf_file, signal_folder, signal_id)
+        return generated, generated
+    
+    def _load_scan_state(self):
+        """Φόρτωση της κατάστασης σάρωσης (μία φορά ανά session)"""
+        if self._scan_state is None:
+            self._scan_state = {}
+            try:
+                if self.scan_state_file.exists():
+                    with open(self.scan_state_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    # Άλλος φάκελος DATA → η παλιά κατάσταση δεν ισχύει
+                    if data.get('data_folder') == str(self.data_folder):
+                        self._scan_state = data.get('folders', {})
+            except Exception as e:
+                print(f"Σφάλμα στη φόρτωση του scan state: {e}")
+        
+        return self._scan_state
+    
+    def _save_scan_state(self):
+        """Αποθήκευση της κατάστασης σάρωσης (temp file + rename)"""
+        try:
+            temp_file = self.scan_state_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'data_folder': str(self.data_folder), 'folders': self._scan_state},
+                          f, ensure_ascii=False)
+            os.replace(temp_file, self.scan_state_file)
+        except Exception as e:
+            print(f"Σφάλμα στην αποθήκευση του scan state: {e}")
+    
+    def request_json_scan(self, recipient_names=None, callback=None):
+        """Προγραμματισμός σάρωσης JSON στο background χωρίς αναμονή
+        
+        Το callback καλείται από το background thread με τον αριθμό των νέων JSON.
+        """
+        with self._scan_queue_lock:
+            if self._scan_worker is None or not self._scan_worker.is_alive():
+                self._scan_worker = threading.Thread(target=self._json_scan_worker, daemon=True)
+                self._scan_worker.start()
+        
+        self._scan_queue.put((recipient_names, callback))
+    
+    def _json_scan_worker(self):
+        """Background worker - συγχωνεύει τα αιτήματα που περιμένουν σε μία σάρωση"""
+        while True:
+            requests = [self._scan_queue.get()]
+            while True:
+                try:
+                    requests.append(self._scan_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            if any(names is None for names, _ in requests):
+                recipient_names = None
+            else:
+                recipient_names = []
+                for names, _ in requests:
+                    recipient_names.extend(name for name in names if name not in recipient_names)
             
-            return generated_count
+            generated_count = self.scan_and_generate_missing_json_files(recipient_names)
             
-        except Exception as e:
-            print(f"Σφάλμα στη σάρωση JSON αρχείων: {e}")
-            return 0
+            for _, callback in requests:
+                if callback:
+                    try:
+                        callback(generated_count)
+                    except Exception as e:
+                        print(f"Σφάλμα στο callback σάρωσης JSON: {e}")
     
     def generate_json_from_pdf(self, pdf_file, signal_folder, signal_id):
         """Δημιουργία JSON αρχείου από PDF σήμα"""
@@ -11,12 +11,12 @@ import shutil
 import os
 import re
 from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.drawing.image import Image
 import tempfile
 import subprocess
 import platform
 from app.utils.path_manager import get_path_manager
+from app.services.search_index import ARCHIVE_SEPARATOR
+from app.utils.progress_manager import ProgressTracker
 
 class USBExtractor:
     def __init__(self, config_manager=None, progress_manager=None):
@@ -26,18 +26,24 @@ class USBExtractor:
         self.backup_folder = self.path_manager.backup_folder
         self.templates_folder = self.path_manager.templates_folder
         self.signal_manager = None
+        self.backup_archiver = None
         self.config_manager = config_manager
         self.progress_manager = progress_manager
-        
-        print(f"USBExtractor using DATA folder: {self.data_folder}")
-        print(f"USBExtractor using BACKUP folder: {self.backup_folder}")
-        print(f"USBExtractor using templates folder: {self.templates_folder}")
     
     def set_signal_manager(self, signal_manager):
         """Ορισμός του signal manager"""
         self.signal_manager = signal_manager
     
-    def copy_signal_folder_without_json(self, source_folder, target_folder):
+    def set_backup_archiver(self, backup_archiver):
+        """Ορισμός του backup archiver"""
+        self.backup_archiver = backup_archiver
+    
+    def _files_to_copy(self, source_folder):
+        """Αρχεία ενός φακέλου σήματος που πάνε στο USB (όλα εκτός από JSON)"""
+        return [file for file in Path(source_folder).iterdir()
+                if file.is_file() and not file.name.endswith('.json')]
+    
+    def copy_signal_folder_without_json(self, source_folder, target_folder, tracker=None):
         """Αντιγραφή φακέλου σήματος εκτός από JSON αρχεία"""
         source_path = Path(source_folder)
         target_path = Path(target_folder)
@@ -46,13 +52,24 @@ class USBExtractor:
         target_path.mkdir(parents=True, exist_ok=True)
         
         # Αντιγραφή όλων των αρχείων εκτός από JSON
-        for file in source_path.iterdir():
-            if file.is_file() and not file.name.endswith('.json'):
-                target_file = target_path / file.name
-                shutil.copy2(file, target_file)
+        for file in self._files_to_copy(source_path):
+            target_file = target_path / file.name
+            shutil.copy2(file, target_file)
+            if tracker is not None:
+                tracker.advance(f"Αντιγραφή {source_path.name}/{file.name}...", steps=0,
+                                bytes_count=target_file.stat().st_size)
     
-    def extract_to_usb(self, usb_path, selected_recipients, file_number, username, is_unofficial=False):
-        """Κύρια μέθοδος εξαγωγής σε USB"""
+    def extract_to_usb(self, usb_path, selected_recipients, file_number, username, is_unofficial=False,
+                       progress_callback=None):
+        """Κύρια μέθοδος εξαγωγής σε USB
+        
+        progress_callback: δέχεται ProgressEvent - ένα βήμα ανά φάκελο σήματος, backup,
+        Excel/PDF παραλήπτη και καθαρισμό, και τα bytes που αντιγράφηκαν στο USB.
+        """
+        if progress_callback is None and self.progress_manager:
+            progress_callback = self.progress_manager.reporter("usb_extraction")
+        tracker = ProgressTracker(progress_callback)
+        
         try:
             if is_unofficial:
                 # For unofficial mode, use current date as folder name
@@ -82,43 +99,61 @@ class USBExtractor:
             # Δημιουργία φακέλου εξαγωγής
             usb_extraction_path.mkdir(parents=True, exist_ok=True)
             
-            # Συλλογή όλων των σημάτων για εξαγωγή
-            all_signals_data = {}
-            
+            # Συλλογή όλων των σημάτων για εξαγωγή - το μέγεθος της δουλειάς είναι γνωστό από την αρχή
+            recipient_signals = {}
             for recipient in selected_recipients:
                 signals = self.signal_manager.get_recipient_signals(recipient)
                 if signals:
-                    # Δημιουργία φακέλου παραλήπτη στο USB
-                    if len(selected_recipients) > 1:
-                        recipient_usb_path = usb_extraction_path / recipient
-                    else:
-                        recipient_usb_path = usb_extraction_path
+                    recipient_signals[recipient] = signals
+            
+            signal_count = sum(len(signals) for signals in recipient_signals.values())
+            excel_steps = 0 if is_unofficial else len(recipient_signals)
+            tracker.add_total(
+                steps=signal_count + len(recipient_signals) + excel_steps + 1,
+                bytes_count=sum(
+                    file.stat().st_size
+                    for signals in recipient_signals.values()
+                    for signal in signals
+                    for file in self._files_to_copy(signal['folder_path'])
+                )
+            )
+            tracker.report(f"Αντιγραφή {signal_count} σημάτων στο USB...")
+            
+            all_signals_data = {}
+            
+            for recipient, signals in recipient_signals.items():
+                # Δημιουργία φακέλου παραλήπτη στο USB
+                if len(selected_recipients) > 1:
+                    recipient_usb_path = usb_extraction_path / recipient
+                else:
+                    recipient_usb_path = usb_extraction_path
+                
+                recipient_usb_path.mkdir(exist_ok=True)
+                
+                # Αντιγραφή φακέλων σημάτων (εκτός από JSON αρχεία)
+                signal_folders = []
+                for signal in signals:
+                    source_folder = Path(signal['folder_path'])
+                    target_folder = recipient_usb_path / source_folder.name
                     
-                    recipient_usb_path.mkdir(exist_ok=True)
+                    # Χρήση helper method για αντιγραφή χωρίς JSON
+                    self.copy_signal_folder_without_json(source_folder, target_folder, tracker)
+                    tracker.advance(f"Αντιγράφηκε το {source_folder.name} ({recipient})")
                     
-                    # Αντιγραφή φακέλων σημάτων (εκτός από JSON αρχεία)
-                    signal_folders = []
-                    for signal in signals:
-                        source_folder = Path(signal['folder_path'])
-                        target_folder = recipient_usb_path / source_folder.name
-                        
-                        # Χρήση helper method για αντιγραφή χωρίς JSON
-                        self.copy_signal_folder_without_json(source_folder, target_folder)
-                        
-                        signal_folders.append(signal['folder_path'])
-                    
-                    # Αποθήκευση δεδομένων για backup και Excel
-                    all_signals_data[recipient] = {
-                        'signals': signals,
-                        'folders': signal_folders
-                    }
+                    signal_folders.append(signal['folder_path'])
+                
+                # Αποθήκευση δεδομένων για backup και Excel
+                all_signals_data[recipient] = {
+                    'signals': signals,
+                    'folders': signal_folders
+                }
             
             # Δημιουργία backup
             if is_unofficial:
                 backup_folder_name = usb_folder_name  # Use date-based name for unofficial
             else:
                 backup_folder_name = f"Α.Φ. {file_number}"
-            self.create_backup(all_signals_data, backup_folder_name)
+            self.create_backup(all_signals_data, backup_folder_name, tracker)
             
             # Δημιουργία Excel και PDF για κάθε παραλήπτη ξεχωριστά (only in official mode)
             pdf_paths = []
@@ -128,25 +163,22 @@ class USBExtractor:
                 
                 for recipient in all_signals_data.keys():
                     current_recipient += 1
+                    tracker.report(f"Δημιουργία Excel αρχείου για '{recipient}'...")
                     
-                    # Update progress for Excel creation
-                    if self.progress_manager:
-                        progress_val = 40 + (current_recipient - 1) * 30 / recipient_count
-                        self.progress_manager.update_progress("usb_extraction", progress_val, 
-                                                            f"Δημιουργία Excel αρχείου για '{recipient}'...")
-                    
-                    recipient_signals = {recipient: all_signals_data[recipient]}
                     pdf_path = self.create_excel_and_pdf_for_recipient(
-                        recipient_signals, file_number, username, backup_folder_name, current_recipient, recipient_count
+                        {recipient: all_signals_data[recipient]}, file_number, username, backup_folder_name,
+                        current_recipient, recipient_count, tracker
                     )
                     if pdf_path:
                         pdf_paths.append(pdf_path)
+                    tracker.advance(f"Excel/PDF για '{recipient}' ολοκληρώθηκε")
                 
                 # Άνοιγμα όλων των PDF αρχείων για εκτύπωση (only in official mode)
                 self.open_pdfs_for_printing(pdf_paths)
             
             # Διαγραφή σημάτων από DATA
             self.cleanup_data_folder(all_signals_data)
+            tracker.advance("Εξαγωγή ολοκληρώθηκε")
             
             # Δημιουργία αναλυτικών αποτελεσμάτων
             result_data = self.create_extraction_results(
@@ -160,17 +192,19 @@ class USBExtractor:
             print(f"Σφάλμα στην εξαγωγή USB: {e}")
             return False, None
     
-    def create_backup(self, signals_data, backup_folder_name):
+    def create_backup(self, signals_data, backup_folder_name, tracker=None):
         """Δημιουργία backup των σημάτων"""
         try:
             for recipient, data in signals_data.items():
                 self.signal_manager.move_to_backup(
                     recipient, data['folders'], backup_folder_name
                 )
+                if tracker is not None:
+                    tracker.advance(f"Backup '{recipient}' ολοκληρώθηκε")
         except Exception as e:
             print(f"Σφάλμα στη δημιουργία backup: {e}")
     
-    def create_excel_and_pdf_for_recipient(self, recipient_signals_data, file_number, username, backup_folder_name, current_recipient=1, total_recipients=1):
+    def create_excel_and_pdf_for_recipient(self, recipient_signals_data, file_number, username, backup_folder_name, current_recipient=1, total_recipients=1, tracker=None):
         """Δημιουργία Excel και PDF για έναν παραλήπτη"""
         import time
         
@@ -178,10 +212,8 @@ class USBExtractor:
             recipient_name = list(recipient_signals_data.keys())[0]
             
             # Update progress for Excel creation start
-            if self.progress_manager:
-                progress_val = 40 + (current_recipient - 1) * 30 / total_recipients
-                self.progress_manager.update_progress("usb_extraction", progress_val, 
-                                                    f"Excel '{recipient_name}' δημιουργείται...")
+            if tracker is not None:
+                tracker.report(f"Excel '{recipient_name}' δημιουργείται ({current_recipient}/{total_recipients})...")
             
             # 1. Δημιουργία temp folder
             temp_folder = self.path_manager.temp_folder
@@ -241,10 +273,8 @@ class USBExtractor:
                 time.sleep(2)
             
             # 4. Εξαγωγή σε PDF
-            if self.progress_manager:
-                progress_val = 40 + (current_recipient - 0.3) * 30 / total_recipients
-                self.progress_manager.update_progress("usb_extraction", progress_val, 
-                                                    f"PDF εξαγωγή '{recipient_name}'...")
+            if tracker is not None:
+                tracker.report(f"PDF εξαγωγή '{recipient_name}' ({current_recipient}/{total_recipients})...")
             
             pdf_path = self.export_excel_to_pdf_new(temp_excel_path, recipient_name, file_number, backup_folder_name, total_signals)
             
@@ -552,8 +582,28 @@ class USBExtractor:
         
         return self.signal_manager.get_all_recipients()
     
-    def undo_extraction(self, result_data):
-        """Αναίρεση εξαγωγής - επαναφορά σημάτων στη θέση τους"""
+    def _find_archived_backup(self, recipient_name, backup_folder_name):
+        """Συμπιεσμένο αρχείο για φάκελο Α.Φ. του backup (αν υπάρχει)"""
+        if not self.backup_archiver:
+            return None
+        return self.backup_archiver.find_archived_pack(recipient_name, backup_folder_name)
+    
+    def _relocate_search_entry(self, old_path, new_path):
+        """Ενημέρωση του ευρετηρίου αναζήτησης για σήμα που επανήλθε στο DATA"""
+        if self.signal_manager and new_path:
+            self.signal_manager.search_index.relocate(old_path, new_path, 'DATA')
+    
+    def _remove_search_entries(self, path):
+        """Αφαίρεση διαγραμμένου backup από το ευρετήριο αναζήτησης"""
+        if self.signal_manager:
+            self.signal_manager.search_index.remove(path)
+    
+    def undo_extraction(self, result_data, progress_callback=None):
+        """Αναίρεση εξαγωγής - επαναφορά σημάτων στη θέση τους
+        
+        progress_callback: δέχεται ProgressEvent - επαναφορά και διαγραφή backup ανά
+        παραλήπτη, διαγραφή από το USB και των PDF.
+        """
         try:
             file_number = result_data.get('file_number')
             backup_folder_name = result_data.get('backup_folder_name', f"Α.Φ. {file_number}")
@@ -564,14 +614,18 @@ class USBExtractor:
                 return False, "Δεν βρέθηκαν δεδομένα παραληπτών για αναίρεση"
             
             restored_count = 0
+            tracker = ProgressTracker(progress_callback,
+                                      total_steps=2 * len(result_data['extracted_recipients']) + 2)
             
             # 1. Επαναφορά σημάτων από backup στο DATA (νέα δομή)
             for recipient_data in result_data.get('extracted_recipients', []):
                 recipient_name = recipient_data['name']
+                tracker.report(f"Επαναφορά σημάτων '{recipient_name}' στο DATA...")
                 
                 # Νέα δομή backup: BACK UP DATA/ΛΑΦ ΙΩΑΝΝΙΝΩΝ/Α.Φ. 8635/
                 recipient_backup_path = self.backup_folder / recipient_name
                 file_number_backup_path = recipient_backup_path / backup_folder_name
+                archive_path = self._find_archived_backup(recipient_name, backup_folder_name)
                 
                 if file_number_backup_path.exists():
                     # Δημιουργία φακέλου παραλήπτη στο DATA
@@ -584,13 +638,29 @@ class USBExtractor:
                             target_path = data_recipient_path / signal_folder.name
                             if not target_path.exists():
                                 shutil.copytree(signal_folder, target_path)
+                                self._relocate_search_entry(signal_folder, target_path)
                                 restored_count += 1
                             else:
                                 # Αν υπάρχει ήδη, απλά αγνοούμε
                                 pass
 
+                elif archive_path:
+                    # Ο φάκελος Α.Φ. έχει ήδη συμπιεστεί - επαναφορά από το ευρετήριο του αρχείου
+                    data_recipient_path = self.data_folder / recipient_name
+                    data_recipient_path.mkdir(parents=True, exist_ok=True)
+                    
+                    index = self.backup_archiver.load_index(archive_path) or {'signals': {}}
+                    for signal_folder_name in index['signals']:
+                        if not (data_recipient_path / signal_folder_name).exists():
+                            restored_path = self.backup_archiver.restore_signal(
+                                archive_path, signal_folder_name, data_recipient_path)
+                            self._relocate_search_entry(f"{archive_path}{ARCHIVE_SEPARATOR}{signal_folder_name}",
+                                                        restored_path)
+                            restored_count += 1
+                
                 else:
                     print(f"Δεν βρέθηκε το backup για {recipient_name}: {file_number_backup_path}")
+                tracker.advance(f"Επαναφέρθηκαν {restored_count} φάκελοι σημάτων")
             
             # 2. Διαγραφή από backup (νέα δομή)
             for recipient_data in result_data.get('extracted_recipients', []):
@@ -598,16 +668,24 @@ class USBExtractor:
                 recipient_backup_path = self.backup_folder / recipient_name
                 file_number_backup_path = recipient_backup_path / backup_folder_name
                 
+                archive_path = self._find_archived_backup(recipient_name, backup_folder_name)
+                if archive_path:
+                    self.backup_archiver.delete_archive(archive_path)
+                    self._remove_search_entries(f"{archive_path}{ARCHIVE_SEPARATOR}")
+                
                 if file_number_backup_path.exists():
                     shutil.rmtree(file_number_backup_path)
-                    
-                    # Αν ο φάκελος παραλήπτη είναι άδειος, διαγραφή του
-                    if recipient_backup_path.exists() and not any(recipient_backup_path.iterdir()):
-                        recipient_backup_path.rmdir()
+                self._remove_search_entries(file_number_backup_path)
+                
+                # Αν ο φάκελος παραλήπτη είναι άδειος, διαγραφή του
+                if recipient_backup_path.exists() and not any(recipient_backup_path.iterdir()):
+                    recipient_backup_path.rmdir()
+                tracker.advance(f"Διαγραφή backup '{recipient_name}' ολοκληρώθηκε")
             
             # 3. Διαγραφή από USB
             if extraction_path.exists():
                 shutil.rmtree(extraction_path)
+            tracker.advance("Διαγραφή από το USB ολοκληρώθηκε")
             
             # 4. Διαγραφή όλων των PDF αρχείων από backup folder (αν υπάρχουν)
             pdf_paths = result_data.get('pdf_paths', [])
@@ -623,6 +701,7 @@ class USBExtractor:
                 Path(old_pdf_path).unlink(missing_ok=True)
             
             # Τα Excel είναι προσωρινά αρχεία, δεν χρειάζεται διαγραφή
+            tracker.advance("Αναίρεση ολοκληρώθηκε")
             
             success_message = f"Επαναφέρθηκαν {restored_count} φάκελοι σημάτων επιτυχώς"
             return True, success_message
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Signal Search Dialog for autoPyrseia
+"""
+
+import os
+import platform
+import subprocess
+import time
+import tkinter as tk
+from tkinter import ttk
+
+
+class SearchDialog:
+    """Dialog αναζήτησης σημάτων στο ευρετήριο πλήρους κειμένου"""
+    
+    LOCATION_LABELS = {'DATA': 'DATA', 'BACKUP': 'BACK UP', 'ARCHIVE': 'Αρχείο zip'}
+    
+    def __init__(self, parent, search_index):
+        self.search_index = search_index
+        self.results = {}
+        self._pending_search = None
+        
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Αναζήτηση Σημάτων")
+        self.dialog.transient(parent)
+        self.dialog.geometry("900x500")
+        self.dialog.minsize(600, 300)
+        
+        self.setup_ui()
+        self.center_dialog()
+        self.query_entry.focus_set()
+    
+    def center_dialog(self):
+        """Κεντράρισμα του dialog στην οθόνη"""
+        self.dialog.update_idletasks()
+        width = self.dialog.winfo_width()
+        height = self.dialog.winfo_height()
+        x = (self.dialog.winfo_screenwidth() // 2) - (width // 2)
+        y = (self.dialog.winfo_screenheight() // 2) - (height // 2)
+        self.dialog.geometry(f"+{x}+{y}")
+    
+    def setup_ui(self):
+        """Δημιουργία του UI"""
+        main_frame = ttk.Frame(self.dialog, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Πεδίο αναζήτησης - αναζήτηση καθώς πληκτρολογεί ο χρήστης
+        query_frame = ttk.Frame(main_frame)
+        query_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(query_frame, text="Αναζήτηση:", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=(0, 5))
+        
+        self.query_var = tk.StringVar()
+        self.query_entry = ttk.Entry(query_frame, textvariable=self.query_var, font=("Arial", 11))
+        self.query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.query_var.trace_add('write', lambda *args: self.schedule_search())
+        self.query_entry.bind('<Return>', lambda e: self.run_search())
+        self.query_entry.bind('<Down>', self.focus_results)
+        
+        # Αποτελέσματα
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ('signal_id', 'recipient', 'location', 'theme', 'snippet')
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', selectmode='browse')
+        self.tree.heading('signal_id', text='ID Σήματος')
+        self.tree.heading('recipient', text='Παραλήπτης')
+        self.tree.heading('location', text='Θέση')
+        self.tree.heading('theme', text='Θέμα')
+        self.tree.heading('snippet', text='Απόσπασμα')
+        self.tree.column('signal_id', width=110, stretch=False)
+        self.tree.column('recipient', width=150, stretch=False)
+        self.tree.column('location', width=80, stretch=False)
+        self.tree.column('theme', width=200)
+        self.tree.column('snippet', width=320)
+        
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree.bind('<Double-1>', lambda e: self.open_selected())
+        self.tree.bind('<Return>', lambda e: self.open_selected())
+        
+        # Κατάσταση και κουμπιά
+        bottom_frame = ttk.Frame(main_frame)
+        bottom_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        self.status_label = ttk.Label(bottom_frame, text="Πληκτρολογήστε ID, Φ.Μ., θέμα ή κείμενο σήματος",
+                                      foreground='#7f8c8d')
+        self.status_label.pack(side=tk.LEFT)
+        
+        ttk.Button(bottom_frame, text="Κλείσιμο", command=self.dialog.destroy).pack(side=tk.RIGHT)
+        ttk.Button(bottom_frame, text="Άνοιγμα Φακέλου", command=self.open_selected).pack(side=tk.RIGHT, padx=(0, 5))
+        
+        self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
+    
+    def schedule_search(self):
+        """Αναζήτηση λίγο μετά το τελευταίο πλήκτρο"""
+        if self._pending_search:
+            self.dialog.after_cancel(self._pending_search)
+        self._pending_search = self.dialog.after(150, self.run_search)
+    
+    def run_search(self):
+        """Εκτέλεση αναζήτησης και εμφάνιση αποτελεσμάτων"""
+        self._pending_search = None
+        query = self.query_var.get().strip()
+        
+        self.tree.delete(*self.tree.get_children())
+        self.results = {}
+        if not query:
+            self.status_label.config(text="Πληκτρολογήστε ID, Φ.Μ., θέμα ή κείμενο σήματος")
+            return
+        
+        start_time = time.perf_counter()
+        try:
+            results = self.search_index.search(query)
+        except Exception as e:
+            self.status_label.config(text=f"Σφάλμα αναζήτησης: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        
+        for result in results:
+            item_id = self.tree.insert('', 'end', values=(
+                result['signal_id'],
+                result['recipient'],
+                self.LOCATION_LABELS.get(result['location'], result['location']),
+                result['theme'],
+                ' '.join((result['snippet'] or '').split())
+            ))
+            self.results[item_id] = result
+        
+        self.status_label.config(text=f"{len(results)} αποτελέσματα ({elapsed_ms:.0f} ms)")
+    
+    def focus_results(self, event=None):
+        """Μετάβαση από το πεδίο αναζήτησης στα αποτελέσματα"""
+        children = self.tree.get_children()
+        if children:
+            self.tree.focus_set()
+            self.tree.selection_set(children[0])
+            self.tree.focus(children[0])
+        return 'break'
+    
+    def open_selected(self):
+        """Άνοιγμα του φακέλου του επιλεγμένου σήματος (ή του φακέλου του zip)"""
+        selection = self.tree.selection()
+        if not selection:
+            return
+        result = self.results.get(selection[0])
+        if not result:
+            return
+        
+        open_path = result['open_path']
+        if result['location'] == 'ARCHIVE':
+            open_path = os.path.dirname(open_path)
+        
+        if not os.path.exists(open_path):
+            self.status_label.config(text=f"Ο φάκελος δεν υπάρχει πλέον: {open_path}")
+            return
+        
+        try:
+            if platform.system() == "Windows":
+                os.startfile(open_path)
+            elif platform.system() == "Darwin":  # macOS
+                subprocess.run(["open", open_path])
+            else:  # Linux
+                subprocess.run(["xdg-open", open_path])
+        except Exception as e:
+            print(f"Error opening folder {open_path}: {e}")
@@ -1,5 +1,9 @@
 """
 Multi-Day Daily History Tab - Navigation through multiple days
+
+Οι γραμμές κάθε λίστας δεν ξαναγράφονται σε κάθε νέα εγγραφή: οι νέες εγγραφές
+προστίθενται στην κορυφή και οι παλαιότερες εμφανίζονται ανά σελίδα όσο ο
+χρήστης κυλάει προς τα κάτω (_PagedHistoryView).
 """
 import tkinter as tk
 from tkinter import ttk
@@ -9,6 +13,77 @@ import platform
 from datetime import datetime
 
 
+class _PagedHistoryView:
+    """Οι εγγραφές μιας ημέρας σε ένα Treeview (νεότερες πρώτα)
+    
+    Το iid κάθε γραμμής είναι η θέση της εγγραφής στην ημέρα, οπότε η εγγραφή
+    μιας γραμμής βρίσκεται χωρίς αναζήτηση (entry_for).
+    """
+    
+    # Γραμμές που προστίθενται κάθε φορά που ο χρήστης φτάνει κοντά στο τέλος
+    PAGE_SIZE = 200
+    
+    # Θέση της μπάρας κύλισης (0-1) από την οποία εμφανίζεται η επόμενη σελίδα
+    LOAD_MORE_AT = 0.9
+    
+    def __init__(self, tree, scrollbar, format_row):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.format_row = format_row
+        self.date = None
+        self.entries = []
+        # Θέση της παλαιότερης εγγραφής που έχει γραμμή (όσες είναι πριν δεν εμφανίζονται ακόμα)
+        self.oldest_rendered = 0
+        self._more_pending = False
+        
+        self.tree.configure(yscrollcommand=self._on_yscroll)
+    
+    def show(self, date, entries):
+        """Εμφάνιση των εγγραφών - μόνο οι νέες αν η ημέρα είναι η ίδια"""
+        known = len(self.entries)
+        if (date == self.date and len(entries) >= known and
+                (known == 0 or entries[known - 1] is self.entries[-1])):
+            # Το ιστορικό είναι append-only: μόνο οι νέες εγγραφές στην κορυφή
+            self.entries = entries
+            for index in range(known, len(entries)):
+                self._insert(index, 0)
+            return
+        
+        # Άλλη ημέρα (ή το ιστορικό άλλαξε) - νέα εμφάνιση από την πρώτη σελίδα
+        self.tree.delete(*self.tree.get_children())
+        self.date = date
+        self.entries = entries
+        self.oldest_rendered = len(entries)
+        self._render_more()
+        self.tree.yview_moveto(0)
+    
+    def entry_for(self, iid):
+        """Η εγγραφή ιστορικού μιας γραμμής"""
+        try:
+            return self.entries[int(iid)]
+        except (ValueError, IndexError):
+            return None
+    
+    def _insert(self, index, position):
+        tag = 'evenrow' if index % 2 == 0 else 'oddrow'
+        self.tree.insert('', position, iid=str(index), values=self.format_row(self.entries[index]), tags=(tag,))
+    
+    def _render_more(self):
+        """Η επόμενη σελίδα παλαιότερων εγγραφών στο τέλος της λίστας"""
+        self._more_pending = False
+        start = max(0, self.oldest_rendered - self.PAGE_SIZE)
+        for index in range(self.oldest_rendered - 1, start - 1, -1):
+            self._insert(index, 'end')
+        self.oldest_rendered = start
+    
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.oldest_rendered > 0 and not self._more_pending and float(last) >= self.LOAD_MORE_AT:
+            # Όχι μέσα στο callback της κύλισης
+            self._more_pending = True
+            self.tree.after_idle(self._render_more)
+
+
 class DailyHistoryTab:
     """Multi-day history tab with navigation controls"""
     
@@ -176,7 +251,7 @@ class DailyHistoryTab:
         
         # Scrollbar for treeview
         tree_scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=self.processed_tree.yview)
-        self.processed_tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.processed_view = _PagedHistoryView(self.processed_tree, tree_scrollbar, self._format_processed_row)
         
         # Pack treeview and scrollbar
         self.processed_tree.pack(side='left', fill='both', expand=True)
@@ -229,7 +304,7 @@ class DailyHistoryTab:
         
         # Scrollbar for treeview
         tree_scrollbar2 = ttk.Scrollbar(tree_frame2, orient='vertical', command=self.extracted_tree.yview)
-        self.extracted_tree.configure(yscrollcommand=tree_scrollbar2.set)
+        self.extracted_view = _PagedHistoryView(self.extracted_tree, tree_scrollbar2, self._format_extracted_row)
         
         # Pack treeview and scrollbar
         self.extracted_tree.pack(side='left', fill='both', expand=True)
@@ -243,10 +318,6 @@ class DailyHistoryTab:
         if not hasattr(self.app, 'daily_history'):
             return
         
-        # Clear treeview
-        for item in self.processed_tree.get_children():
-            self.processed_tree.delete(item)
-        
         # Get processed signals for current viewing date
         processed = self.app.daily_history.get_processed_signals()
         
@@ -267,34 +338,26 @@ class DailyHistoryTab:
             except:
                 self.processed_title_label.config(text=f"Σήματα που επεξεργάστηκαν στις {current_date}:")
         
-        # Add entries (newest first)
-        for idx, entry in enumerate(reversed(processed)):
-            time_str = entry.get('time', '')
-            signal_id = entry.get('signal_id', 'N/A')
-            fm = entry.get('fm', 'N/A')
-            recipients = entry.get('recipients', 'N/A')
-            
-            # Handle recipients list display
-            if isinstance(recipients, list):
-                recipients_str = ', '.join(recipients)
-            else:
-                recipients_str = str(recipients)
-            
-            # Determine row tag for alternating colors
-            tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            
-            # Insert into treeview
-            self.processed_tree.insert('', 'end', values=(time_str, signal_id, fm, recipients_str), tags=(tag,))
+        # Entries (newest first) - μόνο οι νέες γραμμές αν η ημέρα δεν άλλαξε
+        self.processed_view.show(current_date, processed)
+    
+    def _format_processed_row(self, entry):
+        """Τιμές γραμμής για ένα επεξεργασμένο σήμα"""
+        recipients = entry.get('recipients', 'N/A')
+        
+        # Handle recipients list display
+        if isinstance(recipients, list):
+            recipients_str = ', '.join(recipients)
+        else:
+            recipients_str = str(recipients)
+        
+        return (entry.get('time', ''), entry.get('signal_id', 'N/A'), entry.get('fm', 'N/A'), recipients_str)
     
     def refresh_extracted_recipients(self):
         """Refresh extracted recipients display for current viewing date"""
         if not hasattr(self.app, 'daily_history'):
             return
         
-        # Clear treeview
-        for item in self.extracted_tree.get_children():
-            self.extracted_tree.delete(item)
-        
         # Get extracted recipients for current viewing date
         extracted = self.app.daily_history.get_extracted_recipients()
         
@@ -315,17 +378,12 @@ class DailyHistoryTab:
             except:
                 self.extracted_title_label.config(text=f"Εξαγωγές που έγιναν στις {current_date}:")
         
-        # Add entries (newest first)
-        for idx, entry in enumerate(reversed(extracted)):
-            time_str = entry.get('time', '')
-            recipient = entry.get('recipient', 'N/A')
-            signal_count = entry.get('signal_count', 0)
-            
-            # Determine row tag for alternating colors
-            tag = 'evenrow' if idx % 2 == 0 else 'oddrow'
-            
-            # Insert into treeview
-            self.extracted_tree.insert('', 'end', values=(time_str, recipient, f"{signal_count} σήματα"), tags=(tag,))
+        # Entries (newest first) - μόνο οι νέες γραμμές αν η ημέρα δεν άλλαξε
+        self.extracted_view.show(current_date, extracted)
+    
+    def _format_extracted_row(self, entry):
+        """Τιμές γραμμής για μια εξαγωγή"""
+        return (entry.get('time', ''), entry.get('recipient', 'N/A'), f"{entry.get('signal_count', 0)} σήματα")
     
     def refresh_all(self):
         """Refresh both sub-tabs and navigation"""
@@ -351,13 +409,12 @@ class DailyHistoryTab:
         if not selection:
             return
         
-        # Get the selected item values
-        item = self.processed_tree.item(selection[0])
-        values = item['values']
+        # Η εγγραφή ιστορικού της γραμμής (τα values του Treeview μετατρέπουν π.χ. αριθμούς)
+        entry = self.processed_view.entry_for(selection[0])
         
-        if len(values) >= 4:
-            signal_id = values[1]  # Signal ID column
-            recipients_str = values[3]  # Recipients column
+        if entry:
+            signal_id = str(entry.get('signal_id', 'N/A'))
+            recipients_str = entry.get('recipients', 'N/A')
             
             # Parse recipients (handle both string and list formats)
             if isinstance(recipients_str, str):
@@ -365,6 +422,8 @@ class DailyHistoryTab:
                     print("No recipients selected for this signal")
                     return
                 recipients = [r.strip() for r in recipients_str.split(',')]
+            elif isinstance(recipients_str, list):
+                recipients = [str(r) for r in recipients_str]
             else:
                 recipients = [str(recipients_str)]
             
@@ -391,23 +450,12 @@ class DailyHistoryTab:
         if not selection:
             return
         
-        # Get the selected item values
-        item = self.extracted_tree.item(selection[0])
-        values = item['values']
+        # Η εγγραφή ιστορικού της γραμμής (με τον αριθμό φακέλου)
+        entry = self.extracted_view.entry_for(selection[0])
         
-        if len(values) >= 2:
-            recipient = values[1]  # Recipient column
-            time_str = values[0]   # Time column
-            
-            # Find the corresponding history entry to get the file number
-            file_number = None
-            if hasattr(self.app, 'daily_history'):
-                extracted_entries = self.app.daily_history.get_extracted_recipients()
-                for entry in extracted_entries:
-                    if (entry.get('recipient') == recipient and 
-                        entry.get('time') == time_str):
-                        file_number = entry.get('file_number')
-                        break
+        if entry:
+            recipient = str(entry.get('recipient', 'N/A'))
+            file_number = entry.get('file_number')
             
             if file_number:
                 # Build path to specific Α.Φ. folder: BACK UP DATA/recipient/Α.Φ. file_number/
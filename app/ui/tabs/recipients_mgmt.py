@@ -6,6 +6,7 @@ Recipients Management Tab for autoPyrseia
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from app.ui.widgets.virtual_checklist import VirtualChecklist
 
 
 class RecipientsManagementTab:
@@ -83,21 +84,22 @@ class RecipientsManagementTab:
     
     def _create_recipients_section(self, parent):
         """Create recipients list section"""
-        # Frame for checkboxes with scrollbar
-        self.app.manage_canvas = tk.Canvas(parent)
-        manage_scrollbar = ttk.Scrollbar(parent, orient='vertical', command=self.app.manage_canvas.yview)
-        self.app.manage_checkbox_frame = tk.Frame(self.app.manage_canvas)
-        
-        self.app.manage_checkbox_frame.bind(
-            "<Configure>",
-            lambda e: self.app.manage_canvas.configure(scrollregion=self.app.manage_canvas.bbox("all"))
+        # Αναζήτηση στη λίστα
+        search_frame = tk.Frame(parent)
+        search_frame.pack(fill='x', pady=(0, 5))
+        
+        tk.Label(search_frame, text="Αναζήτηση:", font=('Arial', 10)).pack(side='left')
+        self.search_var = tk.StringVar()
+        tk.Entry(search_frame, textvariable=self.search_var, width=30).pack(side='left', padx=(5, 0), fill='x', expand=True)
+        self.search_var.trace_add('write', lambda *args: self.app.manage_checklist.set_filter(self.search_var.get()))
+        
+        # Checkboxes μόνο για τις ορατές γραμμές - η επιλογή μένει στο app.manage_checkboxes
+        self.app.manage_checklist = VirtualChecklist(
+            parent,
+            items=self.app.manage_checkboxes,
+            menu_items=self._checkbox_menu_items
         )
-        
-        self.app.manage_canvas.create_window((0, 0), window=self.app.manage_checkbox_frame, anchor="nw")
-        self.app.manage_canvas.configure(yscrollcommand=manage_scrollbar.set)
-        
-        self.app.manage_canvas.pack(side='left', fill='both', expand=True)
-        manage_scrollbar.pack(side='right', fill='y')
+        self.app.manage_checklist.pack(fill='both', expand=True)
     
     def _create_management_buttons(self, parent):
         """Create management buttons"""
@@ -123,63 +125,31 @@ class RecipientsManagementTab:
     
     def refresh_recipients_list(self):
         """Refresh recipients list with checkboxes"""
-        # Clear previous checkboxes
-        for widget in self.app.manage_checkbox_frame.winfo_children():
-            widget.destroy()
-        self.app.manage_checkboxes.clear()
+        # Η επιλογή διατηρείται για όσους παραλήπτες υπάρχουν ακόμα
+        selected = {item['recipient'] for item in self.app.manage_checkboxes if item['var'].get()}
         
         # Load recipients
         recipients = self.app.recipients_manager.get_all_recipients()
-        for recipient in recipients:
-            var = tk.BooleanVar()
-            
-            checkbox = tk.Checkbutton(
-                self.app.manage_checkbox_frame,
-                text=recipient,
-                variable=var,
-                font=('Arial', 10),
-                anchor='w'
-            )
-            checkbox.pack(fill='x', padx=5, pady=2)
-            
-            # Add keyboard navigation and context menu
-            self._setup_checkbox_bindings(checkbox, var, recipient)
-            
-            self.app.manage_checkboxes.append({
-                'recipient': recipient,
-                'var': var,
-                'checkbox': checkbox
-            })
+        self.app.manage_checklist.set_items([
+            VirtualChecklist.make_item(recipient, recipient in selected) for recipient in recipients
+        ])
     
-    def _setup_checkbox_bindings(self, checkbox, var, recipient):
-        """Setup keyboard and mouse bindings for checkbox"""
-        checkbox.bind('<Return>', lambda e, v=var: v.set(not v.get()))
-        checkbox.bind('<space>', lambda e, v=var: v.set(not v.get()))
-        checkbox.bind('<FocusIn>', lambda e, cb=checkbox: cb.config(bg='#e8f4fd'))
-        checkbox.bind('<FocusOut>', lambda e, cb=checkbox: cb.config(bg='SystemButtonFace'))
-        
-        # Context menu
-        context_menu = tk.Menu(checkbox, tearoff=0)
-        context_menu.add_command(label="Επιλογή", command=lambda v=var: v.set(True))
-        context_menu.add_command(label="Αποεπιλογή", command=lambda v=var: v.set(False))
-        context_menu.add_separator()
-        context_menu.add_command(label="Επιλογή Όλων", command=lambda: self.select_all_manage_checkboxes(True))
-        context_menu.add_command(label="Αποεπιλογή Όλων", command=lambda: self.select_all_manage_checkboxes(False))
-        context_menu.add_separator()
-        context_menu.add_command(label="Διαγραφή", command=lambda r=recipient: self.delete_single_recipient(r))
-        
-        def show_context_menu(event):
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
-        
-        checkbox.bind('<Button-3>', show_context_menu)
+    def _checkbox_menu_items(self, item):
+        """Context menu μιας γραμμής"""
+        var = item['var']
+        return [
+            ("Επιλογή", lambda: var.set(True)),
+            ("Αποεπιλογή", lambda: var.set(False)),
+            None,
+            ("Επιλογή Όλων", lambda: self.select_all_manage_checkboxes(True)),
+            ("Αποεπιλογή Όλων", lambda: self.select_all_manage_checkboxes(False)),
+            None,
+            ("Διαγραφή", lambda r=item['recipient']: self.delete_single_recipient(r)),
+        ]
     
     def select_all_manage_checkboxes(self, state):
-        """Select or deselect all management checkboxes"""
-        for checkbox_data in self.app.manage_checkboxes:
-            checkbox_data['var'].set(state)
+        """Select or deselect all management checkboxes (όσα εμφανίζονται με το φίλτρο)"""
+        self.app.manage_checklist.select_all(state)
     
     def add_new_recipient(self):
         """Add new recipient to management"""
@@ -7,12 +7,16 @@ Signal Processing Tab for autoPyrseia
 import tkinter as tk
 from tkinter import ttk, messagebox
 from pathlib import Path
-from app.utils.file_operations import check_attachment_exists, find_similar_filename
+from app.utils.file_operations import resolve_attachments
+from app.ui.widgets.virtual_checklist import VirtualChecklist
 
 
 class SignalProcessingTab:
     """Signal processing tab component"""
     
+    # Ένδειξη συνημμένου που δεν έχει ελεγχθεί ακόμα
+    PENDING_STATUS = ("…", "gray")
+    
     def __init__(self, notebook, app):
         self.app = app
         self.notebook = notebook
@@ -24,6 +28,8 @@ class SignalProcessingTab:
         # Track duplicate state
         self.is_duplicate_signal = False
         self.recipients_with_signal = []
+        # Οι έλεγχοι που εφαρμόστηκαν στο τρέχον σήμα (None όσο εκκρεμούν)
+        self.signal_checks = None
     
     def create_widgets(self):
         """Create signal processing tab widgets"""
@@ -45,6 +51,9 @@ class SignalProcessingTab:
         
         # Process button - always visible at bottom
         self._create_process_button()
+        
+        # Intake queue - signals waiting behind the current one
+        self._create_intake_queue_section()
     
     def _create_signal_info_section(self, parent):
         """Create signal information section"""
@@ -139,21 +148,13 @@ class SignalProcessingTab:
         self.app.create_tooltip(folder_button, "Επιλέξτε φάκελο ως προσωρινό παραλήπτη")
         self.app.create_tooltip(add_recipient_button, "Προσθέστε παραλήπτη από τη λίστα (Alt+A)")
         
-        # Frame for checkboxes with scrollbar
-        self.app.recipients_canvas = tk.Canvas(parent, height=200)
-        recipients_scrollbar = ttk.Scrollbar(parent, orient='vertical', command=self.app.recipients_canvas.yview)
-        self.app.recipients_checkbox_frame = tk.Frame(self.app.recipients_canvas)
-        
-        self.app.recipients_checkbox_frame.bind(
-            "<Configure>",
-            lambda e: self.app.recipients_canvas.configure(scrollregion=self.app.recipients_canvas.bbox("all"))
-        )
-        
-        self.app.recipients_canvas.create_window((0, 0), window=self.app.recipients_checkbox_frame, anchor="nw")
-        self.app.recipients_canvas.configure(yscrollcommand=recipients_scrollbar.set)
+        # Ειδοποιήσεις διπλότυπου κάτω από τη λίστα
+        self.app.recipients_notice_frame = tk.Frame(parent)
+        self.app.recipients_notice_frame.pack(side='bottom', fill='x')
         
-        self.app.recipients_canvas.pack(side='left', fill='both', expand=True)
-        recipients_scrollbar.pack(side='right', fill='y')
+        # Checkboxes μόνο για τις ορατές γραμμές - η επιλογή μένει στο app.recipients_checkboxes
+        self.app.recipients_checklist = VirtualChecklist(parent, items=self.app.recipients_checkboxes, height=200)
+        self.app.recipients_checklist.pack(fill='both', expand=True)
     
     def _create_process_button(self):
         """Create process signal button"""
@@ -168,8 +169,122 @@ class SignalProcessingTab:
         
         self.app.create_tooltip(self.app.process_button, "Επεξεργαστείτε το σήμα για όλους τους επιλεγμένους παραλήπτες (Enter)")
     
-    def display_signal_data(self, signal_data):
-        """Display signal data in the tab"""
+    def _create_intake_queue_section(self):
+        """Create intake queue section"""
+        self.queue_frame = ttk.LabelFrame(self.frame, text="Ουρά Σημάτων", padding=5)
+        self.queue_frame.pack(side='bottom', fill='x', padx=10)
+        
+        columns = ('number', 'signal_id', 'fm', 'attachments', 'status')
+        self.queue_tree = ttk.Treeview(self.queue_frame, columns=columns, show='headings',
+                                       height=3, selectmode='browse')
+        self.queue_tree.heading('number', text='#')
+        self.queue_tree.heading('signal_id', text='ID Σήματος')
+        self.queue_tree.heading('fm', text='Φ.Μ.')
+        self.queue_tree.heading('attachments', text='Συνημμένα')
+        self.queue_tree.heading('status', text='Κατάσταση')
+        self.queue_tree.column('number', width=50, stretch=False, anchor='center')
+        self.queue_tree.column('signal_id', width=150)
+        self.queue_tree.column('fm', width=200)
+        self.queue_tree.column('attachments', width=80, stretch=False, anchor='center')
+        self.queue_tree.column('status', width=130, stretch=False)
+        self.queue_tree.pack(side='left', fill='x', expand=True)
+        self.queue_tree.bind('<Double-1>', lambda e: self.show_selected_queue_signal())
+        
+        queue_buttons = tk.Frame(self.queue_frame)
+        queue_buttons.pack(side='right', fill='y', padx=(5, 0))
+        
+        show_button = tk.Button(queue_buttons, text="Εμφάνιση", command=self.show_selected_queue_signal,
+                                bg='#3498db', fg='white', font=('Arial', 8), width=10)
+        show_button.pack(pady=(0, 3))
+        remove_button = tk.Button(queue_buttons, text="Αφαίρεση", command=self.remove_selected_queue_signal,
+                                  bg='#e74c3c', fg='white', font=('Arial', 8), width=10)
+        remove_button.pack()
+        
+        self.app.create_tooltip(show_button, "Εμφάνιση του επιλεγμένου σήματος της ουράς (διπλό κλικ)")
+        self.app.create_tooltip(remove_button, "Αφαίρεση του επιλεγμένου σήματος και των αρχείων του από την ουρά")
+    
+    def refresh_intake_queue(self):
+        """Ενημέρωση της λίστας της ουράς σημάτων"""
+        status_labels = {
+            'parsing': "Ανάλυση...",
+            'ready': "Έτοιμο",
+            'manual': "Χειροκίνητη εισαγωγή",
+            'processing': "Επεξεργασία...",
+            'error': "Σφάλμα PDF"
+        }
+        
+        current = self.app.current_signal_data
+        current_id = current.get('intake_id') if current else None
+        selection = self.queue_tree.selection()
+        
+        self.queue_tree.delete(*self.queue_tree.get_children())
+        entries = self.app.intake_queue.entries()
+        for entry in entries:
+            signal_data = entry['signal_data'] or {}
+            status = status_labels.get(entry['status'], entry['status'])
+            if entry['id'] == current_id and entry['status'] != 'processing':
+                status = "▶ Σε προβολή"
+            
+            manual = signal_data.get('manual_input')
+            self.queue_tree.insert('', 'end', iid=str(entry['id']), values=(
+                entry['id'],
+                '' if manual else signal_data.get('id', ''),
+                '' if manual else signal_data.get('fm', ''),
+                len(signal_data.get('attachments', [])) if signal_data else '',
+                status
+            ))
+        
+        if selection and self.queue_tree.exists(selection[0]):
+            self.queue_tree.selection_set(selection[0])
+        
+        waiting = len([entry for entry in entries if entry['id'] != current_id])
+        title = f"Ουρά Σημάτων ({waiting} σε αναμονή)" if waiting else "Ουρά Σημάτων"
+        
+        # Στάδια του pipeline με δουλειά (σε ουρά + σε εξέλιξη)
+        busy_stages = [f"{stats['name']} {stats['depth']}+{stats['in_flight']}"
+                       for stats in self.app.signal_controller.get_pipeline_stats()
+                       if stats['depth'] or stats['in_flight']]
+        if busy_stages:
+            title += " - Στάδια: " + ", ".join(busy_stages)
+        self.queue_frame.config(text=title)
+    
+    def show_selected_queue_signal(self):
+        """Εμφάνιση του επιλεγμένου σήματος της ουράς στη θέση του τρέχοντος"""
+        selection = self.queue_tree.selection()
+        if not selection or self.app.signal_controller.processing:
+            return
+        
+        # Οι αλλαγές (ID, Φ.Μ., θέμα) μένουν στο σήμα της ουράς
+        self.app.current_signal_data = None
+        self.clear_signal_display()
+        self.app.signal_controller.show_intake_entry(int(selection[0]))
+        if not self.app.current_signal_data:
+            # Δεν είναι ακόμα έτοιμο - εμφάνιση του επόμενου διαθέσιμου
+            self.app.signal_controller.handle_new_signal()
+        self.refresh_intake_queue()
+    
+    def remove_selected_queue_signal(self):
+        """Αφαίρεση του επιλεγμένου σήματος από την ουρά"""
+        selection = self.queue_tree.selection()
+        if not selection:
+            return
+        
+        if not messagebox.askyesno("Επιβεβαίωση",
+                                   f"Θέλετε να αφαιρέσετε το σήμα #{selection[0]} από την ουρά;\n\n"
+                                   "Θα διαγραφούν το PDF και τα συνημμένα του.",
+                                   icon='warning'):
+            return
+        
+        if not self.app.discard_signal(int(selection[0])):
+            messagebox.showwarning("Ουρά Σημάτων", "Το σήμα επεξεργάζεται αυτή τη στιγμή.")
+    
+    def display_signal_data(self, signal_data, checks=None):
+        """Display signal data in the tab
+        
+        checks: το αποτέλεσμα του SignalPipeline.signal_checks (διπλότυπα, πλάνο συνημμένων)
+        από το background. Χωρίς αυτό το σήμα εμφανίζεται αμέσως με ενδείξεις αναμονής.
+        Οι έλεγχοι ξανατρέχουν μόνο αν λείπουν ή αν καταχωρήθηκε σήμα από τότε.
+        """
         self.app.current_signal_data = signal_data
         
         # Check if manual input is required
@@ -177,15 +292,6 @@ class SignalProcessingTab:
             self.app.handle_manual_input_required(signal_data)
             return
         
-        # Check for duplicates
-        signal_id = signal_data.get('id', '')
-        fm = signal_data.get('fm', '')
-        serial_number = signal_data.get('serial_number', None)
-        
-        is_duplicate = False
-        if serial_number is not None:
-            is_duplicate = self.app.duplicate_manager.is_duplicate(signal_id, fm, serial_number)
-        
         # Update StringVar variables
         self.app.id_var.set(signal_data.get('id', 'Μη διαθέσιμο'))
         self.app.fm_var.set(signal_data.get('fm', 'Μη διαθέσιμο'))
@@ -197,28 +303,59 @@ class SignalProcessingTab:
         self.app.theme_label.config(fg='black')
         
         # Display attachments
-        self.display_attachments(signal_data.get('attachments', []))
+        self.display_attachments(signal_data.get('attachments', []), checks['attachment_plan'] if checks else None)
         
         # Display recipients with duplicate handling
-        self.display_recipients_with_duplicate_check(signal_data.get('recipients', []), is_duplicate, signal_id, fm, serial_number)
-        
-        # Show duplicate notification if needed
-        if is_duplicate:
-            self._show_duplicate_notification(signal_id, fm, serial_number)
+        self.display_recipients_with_duplicate_check(signal_data.get('recipients', []), checks)
+        
+        # Ξανά στο background μόνο αν λείπουν ή αν καταχωρήθηκε σήμα όσο αυτό ήταν στην ουρά
+        if checks is None or self.app.signal_pipeline.checks_stale(checks):
+            self.app.dispatcher.submit(
+                self.app.signal_pipeline.signal_checks, signal_data,
+                on_done=lambda result: self._apply_signal_checks(signal_data, result),
+                on_error=lambda e: self._signal_checks_failed(signal_data, e)
+            )
         
-        # Enable process button
+        if checks is None:
+            # Χωρίς έλεγχο διπλοτύπων οι παραλήπτες δεν είναι ακόμα σωστοί
+            self.app.process_button.config(state='disabled')
+            self.app.status_bar.update_status("Σήμα φορτώθηκε - Έλεγχος διπλοτύπων και συνημμένων...")
+        else:
+            self._signal_ready()
+    
+    def _signal_ready(self):
+        """Οι έλεγχοι ολοκληρώθηκαν - το σήμα μπορεί να επεξεργαστεί"""
         self.app.process_button.config(state='normal')
         
         # Complete progress and update status
         self.app.status_bar.complete_progress()
         status_msg = "Σήμα φορτώθηκε επιτυχώς - Έτοιμο για επεξεργασία"
-        if is_duplicate:
+        if self.is_duplicate_signal:
             status_msg += " (Ανιχνεύθηκε διπλότυπο)"
-        self.app.root.after(300, lambda: self.app.status_bar.update_status(status_msg))
+        self.app.status_bar.update_status(status_msg)
         self.app.root.after(800, lambda: self.app.status_bar.reset_progress())
     
-    def display_attachments(self, attachments):
-        """Display attachments"""
+    def _apply_signal_checks(self, signal_data, checks):
+        """Αποτέλεσμα των ελέγχων από το background (μόνο αν το σήμα εμφανίζεται ακόμα)"""
+        if self.app.current_signal_data is not signal_data:
+            return
+        
+        pending = self.signal_checks is None
+        self._apply_attachment_plan(signal_data, checks['attachment_plan'])
+        if pending or checks['recipients_with_signal'] != self.recipients_with_signal:
+            self._apply_duplicate_state(checks)
+        if pending:
+            self._signal_ready()
+    
+    def _signal_checks_failed(self, signal_data, error):
+        print(f"Σφάλμα στον έλεγχο διπλοτύπων/συνημμένων: {error}")
+        if self.app.current_signal_data is signal_data and self.signal_checks is None:
+            # Η επεξεργασία ελέγχει ξανά συνημμένα και εκδόσεις - το σήμα δεν μένει κολλημένο
+            self._clear_recipient_notices()
+            self._signal_ready()
+    
+    def display_attachments(self, attachments, attachment_plan=None):
+        """Display attachments (χωρίς πλάνο: ένδειξη αναμονής μέχρι να έρθει από το background)"""
         # Clear previous attachments
         for widget in self.app.attachments_frame.winfo_children():
             widget.destroy()
@@ -232,8 +369,10 @@ class SignalProcessingTab:
             frame.pack(fill='x', pady=1)
             
             # Status icon (✓ or ✗)
-            status = "✓" if check_attachment_exists(attachment) else "✗"
-            color = "green" if status == "✓" else "red"
+            if attachment_plan is not None and attachment in attachment_plan:
+                status, color = self._attachment_status(attachment_plan[attachment])
+            else:
+                status, color = self.PENDING_STATUS
             
             status_label = tk.Label(frame, text=status, fg=color, font=('Arial', 12, 'bold'))
             status_label.pack(side='left')
@@ -247,12 +386,17 @@ class SignalProcessingTab:
             frame.name_label = name_label
             frame.attachment_name = attachment
     
+    def _attachment_status(self, plan_entry):
+        """Εικονίδιο και χρώμα για ένα συνημμένο (πορτοκαλί αν το fuzzy match είναι αμφίβολο)"""
+        if not plan_entry['source']:
+            return "✗", "red"
+        if plan_entry['ambiguous']:
+            return "✓", "orange"
+        return "✓", "green"
+    
     def display_recipients(self, recipients):
         """Display recipients with checkboxes"""
-        # Clear previous checkboxes
-        for widget in self.app.recipients_checkbox_frame.winfo_children():
-            widget.destroy()
-        self.app.recipients_checkboxes.clear()
+        self._clear_recipient_notices()
         
         # Filter recipients if not from manual input
         if hasattr(self.app, 'current_signal_data') and self.app.current_signal_data and \
@@ -264,25 +408,15 @@ class SignalProcessingTab:
             except Exception:
                 filtered_recipients = recipients
         
-        # Create checkboxes for each recipient
-        for recipient in filtered_recipients:
-            var = tk.BooleanVar()
-            var.set(True)  # Auto-select all
-            
-            checkbox = tk.Checkbutton(
-                self.app.recipients_checkbox_frame,
-                text=recipient,
-                variable=var,
-                font=('Arial', 10),
-                anchor='w'
-            )
-            checkbox.pack(fill='x', padx=5, pady=2)
-            
-            self.app.recipients_checkboxes.append({
-                'recipient': recipient,
-                'var': var,
-                'checkbox': checkbox
-            })
+        # Auto-select all
+        self.app.recipients_checklist.set_items([
+            VirtualChecklist.make_item(recipient, True) for recipient in filtered_recipients
+        ])
+    
+    def _clear_recipient_notices(self):
+        """Αφαίρεση των ειδοποιήσεων του προηγούμενου σήματος"""
+        for widget in self.app.recipients_notice_frame.winfo_children():
+            widget.destroy()
     
     def get_selected_recipients(self):
         """Get selected recipients"""
@@ -323,45 +457,53 @@ class SignalProcessingTab:
         tk.Label(self.app.attachments_frame, text="Δεν υπάρχουν συνημμένα", fg='gray').pack()
         
         # Clear recipients
-        for widget in self.app.recipients_checkbox_frame.winfo_children():
-            widget.destroy()
-        
-        # Reset checkboxes list
-        self.app.recipients_checkboxes = []
+        self._clear_recipient_notices()
+        self.app.recipients_checklist.clear()
     
     def update_attachment_indicators(self):
-        """Update attachment indicators"""
-        if not self.app.current_signal_data:
+        """Update attachment indicators (η επίλυση γίνεται στο background)"""
+        signal_data = self.app.current_signal_data
+        if not signal_data:
             return
         
-        attachments = self.app.current_signal_data.get('attachments', [])
+        attachments = signal_data.get('attachments', [])
         if not attachments:
             return
         
+        # Μία επίλυση για όλα τα συνημμένα (το ίδιο πλάνο χρησιμοποιεί και η επεξεργασία)
+        self.app.dispatcher.submit(
+            resolve_attachments, list(attachments), signal_data.get('source_folder'),
+            on_done=lambda plan: self._apply_attachment_plan(signal_data, plan)
+        )
+    
+    def _apply_attachment_plan(self, signal_data, attachment_plan):
+        """Ενημέρωση των ενδείξεων από ένα πλάνο συνημμένων"""
+        if self.app.current_signal_data is not signal_data:
+            return
+        
         # Update indicators
         for widget in self.app.attachments_frame.winfo_children():
             if isinstance(widget, tk.Frame) and hasattr(widget, 'attachment_name'):
                 attachment_name = widget.attachment_name
                 
                 # Check if file exists
-                exists = check_attachment_exists(attachment_name)
-                new_status = "✓" if exists else "✗"
-                new_color = "green" if exists else "red"
+                plan_entry = attachment_plan.get(attachment_name)
+                if plan_entry is None:
+                    continue
+                new_status, new_color = self._attachment_status(plan_entry)
                 
                 # Update status icon if needed
                 current_status = widget.status_label.cget('text')
-                if current_status != new_status:
+                current_color = widget.status_label.cget('fg')
+                if current_status != new_status or current_color != new_color:
                     widget.status_label.config(text=new_status, fg=new_color)
-                    if new_status == "✓":
+                    if new_status == "✓" and current_status == "✗":
                         self.app.status_bar.update_status(f"Ανιχνεύθηκε συνημμένο: {attachment_name}")
     
     def signal_processed_successfully(self, result=None, signal_data=None):
         """Handle successful signal processing"""
         self.app.process_button.config(state='disabled')
         
-        # Complete progress to 100% first
-        self.app.status_bar.complete_progress()
-        
         # Use passed signal_data if available, otherwise fallback to app's current_signal_data
         if signal_data is not None:
             current_signal_data = signal_data
@@ -385,8 +527,13 @@ class SignalProcessingTab:
                     else:
                         recipient_names.append(str(recipient))
                 
+                # Το στάδιο record του pipeline έχει ήδη γράψει το ιστορικό
+                if result and result.get('history_recorded'):
+                    if hasattr(self.app, 'history_tab'):
+                        self.app.history_tab.refresh_processed_signals()
+                
                 # Always add to history if we have a history_tab and signal data
-                if hasattr(self.app, 'history_tab'):
+                elif hasattr(self.app, 'history_tab'):
                     signal_id = current_signal_data.get('id', 'N/A')
                     fm = current_signal_data.get('fm', 'N/A')
                     # Use selected recipients or indicate none selected
@@ -398,27 +545,25 @@ class SignalProcessingTab:
                 import traceback
                 traceback.print_exc()
         
-        # Show results after a brief delay
-        if result:
-            self.app.root.after(500, lambda: self.show_processing_results(result))
-        
         # Clear signal data and UI
         self.app.current_signal_data = None
         self.clear_signal_display()
         
-        # Clear downloads folder
-        from app.utils.file_operations import clear_downloads_folder
-        clear_downloads_folder()
+        # Clear downloads folder (signals from the intake queue were cleaned by the signal manager)
+        if not (current_signal_data or {}).get('source_folder'):
+            from app.utils.file_operations import clear_downloads_folder
+            clear_downloads_folder()
         
-        # Update final status
-        def update_final_status():
-            if result and result.get('total_processed', 0) > 0:
-                self.app.status_bar.update_status("Σήμα επεξεργάστηκε επιτυχώς - Αναμονή για νέο σήμα...")
-            else:
-                self.app.status_bar.update_status("Επεξεργασία ολοκληρώθηκε - Αναμονή για νέο σήμα...")
-            self.app.root.after(500, lambda: self.app.status_bar.reset_progress())
+        # Update final status (100% until the next operation)
+        if result and result.get('total_processed', 0) > 0:
+            final_message = "Σήμα επεξεργάστηκε επιτυχώς - Αναμονή για νέο σήμα..."
+        else:
+            final_message = "Επεξεργασία ολοκληρώθηκε - Αναμονή για νέο σήμα..."
+        self.app.progress_manager.complete_operation("signal_processing", final_message)
         
-        self.app.root.after(800, update_final_status)
+        # Show results as soon as the signal is stored
+        if result:
+            self.show_processing_results(result)
     
     def show_processing_results(self, result):
         """Show detailed processing results dialog with verification information"""
@@ -619,9 +764,8 @@ class SignalProcessingTab:
         self.app.theme_label.config(fg='gray')
         
         # Clear recipients checkboxes
-        for widget in self.app.recipients_checkbox_frame.winfo_children():
-            widget.destroy()
-        self.app.recipients_checkboxes.clear()
+        self._clear_recipient_notices()
+        self.app.recipients_checklist.clear()
         
         # Clear attachments
         for widget in self.app.attachments_frame.winfo_children():
@@ -712,31 +856,10 @@ class SignalProcessingTab:
             if selected_indices:
                 for index in selected_indices:
                     recipient = available_listbox.get(index)
-                    # Add as checkbox with keyboard support
-                    var = tk.BooleanVar()
-                    var.set(True)  # Selected by default
-                    
-                    checkbox = tk.Checkbutton(
-                        self.app.recipients_checkbox_frame,
-                        text=recipient,
-                        variable=var,
-                        font=('Arial', 10),
-                        anchor='w'
-                    )
-                    checkbox.pack(fill='x', padx=5, pady=2)
-                    
-                    # Add keyboard navigation for the new checkbox
-                    checkbox.bind('<Return>', lambda e, v=var: v.set(not v.get()))
-                    checkbox.bind('<space>', lambda e, v=var: v.set(not v.get()))
-                    checkbox.bind('<FocusIn>', lambda e, cb=checkbox: cb.config(bg='#e8f4fd'))
-                    checkbox.bind('<FocusOut>', lambda e, cb=checkbox: cb.config(bg='SystemButtonFace'))
-                    
-                    self.app.recipients_checkboxes.append({
-                        'recipient': recipient,
-                        'var': var,
-                        'checkbox': checkbox,
-                        'is_temporary': False
-                    })
+                    # Selected by default
+                    item = self.app.recipients_checklist.add_item(
+                        VirtualChecklist.make_item(recipient, True, is_temporary=False))
+                    self.app.recipients_checklist.see(item)
                 dialog.destroy()
                 self.app.status_bar.update_status(f"Προστέθηκε παραλήπτης: {recipient}")
         
@@ -762,7 +885,6 @@ class SignalProcessingTab:
         from tkinter import filedialog, messagebox
         import os
         from pathlib import Path
-        import threading
         
         # Open folder dialog
         folder_path = filedialog.askdirectory(title="Επιλογή Φακέλου ως Παραλήπτη")
@@ -781,36 +903,16 @@ class SignalProcessingTab:
             self.app.status_bar.update_status(f"Ο φάκελος '{folder_name}' είναι ήδη στη λίστα")
             return
         
-        # Add as temporary recipient with special marking
-        var = tk.BooleanVar()
-        var.set(True)  # Selected by default
-        
-        # Create display text with folder indicator
-        display_text = f"📁 {folder_name} (Προσωρινός)"
-        
-        checkbox = tk.Checkbutton(
-            self.app.recipients_checkbox_frame,
-            text=display_text,
-            variable=var,
-            font=('Arial', 10),
-            anchor='w',
-            fg='#e67e22'  # Orange color to distinguish temporary recipients
-        )
-        checkbox.pack(fill='x', padx=5, pady=2)
-        
-        # Add keyboard navigation
-        checkbox.bind('<Return>', lambda e, v=var: v.set(not v.get()))
-        checkbox.bind('<space>', lambda e, v=var: v.set(not v.get()))
-        checkbox.bind('<FocusIn>', lambda e, cb=checkbox: cb.config(bg='#e8f4fd'))
-        checkbox.bind('<FocusOut>', lambda e, cb=checkbox: cb.config(bg='SystemButtonFace'))
-        
-        self.app.recipients_checkboxes.append({
-            'recipient': folder_name,  # Store the actual folder name for processing
-            'var': var,
-            'checkbox': checkbox,
-            'is_temporary': True,  # Mark as temporary
-            'folder_path': folder_path  # Store full path for reference
-        })
+        # Add as temporary recipient with special marking (selected by default)
+        item = self.app.recipients_checklist.add_item(VirtualChecklist.make_item(
+            folder_name,  # Store the actual folder name for processing
+            True,
+            text=f"📁 {folder_name} (Προσωρινός)",  # Display text with folder indicator
+            fg='#e67e22',  # Orange color to distinguish temporary recipients
+            is_temporary=True,  # Mark as temporary
+            folder_path=folder_path  # Store full path for reference
+        ))
+        self.app.recipients_checklist.see(item)
         
         self.app.status_bar.update_status(f"Προστέθηκε προσωρινός παραλήπτης: {folder_name}")
         
@@ -821,17 +923,17 @@ class SignalProcessingTab:
                 pdf_files = list(folder_obj.glob("*.pdf"))
                 
                 if not pdf_files:
-                    self.app.root.after(0, lambda: self.app.status_bar.update_status(f"Δεν βρέθηκαν PDF αρχεία στον φάκελο: {folder_name}"))
+                    self.app.dispatcher.call_soon(lambda: self.app.status_bar.update_status(f"Δεν βρέθηκαν PDF αρχεία στον φάκελο: {folder_name}"))
                     return
                 
-                self.app.root.after(0, lambda: self.app.status_bar.update_status(f"Βρέθηκαν {len(pdf_files)} PDF αρχεία. Επεξεργασία..."))
+                self.app.dispatcher.call_soon(lambda: self.app.status_bar.update_status(f"Βρέθηκαν {len(pdf_files)} PDF αρχεία. Επεξεργασία..."))
                 
                 # Process each PDF file
                 processed_count = 0
                 for pdf_file in pdf_files:
                     try:
                         # Update status for current file
-                        self.app.root.after(0, lambda f=pdf_file.name: self.app.status_bar.update_status(f"Επεξεργασία: {f}"))
+                        self.app.dispatcher.call_soon(lambda f=pdf_file.name: self.app.status_bar.update_status(f"Επεξεργασία: {f}"))
                         
                         # Process the PDF
                         signal_data = self.app.pdf_processor.process_pdf(str(pdf_file))
@@ -842,7 +944,7 @@ class SignalProcessingTab:
                             
                             # Update UI with the last processed signal (or first if only one)
                             if processed_count == 1 or len(pdf_files) == 1:
-                                self.app.root.after(0, lambda data=signal_data: self.display_signal_data(data))
+                                self.app.dispatcher.call_soon(lambda data=signal_data: self.display_signal_data(data))
                         
                     except Exception as e:
                         print(f"Σφάλμα επεξεργασίας PDF {pdf_file.name}: {e}")
@@ -850,19 +952,19 @@ class SignalProcessingTab:
                 
                 # Final status update
                 if processed_count > 0:
-                    self.app.root.after(0, lambda: self.app.status_bar.update_status(f"Επεξεργάστηκαν επιτυχώς {processed_count} από {len(pdf_files)} PDF αρχεία"))
+                    self.app.dispatcher.call_soon(lambda: self.app.status_bar.update_status(f"Επεξεργάστηκαν επιτυχώς {processed_count} από {len(pdf_files)} PDF αρχεία"))
                     if processed_count == 1:
-                        self.app.root.after(1000, lambda: self.app.status_bar.update_status("Σήμα φορτώθηκε από φάκελο - Έτοιμο για επεξεργασία"))
+                        self.app.dispatcher.call_later(1000, lambda: self.app.status_bar.update_status("Σήμα φορτώθηκε από φάκελο - Έτοιμο για επεξεργασία"))
                 else:
-                    self.app.root.after(0, lambda: self.app.status_bar.update_status(f"Δεν ήταν δυνατή η επεξεργασία κανενός PDF στον φάκελο: {folder_name}"))
+                    self.app.dispatcher.call_soon(lambda: self.app.status_bar.update_status(f"Δεν ήταν δυνατή η επεξεργασία κανενός PDF στον φάκελο: {folder_name}"))
                 
             except Exception as e:
                 error_msg = f"Σφάλμα σάρωσης φακέλου: {str(e)}"
-                self.app.root.after(0, lambda: self.app.status_bar.update_status(error_msg))
+                self.app.dispatcher.call_soon(lambda: self.app.status_bar.update_status(error_msg))
                 print(error_msg)
         
         # Run folder scanning in a separate thread to avoid blocking UI
-        threading.Thread(target=scan_and_process_folder, daemon=True).start()
+        self.app.dispatcher.submit(scan_and_process_folder)
     
     def copy_id_to_clipboard(self, event=None):
         """Copy ID to clipboard"""
@@ -1062,19 +1164,17 @@ class SignalProcessingTab:
         self.app.theme_text.bind('<Escape>', lambda e: save_theme())
         self.app.theme_text.bind('<Control-Return>', lambda e: save_theme())
     
-    def display_recipients_with_duplicate_check(self, recipients, is_duplicate, signal_id, fm, serial_number):
-        """Display recipients with checkboxes, handling duplicate detection"""
-        # Clear previous checkboxes
-        for widget in self.app.recipients_checkbox_frame.winfo_children():
-            widget.destroy()
-        self.app.recipients_checkboxes.clear()
+    def display_recipients_with_duplicate_check(self, recipients, checks=None):
+        """Display recipients with checkboxes, handling duplicate detection
+        
+        checks: αποτέλεσμα του SignalPipeline.signal_checks ή None αν ο έλεγχος εκκρεμεί.
+        """
+        self._clear_recipient_notices()
         
         # Update duplicate state
-        self.is_duplicate_signal = is_duplicate
+        self.is_duplicate_signal = False
         self.recipients_with_signal = []
-        
-        if is_duplicate and serial_number is not None:
-            self.recipients_with_signal = self.app.duplicate_manager.get_recipients_with_signal(signal_id, fm, serial_number)
+        self.signal_checks = None
         
         # Filter recipients if not from manual input
         if hasattr(self.app, 'current_signal_data') and self.app.current_signal_data and \
@@ -1086,61 +1186,77 @@ class SignalProcessingTab:
             except Exception:
                 filtered_recipients = recipients
         
-        # Create checkboxes for each recipient
+        items = []
         for recipient in filtered_recipients:
-            # Determine if this recipient should be unchecked (has the signal already)
-            has_signal = recipient in self.recipients_with_signal
-            default_checked = not has_signal  # Uncheck if they already have it
+            item = VirtualChecklist.make_item(recipient, True, has_signal=False)
             
-            var = tk.BooleanVar()
-            var.set(default_checked)
-            
-            # Create checkbox with special styling for duplicates
-            checkbox = tk.Checkbutton(
-                self.app.recipients_checkbox_frame,
-                text=recipient,
-                variable=var,
-                font=('Arial', 10),
-                anchor='w',
-                fg='gray' if has_signal else 'black'  # Gray out recipients that have it
-            )
-            checkbox.pack(fill='x', pady=1)
+            # Handle re-checking
+            item['var'].on_change(lambda var, it=item: self._handle_duplicate_recipient_recheck(it, var))
+            items.append(item)
+        
+        self.app.recipients_checklist.set_items(items)
+        
+        if checks is not None:
+            self._apply_duplicate_state(checks)
+        else:
+            self._show_pending_checks_notice()
+    
+    def _apply_duplicate_state(self, checks):
+        """Αποεπιλογή των παραληπτών που έχουν ήδη το σήμα και ειδοποιήσεις"""
+        self.signal_checks = checks
+        self.is_duplicate_signal = checks['is_duplicate']
+        self.recipients_with_signal = list(checks['recipients_with_signal'])
+        
+        for item in self.app.recipients_checklist.items:
+            # Determine if this recipient should be unchecked (has the signal already)
+            has_signal = item['recipient'] in self.recipients_with_signal
+            if has_signal == item.get('has_signal', False):
+                continue
             
-            # Add tooltip for recipients that already have the signal
+            item['has_signal'] = has_signal
             if has_signal:
-                from app.ui.utils.tooltips import create_tooltip
-                create_tooltip(checkbox, f"Ο παραλήπτης έχει ήδη αυτό το σήμα")
-                
-                # Bind event to handle re-checking
-                var.trace('w', lambda *args, r=recipient, v=var: self._handle_duplicate_recipient_recheck(r, v))
-            
-            self.app.recipients_checkboxes.append({
-                'recipient': recipient,
-                'var': var,
-                'checkbox': checkbox,
-                'has_signal': has_signal
-            })
+                # Gray out recipients that have it
+                item['fg'] = 'gray'
+                item['tooltip'] = "Ο παραλήπτης έχει ήδη αυτό το σήμα"
+                item['var'].set(False)
+            else:
+                item.pop('fg', None)
+                item.pop('tooltip', None)
+        
+        self.app.recipients_checklist.refresh()
+        
+        self._clear_recipient_notices()
         
         # Show info message if duplicates were unchecked
-        if is_duplicate and self.recipients_with_signal:
+        if self.is_duplicate_signal and self.recipients_with_signal:
             self._show_unchecked_recipients_info()
+        
+        # Show duplicate notification if needed
+        if self.is_duplicate_signal:
+            self._show_duplicate_notification(self.app.current_signal_data.get('serial_number', None))
+    
+    def _show_pending_checks_notice(self):
+        """Ένδειξη αναμονής όσο ο έλεγχος διπλοτύπων τρέχει στο background"""
+        tk.Label(
+            self.app.recipients_notice_frame,
+            text="⏳ Έλεγχος διπλοτύπων...",
+            font=('Arial', 8),
+            fg='gray'
+        ).pack(fill='x', pady=2)
     
-    def _handle_duplicate_recipient_recheck(self, recipient, var):
+    def _handle_duplicate_recipient_recheck(self, item, var):
         """Handle when user re-checks a recipient that already has the signal"""
-        if var.get():  # If user checked it
+        if var.get() and item.get('has_signal'):  # If user checked it
             # This will create a versioned copy when processed
             # Update the checkbox color to indicate it will be processed
-            for cb_data in self.app.recipients_checkboxes:
-                if cb_data['recipient'] == recipient:
-                    cb_data['checkbox'].config(fg='blue')
-                    from app.ui.utils.tooltips import create_tooltip
-                    create_tooltip(cb_data['checkbox'], f"Θα δημιουργηθεί νέα έκδοση για τον παραλήπτη")
-                    break
+            item['fg'] = 'blue'
+            item['tooltip'] = "Θα δημιουργηθεί νέα έκδοση για τον παραλήπτη"
+            self.app.recipients_checklist.refresh_item(item)
     
-    def _show_duplicate_notification(self, signal_id, fm, serial_number):
+    def _show_duplicate_notification(self, serial_number):
         """Show permanent duplicate notification"""
         # Create a permanent notification label
-        notification_frame = tk.Frame(self.app.recipients_checkbox_frame)
+        notification_frame = tk.Frame(self.app.recipients_notice_frame)
         notification_frame.pack(fill='x', pady=5)
         
         # Use the existing serial_number from signal data
@@ -1163,7 +1279,7 @@ class SignalProcessingTab:
     
     def _show_unchecked_recipients_info(self):
         """Show permanent info about unchecked recipients"""
-        info_frame = tk.Frame(self.app.recipients_checkbox_frame)
+        info_frame = tk.Frame(self.app.recipients_notice_frame)
         info_frame.pack(fill='x', pady=2)
         
         unchecked_count = len(self.recipients_with_signal)
@@ -1197,12 +1313,18 @@ class SignalProcessingTab:
                 # Clear the downloads folder
                 clear_downloads_folder()
                 
+                current = self.app.current_signal_data
+                
                 # Reset signal display
                 self.app.clear_signal_display()
                 
                 # Reset current signal data
                 self.app.current_signal_data = None
                 
+                # The displayed signal's files live in its intake folder
+                if current and current.get('intake_id') is not None:
+                    self.app.discard_signal(current['intake_id'])
+                
                 # Update status
                 self.app.progress_manager.global_message("Ο φάκελος downloads καθαρίστηκε - Έτοιμο για νέο σήμα")
                 
@@ -9,6 +9,7 @@ from tkinter import ttk
 import os
 from pathlib import Path
 from app.ui.widgets.folder_button import FolderIconButton
+from app.ui.widgets.virtual_checklist import VirtualChecklist
 from app.utils.path_manager import get_path_manager
 
 
@@ -25,6 +26,10 @@ class USBExtractionTab:
         self.username_save_timer = None
         self.file_number_save_timer = None
         
+        # Μία μέτρηση παραληπτών στο background κάθε φορά
+        self._refresh_running = False
+        self._refresh_pending = False
+        
         self.create_widgets()
     
     def create_widgets(self):
@@ -69,21 +74,29 @@ class USBExtractionTab:
     
     def _create_recipients_section(self, parent):
         """Create recipients selection section"""
-        # Frame for checkboxes with scrollbar
-        self.app.extraction_canvas = tk.Canvas(parent, height=200)
-        extraction_scrollbar = ttk.Scrollbar(parent, orient='vertical', command=self.app.extraction_canvas.yview)
-        self.app.extraction_checkbox_frame = tk.Frame(self.app.extraction_canvas)
-        
-        self.app.extraction_checkbox_frame.bind(
-            "<Configure>",
-            lambda e: self.app.extraction_canvas.configure(scrollregion=self.app.extraction_canvas.bbox("all"))
+        # Αναζήτηση στη λίστα
+        search_frame = tk.Frame(parent)
+        search_frame.pack(fill='x', pady=(0, 5))
+        
+        tk.Label(search_frame, text="Αναζήτηση:", font=('Arial', 10)).pack(side='left')
+        self.search_var = tk.StringVar()
+        tk.Entry(search_frame, textvariable=self.search_var, width=30).pack(side='left', padx=(5, 0), fill='x', expand=True)
+        self.search_var.trace_add('write', lambda *args: self.app.extraction_checklist.set_filter(self.search_var.get()))
+        
+        # Checkboxes και κουμπιά φακέλου μόνο για τις ορατές γραμμές
+        self.app.extraction_checklist = VirtualChecklist(
+            parent,
+            items=self.app.extraction_checkboxes,
+            height=200,
+            row_style=self._recipient_row_style,
+            row_action=lambda frame, current_item: FolderIconButton.create(
+                frame,
+                lambda: current_item()['recipient'],
+                status_callback=lambda msg: self.app.progress_manager.global_message(msg)
+            ),
+            menu_items=self._checkbox_menu_items
         )
-        
-        self.app.extraction_canvas.create_window((0, 0), window=self.app.extraction_checkbox_frame, anchor="nw")
-        self.app.extraction_canvas.configure(yscrollcommand=extraction_scrollbar.set)
-        
-        self.app.extraction_canvas.pack(side='left', fill='x', expand=True)
-        extraction_scrollbar.pack(side='right', fill='y')
+        self.app.extraction_checklist.pack(fill='x', expand=True)
     
     def _create_extraction_controls(self):
         """Create extraction control buttons"""
@@ -136,131 +149,99 @@ class USBExtractionTab:
         
         self.app.create_tooltip(self.app.extract_button, "Εξαγωγή επιλεγμένων παραληπτών σε USB (Enter)")
     
-    def refresh_extraction_list(self):
-        """Refresh extraction list with checkboxes and folder buttons"""
-        # Scan for JSON files before refreshing
-        try:
-            self.app.signal_manager.scan_and_generate_missing_json_files()
-        except Exception as e:
-            print(f"Σφάλμα στη σάρωση JSON κατά την ανανέωση: {e}")
+    def refresh_extraction_list(self, scan=True):
+        """Refresh extraction list with checkboxes and folder buttons
+        
+        Τα πλήθη σημάτων μετριούνται στο background. Στη λίστα αλλάζουν μόνο
+        οι γραμμές που άλλαξαν και η επιλογή του χρήστη διατηρείται.
+        """
+        # Scan for JSON files in the background - the list refreshes again if any were created
+        if scan:
+            try:
+                self.app.signal_manager.request_json_scan(callback=self._on_json_scan_finished)
+            except Exception as e:
+                print(f"Σφάλμα στη σάρωση JSON κατά την ανανέωση: {e}")
         
         # Update username suggestions as well
         self._update_username_suggestions()
         
-        # Clear previous checkboxes
-        for widget in self.app.extraction_checkbox_frame.winfo_children():
-            widget.destroy()
-        self.app.extraction_checkboxes.clear()
-        
-        # Load available recipients from DATA folder
-        path_manager = get_path_manager()
-        data_path = path_manager.data_folder
+        # Ανανεώσεις που ζητούνται όσο τρέχει μία γίνονται μία ακόμα στο τέλος της
+        if self._refresh_running:
+            self._refresh_pending = True
+            return
         
-        if data_path.exists():
-            recipients = []
-            for recipient_folder in data_path.iterdir():
-                if recipient_folder.is_dir():
-                    recipients.append(recipient_folder.name)
-            
-            # Create checkboxes for each recipient
-            for recipient in sorted(recipients):
-                var = tk.BooleanVar()
-                
-                # Get signal count for this recipient
-                signal_count = 0
-                try:
-                    signals = self.app.signal_manager.get_recipient_signals(recipient)
-                    signal_count = len(signals) if signals else 0
-                except:
-                    signal_count = 0
-                
-                # Create a frame to hold checkbox and folder button
-                recipient_frame = tk.Frame(self.app.extraction_checkbox_frame)
-                recipient_frame.pack(fill='x', padx=5, pady=1)
-                
-                # Create checkbox with signal count
-                display_text = f"{recipient} ({signal_count} σήματα)"
-                checkbox = tk.Checkbutton(
-                    recipient_frame,
-                    text=display_text,
-                    variable=var,
-                    font=('Arial', 10),
-                    anchor='w',
-                    command=lambda r=recipient, v=var, cb=None: self._on_recipient_selection_changed(r, v, cb)
-                )
-                checkbox.pack(side='left', fill='x', expand=True)
-                
-                # Update the lambda to pass the checkbox reference
-                checkbox.config(command=lambda r=recipient, v=var, cb=checkbox: self._on_recipient_selection_changed(r, v, cb))
-                
-                # Create folder icon button
-                folder_button = FolderIconButton.create(
-                    recipient_frame, 
-                    recipient, 
-                    status_callback=lambda msg: self.app.progress_manager.global_message(msg)
-                )
-                folder_button.pack(side='right', padx=(5, 0))
-                
-                # Add keyboard navigation and context menu to checkbox
-                self._setup_checkbox_bindings(checkbox, var, recipient)
-                
-                self.app.extraction_checkboxes.append({
-                    'recipient': recipient,
-                    'var': var,
-                    'checkbox': checkbox,
-                    'frame': recipient_frame,
-                    'folder_button': folder_button
-                })
+        self._refresh_running = True
+        self.app.dispatcher.submit(
+            self.app.signal_manager.count_recipient_signals,
+            on_done=self._on_recipient_counts,
+            on_error=self._on_recipient_counts_failed
+        )
     
-    def _setup_checkbox_bindings(self, checkbox, var, recipient):
-        """Setup keyboard and mouse bindings for checkbox"""
-        checkbox.bind('<Return>', lambda e, v=var: v.set(not v.get()))
-        checkbox.bind('<space>', lambda e, v=var: v.set(not v.get()))
-        checkbox.bind('<FocusIn>', lambda e, cb=checkbox: cb.config(bg='#e8f4fd'))
-        checkbox.bind('<FocusOut>', lambda e, cb=checkbox: cb.config(bg='SystemButtonFace'))
-        
-        # Context menu
-        context_menu = tk.Menu(checkbox, tearoff=0)
-        context_menu.add_command(label="Επιλογή", command=lambda v=var: v.set(True))
-        context_menu.add_command(label="Αποεπιλογή", command=lambda v=var: v.set(False))
-        context_menu.add_separator()
-        context_menu.add_command(label="Επιλογή Όλων", command=lambda: self.select_all_extraction_checkboxes(True))
-        context_menu.add_command(label="Αποεπιλογή Όλων", command=lambda: self.select_all_extraction_checkboxes(False))
-        context_menu.add_separator()
-        context_menu.add_command(label="Άνοιγμα Φακέλου", 
-                               command=lambda r=recipient: self._open_recipient_folder(r))
-        
-        def show_context_menu(event):
-            try:
-                context_menu.tk_popup(event.x_root, event.y_root)
-            finally:
-                context_menu.grab_release()
-        
-        checkbox.bind('<Button-3>', show_context_menu)
+    def _on_recipient_counts(self, counts):
+        """Tk thread: τα πλήθη σημάτων ανά παραλήπτη είναι έτοιμα"""
+        self._refresh_running = False
+        self._update_recipient_rows(counts)
+        
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_extraction_list(scan=False)
     
-    def _on_recipient_selection_changed(self, recipient_name, var, checkbox):
-        """Handle recipient selection change to update visual styling"""
-        try:
-            if var.get():  # Selected
-                # Make selected recipient more noticeable
-                checkbox.config(
-                    font=('Arial', 12, 'bold'),  # Larger, bold font
-                    bg='#e3f2fd',  # Light blue highlight background
-                    fg='#1976d2',  # Dark blue text
-                    activebackground='#bbdefb',  # Slightly darker when active
-                    selectcolor='#2196f3'  # Blue checkbox color
-                )
-            else:  # Deselected
-                # Return to normal styling
-                checkbox.config(
-                    font=('Arial', 10),  # Normal font
-                    bg='SystemButtonFace',  # Default background
-                    fg='SystemButtonText',  # Default text color
-                    activebackground='SystemButtonFace',  # Default active background
-                    selectcolor='SystemWindow'  # Default checkbox color
-                )
-        except Exception as e:
-            print(f"Error updating checkbox styling: {e}")
+    def _on_recipient_counts_failed(self, error):
+        self._refresh_running = False
+        self._refresh_pending = False
+        print(f"Σφάλμα στην ανανέωση της λίστας εξαγωγής: {error}")
+    
+    def _update_recipient_rows(self, counts):
+        """Νέα πλήθη σημάτων (counts: παραλήπτης -> σήματα, ταξινομημένο)
+        
+        Οι εγγραφές των παραληπτών που υπάρχουν ακόμα κρατιούνται (με την επιλογή τους)
+        και η λίστα ξανασχεδιάζει μόνο τις ορατές γραμμές.
+        """
+        existing = {item['recipient']: item for item in self.app.extraction_checkboxes}
+        
+        items = []
+        for recipient, signal_count in counts.items():
+            item = existing.get(recipient)
+            if item is None:
+                item = VirtualChecklist.make_item(recipient)
+            item['signal_count'] = signal_count
+            item['text'] = self._recipient_label(recipient, signal_count)
+            items.append(item)
+        
+        self.app.extraction_checklist.set_items(items)
+    
+    def _recipient_label(self, recipient, signal_count):
+        return f"{recipient} ({signal_count} σήματα)"
+    
+    def _on_json_scan_finished(self, generated_count):
+        """Called from the scan worker thread when the background JSON scan ends"""
+        if generated_count > 0:
+            self.app.dispatcher.call_soon(lambda: self.refresh_extraction_list(scan=False))
+    
+    def _checkbox_menu_items(self, item):
+        """Context menu μιας γραμμής"""
+        var = item['var']
+        return [
+            ("Επιλογή", lambda: var.set(True)),
+            ("Αποεπιλογή", lambda: var.set(False)),
+            None,
+            ("Επιλογή Όλων", lambda: self.select_all_extraction_checkboxes(True)),
+            ("Αποεπιλογή Όλων", lambda: self.select_all_extraction_checkboxes(False)),
+            None,
+            ("Άνοιγμα Φακέλου", lambda r=item['recipient']: self._open_recipient_folder(r)),
+        ]
+    
+    def _recipient_row_style(self, item):
+        """Οι επιλεγμένοι παραλήπτες ξεχωρίζουν (οι υπόλοιποι με την προεπιλεγμένη εμφάνιση)"""
+        if not item['var'].get():
+            return {}
+        return {
+            'font': ('Arial', 12, 'bold'),  # Larger, bold font
+            'bg': '#e3f2fd',  # Light blue highlight background
+            'fg': '#1976d2',  # Dark blue text
+            'activebackground': '#bbdefb',  # Slightly darker when active
+            'selectcolor': '#2196f3'  # Blue checkbox color
+        }
     
     def _open_recipient_folder(self, recipient_name):
         """Open recipient folder in File Explorer"""
@@ -282,15 +263,8 @@ class USBExtractionTab:
             self.app.progress_manager.global_message(f"Σφάλμα ανοίγματος φακέλου: {recipient_name}")
     
     def select_all_extraction_checkboxes(self, state):
-        """Select or deselect all extraction checkboxes"""
-        for checkbox_data in self.app.extraction_checkboxes:
-            checkbox_data['var'].set(state)
-            # Trigger visual feedback for each checkbox
-            self._on_recipient_selection_changed(
-                checkbox_data['recipient'], 
-                checkbox_data['var'], 
-                checkbox_data['checkbox']
-            )
+        """Select or deselect all extraction checkboxes (όσα εμφανίζονται με το φίλτρο)"""
+        self.app.extraction_checklist.select_all(state)
     
     def get_selected_extraction_recipients(self):
         """Get selected recipients for extraction"""
@@ -302,7 +276,6 @@ class USBExtractionTab:
     
     def extract_to_usb(self):
         """Extract selected recipients to USB"""
-        import threading
         from tkinter import filedialog, messagebox
         
         # Check that recipients are selected
@@ -330,71 +303,65 @@ class USBExtractionTab:
             self.app.progress_manager.global_message("Ακυρώθηκε η επιλογή φακέλου USB")
             return
         
+        # Check if unofficial mode is enabled (Tk variables are read on the Tk thread only)
+        is_unofficial = self.app.unofficial_mode.get()
+        
         # Start USB extraction operation
         self.app.progress_manager.start_operation("usb_extraction", "Εξαγωγή σε USB...", 5)
         
-        def extract_in_thread():
+        def extract():
+            # Scan for JSON files only for selected recipients
             try:
-                # Scan for JSON files only for selected recipients
-                try:
-                    self.app.signal_manager.scan_and_generate_missing_json_files(selected_recipients)
-                except Exception as e:
-                    print(f"Σφάλμα στη σάρωση JSON πριν την εξαγωγή: {e}")
-                
-                self.app.root.after(0, lambda: self.app.progress_manager.update_progress("usb_extraction", 15, "Προετοιμασία εξαγωγής..."))
-                
-                # Check if unofficial mode is enabled
-                is_unofficial = self.app.unofficial_mode.get()
-                
-                if is_unofficial:
-                    self.app.root.after(400, lambda: self.app.progress_manager.update_progress("usb_extraction", 30, "ΑΝΕΠΙΣΗΜΗ εξαγωγή - Μόνο αρχεία σημάτων..."))
-                else:
-                    self.app.root.after(400, lambda: self.app.progress_manager.update_progress("usb_extraction", 30, "Δημιουργία αρχείων Excel..."))
-                
-                success, result_data = self.app.usb_extractor.extract_to_usb(
-                    usb_path, selected_recipients, file_number, username, is_unofficial
-                )
-                
-                self.app.root.after(0, lambda: self.app.progress_manager.smooth_progress("usb_extraction", 80, 200))
-                self.app.root.after(200, lambda: self.app.progress_manager.update_message("usb_extraction", "Αντιγραφή αρχείων..."))
-                
-                if success:
-                    # Only increment file number if NOT in unofficial mode
-                    if not is_unofficial:
-                        self.app.config_manager.increment_file_number()
-                        self.app.file_number.set(str(self.app.config_manager.get_next_file_number()))
-                        
-                    # Save username
-                    self.app.config_manager.set_username(username)
-                    
-                    extraction_type = "ΑΝΕΠΙΣΗΜΗ" if is_unofficial else "κανονική"
-                    
-                    # Add extraction type info to result_data for undo handling
-                    def handle_success_with_mode(result):
-                        if result and not is_unofficial:
-                            result['is_unofficial'] = False
-                        elif result and is_unofficial:
-                            result['is_unofficial'] = True
-                        self.extraction_completed(result)
-                        # Complete progress after extraction_completed
-                        self.app.progress_manager.complete_operation("usb_extraction", f"Ολοκλήρωση {extraction_type} εξαγωγής...")
-                        # Reset progress bar to 0% after 2 seconds
-                        self.app.root.after(2000, lambda: self.app.progress_manager.reset_progress("usb_extraction", "Έτοιμο - Αναμονή για νέο σήμα..."))
-                    
-                    self.app.root.after(400, lambda: handle_success_with_mode(result_data))
-                else:
-                    self.app.root.after(0, lambda: self.extraction_completed(None))
-                    # Reset progress bar to 0% after failure
-                    self.app.root.after(2000, lambda: self.app.progress_manager.reset_progress("usb_extraction", "Έτοιμο - Αναμονή για νέο σήμα..."))
-                
+                self.app.signal_manager.scan_and_generate_missing_json_files(selected_recipients)
             except Exception as e:
-                print(f"Σφάλμα εξαγωγής: {e}")
-                self.app.root.after(0, lambda: self.extraction_completed(None))
-                self.app.root.after(0, lambda: self.app.progress_manager.reset_progress("usb_extraction", f"Σφάλμα: {str(e)}"))
-                # Reset to ready state after 3 seconds
-                self.app.root.after(3000, lambda: self.app.progress_manager.reset_progress("usb_extraction", "Έτοιμο - Αναμονή για νέο σήμα..."))
+                print(f"Σφάλμα στη σάρωση JSON πριν την εξαγωγή: {e}")
+            
+            if is_unofficial:
+                self.app.progress_manager.update_progress("usb_extraction", 10, "ΑΝΕΠΙΣΗΜΗ εξαγωγή - Μόνο αρχεία σημάτων...")
+            else:
+                self.app.progress_manager.update_progress("usb_extraction", 10, "Προετοιμασία εξαγωγής...")
+            
+            # Πραγματική πρόοδος (φάκελοι, bytes, Excel/PDF) από τον USBExtractor
+            return self.app.usb_extractor.extract_to_usb(
+                usb_path, selected_recipients, file_number, username, is_unofficial,
+                progress_callback=self.app.progress_manager.reporter("usb_extraction", 10, 100)
+            )
         
-        threading.Thread(target=extract_in_thread, daemon=True).start()
+        def extracted(outcome):
+            success, result_data = outcome
+            
+            if success:
+                # Only increment file number if NOT in unofficial mode
+                if not is_unofficial:
+                    self.app.config_manager.increment_file_number()
+                    self.app.file_number.set(str(self.app.config_manager.get_next_file_number()))
+                    
+                # Save username
+                self.app.config_manager.set_username(username)
+                
+                extraction_type = "ΑΝΕΠΙΣΗΜΗ" if is_unofficial else "κανονική"
+                
+                # Add extraction type info to result_data for undo handling
+                if result_data:
+                    result_data['is_unofficial'] = is_unofficial
+                self.extraction_completed(result_data)
+                # Complete progress after extraction_completed
+                self.app.progress_manager.complete_operation("usb_extraction", f"Ολοκλήρωση {extraction_type} εξαγωγής...")
+                # Reset progress bar to 0% after 2 seconds
+                self.app.root.after(2000, lambda: self.app.progress_manager.reset_progress("usb_extraction", "Έτοιμο - Αναμονή για νέο σήμα..."))
+            else:
+                self.extraction_completed(None)
+                # Reset progress bar to 0% after failure
+                self.app.root.after(2000, lambda: self.app.progress_manager.reset_progress("usb_extraction", "Έτοιμο - Αναμονή για νέο σήμα..."))
+        
+        def failed(e):
+            print(f"Σφάλμα εξαγωγής: {e}")
+            self.extraction_completed(None)
+            self.app.progress_manager.reset_progress("usb_extraction", f"Σφάλμα: {str(e)}")
+            # Reset to ready state after 3 seconds
+            self.app.root.after(3000, lambda: self.app.progress_manager.reset_progress("usb_extraction", "Έτοιμο - Αναμονή για νέο σήμα..."))
+        
+        self.app.dispatcher.submit(extract, on_done=extracted, on_error=failed)
     
     def extraction_completed(self, result_data):
         """Completion of extraction with status display"""
@@ -437,6 +404,11 @@ class USBExtractionTab:
             # No result_data - skipping processing
             pass
         
+        # Οι παραλήπτες που εξήχθησαν δεν μένουν επιλεγμένοι (η ανανέωση κρατά την επιλογή)
+        if result_data:
+            for item in self.app.extraction_checkboxes:
+                item['var'].set(False)
+        
         # Refresh extraction list
         self.refresh_extraction_list()
         
@@ -457,7 +429,6 @@ class USBExtractionTab:
     
     def undo_last_extraction(self):
         """Undo last extraction"""
-        import threading
         from tkinter import messagebox
         
         if not self.app.last_extraction_data:
@@ -487,35 +458,33 @@ class USBExtractionTab:
         # Start undo operation
         self.app.progress_manager.start_operation("usb_undo", "Αναίρεση εξαγωγής...", 10)
         
-        def undo_in_thread():
-            try:
-                success, message = self.app.usb_extractor.undo_extraction(self.app.last_extraction_data)
+        def undone(outcome):
+            success, message = outcome
+            
+            if success:
+                # Only decrement file number if it was NOT an unofficial extraction
+                if not is_unofficial_extraction:
+                    self.app.config_manager.decrement_file_number()
+                    self.app.file_number.set(str(self.app.config_manager.get_next_file_number()))
                 
-                self.app.root.after(0, lambda: self.app.progress_manager.smooth_progress("usb_undo", 80, 300))
-                self.app.root.after(300, lambda: self.app.progress_manager.update_message("usb_undo", "Ολοκλήρωση αναίρεσης..."))
+                # Clear last extraction data and disable undo
+                self.app.last_extraction_data = None
+                self.app.undo_button.config(state='disabled')
+                self.app.extraction_status_label.config(text="Αναίρεση ολοκληρώθηκε", fg='blue', font=('Arial', 10, 'bold'))
                 
-                if success:
-                    # Only decrement file number if it was NOT an unofficial extraction
-                    if not is_unofficial_extraction:
-                        self.app.config_manager.decrement_file_number()
-                        self.app.file_number.set(str(self.app.config_manager.get_next_file_number()))
-                    
-                    # Clear last extraction data and disable undo
-                    self.app.last_extraction_data = None
-                    self.app.undo_button.config(state='disabled')
-                    self.app.extraction_status_label.config(text="Αναίρεση ολοκληρώθηκε", fg='blue', font=('Arial', 10, 'bold'))
-                    
-                    # Refresh lists
-                    self.refresh_extraction_list()
-                    
-                    self.app.root.after(500, lambda: self.app.progress_manager.complete_operation("usb_undo", f"Αναίρεση επιτυχής: {message}"))
-                else:
-                    self.app.root.after(0, lambda: self.app.progress_manager.reset_progress("usb_undo", f"Σφάλμα αναίρεσης: {message}"))
+                # Refresh lists
+                self.refresh_extraction_list()
                 
-            except Exception as e:
-                self.app.root.after(0, lambda: self.app.progress_manager.reset_progress("usb_undo", f"Σφάλμα αναίρεσης: {str(e)}"))
+                self.app.progress_manager.complete_operation("usb_undo", f"Αναίρεση επιτυχής: {message}")
+            else:
+                self.app.progress_manager.reset_progress("usb_undo", f"Σφάλμα αναίρεσης: {message}")
         
-        threading.Thread(target=undo_in_thread, daemon=True).start()
+        self.app.dispatcher.submit(
+            self.app.usb_extractor.undo_extraction, self.app.last_extraction_data,
+            progress_callback=self.app.progress_manager.reporter("usb_undo", 10, 100),
+            on_done=undone,
+            on_error=lambda e: self.app.progress_manager.reset_progress("usb_undo", f"Σφάλμα αναίρεσης: {str(e)}")
+        )
     
     def toggle_unofficial_mode(self):
         """Toggle unofficial mode"""
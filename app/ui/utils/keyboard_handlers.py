@@ -41,12 +41,13 @@ class KeyboardHandlerMixin:
         # F5 for refresh operations
         self.root.bind('<F5>', self.handle_refresh_key)
         
+        # Ctrl+F for full-text signal search
+        self.root.bind('<Control-f>', self.open_search_dialog)
+        self.root.bind('<Control-F>', self.open_search_dialog)
+        
         # Alt+A for adding recipient (Signal Processing tab)
         self.root.bind('<Alt-a>', self.handle_alt_a_key)
         self.root.bind('<Alt-A>', self.handle_alt_a_key)
-        
-        # Mouse wheel scrolling for canvas areas
-        self.setup_mouse_wheel_scrolling()
     
     def next_tab(self, event=None):
         """Μετάβαση στην επόμενη καρτέλα"""
@@ -94,23 +95,22 @@ class KeyboardHandlerMixin:
         current_tab = self.notebook.index(self.notebook.select())
         
         if current_tab == 0:  # Signal Processing tab
-            checkboxes = getattr(self, 'recipients_checkboxes', [])
+            checklist = getattr(self, 'recipients_checklist', None)
         elif current_tab == 1:  # USB Extraction tab
-            checkboxes = getattr(self, 'extraction_checkboxes', [])
+            checklist = getattr(self, 'extraction_checklist', None)
         elif current_tab == 2:  # Recipients Management tab
-            checkboxes = getattr(self, 'manage_checkboxes', [])
+            checklist = getattr(self, 'manage_checklist', None)
         else:
             return 'break'
         
+        # Μόνο οι παραλήπτες που εμφανίζονται με το φίλτρο αναζήτησης
+        checkboxes = checklist.visible_items() if checklist is not None else []
         if not checkboxes:
             return 'break'
         
         # Check if all are selected - if so, deselect all, otherwise select all
         all_selected = all(cb['var'].get() for cb in checkboxes)
-        new_state = not all_selected
-        
-        for checkbox_data in checkboxes:
-            checkbox_data['var'].set(new_state)
+        checklist.select_all(not all_selected)
         
         return 'break'
     
@@ -137,61 +137,3 @@ class KeyboardHandlerMixin:
                 self.refresh_recipients_list()
         
         return 'break'
-    
-    def setup_mouse_wheel_scrolling(self):
-        """Ρύθμιση mouse wheel scrolling για canvas areas"""
-        def bind_mousewheel(widget):
-            """Bind mouse wheel events to a widget"""
-            def _on_mousewheel(event):
-                if hasattr(widget, 'yview_scroll'):
-                    widget.yview_scroll(int(-1*(event.delta/120)), "units")
-                return 'break'
-            
-            def _on_mousewheel_linux(event):
-                if hasattr(widget, 'yview_scroll'):
-                    if event.num == 4:
-                        widget.yview_scroll(-1, "units")
-                    elif event.num == 5:
-                        widget.yview_scroll(1, "units")
-                return 'break'
-            
-            # Windows and MacOS
-            widget.bind("<MouseWheel>", _on_mousewheel)
-            # Linux
-            widget.bind("<Button-4>", _on_mousewheel_linux)
-            widget.bind("<Button-5>", _on_mousewheel_linux)
-        
-        # This will be called after canvas widgets are created
-        if hasattr(self, 'root'):
-            self.root.after(100, self.bind_wheel_to_canvas_widgets)
-    
-    def bind_wheel_to_canvas_widgets(self):
-        """Bind mouse wheel scrolling to all canvas widgets"""
-        def bind_mousewheel_to_canvas(canvas):
-            def _on_mousewheel(event):
-                canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                return 'break'
-            
-            def _on_mousewheel_linux(event):
-                if event.num == 4:
-                    canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    canvas.yview_scroll(1, "units")
-                return 'break'
-            
-            canvas.bind("<MouseWheel>", _on_mousewheel)
-            canvas.bind("<Button-4>", _on_mousewheel_linux)
-            canvas.bind("<Button-5>", _on_mousewheel_linux)
-            
-            # Also bind to the frame inside the canvas
-            frame = canvas.winfo_children()[0] if canvas.winfo_children() else None
-            if frame:
-                frame.bind("<MouseWheel>", _on_mousewheel)
-                frame.bind("<Button-4>", _on_mousewheel_linux)
-                frame.bind("<Button-5>", _on_mousewheel_linux)
-        
-        # Find and bind all canvas widgets
-        for widget_name in ['recipients_canvas', 'extraction_canvas', 'manage_canvas']:
-            if hasattr(self, widget_name):
-                canvas = getattr(self, widget_name)
-                bind_mousewheel_to_canvas(canvas)
@@ -20,6 +20,9 @@ class ToolTip:
     
     def on_enter(self, event):
         """Εμφάνιση tooltip"""
+        # Χωρίς κείμενο (π.χ. γραμμή VirtualChecklist χωρίς tooltip) δεν εμφανίζεται τίποτα
+        if not self.text:
+            return
         self.tooltip = tk.Toplevel()
         self.tooltip.wm_overrideredirect(True)
         self.tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
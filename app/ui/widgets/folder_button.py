@@ -22,31 +22,33 @@ class FolderIconButton:
         
         Args:
             parent: Parent widget
-            recipient_name: Name of the recipient folder to open
+            recipient_name: Name of the recipient folder to open (or a callable returning it)
             status_callback: Optional callback function to update status
         
         Returns:
             tkinter.Button: The created folder button
         """
         def open_folder():
+            # Γραμμές του VirtualChecklist: ο παραλήπτης της γραμμής τη στιγμή του κλικ
+            name = recipient_name() if callable(recipient_name) else recipient_name
             try:
                 path_manager = get_path_manager()
-                folder_path = path_manager.get_recipient_folder(recipient_name)
+                folder_path = path_manager.get_recipient_folder(name)
                 
                 if folder_path.exists() and folder_path.is_dir():
                     # Use os.startfile on Windows to open folder in File Explorer
                     os.startfile(str(folder_path))
                     if status_callback:
-                        status_callback(f"Άνοιξε ο φάκελος: {recipient_name}")
+                        status_callback(f"Άνοιξε ο φάκελος: {name}")
                 else:
                     messagebox.showwarning("Φάκελος Δεν Βρέθηκε", 
-                                         f"Ο φάκελος '{recipient_name}' δεν βρέθηκε στο DATA/")
+                                         f"Ο φάκελος '{name}' δεν βρέθηκε στο DATA/")
                     if status_callback:
-                        status_callback(f"Ο φάκελος {recipient_name} δεν υπάρχει")
+                        status_callback(f"Ο φάκελος {name} δεν υπάρχει")
             except Exception as e:
                 messagebox.showerror("Σφάλμα", f"Αδυναμία ανοίγματος φακέλου: {str(e)}")
                 if status_callback:
-                    status_callback(f"Σφάλμα ανοίγματος φακέλου: {recipient_name}")
+                    status_callback(f"Σφάλμα ανοίγματος φακέλου: {name}")
         
         button = tk.Button(parent, 
                           text="📁", 
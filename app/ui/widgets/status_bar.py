@@ -87,4 +87,4 @@ class StatusBar:
     
     def complete_progress(self):
         """Ολοκλήρωση του progress bar στο 100%"""
-        self.smooth_progress_to(100, 200)  # Ομαλή μετάβαση στο 100%
+        self.update_progress(100)
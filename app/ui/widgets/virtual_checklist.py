@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Virtualised checklist widget for autoPyrseia
+
+Λίστα με checkboxes που δημιουργεί widgets μόνο για τις γραμμές που χωράνε
+στο ορατό ύψος. Οι γραμμές ανακυκλώνονται κατά την κύλιση, οπότε εκατοντάδες
+παραλήπτες εμφανίζονται χωρίς εκατοντάδες Checkbutton.
+
+Το μοντέλο είναι η λίστα dicts που χρησιμοποιούσαν ήδη τα tabs
+({'recipient': ..., 'var': ..., ...}) - η επιλογή κρατιέται σε CheckVar
+(get/set όπως το tk.BooleanVar), όχι στα widgets.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+from ..utils.tooltips import create_tooltip
+
+
+class CheckVar:
+    """Κατάσταση επιλογής μιας γραμμής (get/set όπως το tk.BooleanVar, χωρίς Tcl μεταβλητή)"""
+    
+    def __init__(self, value=False):
+        self._value = bool(value)
+        self.listeners = []
+    
+    def get(self):
+        return self._value
+    
+    def set(self, value):
+        value = bool(value)
+        if value == self._value:
+            return
+        self._value = value
+        for listener in list(self.listeners):
+            listener(self)
+    
+    def on_change(self, listener):
+        """listener(var) σε κάθε αλλαγή της τιμής"""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+
+class _Row:
+    """Ένα widget γραμμής του pool - δείχνει όποια εγγραφή του ανατεθεί"""
+    
+    def __init__(self, frame, checkbox, check_var, tooltip, action):
+        self.frame = frame
+        self.checkbox = checkbox
+        self.check_var = check_var
+        self.tooltip = tooltip
+        self.action = action
+        self.item = None
+
+
+class VirtualChecklist(tk.Frame):
+    """Checklist με widgets μόνο για τις ορατές γραμμές
+    
+    items: η λίστα του μοντέλου (το ίδιο list object μένει σε όλη τη ζωή του widget).
+    Κάθε εγγραφή είναι dict με 'recipient' και 'var' (CheckVar) και προαιρετικά
+    'text' (κείμενο γραμμής), 'fg' και 'tooltip'.
+    row_style(item): επιπλέον επιλογές Checkbutton (π.χ. έντονη γραμματοσειρά όταν είναι επιλεγμένη).
+    row_action(parent, current_item): widget στα δεξιά κάθε γραμμής - current_item() δίνει την εγγραφή της.
+    menu_items(item): [(label, command) ή None για separator] για το δεξί κλικ.
+    """
+    
+    # Επιλογές του Checkbutton που επαναφέρονται όταν μια γραμμή δείχνει άλλη εγγραφή
+    STYLE_KEYS = ('font', 'fg', 'bg', 'activebackground', 'selectcolor')
+    
+    FOCUS_BACKGROUND = '#e8f4fd'
+    
+    def __init__(self, parent, items=None, height=200, width=400, font=('Arial', 10),
+                 row_style=None, row_action=None, menu_items=None, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.items = items if items is not None else []
+        self.font = font
+        self.row_style = row_style
+        self.row_action = row_action
+        self.menu_items = menu_items
+        
+        # Οι εγγραφές που περνούν το φίλτρο και η πρώτη ορατή
+        self._filter = ""
+        self._view = []
+        self._top = 0
+        
+        self._rows = []
+        self._row_height = None
+        self._default_style = None
+        self._visible_rows = 1
+        self._wheel_tag = f"VirtualChecklist{id(self)}"
+        
+        self.body = tk.Frame(self, height=height, width=width)
+        self.body.pack_propagate(False)
+        self.scrollbar = ttk.Scrollbar(self, orient='vertical', command=self.yview)
+        
+        self.body.pack(side='left', fill='both', expand=True)
+        self.scrollbar.pack(side='right', fill='y')
+        
+        self.body.bind('<Configure>', lambda e: self._layout())
+        self._add_wheel_tag(self.body)
+        self.bind_class(self._wheel_tag, '<MouseWheel>', self._on_mousewheel)
+        self.bind_class(self._wheel_tag, '<Button-4>', lambda e: self.yview_scroll(-1, 'units'))
+        self.bind_class(self._wheel_tag, '<Button-5>', lambda e: self.yview_scroll(1, 'units'))
+        
+        self.refresh()
+    
+    # ------------------------------------------------------------------
+    # Μοντέλο
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def make_item(recipient, checked=False, **extra):
+        """Νέα εγγραφή μοντέλου"""
+        item = {'recipient': recipient, 'var': CheckVar(checked)}
+        item.update(extra)
+        return item
+    
+    def set_items(self, items):
+        """Αντικατάσταση όλων των εγγραφών (η λίστα self.items μένει η ίδια)"""
+        self.items[:] = items
+        self.refresh()
+    
+    def add_item(self, item):
+        self.items.append(item)
+        self.refresh()
+        return item
+    
+    def clear(self):
+        self.set_items([])
+    
+    def set_filter(self, text):
+        """Εμφάνιση μόνο των εγγραφών που περιέχουν το κείμενο"""
+        self._filter = (text or "").strip().lower()
+        self._top = 0
+        self.refresh()
+    
+    def visible_items(self):
+        """Οι εγγραφές που περνούν το φίλτρο"""
+        return list(self._view)
+    
+    def select_all(self, state):
+        """Επιλογή/αποεπιλογή όλων των εγγραφών του φίλτρου"""
+        for item in self._view:
+            item['var'].set(state)
+    
+    def refresh(self):
+        """Εφαρμογή του φίλτρου και επανασχεδίαση των ορατών γραμμών"""
+        for item in self.items:
+            item['var'].on_change(self._on_var_changed)
+        
+        if self._filter:
+            self._view = [item for item in self.items if self._filter in self._label(item).lower()]
+        else:
+            self._view = list(self.items)
+        self._render()
+    
+    def refresh_item(self, item):
+        """Επανασχεδίαση μιας εγγραφής αν είναι ορατή (π.χ. μετά από αλλαγή 'fg')"""
+        for row in self._rows:
+            if row.item is item:
+                self._bind_row(row, item)
+    
+    # ------------------------------------------------------------------
+    # Κύλιση
+    # ------------------------------------------------------------------
+    
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) ή ('scroll', n, 'units'|'pages')"""
+        if not args:
+            return self._fractions()
+        if args[0] == 'moveto':
+            self._scroll_to(round(float(args[1]) * len(self._view)))
+        elif args[0] == 'scroll':
+            self.yview_scroll(int(args[1]), args[2])
+    
+    def yview_scroll(self, number, what):
+        step = self._visible_rows if what == 'pages' else 1
+        self._scroll_to(self._top + number * step)
+    
+    def see(self, item):
+        """Κύλιση ώστε η εγγραφή να είναι ορατή"""
+        if item in self._view:
+            index = self._view.index(item)
+            if index < self._top:
+                self._scroll_to(index)
+            elif index >= self._top + self._visible_rows:
+                self._scroll_to(index - self._visible_rows + 1)
+    
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self._view) - self._visible_rows))
+        if top != self._top:
+            self._top = top
+            self._render()
+    
+    def _fractions(self):
+        total = len(self._view)
+        if total <= self._visible_rows:
+            return 0.0, 1.0
+        return self._top / total, (self._top + self._visible_rows) / total
+    
+    def _on_mousewheel(self, event):
+        self.yview_scroll(int(-1 * (event.delta / 120)), 'units')
+        return 'break'
+    
+    # ------------------------------------------------------------------
+    # Γραμμές
+    # ------------------------------------------------------------------
+    
+    def _label(self, item):
+        return item.get('text') or str(item['recipient'])
+    
+    def _layout(self):
+        """Αλλαγή μεγέθους: όσες γραμμές χωράνε στο ύψος"""
+        self._render()
+    
+    def _render(self):
+        if self._row_height is None:
+            self._create_row()
+        
+        height = max(self.body.winfo_height(), 1)
+        if height <= 1:
+            height = int(self.body.cget('height'))
+        self._visible_rows = max(1, height // self._row_height)
+        needed = min(len(self._view), self._visible_rows + 1)
+        
+        # Το pool μεγαλώνει μόνο όταν μεγαλώσει το παράθυρο
+        while len(self._rows) < needed:
+            self._create_row()
+        
+        self._top = max(0, min(self._top, len(self._view) - self._visible_rows))
+        for position, row in enumerate(self._rows):
+            index = self._top + position
+            if position < needed and index < len(self._view):
+                self._bind_row(row, self._view[index])
+                row.frame.place(x=0, y=position * self._row_height, relwidth=1, height=self._row_height)
+            else:
+                row.item = None
+                row.frame.place_forget()
+        
+        first, last = self._fractions()
+        self.scrollbar.set(first, last)
+    
+    def _create_row(self):
+        frame = tk.Frame(self.body)
+        check_var = tk.BooleanVar()
+        checkbox = tk.Checkbutton(frame, variable=check_var, font=self.font, anchor='w')
+        checkbox.pack(side='left', fill='x', expand=True, padx=5)
+        tooltip = create_tooltip(checkbox, None)
+        
+        row = _Row(frame, checkbox, check_var, tooltip, None)
+        checkbox.config(command=lambda r=row: self._on_row_toggled(r))
+        
+        if self.row_action is not None:
+            row.action = self.row_action(frame, lambda r=row: r.item)
+            row.action.pack(side='right', padx=(5, 0))
+        
+        if self._default_style is None:
+            self._default_style = {key: checkbox.cget(key) for key in self.STYLE_KEYS}
+        
+        # Πληκτρολόγιο και δεξί κλικ όπως στα παλιά checkboxes
+        checkbox.bind('<Return>', lambda e, r=row: r.checkbox.invoke())
+        checkbox.bind('<FocusIn>', lambda e, r=row: r.checkbox.config(bg=self.FOCUS_BACKGROUND))
+        checkbox.bind('<FocusOut>', lambda e, r=row: r.item is not None and self._bind_row(r, r.item))
+        if self.menu_items is not None:
+            checkbox.bind('<Button-3>', lambda e, r=row: self._show_menu(e, r))
+        
+        for widget in (frame, checkbox, row.action):
+            if widget is not None:
+                self._add_wheel_tag(widget)
+        
+        if self._row_height is None:
+            frame.update_idletasks()
+            self._row_height = max(frame.winfo_reqheight(), tkfont.Font(font=self.font).metrics('linespace') + 8)
+        
+        self._rows.append(row)
+        return row
+    
+    def _bind_row(self, row, item):
+        """Η γραμμή δείχνει την εγγραφή: κείμενο, κατάσταση και εμφάνιση"""
+        row.item = item
+        row.check_var.set(item['var'].get())
+        
+        style = dict(self._default_style)
+        style['text'] = self._label(item)
+        if item.get('fg'):
+            style['fg'] = item['fg']
+        if self.row_style is not None:
+            style.update(self.row_style(item))
+        row.checkbox.config(**style)
+        row.tooltip.text = item.get('tooltip')
+    
+    def _on_row_toggled(self, row):
+        if row.item is not None:
+            row.item['var'].set(row.check_var.get())
+    
+    def _on_var_changed(self, var):
+        for row in self._rows:
+            if row.item is not None and row.item['var'] is var:
+                self._bind_row(row, row.item)
+    
+    def _show_menu(self, event, row):
+        if row.item is None:
+            return
+        menu = tk.Menu(self, tearoff=0)
+        for entry in self.menu_items(row.item):
+            if entry is None:
+                menu.add_separator()
+            else:
+                label, command = entry
+                menu.add_command(label=label, command=command)
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+    
+    def _add_wheel_tag(self, widget):
+        widget.bindtags((self._wheel_tag,) + widget.bindtags())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI dispatcher for autoPyrseia
+
+Η δουλειά των services τρέχει σε executor και επιστρέφει futures. Τα
+αποτελέσματα (και κάθε άλλη ενημέρωση του UI από background threads)
+μπαίνουν σε μία ουρά και εκτελούνται στο Tk thread με ένα μόνο wake-up
+(root.after) ανά ομάδα - χωρίς polling.
+
+Οι workers δεν αγγίζουν widgets ή μεταβλητές Tk. Η μόνη κλήση Tk από άλλο
+thread είναι σκόπιμα το root.after(0, ...) του wake-up (_wake): το Tcl του
+Python (threaded build) τη μεταφέρει στο Tk thread, και γίνεται το πολύ μία
+φορά ανά ομάδα callbacks. Αν αποτύχει, τα callbacks μένουν στην ουρά.
+
+Τα dialogs γίνονται awaitable: ask() επιστρέφει future με το αποτέλεσμα του
+dialog, που ένας worker μπορεί να περιμένει χωρίς να αγγίξει το Tk.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class UIDispatcher:
+    """Executor για background δουλειά και ουρά callbacks για το Tk thread"""
+    
+    def __init__(self, root, max_workers=4):
+        # Χωρίς root (π.χ. headless) τα callbacks εκτελούνται αμέσως
+        self.root = root
+        self._ui_thread = threading.get_ident()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ui-dispatch")
+        
+        self._lock = threading.Lock()
+        self._callbacks = deque()
+        self._wake_pending = False
+        self._closed = False
+    
+    def in_ui_thread(self):
+        return threading.get_ident() == self._ui_thread
+    
+    def call_soon(self, callback, *args):
+        """Εκτέλεση στο Tk thread (ασφαλές από οποιοδήποτε thread)"""
+        if self.root is None:
+            self._run_callback(callback, args)
+            return
+        
+        with self._lock:
+            if self._closed:
+                return
+            self._callbacks.append((callback, args))
+            if self._wake_pending:
+                # Ένα wake-up είναι ήδη προγραμματισμένο - θα εκτελέσει και αυτό
+                return
+            self._wake_pending = True
+        self._wake()
+    
+    def call_later(self, delay_ms, callback, *args):
+        """Εκτέλεση στο Tk thread μετά από delay_ms"""
+        if self.root is None:
+            threading.Timer(delay_ms / 1000.0, self._run_callback, args=(callback, args)).start()
+            return
+        self.call_soon(lambda: self.root.after(delay_ms, lambda: self._run_callback(callback, args)))
+    
+    def start(self):
+        """Εκτέλεση ό,τι μαζεύτηκε πριν ξεκινήσει το mainloop"""
+        with self._lock:
+            if not self._callbacks or self._wake_pending:
+                return
+            self._wake_pending = True
+        self._wake()
+    
+    def _wake(self):
+        # Η μοναδική κλήση Tk που μπορεί να γίνει από worker thread (βλ. docstring του module)
+        try:
+            self.root.after(0, self._drain)
+        except Exception:
+            # Το παράθυρο έκλεισε ή το mainloop δεν τρέχει ακόμα - τα callbacks
+            # μένουν στην ουρά για το επόμενο wake-up (ή το start)
+            with self._lock:
+                self._wake_pending = False
+    
+    def _drain(self):
+        with self._lock:
+            self._wake_pending = False
+            callbacks = list(self._callbacks)
+            self._callbacks.clear()
+        
+        for callback, args in callbacks:
+            self._run_callback(callback, args)
+    
+    def _run_callback(self, callback, args):
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"Σφάλμα σε ενημέρωση UI: {e}")
+    
+    def submit(self, fn, *args, on_done=None, on_error=None, **kwargs):
+        """Εκτέλεση fn στον executor - on_done/on_error καλούνται στο Tk thread"""
+        future = self._executor.submit(fn, *args, **kwargs)
+        if on_done is not None or on_error is not None:
+            self.then(future, on_done, on_error)
+        return future
+    
+    def then(self, future, on_done=None, on_error=None):
+        """Callbacks στο Tk thread όταν ολοκληρωθεί το future"""
+        def completed(done_future):
+            if done_future.cancelled():
+                return
+            error = done_future.exception()
+            if error is None:
+                if on_done is not None:
+                    self.call_soon(on_done, done_future.result())
+            elif on_error is not None:
+                self.call_soon(on_error, error)
+            else:
+                print(f"Σφάλμα σε εργασία background: {error}")
+        
+        future.add_done_callback(completed)
+        return future
+    
+    def run_on_ui(self, fn, *args):
+        """fn στο Tk thread - επιστρέφει future με το αποτέλεσμα
+        
+        Από το Tk thread μην περιμένετε το future.result() (deadlock) - χρησιμοποιήστε then().
+        """
+        future = Future()
+        
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        self.call_soon(run)
+        return future
+    
+    def ask(self, dialog_factory):
+        """Awaitable modal dialog: future με το dialog.result"""
+        return self.run_on_ui(lambda: dialog_factory().result)
+    
+    def shutdown(self):
+        """Τέλος - νέα callbacks αγνοούνται και οι εργασίες σε αναμονή ακυρώνονται"""
+        with self._lock:
+            self._closed = True
+            self._callbacks.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
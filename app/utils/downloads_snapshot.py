@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Downloads folder snapshot for autoPyrseia
+
+Μία κοινή λίστα του φακέλου downloads (ονόματα, κανονικοποιημένα ονόματα,
+μεγέθη) που ανανεώνεται από τα γεγονότα του file watcher, ώστε οι έλεγχοι
+συνημμένων να μη διαβάζουν τον φάκελο ξανά και ξανά για κάθε σήμα.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from .path_manager import get_path_manager
+from .fuzzy_matcher import FilenameMatcher
+
+
+class DownloadsSnapshot:
+    """Κοινή, thread-safe εικόνα του φακέλου downloads"""
+    
+    # Χωρίς watcher γεγονότων η λίστα θεωρείται έγκυρη μόνο για λίγο
+    UNWATCHED_TTL = 1.0
+    
+    def __init__(self, folder=None):
+        self.folder = folder or get_path_manager().downloads_folder
+        self._lock = threading.RLock()
+        self._entries = {}        # name -> (size, mtime_ns)
+        self._order = []          # σειρά του λειτουργικού (όπως το glob)
+        # Ευρετήριο fuzzy matching (κρατάει τα κανονικοποιημένα ονόματα ανάμεσα στις ανανεώσεις)
+        self._matcher = FilenameMatcher()
+        self._matcher_generation = None
+        self._dirty = True
+        self._refreshed_at = 0.0
+        self.watched = False
+        self.listing_count = 0
+        # Αυξάνεται όταν αλλάζει το περιεχόμενο (για cache αποτελεσμάτων, π.χ. resolve_attachments)
+        self.generation = 0
+        self._plan_cache = None
+    
+    def set_watched(self, watched):
+        """Ο file watcher ενημερώνει για κάθε αλλαγή - χωρίς λήξη της λίστας"""
+        self.watched = watched
+        self.invalidate()
+    
+    def invalidate(self):
+        """Σήμανση ότι ο φάκελος άλλαξε (η λίστα ανανεώνεται στην επόμενη ερώτηση)"""
+        self._dirty = True
+    
+    def refresh(self):
+        """Ανάγνωση του φακέλου με ένα scandir"""
+        entries = {}
+        order = []
+        try:
+            with os.scandir(self.folder) as iterator:
+                for entry in iterator:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries[entry.name] = (stat.st_size, stat.st_mtime_ns)
+                        order.append(entry.name)
+        except OSError:
+            pass
+        
+        with self._lock:
+            if entries != self._entries:
+                self.generation += 1
+            self._entries = entries
+            self._order = order
+            self._dirty = False
+            self._refreshed_at = time.time()
+            self.listing_count += 1
+    
+    def _ensure_fresh(self):
+        if self._dirty or (not self.watched and time.time() - self._refreshed_at > self.UNWATCHED_TTL):
+            self.refresh()
+    
+    def names(self):
+        """Ονόματα αρχείων με τη σειρά του φακέλου"""
+        with self._lock:
+            self._ensure_fresh()
+            return list(self._order)
+    
+    def entries(self):
+        """Αντίγραφο {όνομα: (μέγεθος, mtime_ns)}"""
+        with self._lock:
+            self._ensure_fresh()
+            return dict(self._entries)
+    
+    def exists(self, name):
+        """Ακριβές όνομα"""
+        with self._lock:
+            self._ensure_fresh()
+            return name in self._entries
+    
+    def find_case_insensitive(self, name):
+        """Όνομα αρχείου που διαφέρει μόνο σε πεζά/κεφαλαία (ή None)"""
+        lowered = name.lower()
+        with self._lock:
+            self._ensure_fresh()
+            for file_name in self._order:
+                if file_name.lower() == lowered:
+                    return file_name
+        return None
+    
+    def _fresh_matcher(self):
+        """Το ευρετήριο fuzzy matching ξαναχτίζεται μόνο όταν αλλάξει ο φάκελος"""
+        self._ensure_fresh()
+        if self._matcher_generation != self.generation:
+            self._matcher.update(self._order)
+            self._matcher_generation = self.generation
+        return self._matcher
+    
+    def cleaned_name(self, name):
+        """Κανονικοποιημένο όνομα για fuzzy matching (υπολογίζεται μία φορά ανά αρχείο)"""
+        with self._lock:
+            return self._fresh_matcher().cleaned_name(name)
+    
+    def find_similar(self, target_name):
+        """Fuzzy matching (ίδιο κριτήριο με το find_similar_filename)"""
+        candidates = self.find_similar_candidates(target_name)
+        return candidates[0][0] if candidates else None
+    
+    def find_similar_candidates(self, target_name):
+        """Όλα τα αρχεία πάνω από το όριο ομοιότητας, [(όνομα, score)] με το καλύτερο πρώτο"""
+        # Ίδια αποτελέσματα με το calculate_filename_similarity > 0.8 για κάθε αρχείο,
+        # σε ισοβαθμία κερδίζει το πρώτο στη σειρά του φακέλου
+        with self._lock:
+            return self._fresh_matcher().candidates(target_name)
+    
+    def resolve(self, attachment_name):
+        """Πραγματικό όνομα αρχείου για ένα συνημμένο: ακριβές, πεζά/κεφαλαία ή fuzzy"""
+        if self.exists(attachment_name):
+            return attachment_name
+        return self.find_case_insensitive(attachment_name) or self.find_similar(attachment_name)
+    
+    def resolve_attachments(self, attachment_names):
+        """Πλάνο επίλυσης συνημμένων (βλ. file_operations.resolve_attachments)"""
+        names = tuple(attachment_names)
+        with self._lock:
+            self._ensure_fresh()
+            cache_key = (self.generation, names)
+            if self._plan_cache and self._plan_cache[0] == cache_key:
+                return self._plan_cache[1]
+            
+            plan = {}
+            for name in names:
+                entry = {'source': None, 'file_name': None, 'match': None, 'score': 0.0,
+                         'ambiguous': False, 'candidates': []}
+                
+                if name in self._entries:
+                    entry.update(file_name=name, match='exact', score=1.0)
+                else:
+                    case_match = self.find_case_insensitive(name)
+                    if case_match:
+                        entry.update(file_name=case_match, match='case', score=1.0)
+                    else:
+                        candidates = self.find_similar_candidates(name)
+                        if candidates:
+                            entry.update(file_name=candidates[0][0], match='fuzzy', score=candidates[0][1],
+                                         candidates=[file_name for file_name, _ in candidates],
+                                         ambiguous=len(candidates) > 1)
+                
+                if entry['file_name']:
+                    entry['source'] = self.folder / entry['file_name']
+                plan[name] = entry
+            
+            # Ένα αρχείο που καλύπτει δύο συνημμένα μέσω fuzzy matching είναι αμφίβολο
+            used_by = {}
+            for entry in plan.values():
+                if entry['file_name']:
+                    used_by.setdefault(entry['file_name'], []).append(entry)
+            for entries in used_by.values():
+                if len(entries) > 1 and any(entry['match'] == 'fuzzy' for entry in entries):
+                    for entry in entries:
+                        entry['ambiguous'] = entry['match'] == 'fuzzy'
+            
+            self._plan_cache = (cache_key, plan)
+            return plan
+    
+    def clear(self):
+        """Διαγραφή όλων των αρχείων του φακέλου"""
+        for name in self.names():
+            try:
+                (self.folder / name).unlink()
+            except FileNotFoundError:
+                pass
+        self.invalidate()
+
+
+# Global snapshot instance
+_downloads_snapshot = None
+
+
+def get_downloads_snapshot():
+    """Get the global downloads snapshot instance"""
+    global _downloads_snapshot
+    if _downloads_snapshot is None:
+        _downloads_snapshot = DownloadsSnapshot()
+    return _downloads_snapshot
+
+
+# Snapshots άλλων φακέλων με αρχεία σήματος (π.χ. φάκελοι της ουράς intake)
+_folder_snapshots = {}
+_folder_snapshots_lock = threading.Lock()
+
+
+def get_folder_snapshot(folder):
+    """Snapshot για έναν φάκελο σήματος (το downloads επιστρέφει το κοινό snapshot)"""
+    folder = Path(folder)
+    downloads_snapshot = get_downloads_snapshot()
+    if folder == downloads_snapshot.folder:
+        return downloads_snapshot
+    
+    with _folder_snapshots_lock:
+        snapshot = _folder_snapshots.get(folder)
+        if snapshot is None:
+            snapshot = _folder_snapshots[folder] = DownloadsSnapshot(folder)
+        return snapshot
+
+
+def drop_folder_snapshot(folder):
+    """Αφαίρεση του snapshot ενός φακέλου που διαγράφηκε"""
+    with _folder_snapshots_lock:
+        _folder_snapshots.pop(Path(folder), None)
@@ -5,9 +5,15 @@ File operations utilities for autoPyrseia
 """
 
 import os
+import time
 from pathlib import Path
-from .string_utils import clean_filename_for_matching, calculate_filename_similarity
+from .fuzzy_matcher import FilenameMatcher
 from .path_manager import get_path_manager
+from .downloads_snapshot import get_downloads_snapshot, get_folder_snapshot
+
+# Προσωρινά αρχεία browsers για λήψεις που δεν έχουν ολοκληρωθεί (Chrome/Edge, Firefox, IE/Edge legacy, Safari).
+# Όχι το γενικό .tmp: ένα άσχετο .tmp στο downloads θα καθυστερούσε κάθε σήμα μέχρι το timeout
+IN_FLIGHT_SUFFIXES = ('.crdownload', '.part', '.partial', '.download')
 
 
 def get_download_folder():
@@ -23,62 +29,112 @@ def ensure_directory_exists(path):
 
 def check_attachment_exists(attachment_name):
     """Έλεγχος αν υπάρχει το συνημμένο αρχείο"""
-    path_manager = get_path_manager()
-    downloads_path = path_manager.downloads_folder
-    
-    # Έλεγχος ακριβούς ονόματος
-    if (downloads_path / attachment_name).exists():
-        return True
-    
-    # Έλεγχος για παρόμοια ονόματα
-    for file in downloads_path.glob("*"):
-        if file.name.lower() == attachment_name.lower():
-            return True
-    
-    # Fuzzy matching για παρόμοια ονόματα
-    similar_file = find_similar_filename(attachment_name, downloads_path)
-    if similar_file:
-        return True
+    # Ακριβές όνομα, πεζά/κεφαλαία ή fuzzy matching πάνω στην κοινή λίστα του downloads
+    return get_downloads_snapshot().resolve(attachment_name) is not None
+
+
+def resolve_attachments(attachment_names, folder=None):
+    """Επίλυση όλων των συνημμένων ενός σήματος σε αρχεία του downloads με μία λίστα
     
-    return False
+    Επιστρέφει {όνομα: {'source', 'file_name', 'match', 'score', 'ambiguous', 'candidates'}}
+    με match 'exact', 'case', 'fuzzy' ή None (λείπει). Έλεγχος, dialog, indicators
+    και αντιγραφή χρησιμοποιούν το ίδιο πλάνο όσο δεν αλλάζει ο φάκελος.
+    folder: φάκελος του σήματος στην ουρά intake (προεπιλογή το downloads).
+    """
+    if folder:
+        return get_folder_snapshot(folder).resolve_attachments(attachment_names)
+    return get_downloads_snapshot().resolve_attachments(attachment_names)
 
 
 def find_similar_filename(target_name, search_path):
     """Αναζήτηση παρόμοιου ονόματος αρχείου με fuzzy matching"""
+    snapshot = get_downloads_snapshot()
+    if Path(search_path) == snapshot.folder:
+        return snapshot.find_similar(target_name)
+    
     if not search_path.exists():
         return None
     
-    # Καθαρισμός του target name από διάφορα προβλήματα
-    cleaned_target = clean_filename_for_matching(target_name)
-    
-    best_match = None
-    best_score = 0
-    
-    for file in search_path.glob("*"):
-        if file.is_file():
-            # Καθαρισμός του πραγματικού ονόματος αρχείου
-            cleaned_filename = clean_filename_for_matching(file.name)
-            
-            # Υπολογισμός similarity score
-            score = calculate_filename_similarity(cleaned_target, cleaned_filename)
-            
-            # Θεωρούμε match αν το score είναι πάνω από 0.8 (80% similarity)
-            if score > 0.8 and score > best_score:
-                best_score = score
-                best_match = file.name
-    
-    return best_match
+    # Θεωρούμε match αν το score είναι πάνω από 0.8 (80% similarity)
+    file_names = [file.name for file in search_path.glob("*") if file.is_file()]
+    return FilenameMatcher(file_names).best_match(target_name)
 
 
 def clear_downloads_folder():
     """Καθαρισμός του φακέλου downloads"""
     try:
-        path_manager = get_path_manager()
-        downloads_path = path_manager.downloads_folder
-        
-        if downloads_path.exists():
-            for file in downloads_path.glob("*"):
-                if file.is_file():
-                    file.unlink()
+        get_downloads_snapshot().clear()
     except Exception as e:
         print(f"Σφάλμα κατά τον καθαρισμό του φακέλου downloads: {str(e)}")
+
+
+def find_in_flight_downloads(folder=None):
+    """Λήψεις σε εξέλιξη στο downloads (π.χ. .crdownload, .part)"""
+    folder = Path(folder) if folder else get_download_folder()
+    try:
+        with os.scandir(folder) as entries:
+            return [entry.name for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(IN_FLIGHT_SUFFIXES)]
+    except OSError:
+        return []
+
+
+def is_file_locked(file_path):
+    """True αν κάποιο άλλο πρόγραμμα κρατάει ακόμα το αρχείο ανοιχτό για εγγραφή"""
+    # Αρχεία μόνο για ανάγνωση δεν ανοίγουν ποτέ για εγγραφή
+    mode = 'r+b' if os.access(file_path, os.W_OK) else 'rb'
+    try:
+        with open(file_path, mode):
+            return False
+    except OSError:
+        return True
+
+
+def is_pdf_complete(pdf_path):
+    """Ένα πλήρες PDF τελειώνει με %%EOF (μέσα στο τελευταίο 1KB)"""
+    try:
+        with open(pdf_path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 1024))
+            return b'%%EOF' in f.read()
+    except OSError:
+        return False
+
+
+def wait_for_stable_file(file_path, quiet_seconds=0.5, timeout=30.0, poll_interval=0.2, should_continue=None):
+    """Αναμονή μέχρι να ολοκληρωθεί η εγγραφή ενός αρχείου λήψης
+    
+    Το αρχείο θεωρείται έτοιμο όταν μέγεθος και mtime δεν αλλάζουν για
+    quiet_seconds, ανοίγει αποκλειστικά, δεν υπάρχουν άλλες λήψεις σε
+    εξέλιξη στον ίδιο φάκελο και (για PDF) έχει γραφτεί ολόκληρο.
+    Επιστρέφει (stable, waited_seconds) - stable=False σε timeout.
+    """
+    file_path = Path(file_path)
+    start_time = time.time()
+    last_state = None
+    quiet_since = start_time
+    
+    while should_continue is None or should_continue():
+        now = time.time()
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Το αρχείο διαγράφηκε ή μετονομάζεται
+            last_state = None
+            quiet_since = now
+        else:
+            state = (stat.st_size, stat.st_mtime_ns)
+            if state != last_state:
+                last_state = state
+                quiet_since = now
+            elif (now - quiet_since >= quiet_seconds and stat.st_size > 0
+                  and not is_file_locked(file_path)
+                  and not find_in_flight_downloads(file_path.parent)
+                  and (file_path.suffix.lower() != '.pdf' or is_pdf_complete(file_path))):
+                return True, now - start_time
+        
+        if now - start_time >= timeout:
+            return False, now - start_time
+        time.sleep(poll_interval)
+    
+    return False, time.time() - start_time
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fast fuzzy filename matcher for autoPyrseia
+
+Δίνει ακριβώς τα ίδια αποτελέσματα με το calculate_filename_similarity
+(όριο 0.8), αλλά:
+- κανονικοποιεί κάθε όνομα αρχείου μία φορά (cache),
+- κρατάει ευρετήριο από bigrams και λέξεις για να διαλέξει υποψήφια,
+- απορρίπτει υποψήφια από τη διαφορά μήκους,
+- υπολογίζει Levenshtein μόνο μέσα σε μια λωρίδα (banded) με πρόωρη έξοδο.
+"""
+
+from collections import Counter
+from functools import lru_cache
+from .string_utils import clean_filename_for_matching
+
+DEFAULT_THRESHOLD = 0.8
+
+# Το ίδιο όνομα συνημμένου ελέγχεται πολλές φορές (indicators, έλεγχος, αντιγραφή)
+cached_clean_filename = lru_cache(maxsize=4096)(clean_filename_for_matching)
+
+
+def _bigrams(text):
+    return Counter(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def banded_levenshtein(s1, s2, max_distance):
+    """Levenshtein distance αν είναι <= max_distance, αλλιώς None (πρόωρη έξοδος)"""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    len1, len2 = len(s1), len(s2)
+    if len1 - len2 > max_distance:
+        return None
+    if len2 == 0:
+        return len1
+    
+    big = max_distance + 1
+    previous_row = [j if j <= max_distance else big for j in range(len2 + 1)]
+    for i in range(1, len1 + 1):
+        c1 = s1[i - 1]
+        start = max(1, i - max_distance)
+        end = min(len2, i + max_distance)
+        current_row = [big] * (len2 + 1)
+        if i <= max_distance:
+            current_row[0] = i
+        row_min = current_row[0]
+        for j in range(start, end + 1):
+            value = previous_row[j - 1] + (c1 != s2[j - 1])
+            insertion = previous_row[j] + 1
+            if insertion < value:
+                value = insertion
+            deletion = current_row[j - 1] + 1
+            if deletion < value:
+                value = deletion
+            if value > big:
+                value = big
+            current_row[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous_row = current_row
+    
+    distance = previous_row[len2]
+    return distance if distance <= max_distance else None
+
+
+def similarity_above(name1, name2, threshold=DEFAULT_THRESHOLD):
+    """calculate_filename_similarity(name1, name2) αν είναι > threshold, αλλιώς None
+    
+    Οι εκφράσεις float είναι ίδιες με το calculate_filename_similarity, ώστε
+    τα scores (και η κατάταξη) να είναι πανομοιότυπα.
+    """
+    if not name1 or not name2:
+        return None
+    if name1 == name2:
+        return 1.0 if 1.0 > threshold else None
+    
+    max_length = max(len(name1), len(name2))
+    length_difference = abs(len(name1) - len(name2))
+    
+    # Substring: η απόσταση είναι ακριβώς η διαφορά μήκους
+    is_substring = name1 in name2 or name2 in name1
+    if is_substring:
+        distance = length_difference
+    else:
+        # Χωρίς bonus χρειάζεται 1 - d/L > threshold - λίγο φαρδύτερη λωρίδα για ασφάλεια
+        max_distance = int((1.0 - threshold) * max_length) + 1
+        distance = banded_levenshtein(name1, name2, max_distance)
+    
+    if distance is not None:
+        similarity = 1.0 - (distance / max_length) if max_length > 0 else 0.0
+        if is_substring:
+            similarity = min(1.0, similarity + 0.1)
+    else:
+        # Εκτός λωρίδας: η ομοιότητα απόστασης είναι σίγουρα κάτω από το όριο
+        similarity = 0.0
+    
+    tokens1 = set(name1.split())
+    tokens2 = set(name2.split())
+    if tokens1 and tokens2:
+        common_tokens = len(tokens1.intersection(tokens2))
+        total_tokens = len(tokens1.union(tokens2))
+        token_similarity = common_tokens / total_tokens
+        similarity = max(similarity, token_similarity)
+    
+    return similarity if similarity > threshold else None
+
+
+class FilenameMatcher:
+    """Ευρετήριο ονομάτων αρχείων για γρήγορο fuzzy matching"""
+    
+    def __init__(self, file_names=(), threshold=DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._cleaned_cache = {}
+        self.update(file_names)
+    
+    def update(self, file_names):
+        """Νέα λίστα αρχείων - η κανονικοποίηση κρατιέται για όσα υπήρχαν ήδη"""
+        self.names = list(file_names)
+        cleaned_cache = {}
+        self._cleaned = []
+        self._lengths = []
+        self._exact = {}
+        self._bigram_index = {}
+        self._token_index = {}
+        
+        for position, name in enumerate(self.names):
+            cleaned = self._cleaned_cache.get(name)
+            if cleaned is None:
+                cleaned = clean_filename_for_matching(name)
+            cleaned_cache[name] = cleaned
+            self._cleaned.append(cleaned)
+            self._lengths.append(len(cleaned))
+            self._exact.setdefault(cleaned, []).append(position)
+            
+            for bigram, count in _bigrams(cleaned).items():
+                self._bigram_index.setdefault(bigram, []).append((position, count))
+            for token in set(cleaned.split()):
+                self._token_index.setdefault(token, []).append(position)
+        
+        self._cleaned_cache = cleaned_cache
+    
+    def cleaned_name(self, name):
+        """Κανονικοποιημένο όνομα αρχείου του ευρετηρίου"""
+        cleaned = self._cleaned_cache.get(name)
+        return cleaned if cleaned is not None else cached_clean_filename(name)
+    
+    def _shortlist(self, target):
+        """Θέσεις αρχείων που μπορεί να ξεπερνούν το όριο"""
+        target_length = len(target)
+        shortlist = set(self._exact.get(target, ()))
+        
+        # Λέξεις: token Jaccard > όριο απαιτεί τουλάχιστον μία κοινή λέξη
+        for token in set(target.split()):
+            shortlist.update(self._token_index.get(token, ()))
+        
+        # Substring: όποιο ταιριάζει σε μήκος και περιέχει/περιέχεται
+        max_ratio_gap = 1.0 - self.threshold + 0.1
+        for position, cleaned in enumerate(self._cleaned):
+            length = self._lengths[position]
+            longest = max(length, target_length)
+            if longest and abs(length - target_length) < max_ratio_gap * longest + 1:
+                if cleaned and (target in cleaned or cleaned in target):
+                    shortlist.add(position)
+        
+        # Απόσταση: q-gram lemma - κοινά bigrams >= L - 1 - 2k
+        target_bigrams = _bigrams(target)
+        common = {}
+        for bigram, count in target_bigrams.items():
+            for position, candidate_count in self._bigram_index.get(bigram, ()):
+                common[position] = common.get(position, 0) + min(count, candidate_count)
+        
+        for position in range(len(self.names)):
+            length = self._lengths[position]
+            longest = max(length, target_length)
+            if not longest:
+                continue
+            max_distance = int((1.0 - self.threshold) * longest) + 1
+            if abs(length - target_length) > max_distance:
+                continue
+            if common.get(position, 0) >= longest - 1 - 2 * max_distance:
+                shortlist.add(position)
+        
+        return sorted(shortlist)
+    
+    def candidates(self, target_name):
+        """[(όνομα, score)] πάνω από το όριο, με το καλύτερο πρώτο (σε ισοβαθμία η σειρά του φακέλου)"""
+        target = cached_clean_filename(target_name)
+        results = []
+        for position in self._shortlist(target):
+            score = similarity_above(target, self._cleaned[position], self.threshold)
+            if score is not None:
+                results.append((self.names[position], score))
+        
+        results.sort(key=lambda candidate: candidate[1], reverse=True)
+        return results
+    
+    def best_match(self, target_name):
+        """Το καλύτερο όνομα αρχείου ή None (ίδιο με το find_similar_filename)"""
+        results = self.candidates(target_name)
+        return results[0][0] if results else None
@@ -46,23 +46,18 @@ class PathManager:
             
             # IMPORTANT: Change the working directory to the correct location
             os.chdir(application_path)
-            print(f"Running as executable from: {application_path}")
-            print(f"Changed working directory to: {os.getcwd()}")
             return application_path
         else:
             # We're running as a Python script
             # Use the current working directory
             application_path = Path.cwd()
-            print(f"Running as script from: {application_path}")
             return application_path
     
     def _ensure_directories(self):
         """Create all required directories if they don't exist"""
-        print(f"Creating directories in: {self.base_dir}")
         for name, path in self._paths.items():
             try:
                 path.mkdir(parents=True, exist_ok=True)
-                print(f"✓ Directory ensured: {path}")
             except Exception as e:
                 print(f"✗ Failed to create directory {path}: {e}")
     
@@ -151,7 +146,5 @@ def get_path_manager():
 def ensure_app_directories():
     """Ensure all application directories exist - call at app startup"""
     pm = get_path_manager()
-    print("=== Ensuring Application Directories ===")
-    print(f"Working directory: {os.getcwd()}")
-    print(f"Base directory: {pm.base_dir}")
+    print(f"autoPyrseia φάκελος εργασίας: {pm.base_dir}")
     return pm
@@ -3,6 +3,12 @@
 """
 Centralized progress management system for autoPyrseia
 Prevents progress bar conflicts and provides smooth transitions
+
+Οι ενημερώσεις μπαίνουν σε ουρά από οποιοδήποτε thread και εφαρμόζονται
+στο Tk thread μόνο όταν υπάρχουν (ένα wake-up μέσω του UIDispatcher).
+
+Τα services αναφέρουν πραγματική πρόοδο (βήματα και bytes) με ProgressEvent
+μέσω ενός progress_callback - ο reporter() τα μετατρέπει σε ποσοστό της μπάρας.
 """
 
 import threading
@@ -22,17 +28,85 @@ class ProgressUpdate:
     duration_ms: Optional[int] = None
 
 
+@dataclass
+class ProgressEvent:
+    """Πρόοδος μιας εργασίας service: ολοκληρωμένα βήματα και bytes"""
+    step: int
+    total_steps: int
+    message: Optional[str] = None
+    bytes_done: int = 0
+    bytes_total: int = 0
+    
+    @property
+    def fraction(self) -> float:
+        """Ποσοστό ολοκλήρωσης 0-1 (μέσος όρος βημάτων και bytes όταν υπάρχουν και τα δύο)"""
+        parts = []
+        if self.total_steps > 0:
+            parts.append(min(1.0, self.step / self.total_steps))
+        if self.bytes_total > 0:
+            parts.append(min(1.0, self.bytes_done / self.bytes_total))
+        return sum(parts) / len(parts) if parts else 0.0
+
+
+class ProgressTracker:
+    """Thread-safe μετρητής βημάτων/bytes μιας εργασίας - στέλνει ProgressEvent στο callback
+    
+    Χωρίς callback δεν κάνει τίποτα, ώστε τα services να το χρησιμοποιούν πάντα.
+    """
+    
+    def __init__(self, callback: Optional[Callable[[ProgressEvent], None]], total_steps: int = 0, bytes_total: int = 0):
+        self.callback = callback
+        self.total_steps = total_steps
+        self.bytes_total = bytes_total
+        self.step = 0
+        self.bytes_done = 0
+        self.lock = threading.Lock()
+    
+    def add_total(self, steps: int = 0, bytes_count: int = 0):
+        """Περισσότερη δουλειά από όση ήταν γνωστή στην αρχή"""
+        with self.lock:
+            self.total_steps += steps
+            self.bytes_total += bytes_count
+    
+    def advance(self, message: Optional[str] = None, steps: int = 1, bytes_count: int = 0):
+        """Ολοκλήρωση βημάτων (και bytes) και αναφορά"""
+        with self.lock:
+            self.step += steps
+            self.bytes_done += bytes_count
+            event = ProgressEvent(self.step, self.total_steps, message, self.bytes_done, self.bytes_total)
+        self._emit(event)
+    
+    def report(self, message: str):
+        """Μήνυμα χωρίς αλλαγή της προόδου (π.χ. αρχή ενός αργού βήματος)"""
+        with self.lock:
+            event = ProgressEvent(self.step, self.total_steps, message, self.bytes_done, self.bytes_total)
+        self._emit(event)
+    
+    def _emit(self, event: ProgressEvent):
+        if self.callback is None:
+            return
+        try:
+            self.callback(event)
+        except Exception as e:
+            print(f"Σφάλμα στην αναφορά προόδου: {e}")
+
+
 class ProgressManager:
     """Centralized manager for all progress bar operations"""
     
-    def __init__(self, status_bar, root):
+    def __init__(self, status_bar, root, dispatcher=None):
         self.status_bar = status_bar
         self.root = root
+        self.dispatcher = dispatcher
         self.queue = Queue()
         self.current_operation = None
         self.is_running = False
         self.lock = threading.Lock()
         
+        # Ένα προγραμματισμένο άδειασμα της ουράς κάθε φορά (όχι polling)
+        self._drain_lock = threading.Lock()
+        self._drain_scheduled = False
+        
         # Animation state
         self.animation_timer = None
         self.is_animating = False
@@ -43,7 +117,7 @@ class ProgressManager:
     def start_processor(self):
         """Start the progress update processor"""
         self.is_running = True
-        self.process_updates()
+        self._schedule_drain()
     
     def stop_processor(self):
         """Stop the progress update processor"""
@@ -51,8 +125,30 @@ class ProgressManager:
         if self.animation_timer:
             self.root.after_cancel(self.animation_timer)
     
+    def _enqueue(self, update: ProgressUpdate):
+        """Ενημέρωση στην ουρά και wake-up του Tk thread (αν δεν έχει ήδη ζητηθεί)"""
+        self.queue.put(update)
+        self._schedule_drain()
+    
+    def _schedule_drain(self):
+        with self._drain_lock:
+            if self._drain_scheduled or not self.is_running:
+                return
+            self._drain_scheduled = True
+        
+        if self.dispatcher is not None:
+            self.dispatcher.call_soon(self.process_updates)
+        else:
+            try:
+                self.root.after(0, self.process_updates)
+            except Exception:
+                with self._drain_lock:
+                    self._drain_scheduled = False
+    
     def process_updates(self):
         """Process queued progress updates"""
+        with self._drain_lock:
+            self._drain_scheduled = False
         if not self.is_running:
             return
             
@@ -66,9 +162,6 @@ class ProgressManager:
                     break
         except Exception as e:
             print(f"Error processing progress updates: {e}")
-        
-        # Schedule next processing cycle
-        self.root.after(50, self.process_updates)
     
     def _apply_update(self, update: ProgressUpdate):
         """Apply a single progress update"""
@@ -172,10 +265,13 @@ class ProgressManager:
     
     def _complete_progress(self, message: Optional[str]):
         """Complete progress to 100%"""
-        self._smooth_progress(100, 200)
+        if self.is_animating:
+            self.is_animating = False
+            if self.animation_timer:
+                self.root.after_cancel(self.animation_timer)
+        self.status_bar.update_progress(100)
         if message:
-            # Delay message until animation completes
-            self.root.after(200, lambda: self._update_message(message, None))
+            self._update_message(message, None)
     
     def _clear_operation(self):
         """Clear current operation"""
@@ -192,7 +288,7 @@ class ProgressManager:
             value=initial_progress,
             message=message
         )
-        self.queue.put(update)
+        self._enqueue(update)
     
     def update_progress(self, operation_id: str, progress: float, message: Optional[str] = None):
         """Update progress for an operation"""
@@ -202,7 +298,15 @@ class ProgressManager:
             value=progress,
             message=message
         )
-        self.queue.put(update)
+        self._enqueue(update)
+    
+    def reporter(self, operation_id: str, start: float = 0, end: float = 100,
+                 default_message: Optional[str] = None) -> Callable[[ProgressEvent], None]:
+        """progress_callback για services: ProgressEvent → ποσοστό μεταξύ start και end"""
+        def report(event: ProgressEvent):
+            progress = start + (end - start) * event.fraction
+            self.update_progress(operation_id, progress, event.message or default_message)
+        return report
     
     def smooth_progress(self, operation_id: str, target_progress: float, duration_ms: int = 300):
         """Smoothly animate progress to target value"""
@@ -212,7 +316,7 @@ class ProgressManager:
             value=target_progress,
             duration_ms=duration_ms
         )
-        self.queue.put(update)
+        self._enqueue(update)
     
     def update_message(self, operation_id: str, message: str, progress: Optional[float] = None):
         """Update status message"""
@@ -222,7 +326,7 @@ class ProgressManager:
             message=message,
             value=progress
         )
-        self.queue.put(update)
+        self._enqueue(update)
     
     def complete_operation(self, operation_id: str, message: str):
         """Complete an operation"""
@@ -231,7 +335,7 @@ class ProgressManager:
             action='complete',
             message=message
         )
-        self.queue.put(update)
+        self._enqueue(update)
     
     def reset_progress(self, operation_id: str, message: Optional[str] = None):
         """Reset progress for an operation"""
@@ -240,7 +344,7 @@ class ProgressManager:
             action='reset',
             message=message
         )
-        self.queue.put(update)
+        self._enqueue(update)
     
     def global_message(self, message: str):
         """Display a global message without changing current operation"""
@@ -249,4 +353,4 @@ class ProgressManager:
             action='message',
             message=message
         )
-        self.queue.put(update)
+        self._enqueue(update)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Startup helpers για autoPyrseia
+
+LazyService: τα services δημιουργούνται στην πρώτη χρήση τους και όχι όλα
+πριν εμφανιστεί το παράθυρο.
+
+StartupProfiler: χρόνοι εκκίνησης (φάσεις, δημιουργία services, time to
+interactive). Με --profile-startup μετράει και τον χρόνο import κάθε module
+και γράφει την αναφορά στο logs/startup_profile.txt.
+"""
+
+import builtins
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+# Χρόνος αναφοράς: το main.py φορτώνει αυτό το module πρώτο
+PROCESS_START = time.perf_counter()
+
+# Πόσα modules εμφανίζονται στην αναφορά
+REPORT_MODULES = 25
+
+
+class StartupProfiler:
+    """Μετρήσεις εκκίνησης σε δευτερόλεπτα από το PROCESS_START"""
+
+    def __init__(self):
+        self.enabled = False
+        self.phases = []          # (όνομα, διάρκεια)
+        self.marks = {}           # όνομα -> χρόνος από την αρχή
+        self.imports = {}         # module -> (συνολικός χρόνος, ίδιος χρόνος)
+        self._lock = threading.Lock()
+        self._import_stack = threading.local()
+        self._original_import = None
+
+    def enable(self):
+        """Μέτρηση και των imports (μόνο για --profile-startup)"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Μετράμε μόνο imports που φορτώνουν πραγματικά ένα νέο module
+        if level or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        stack = getattr(self._import_stack, 'frames', None)
+        if stack is None:
+            stack = self._import_stack.frames = []
+        stack.append(0.0)
+        started_at = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            if name in sys.modules:
+                with self._lock:
+                    self.imports.setdefault(name, (elapsed, elapsed - children))
+
+    @contextmanager
+    def phase(self, name):
+        """Μέτρηση μιας φάσης εκκίνησης (π.χ. δημιουργία ενός service)"""
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases.append((name, time.perf_counter() - started_at))
+
+    def mark(self, name):
+        """Χρονικό σημείο της εκκίνησης (μόνο η πρώτη φορά μετράει)"""
+        with self._lock:
+            self.marks.setdefault(name, time.perf_counter() - PROCESS_START)
+        return self.marks[name]
+
+    def report(self):
+        """Αναφορά σε κείμενο"""
+        lines = [f"autoPyrseia startup profile ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})", ""]
+
+        lines.append("Χρονικά σημεία (από την έναρξη της διεργασίας):")
+        for name, at in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"  {at * 1000:9.1f} ms  {name}")
+
+        lines.append("")
+        lines.append("Φάσεις αρχικοποίησης:")
+        for name, duration in self.phases:
+            lines.append(f"  {duration * 1000:9.1f} ms  {name}")
+
+        if self.imports:
+            lines.append("")
+            lines.append(f"Imports (συνολικός / ίδιος χρόνος, {REPORT_MODULES} πιο αργά):")
+            slowest = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+            for name, (total, own) in slowest[:REPORT_MODULES]:
+                lines.append(f"  {total * 1000:9.1f} ms {own * 1000:9.1f} ms  {name}")
+
+        return "\n".join(lines)
+
+    def save(self, path):
+        """Εγγραφή της αναφοράς (π.χ. στο frozen build χωρίς κονσόλα)"""
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(self.report() + "\n", encoding='utf-8')
+        except Exception as e:
+            print(f"Σφάλμα στην αποθήκευση του startup profile: {e}")
+
+
+class LazyService:
+    """Attribute που δημιουργεί το service στην πρώτη πρόσβαση (μία φορά, thread-safe)
+
+    factory(app) επιστρέφει το service. Μετά τη δημιουργία η τιμή μένει στο
+    __dict__ του αντικειμένου και η πρόσβαση είναι απλό attribute lookup.
+    """
+
+    # Κοινό RLock: ένα factory μπορεί να χρειάζεται άλλο service
+    _lock = threading.RLock()
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with LazyService._lock:
+            if self.name not in instance.__dict__:
+                with get_startup_profiler().phase(f"service {self.name}"):
+                    instance.__dict__[self.name] = self.factory(instance)
+        return instance.__dict__[self.name]
+
+    @staticmethod
+    def is_created(instance, name):
+        """Αν το service έχει ήδη δημιουργηθεί (χωρίς να το δημιουργήσει)"""
+        return name in instance.__dict__
+
+
+# Global profiler instance
+_startup_profiler = StartupProfiler()
+
+
+def get_startup_profiler():
+    """Get the global startup profiler instance"""
+    return _startup_profiler
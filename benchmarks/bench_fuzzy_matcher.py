@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark του fuzzy matching συνημμένων
+
+Συγκρίνει τον αρχικό βρόχο (calculate_filename_similarity για κάθε αρχείο)
+με το FilenameMatcher σε συνθετικό φάκελο downloads με ελληνικά ονόματα και
+ελέγχει ότι τα αποτελέσματα (ονόματα, scores, σειρά) είναι πανομοιότυπα.
+
+Χρήση:
+    python benchmarks/bench_fuzzy_matcher.py [--files 300] [--targets 100] [--seed 1]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.string_utils import clean_filename_for_matching, calculate_filename_similarity
+from app.utils.fuzzy_matcher import FilenameMatcher
+
+WORDS = [
+    'ΔΙΑΤΑΓΗ', 'Αναφορά', 'Πίνακας', 'Προσωπικού', 'Μεταθέσεις', 'Εκπαίδευση', 'ΣΧΕΔΙΟ',
+    'Υλικού', 'Δαπάνες', 'Συντήρηση', 'Οχημάτων', 'Άδειες', 'Έγγραφο', 'ΠΑΡΑΡΤΗΜΑ', 'Α',
+    'Β', 'Γ', 'Ε.Σ.', 'ΓΕΣ', 'Φ.900', 'Σ.3500', 'τελικό', 'διορθωμένο', 'Μάιος', 'Ιούνιος',
+]
+EXTENSIONS = ['.pdf', '.docx', '.xlsx', '.odt', '.txt', '.zip']
+
+
+def make_name(rng):
+    words = rng.sample(WORDS, rng.randint(1, 5))
+    name = rng.choice([' ', '_', '-']).join(words)
+    if rng.random() < 0.4:
+        name += f" {rng.randint(1, 999)}"
+    return name + rng.choice(EXTENSIONS)
+
+
+def perturb(name, rng):
+    """Παραλλαγές όπως τις βλέπουμε στα σήματα: τόνοι, κενά, τυπογραφικά, κεφαλαία"""
+    stem, dot, extension = name.rpartition('.')
+    choice = rng.random()
+    if choice < 0.2:
+        stem = stem.upper()
+    elif choice < 0.4:
+        stem = stem.replace(' ', '  ').replace('_', ' ')
+    elif choice < 0.6 and len(stem) > 3:
+        position = rng.randrange(len(stem))
+        stem = stem[:position] + rng.choice('αβγδεζηθ ') + stem[position + 1:]
+    elif choice < 0.75:
+        stem = stem + ' (1)'
+    elif choice < 0.9 and len(stem) > 6:
+        stem = stem[:len(stem) - rng.randint(1, 4)]
+    else:
+        return make_name(rng)
+    return stem + dot + extension
+
+
+def brute_force_candidates(target_name, file_names):
+    """Ο αρχικός βρόχος του DownloadsSnapshot.find_similar_candidates"""
+    cleaned_target = clean_filename_for_matching(target_name)
+    candidates = []
+    for file_name in file_names:
+        score = calculate_filename_similarity(cleaned_target, clean_filename_for_matching(file_name))
+        if score > 0.8:
+            candidates.append((file_name, score))
+    candidates.sort(key=lambda candidate: candidate[1], reverse=True)
+    return candidates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy matching συνημμένων")
+    parser.add_argument('--files', type=int, default=300, help="αρχεία στον συνθετικό φάκελο")
+    parser.add_argument('--targets', type=int, default=100, help="ονόματα συνημμένων προς αναζήτηση")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    file_names = list(dict.fromkeys(make_name(rng) for _ in range(args.files)))
+    targets = [perturb(rng.choice(file_names), rng) for _ in range(args.targets)]
+    
+    start = time.perf_counter()
+    expected = [brute_force_candidates(target, file_names) for target in targets]
+    brute_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    matcher = FilenameMatcher(file_names)
+    build_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    actual = [matcher.candidates(target) for target in targets]
+    matcher_seconds = time.perf_counter() - start
+    
+    mismatches = [(target, e, a) for target, e, a in zip(targets, expected, actual) if e != a]
+    matched = sum(1 for result in expected if result)
+    
+    print(f"Αρχεία: {len(file_names)}, συνημμένα: {len(targets)} ({matched} με match)")
+    print(f"Αρχικός βρόχος:   {brute_seconds * 1000:9.1f} ms "
+          f"({brute_seconds / len(targets) * 1000:.2f} ms/συνημμένο)")
+    print(f"FilenameMatcher:  {matcher_seconds * 1000:9.1f} ms "
+          f"({matcher_seconds / len(targets) * 1000:.2f} ms/συνημμένο, ευρετήριο {build_seconds * 1000:.1f} ms)")
+    if matcher_seconds > 0:
+        print(f"Επιτάχυνση:       {brute_seconds / matcher_seconds:9.1f}x")
+    
+    if mismatches:
+        print(f"ΔΙΑΦΟΡΕΣ ΑΠΟΤΕΛΕΣΜΑΤΩΝ: {len(mismatches)}")
+        for target, e, a in mismatches[:10]:
+            print(f"  {target!r}\n    αναμενόμενο: {e}\n    matcher:     {a}")
+        return 1
+    
+    print("Τα αποτελέσματα είναι πανομοιότυπα")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks των hot paths της επεξεργασίας σημάτων
+
+Δημιουργεί συνθετικό corpus (benchmarks/corpus.py) σε προσωρινό φάκελο,
+στρέφει το PathManager εκεί και μετράει:
+    process_pdf             PDFProcessor.process_pdf ανά σήμα
+    extract_*               extract_signal_info και κάθε extract_* πάνω στο κείμενο
+    duplicate_lookup        DuplicateManager.get_recipients_with_signal (σάρωση DATA)
+    fuzzy_matcher           FilenameMatcher.candidates για παραλλαγμένα ονόματα
+    resolve_attachments     πλάνο συνημμένων με νέο snapshot φακέλου ανά σήμα
+    get_recipient_signals   SignalManager.get_recipient_signals για όλους τους παραλήπτες
+    count_recipient_signals SignalManager.count_recipient_signals
+    usb_extraction          USBExtractor.extract_to_usb (ανεπίσημη εξαγωγή, χωρίς Excel)
+
+Κάθε μέτρηση επαναλαμβάνεται --repeat φορές και αναφέρεται ο διάμεσος χρόνος.
+Με --save-baseline τα αποτελέσματα γράφονται σε JSON. Σε επόμενη εκτέλεση το
+baseline (αν υπάρχει) συγκρίνεται και κάθε μέτρηση πάνω από --tolerance
+σημειώνεται ως regression (exit code 1). Τα baselines ισχύουν μόνο για το
+μηχάνημα και τα μεγέθη corpus με τα οποία γράφτηκαν - αλλιώς δεν γίνεται
+σύγκριση. Το baseline.json είναι τοπικό και δεν μπαίνει στο git.
+
+Χρήση:
+    python benchmarks/bench_pipeline.py [--repeat 5] [--only process_pdf,duplicate_lookup]
+           [--save-baseline] [--baseline benchmarks/baseline.json] [--tolerance 0.25]
+           [--signals 30] [--recipients 40] [--signals-per-recipient 20] [--backup-signals 200]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import corpus
+from bench_fuzzy_matcher import make_name, perturb
+
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+
+# Μεγέθη corpus που πρέπει να ταιριάζουν για σύγκριση με baseline
+CORPUS_KEYS = ('signals', 'recipients', 'signals_per_recipient', 'backup_signals', 'max_pages', 'seed')
+
+
+def measure(run, repeat, setup=None):
+    """Χρόνοι (δευτερόλεπτα) για repeat εκτελέσεις - το setup δεν μετράει"""
+    times = []
+    for _ in range(repeat):
+        argument = setup() if setup is not None else None
+        start = time.perf_counter()
+        if setup is not None:
+            run(argument)
+        else:
+            run()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+class PipelineBenchmarks:
+    """Οι μετρήσεις πάνω σε ένα corpus (κάθε bench_* επιστρέφει (χρόνοι, αντικείμενα ανά εκτέλεση))"""
+    
+    def __init__(self, args, base):
+        self.args = args
+        self.base = Path(base)
+        self.rng = random.Random(args.seed)
+        
+        print(f"Δημιουργία corpus στο {self.base}...")
+        started_at = time.perf_counter()
+        self.corpus = corpus.generate_corpus(
+            self.base, seed=args.seed, signals=args.signals, recipients=args.recipients,
+            signals_per_recipient=args.signals_per_recipient, backup_signals=args.backup_signals,
+            max_pages=args.max_pages
+        )
+        print(f"Corpus έτοιμο σε {time.perf_counter() - started_at:.1f} s "
+              f"({len(self.corpus['signal_folders'])} σήματα, {self.corpus['pages']} σελίδες)")
+        
+        # Όλα τα services διαβάζουν τους φακέλους από το PathManager
+        import app.utils.path_manager as path_manager_module
+        path_manager_module._path_manager = path_manager_module.PathManager(self.base)
+        
+        from app.services.pdf_processor import PDFProcessor
+        self.pdf_processor = PDFProcessor()
+        self.pdf_paths = list(self.corpus['signal_pdfs'])
+        self._texts = None
+    
+    def texts(self):
+        """Κείμενο κάθε PDF (μία φορά, για τα extract_*)"""
+        if self._texts is None:
+            self._texts = [(self.pdf_processor.process_pdf(str(path), open_for_manual_input=False)['full_text'], path)
+                           for path in self.pdf_paths]
+        return self._texts
+    
+    def bench_process_pdf(self):
+        def run():
+            for path in self.pdf_paths:
+                self.pdf_processor.process_pdf(str(path), open_for_manual_input=False)
+        return measure(run, self.args.repeat), len(self.pdf_paths)
+    
+    def bench_extract_signal_info(self):
+        texts = self.texts()
+        def run():
+            for text, path in texts:
+                self.pdf_processor.extract_signal_info(text, str(path))
+        return measure(run, self.args.repeat), len(texts)
+    
+    def _bench_extract(self, extract, use_lines=False):
+        cleaned = [self.pdf_processor.detect_and_remove_original_message(text) for text, _ in self.texts()]
+        inputs = [text.split('\n') for text in cleaned] if use_lines else cleaned
+        def run():
+            for value in inputs:
+                extract(value)
+        return measure(run, self.args.repeat), len(inputs)
+    
+    def bench_extract_id(self):
+        return self._bench_extract(self.pdf_processor.extract_id, use_lines=True)
+    
+    def bench_extract_fm(self):
+        return self._bench_extract(self.pdf_processor.extract_fm)
+    
+    def bench_extract_recipients(self):
+        return self._bench_extract(self.pdf_processor.extract_recipients)
+    
+    def bench_extract_theme(self):
+        return self._bench_extract(self.pdf_processor.extract_theme)
+    
+    def bench_extract_attachments(self):
+        return self._bench_extract(self.pdf_processor.extract_attachments)
+    
+    def bench_duplicate_lookup(self):
+        from app.services.duplicate_manager import DuplicateManager
+        duplicate_manager = DuplicateManager()
+        
+        # Μισά serial υπάρχουν στο DATA, μισά όχι
+        known = self.rng.sample(self.corpus['serial_numbers'],
+                                min(len(self.corpus['serial_numbers']), self.args.lookups // 2))
+        unknown = [corpus.serial_number_for("UNKNOWN", -2, number) for number in range(self.args.lookups - len(known))]
+        serials = known + unknown
+        
+        def run():
+            for serial_number in serials:
+                duplicate_manager.get_recipients_with_signal("", "", serial_number)
+        return measure(run, self.args.repeat), len(serials)
+    
+    def _downloads_names(self):
+        rng = random.Random(self.args.seed)
+        file_names = list(dict.fromkeys(make_name(rng) for _ in range(self.args.downloads_files)))
+        targets = [perturb(rng.choice(file_names), rng) for _ in range(self.args.lookups)]
+        return file_names, targets
+    
+    def bench_fuzzy_matcher(self):
+        from app.utils.fuzzy_matcher import FilenameMatcher
+        file_names, targets = self._downloads_names()
+        def run():
+            matcher = FilenameMatcher(file_names)
+            for target in targets:
+                matcher.candidates(target)
+        return measure(run, self.args.repeat), len(targets)
+    
+    def bench_resolve_attachments(self):
+        from app.utils.downloads_snapshot import DownloadsSnapshot
+        
+        signals = []
+        for text, path in self.texts():
+            cleaned = self.pdf_processor.detect_and_remove_original_message(text)
+            signals.append((path.parent, self.pdf_processor.extract_attachments(cleaned)))
+        
+        def run():
+            # Νέο snapshot: μία ανάγνωση φακέλου και ευρετήριο fuzzy ανά σήμα (όπως στην πρώτη εμφάνιση)
+            for folder, attachments in signals:
+                DownloadsSnapshot(folder).resolve_attachments(attachments)
+        return measure(run, self.args.repeat), len(signals)
+    
+    def _signal_manager(self):
+        from app.services.signal_manager import SignalManager
+        return SignalManager()
+    
+    def bench_get_recipient_signals(self):
+        signal_manager = self._signal_manager()
+        recipients = self.corpus['recipients']
+        def run():
+            for recipient in recipients:
+                signal_manager.get_recipient_signals(recipient)
+        return measure(run, self.args.repeat), len(recipients)
+    
+    def bench_count_recipient_signals(self):
+        signal_manager = self._signal_manager()
+        return measure(signal_manager.count_recipient_signals, self.args.repeat), len(self.corpus['recipients'])
+    
+    def bench_usb_extraction(self):
+        from app.services.usb_extractor import USBExtractor
+        
+        signal_manager = self._signal_manager()
+        extractor = USBExtractor()
+        extractor.set_signal_manager(signal_manager)
+        usb_root = self.base / "usb"
+        recipients = self.corpus['recipients'][:self.args.extract_recipients]
+        rounds = iter(range(self.args.repeat))
+        
+        def setup():
+            # Κάθε εκτέλεση αδειάζει τους παραλήπτες - νέο DATA για αυτούς πριν από τη μέτρηση
+            shutil.rmtree(usb_root, ignore_errors=True)
+            usb_root.mkdir(parents=True)
+            corpus.build_data_tree(self.base, random.Random(self.args.seed + next(rounds)), recipients,
+                                   self.args.signals_per_recipient, 0, shared=0.0)
+            return usb_root
+        
+        def run(usb_path):
+            success, _ = extractor.extract_to_usb(usb_path, recipients, None, "bench", is_unofficial=True)
+            if not success:
+                raise RuntimeError("η εξαγωγή απέτυχε")
+        
+        return measure(run, self.args.repeat, setup), len(recipients) * self.args.signals_per_recipient
+    
+    def names(self):
+        return [name[len('bench_'):] for name in dir(self) if name.startswith('bench_')]
+    
+    def run(self, name):
+        return getattr(self, f"bench_{name}")()
+
+
+def ordered_names(benchmarks):
+    """Με τη σειρά της ροής: ανάλυση, έλεγχοι, εξαγωγή"""
+    order = ['process_pdf', 'extract_signal_info', 'extract_id', 'extract_fm', 'extract_recipients',
+             'extract_theme', 'extract_attachments', 'duplicate_lookup', 'fuzzy_matcher',
+             'resolve_attachments', 'get_recipient_signals', 'count_recipient_signals', 'usb_extraction']
+    available = benchmarks.names()
+    return [name for name in order if name in available] + sorted(set(available) - set(order))
+
+
+def load_baseline(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Σφάλμα στην ανάγνωση του baseline {path}: {e}")
+        return None
+
+
+def save_baseline(path, corpus_settings, results):
+    baseline = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'corpus': corpus_settings,
+        'results': results
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+    print(f"Baseline αποθηκεύτηκε: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks επεξεργασίας σημάτων")
+    parser.add_argument('--repeat', type=int, default=5, help="εκτελέσεις ανά μέτρηση (διάμεσος)")
+    parser.add_argument('--only', default=None, help="μόνο αυτές οι μετρήσεις (χωρισμένες με κόμμα)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="αρχείο baseline για σύγκριση/αποθήκευση")
+    parser.add_argument('--save-baseline', action='store_true', help="αποθήκευση των αποτελεσμάτων ως baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="επιτρεπτή επιβράδυνση πριν από regression")
+    parser.add_argument('--signals', type=int, default=30)
+    parser.add_argument('--recipients', type=int, default=40)
+    parser.add_argument('--signals-per-recipient', type=int, default=20)
+    parser.add_argument('--backup-signals', type=int, default=200)
+    parser.add_argument('--max-pages', type=int, default=4)
+    parser.add_argument('--lookups', type=int, default=20, help="αναζητήσεις διπλοτύπων/fuzzy ανά εκτέλεση")
+    parser.add_argument('--downloads-files', type=int, default=300, help="αρχεία για το fuzzy matching")
+    parser.add_argument('--extract-recipients', type=int, default=5, help="παραλήπτες ανά εξαγωγή USB")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--keep', action='store_true', help="δεν διαγράφεται ο φάκελος του corpus")
+    args = parser.parse_args()
+    
+    corpus_settings = {key: getattr(args, key) for key in CORPUS_KEYS}
+    base = tempfile.mkdtemp(prefix="autopyrseia_bench_")
+    try:
+        benchmarks = PipelineBenchmarks(args, base)
+        names = ordered_names(benchmarks)
+        if args.only:
+            selected = [name.strip() for name in args.only.split(',') if name.strip()]
+            unknown = [name for name in selected if name not in names]
+            if unknown:
+                print(f"Άγνωστες μετρήσεις: {', '.join(unknown)} (διαθέσιμες: {', '.join(names)})")
+                return 2
+            names = [name for name in names if name in selected]
+        
+        baseline = None if args.save_baseline else load_baseline(args.baseline)
+        if baseline is not None and baseline.get('corpus') != corpus_settings:
+            print(f"Το baseline {args.baseline} γράφτηκε με άλλο corpus - χωρίς σύγκριση")
+            baseline = None
+        elif baseline is not None and baseline.get('platform') != platform.platform():
+            print(f"Το baseline {args.baseline} γράφτηκε σε άλλο μηχάνημα ({baseline.get('platform')}) - χωρίς σύγκριση")
+            baseline = None
+        
+        print("")
+        print(f"{'μέτρηση':<26}{'διάμεσος':>12}{'ελάχιστος':>12}{'ανά αντικείμενο':>18}  baseline")
+        results = {}
+        regressions = []
+        for name in names:
+            times, items = benchmarks.run(name)
+            median = statistics.median(times)
+            results[name] = {'median': median, 'min': min(times), 'items': items, 'runs': len(times)}
+            
+            comparison = ""
+            previous = (baseline or {}).get('results', {}).get(name)
+            if previous and previous.get('median'):
+                change = median / previous['median'] - 1
+                comparison = f"{change:+.0%}"
+                if change > args.tolerance:
+                    comparison += "  REGRESSION"
+                    regressions.append(name)
+            
+            per_item = f"{median / items * 1000:.3f} ms" if items else "-"
+            print(f"{name:<26}{median * 1000:>9.1f} ms{min(times) * 1000:>9.1f} ms{per_item:>18}  {comparison}")
+        
+        if args.save_baseline:
+            save_baseline(args.baseline, corpus_settings, results)
+        
+        if regressions:
+            print(f"\nRegressions πάνω από {args.tolerance:.0%}: {', '.join(regressions)}")
+            return 1
+        return 0
+    
+    finally:
+        if args.keep:
+            print(f"Corpus: {base}")
+        else:
+            shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Συνθετικό corpus σημάτων για τα benchmarks
+
+Δημιουργεί σήματα με τη διάταξη του Pyrseia (header/footer με το URL, ID,
+FM, TO/INFO, ΘΕΜΑ, ΣΧΕΤ., σώμα σε πολλές σελίδες και αριθμημένα
+συνημμένα) ως πραγματικά PDF με το PyMuPDF, μαζί με DATA και BACK UP DATA
+δέντρο στο μέγεθος που ζητείται. Ίδιο seed, ίδιο corpus.
+
+Διάταξη εξόδου:
+    signals/NNNN/<ID>.pdf + συνημμένα   (φάκελος πηγής για το signal_tester)
+    DATA/<παραλήπτης>/<ID>/...          (signal_info.json, PDF, συνημμένα)
+    BACK UP DATA/<παραλήπτης>/Α.Φ. NNNN/<ID>/...
+    recipients.json
+
+Χρήση:
+    python benchmarks/corpus.py OUTPUT [--signals 30] [--recipients 40]
+           [--signals-per-recipient 20] [--backup-signals 200] [--max-pages 4] [--seed 1]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_fuzzy_matcher import make_name, perturb
+
+PYRSEIA_URL = "8mptexchn2.army.hndgs.mil/pyrseia/pyrseia_server.php"
+
+UNITS = ['ΛΑΦ', 'ΣΠ', 'ΣΥ', 'ΦΡΟΥΡΑΡΧΕΙΟ', 'ΣΤΡΑΤΟΔΙΚΕΙΟ', 'ΝΑΥΤΟΔΙΚΕΙΟ', 'ΑΕΡΟΔΙΚΕΙΟ',
+         'ΚΕΠΙΚ', 'ΤΑΞΥΠ', 'ΠΜΥ', 'ΚΕΥΠ', 'ΣΣΑΣ']
+PLACES = ['ΙΩΑΝΝΙΝΩΝ', 'ΗΠΕΙΡΟΥ', 'ΛΑΡΙΣΑΣ', 'ΘΕΣΣΑΛΟΝΙΚΗΣ', 'ΚΟΖΑΝΗΣ', 'ΠΡΕΒΕΖΑΣ', 'ΑΡΤΑΣ',
+          'ΚΕΡΚΥΡΑΣ', 'ΤΡΙΚΑΛΩΝ', 'ΚΑΣΤΟΡΙΑΣ', 'ΦΛΩΡΙΝΑΣ', 'ΞΑΝΘΗΣ']
+FM_SENDERS = ['ΓΕΣ/ΔΙΚ', 'ΓΕΣ/ΔΟΙ/3', 'ΓΕΕΘΑ/ΔΜΣ', 'Δ ΣΤΡΑΤΙΑ/ΕΓ', 'ΑΣΔΕΝ/ΔΥΠ', '8 Μ/Π ΤΑΞ/ΕΓ']
+MONTHS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+GREEK_MONTHS = ['ΙΑΝ', 'ΦΕΒ', 'ΜΑΡ', 'ΑΠΡ', 'ΜΑΪ', 'ΙΟΥΝ', 'ΙΟΥΛ', 'ΑΥΓ', 'ΣΕΠ', 'ΟΚΤ', 'ΝΟΕ', 'ΔΕΚ']
+THEMES = [
+    'Μεταθέσεις προσωπικού', 'Εκπαίδευση στελεχών', 'Συντήρηση οχημάτων', 'Άδειες οπλιτών',
+    'Διάθεση υλικού', 'Δαπάνες μετακινήσεων', 'Σχέδιο ασφαλείας', 'Υγειονομική κάλυψη',
+    'Απογραφή υλικού', 'Διοικητική μέριμνα', 'Πρόγραμμα ασκήσεων', 'Κατανομή πιστώσεων',
+]
+SENTENCE_WORDS = [
+    'σχετικά', 'με', 'την', 'υλοποίηση', 'του', 'προγράμματος', 'παρακαλούμε', 'όπως',
+    'ενεργήσετε', 'για', 'τα', 'περαιτέρω', 'σύμφωνα', 'οδηγίες', 'ανωτέρω', 'διαταγής',
+    'μονάδες', 'υποβάλουν', 'στοιχεία', 'έως', 'προσωπικό', 'υλικό', 'έγκαιρη', 'ενημέρωση',
+    'αρμόδιων', 'υπηρεσιών', 'κατά', 'περίπτωση', 'εφαρμογή', 'μέτρων', 'ασφαλείας',
+]
+
+# Διάσταση σελίδας A4 και θέσεις γραμμών (το header/footer πέφτει στις ζώνες 10%)
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842
+LINE_HEIGHT = 14
+BODY_TOP = 110
+BODY_BOTTOM = 740
+
+
+def make_recipients(rng, count):
+    """Μοναδικά ονόματα παραληπτών όπως στο recipients.json"""
+    names = []
+    seen = set()
+    while len(names) < count:
+        name = f"{rng.choice(UNITS)} {rng.choice(PLACES)}"
+        if len(seen) >= len(UNITS) * len(PLACES) or rng.random() < 0.2:
+            name = f"{rng.randint(1, 9999)} {rng.choice(UNITS)}"
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def make_signal_id(rng):
+    """π.χ. R 240846Z JUN 25"""
+    return (f"{rng.choice('RPO')} {rng.randint(1, 28):02d}{rng.randint(0, 23):02d}"
+            f"{rng.randint(0, 59):02d}Z {rng.choice(MONTHS)} {rng.randint(20, 26)}")
+
+
+def make_sentence(rng):
+    words = [rng.choice(SENTENCE_WORDS) for _ in range(rng.randint(6, 14))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def make_signal(rng, recipients, max_pages=4):
+    """Περιεχόμενο ενός σήματος (dict) με γραμμές σώματος για 1 έως max_pages σελίδες"""
+    to_count = rng.randint(1, min(6, len(recipients)))
+    info_count = rng.randint(0, min(4, len(recipients) - to_count))
+    chosen = rng.sample(recipients, to_count + info_count)
+    attachments = list(dict.fromkeys(make_name(rng) for _ in range(rng.choice([0, 0, 1, 2, 3, 5, 8]))))
+    
+    # Γραμμές ανά σελίδα - το σώμα γεμίζει τις σελίδες που κληρώθηκαν
+    lines_per_page = (BODY_BOTTOM - BODY_TOP) // LINE_HEIGHT
+    body_lines = rng.randint(8, max(8, lines_per_page * rng.randint(1, max_pages) - 20))
+    paragraphs = []
+    while sum(len(paragraph) for paragraph in paragraphs) < body_lines:
+        paragraphs.append([make_sentence(rng) for _ in range(rng.randint(1, 4))])
+    
+    return {
+        'id': make_signal_id(rng),
+        'fm': rng.choice(FM_SENDERS),
+        'to': chosen[:to_count],
+        'info': chosen[to_count:],
+        'theme': f"{rng.choice(THEMES)} {rng.randint(2020, 2026)}",
+        'reference': (f"Φ.{rng.randint(100, 999)}/{rng.randint(1, 99)}/{rng.randint(100000, 999999)}"
+                      f"/Σ.{rng.randint(100, 9999)}/{rng.randint(1, 28)} {rng.choice(GREEK_MONTHS)} "
+                      f"{rng.randint(20, 26)}/{rng.choice(FM_SENDERS)}"),
+        'paragraphs': paragraphs,
+        'attachments': attachments
+    }
+
+
+def _split_attachment(name, rng):
+    """Μακρύ όνομα σε δύο γραμμές όπως τα σπάει το Pyrseia (χωρίς χαμένο κενό)"""
+    if len(name) < 28 or rng.random() < 0.5:
+        return [name]
+    for position in range(len(name) // 2, len(name) - 5):
+        if name[position - 1] != ' ' and name[position] != ' ' and name[position].islower():
+            return [name[:position], name[position:]]
+    return [name]
+
+
+def signal_lines(signal, rng):
+    """Κείμενο του σήματος γραμμή προς γραμμή"""
+    lines = [signal['id'], f"FM {signal['fm']}"]
+    lines += [f"TO {recipient}" if index == 0 else recipient for index, recipient in enumerate(signal['to'])]
+    lines += [f"INFO {recipient}" if index == 0 else recipient for index, recipient in enumerate(signal['info'])]
+    lines += ["BT", "ΑΔΙΑΒΑΘΜΗΤΟ", f"ΘΕΜΑ: {signal['theme']}", f"ΣΧΕΤ. : {signal['reference']}", ""]
+    
+    for number, paragraph in enumerate(signal['paragraphs'], 1):
+        text = f"{number}. " + ' '.join(paragraph)
+        # Αναδίπλωση στο πλάτος της σελίδας
+        line = ""
+        for word in text.split(' '):
+            if line and len(line) + len(word) + 1 > 85:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}" if line else word
+        lines.append(line)
+    
+    if signal['attachments']:
+        lines += ["", f"Συνημμένα αρχεία: {len(signal['attachments'])}"]
+        for number, attachment in enumerate(signal['attachments'], 1):
+            parts = _split_attachment(attachment, rng)
+            lines.append(f"{number}. {parts[0]}")
+            lines.extend(parts[1:])
+    else:
+        lines += ["", "BT"]
+    return lines
+
+
+def write_signal_pdf(pdf_path, lines, printed_at):
+    """PDF με header (ημερομηνία, ώρα, URL) και footer (URL, σελίδα) σε κάθε σελίδα"""
+    import fitz  # PyMuPDF
+    
+    font = fitz.Font("helv")
+    lines_per_page = (BODY_BOTTOM - BODY_TOP) // LINE_HEIGHT
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+    
+    hour = printed_at.hour % 12 or 12
+    meridiem = 'π.μ.' if printed_at.hour < 12 else 'μ.μ.'
+    header = (f"{printed_at.day}/{printed_at.month}/{printed_at.strftime('%y')}, "
+              f"{hour}:{printed_at.strftime('%M')} {meridiem} {PYRSEIA_URL}")
+    
+    doc = fitz.open()
+    try:
+        for page_number, page_lines in enumerate(pages, 1):
+            page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            writer = fitz.TextWriter(page.rect)
+            writer.append((40, 40), header, font=font, fontsize=8)
+            for index, line in enumerate(page_lines):
+                if line:
+                    writer.append((50, BODY_TOP + index * LINE_HEIGHT), line, font=font, fontsize=10)
+            writer.append((40, PAGE_HEIGHT - 30), f"{PYRSEIA_URL} {page_number}/{len(pages)}", font=font, fontsize=8)
+            writer.write_text(page)
+        doc.save(str(pdf_path), garbage=3, deflate=True)
+    finally:
+        doc.close()
+    return len(pages)
+
+
+def write_attachment(path, rng, size_range=(2 * 1024, 64 * 1024)):
+    """Συνημμένο με τυχαίο περιεχόμενο (μοναδικό ανά αρχείο)"""
+    with open(path, 'wb') as f:
+        f.write(rng.randbytes(rng.randint(*size_range)))
+
+
+def write_signal_folder(folder, signal, rng, printed_at, misspell=0.2):
+    """Φάκελος σήματος όπως τον κατεβάζει ο χρήστης: PDF και συνημμένα
+    
+    Ένα μέρος των συνημμένων παίρνει παραλλαγμένο όνομα (fuzzy matching).
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    pages = write_signal_pdf(folder / f"{signal['id']}.pdf", signal_lines(signal, rng), printed_at)
+    for attachment in signal['attachments']:
+        name = perturb(attachment, rng) if rng.random() < misspell else attachment
+        write_attachment(folder / name, rng)
+    return pages
+
+
+def serial_number_for(signal_id, recipient_index, salt):
+    """Σταθερό serial για τα σήματα του δέντρου DATA (όπως το generate_serial_number, sha256)"""
+    return hashlib.sha256(f"{signal_id}|{recipient_index}|{salt}".encode('utf-8')).hexdigest()[:16]
+
+
+def write_stored_signal(folder, rng, recipients, signal_id, serial_number, processed_at):
+    """Φάκελος σήματος μέσα στο DATA/BACK UP DATA (όπως τον γράφει το SignalManager)"""
+    folder.mkdir(parents=True, exist_ok=True)
+    attachments = list(dict.fromkeys(make_name(rng) for _ in range(rng.choice([0, 1, 1, 2, 3]))))
+    signal_info = {
+        "id": signal_id,
+        "fm": rng.choice(FM_SENDERS),
+        "theme": f"{rng.choice(THEMES)} {rng.randint(2020, 2026)}",
+        "recipients": recipients,
+        "attachments": attachments,
+        "serial_number": serial_number,
+        "processed_date": processed_at.isoformat(),
+        "pdf_filename": f"{signal_id}.pdf",
+        "manual_input": False
+    }
+    with open(folder / "signal_info.json", 'w', encoding='utf-8') as f:
+        json.dump(signal_info, f, ensure_ascii=False, indent=2)
+    write_attachment(folder / f"{signal_id}.pdf", rng, (4 * 1024, 32 * 1024))
+    for attachment in attachments:
+        write_attachment(folder / attachment, rng)
+    return signal_info
+
+
+def build_data_tree(base, rng, recipients, signals_per_recipient, backup_signals, shared=0.3):
+    """DATA με signals_per_recipient σήματα ανά παραλήπτη και BACK UP DATA με backup_signals σήματα
+    
+    Ένα μέρος (shared) των σημάτων υπάρχει σε περισσότερους παραλήπτες με το ίδιο
+    serial, όπως όταν ένα σήμα πηγαίνει σε πολλούς. Επιστρέφει τα serial του DATA.
+    """
+    base = Path(base)
+    now = datetime.now()
+    serial_numbers = []
+    
+    for index, recipient in enumerate(recipients):
+        recipient_folder = base / "DATA" / recipient
+        used_ids = set()
+        for number in range(signals_per_recipient):
+            signal_id = make_signal_id(rng)
+            if rng.random() < shared and serial_numbers:
+                serial_number = rng.choice(serial_numbers)
+            else:
+                serial_number = serial_number_for(signal_id, index, number)
+                serial_numbers.append(serial_number)
+            
+            # Ίδιο ID με άλλο serial: έκδοση (1), (2)... όπως το DuplicateManager
+            folder_name = signal_id
+            version = 0
+            while folder_name in used_ids:
+                version += 1
+                folder_name = f"{signal_id}({version})"
+            used_ids.add(folder_name)
+            
+            write_stored_signal(recipient_folder / folder_name, rng, [recipient], signal_id, serial_number,
+                                now - timedelta(minutes=rng.randint(0, 60 * 24 * 7)))
+    
+    for number in range(backup_signals):
+        recipient = rng.choice(recipients)
+        signal_id = make_signal_id(rng)
+        folder = base / "BACK UP DATA" / recipient / f"Α.Φ. {rng.randint(1000, 9999)}" / signal_id
+        if folder.exists():
+            continue
+        write_stored_signal(folder, rng, [recipient], signal_id, serial_number_for(signal_id, -1, number),
+                            now - timedelta(days=rng.randint(7, 365)))
+    
+    return serial_numbers
+
+
+def generate_corpus(base, seed=1, signals=30, recipients=40, signals_per_recipient=20,
+                    backup_signals=200, max_pages=4):
+    """Ολόκληρο το corpus σε έναν φάκελο - επιστρέφει σύνοψη (dict)"""
+    base = Path(base)
+    rng = random.Random(seed)
+    base.mkdir(parents=True, exist_ok=True)
+    
+    recipient_names = make_recipients(rng, recipients)
+    with open(base / "recipients.json", 'w', encoding='utf-8') as f:
+        json.dump(sorted(recipient_names), f, ensure_ascii=False, indent=2)
+    
+    printed_at = datetime(2025, 6, 24, 8, 46)
+    signal_folders = []
+    signal_pdfs = []
+    page_count = 0
+    attachment_count = 0
+    for number in range(1, signals + 1):
+        signal = make_signal(rng, recipient_names, max_pages)
+        folder = base / "signals" / f"{number:04d}"
+        page_count += write_signal_folder(folder, signal, rng, printed_at + timedelta(minutes=number))
+        attachment_count += len(signal['attachments'])
+        signal_folders.append(folder)
+        # Τα συνημμένα μπορεί να είναι κι αυτά .pdf - το PDF του σήματος έχει το όνομα του ID
+        signal_pdfs.append(folder / f"{signal['id']}.pdf")
+    
+    serial_numbers = build_data_tree(base, rng, recipient_names, signals_per_recipient, backup_signals)
+    
+    return {
+        'base': base,
+        'recipients': recipient_names,
+        'signal_folders': signal_folders,
+        'signal_pdfs': signal_pdfs,
+        'serial_numbers': serial_numbers,
+        'pages': page_count,
+        'attachments': attachment_count
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Συνθετικό corpus σημάτων Pyrseia")
+    parser.add_argument('output', help="φάκελος εξόδου (π.χ. ένας κενός φάκελος δοκιμών)")
+    parser.add_argument('--signals', type=int, default=30, help="PDF σημάτων στο signals/")
+    parser.add_argument('--recipients', type=int, default=40, help="παραλήπτες (recipients.json και DATA)")
+    parser.add_argument('--signals-per-recipient', type=int, default=20, help="σήματα ανά παραλήπτη στο DATA")
+    parser.add_argument('--backup-signals', type=int, default=200, help="σήματα στο BACK UP DATA")
+    parser.add_argument('--max-pages', type=int, default=4, help="μέγιστες σελίδες ανά σήμα")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    summary = generate_corpus(args.output, seed=args.seed, signals=args.signals, recipients=args.recipients,
+                              signals_per_recipient=args.signals_per_recipient,
+                              backup_signals=args.backup_signals, max_pages=args.max_pages)
+    
+    print(f"Corpus στο {summary['base']}:")
+    print(f"  {len(summary['signal_folders'])} σήματα ({summary['pages']} σελίδες, "
+          f"{summary['attachments']} συνημμένα) στο signals/")
+    print(f"  {len(summary['recipients'])} παραλήπτες, "
+          f"{args.recipients * args.signals_per_recipient} σήματα στο DATA, "
+          f"έως {args.backup_signals} στο BACK UP DATA")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
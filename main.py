@@ -8,14 +8,46 @@ autoPyrseia - Main Entry Point
 Εφαρμογή για την αυτοματοποίηση της διαχείρισης σημάτων από το σύστημα Pyrseia
 """
 
+import argparse
 import sys
 import os
 
 # Add the current directory to Python path to ensure imports work
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.core import AutoPyrseiaApp
+# Πρώτο import: ο χρόνος εκκίνησης μετράει από εδώ
+from app.utils.startup import get_startup_profiler
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="autoPyrseia - Διαχείριση Σημάτων")
+    parser.add_argument('--headless', action='store_true',
+                        help="επεξεργασία χωρίς γραφικό περιβάλλον (αυτόματη επιλογή παραληπτών)")
+    parser.add_argument('--exit-when-idle', type=float, default=None, metavar='SECONDS',
+                        help="headless: τερματισμός όταν δεν υπάρχει δουλειά για SECONDS")
+    parser.add_argument('--results', default=None, metavar='PATH',
+                        help="headless: αρχείο JSONL αποτελεσμάτων (προεπιλογή logs/headless_results.jsonl)")
+    parser.add_argument('--stats-interval', type=float, default=None, metavar='SECONDS',
+                        help="headless: κάθε πόσο τυπώνονται μετρήσεις (0 για ποτέ)")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help="χρόνοι import/αρχικοποίησης ανά module και time to interactive (logs/startup_profile.txt)")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_arguments()
+    
+    if args.headless:
+        # Χωρίς import του Tk - μπορεί να τρέξει σε server
+        from app.headless import run_headless
+        sys.exit(run_headless(results_file=args.results, exit_when_idle=args.exit_when_idle,
+                              stats_interval=args.stats_interval))
+    
+    profiler = get_startup_profiler()
+    if args.profile_startup:
+        profiler.enable()
+    
+    with profiler.phase("import app.core"):
+        from app.core import AutoPyrseiaApp
     app = AutoPyrseiaApp()
     app.run()
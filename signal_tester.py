@@ -6,18 +6,32 @@ Signal Tester for autoPyrseia
 
 Βοηθητικό εργαλείο για τεστάρισμα του autoPyrseia με σήματα από φάκελο.
 Διαβάζει σήματα από έναν φάκελο και τα αντιγράφει στο downloads για δοκιμή.
+
+Replay χωρίς GUI (μέτρηση καθυστερήσεων με την headless λειτουργία):
+    python signal_tester.py --replay SOURCE --spawn APP_DIR [--rate 30 | --burst 10 --burst-pause 30]
+    python signal_tester.py --replay SOURCE --downloads PATH [--results PATH] [--report replay.json]
 """
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
 import os
+import sys
 import shutil
+import subprocess
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 import json
 from datetime import datetime
 import re
 import random  # Add this import
 
+# Το replay (--replay) τρέχει και σε server χωρίς Tk
+try:
+    import tkinter as tk
+    from tkinter import ttk, filedialog, messagebox
+except ImportError:
+    tk = None
+
 # Try to import PDF processor for theme extraction
 try:
     from app.services.pdf_processor import PDFProcessor
@@ -25,6 +39,208 @@ try:
 except ImportError:
     PDF_PROCESSOR_AVAILABLE = False
 
+class SignalCorpusScanner:
+    """Εντοπισμός σημάτων (PDF και συνημμένα) σε φάκελο δοκιμών - χωρίς Tk
+    
+    Η σάρωση γίνεται παράλληλα με os.scandir (τα μεγέθη έρχονται από τα DirEntry,
+    χωρίς ξεχωριστό stat ανά PDF). Η λίστα κάθε φακέλου αποθηκεύεται στο manifest
+    μαζί με το mtime του φακέλου - σε επόμενη σάρωση ξαναδιαβάζονται μόνο οι
+    φάκελοι που άλλαξαν (νέα, διαγραμμένα ή μετονομασμένα αρχεία).
+    """
+    
+    MANIFEST_VERSION = 1
+    
+    # Threads σάρωσης - σε δικτυακό δίσκο ο χρόνος είναι κυρίως αναμονή δικτύου
+    WORKERS = 8
+    
+    def __init__(self, manifest_file=None, workers=None):
+        self.manifest_file = Path(manifest_file) if manifest_file else None
+        self.workers = workers or self.WORKERS
+        self.last_scan = {}
+    
+    def scan(self, directory):
+        """Όλα τα σήματα κάτω από τον φάκελο (λίστα dicts του analyze_signal_folder)"""
+        start_time = time.time()
+        root = Path(directory).absolute()
+        cached = self._load_manifest(root)
+        folders = {}
+        reused = 0
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = {executor.submit(self._list_folder, root, None, cached)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    folder_path, listing, from_manifest = future.result()
+                    if listing is None:
+                        continue  # Αγνοούμε φακέλους χωρίς δικαιώματα
+                    folders[folder_path] = listing
+                    reused += from_manifest
+                    for name, mtime_ns in listing['dirs'].items():
+                        pending.add(executor.submit(self._list_folder, folder_path / name, mtime_ns, cached))
+        
+        self._save_manifest(root, folders)
+        
+        # Ο ίδιος ο φάκελος πηγής δεν είναι σήμα - μόνο οι υποφάκελοί του
+        signals = []
+        for folder_path in sorted(folders):
+            if folder_path != root:
+                signal_data = self.analyze_signal_folder(folder_path, folders[folder_path])
+                if signal_data:
+                    signals.append(signal_data)
+        
+        self.last_scan = {
+            'folders': len(folders),
+            'from_manifest': reused,
+            'signals': len(signals),
+            'seconds': round(time.time() - start_time, 3)
+        }
+        print(f"Σάρωση σημάτων: {self.last_scan}")
+        return signals
+    
+    def _list_folder(self, folder_path, mtime_ns, cached):
+        """Περιεχόμενα ενός φακέλου: (φάκελος, listing, αν ήρθε από το manifest)
+        
+        listing = {'mtime_ns': ..., 'dirs': {όνομα: mtime_ns ή None}, 'files': {όνομα: μέγεθος}}
+        """
+        try:
+            if mtime_ns is None:
+                mtime_ns = os.stat(folder_path).st_mtime_ns
+            
+            previous = cached.get(str(folder_path))
+            if previous and previous['mtime_ns'] == mtime_ns:
+                # Οι υποφάκελοι μπορεί να άλλαξαν χωρίς να αλλάξει ο γονέας - νέο stat για τον καθένα
+                return folder_path, {'mtime_ns': mtime_ns, 'dirs': dict.fromkeys(previous['dirs']),
+                                     'files': previous['files']}, True
+            
+            dirs = {}
+            files = {}
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            # Στα Windows το stat του DirEntry δεν κοστίζει κλήση στο σύστημα αρχείων
+                            dirs[entry.name] = entry.stat().st_mtime_ns
+                        elif entry.is_file():
+                            files[entry.name] = entry.stat().st_size
+                    except OSError:
+                        continue
+            return folder_path, {'mtime_ns': mtime_ns, 'dirs': dirs, 'files': files}, False
+        
+        except OSError:
+            return folder_path, None, False
+    
+    def _load_manifest(self, root):
+        """Λίστες φακέλων της προηγούμενης σάρωσης του ίδιου φακέλου πηγής"""
+        if not self.manifest_file or not self.manifest_file.exists():
+            return {}
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('version') != self.MANIFEST_VERSION or manifest.get('root') != str(root):
+                return {}
+            return manifest.get('folders', {})
+        except Exception as e:
+            print(f"Σφάλμα φόρτωσης manifest σάρωσης: {e}")
+            return {}
+    
+    def _save_manifest(self, root, folders):
+        """Εγγραφή σε προσωρινό αρχείο και os.replace (μόνο οι φάκελοι που υπάρχουν ακόμη)"""
+        if not self.manifest_file:
+            return
+        manifest = {
+            'version': self.MANIFEST_VERSION,
+            'root': str(root),
+            'folders': {
+                str(folder_path): {'mtime_ns': listing['mtime_ns'], 'dirs': sorted(listing['dirs']),
+                                   'files': listing['files']}
+                for folder_path, listing in folders.items()
+            }
+        }
+        temp_file = self.manifest_file.with_name(self.manifest_file.name + ".tmp")
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.replace(temp_file, self.manifest_file)
+        except Exception as e:
+            print(f"Σφάλμα αποθήκευσης manifest σάρωσης: {e}")
+            temp_file.unlink(missing_ok=True)
+    
+    def analyze_signal_folder(self, folder_path, listing):
+        """Ανάλυση φακέλου για εντοπισμό σήματος (από τη λίστα αρχείων του - χωρίς I/O)"""
+        files = listing['files']
+        # Όπως το glob("*.pdf") στα Windows: χωρίς διάκριση πεζών/κεφαλαίων
+        pdf_files = [folder_path / name for name in sorted(files) if name.lower().endswith('.pdf')]
+        
+        if not pdf_files:
+            return None
+        
+        # Βρίσκουμε το κύριο σήμα PDF
+        signal_pdf = self.identify_signal_pdf(pdf_files, files)
+        
+        if not signal_pdf:
+            return None
+        
+        # Φιλτράρισμα συνημμένων: αποκλείουμε το κύριο PDF, JSON info files, και txt markers
+        attachments = [folder_path / name for name in sorted(files)
+                      if name != signal_pdf.name
+                      and not name.endswith('.txt')  # marker files
+                      and not name.endswith('_info.json')]  # JSON info files
+        
+        # Έλεγχος αν έχει ήδη σταλεί
+        is_sent = "sent_to_downloads.txt" in files
+        
+        return {
+            'folder_path': folder_path,
+            'folder_name': folder_path.name,
+            'signal_pdf': signal_pdf,
+            'attachments': attachments,
+            'is_sent': is_sent
+        }
+    
+    def identify_signal_pdf(self, pdf_files, sizes):
+        """Εντοπισμός του κύριου σήματος PDF (sizes: όνομα αρχείου -> μέγεθος)"""
+        if len(pdf_files) == 1:
+            return pdf_files[0]
+        
+        # Προτεραιότητα 1: Σήματα με το τυπικό pattern ID σήματος
+        # Pattern: [R|P|O] DDHHMMZ [Month] YY (π.χ. "R 250417Z JUL 25.pdf")
+        signal_id_pattern = r'^[RPO]\s+\d{6}Z\s+[A-Z]{3}\s+\d{2}\.pdf$'
+        
+        for pdf in pdf_files:
+            if re.match(signal_id_pattern, pdf.name, re.IGNORECASE):
+                return pdf
+        
+        # Προτεραιότητα 2: Αρχεία που ταιριάζουν με το όνομα του φακέλου
+        # (π.χ. φάκελος "R 250417Z JUL 25" και αρχείο "R 250417Z JUL 25.pdf")
+        folder_name = pdf_files[0].parent.name
+        for pdf in pdf_files:
+            if pdf.stem == folder_name:  # stem είναι το όνομα χωρίς την επέκταση
+                return pdf
+        
+        # Προτεραιότητα 3: Αρχεία με συγκεκριμένα ονόματα
+        priority_patterns = [
+            r'signal', r'σήμα', r'message', r'μήνυμα',
+            r'pyrseia', r'πυρσεία'
+        ]
+        
+        for pattern in priority_patterns:
+            for pdf in pdf_files:
+                if re.search(pattern, pdf.name, re.IGNORECASE):
+                    return pdf
+        
+        # Προτεραιότητα 4: Αποκλεισμός UUID αρχείων (πιθανά συνημμένα)
+        # UUID pattern: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx.pdf
+        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.pdf$'
+        non_uuid_pdfs = [pdf for pdf in pdf_files if not re.match(uuid_pattern, pdf.name, re.IGNORECASE)]
+        
+        if non_uuid_pdfs:
+            # Από τα μη-UUID αρχεία, επιλέγουμε το μεγαλύτερο
+            return max(non_uuid_pdfs, key=lambda x: sizes[x.name])
+        
+        # Τελευταία επιλογή: το μεγαλύτερο αρχείο
+        return max(pdf_files, key=lambda x: sizes[x.name])
+
 class SignalTester:
     def __init__(self, root):
         self.root = root
@@ -41,6 +257,7 @@ class SignalTester:
         # Signal data
         self.signals = []
         self.current_signal_index = 0
+        self.scanner = SignalCorpusScanner(manifest_file=Path("signal_tester_manifest.json"))
         
         # PDF processor for theme extraction
         self.pdf_processor = None
@@ -57,7 +274,7 @@ class SignalTester:
         
         # Save config when window is closed
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        
+    
     def setup_ui(self):
         """Δημιουργία του UI"""
         # Main frame
@@ -167,7 +384,7 @@ class SignalTester:
         
         # Configure main_frame grid weights
         main_frame.rowconfigure(5, weight=1)
-        
+    
     def load_config(self):
         """Φόρτωση αποθηκευμένης διαμόρφωσης"""
         try:
@@ -198,7 +415,7 @@ class SignalTester:
                 json.dump(config, f, ensure_ascii=False, indent=2)
         except Exception as e:
             print(f"Σφάλμα αποθήκευσης διαμόρφωσης: {e}")
-        
+    
     def select_source_folder(self):
         """Επιλογή φακέλου σημάτων"""
         # Use saved path as initial directory if available
@@ -208,7 +425,7 @@ class SignalTester:
             self.source_var.set(folder)
             self.source_path = folder
             self.save_config()
-            
+    
     def select_downloads_folder(self):
         """Επιλογή φακέλου downloads"""
         # Use saved path as initial directory if available
@@ -218,16 +435,15 @@ class SignalTester:
             self.downloads_var.set(folder)
             self.downloads_path = folder
             self.save_config()
-            
+    
     def scan_signals(self):
         """Σάρωση για σήματα στον φάκελο"""
         if not self.source_path or not self.downloads_path:
             self.status_var.set("Σφάλμα: Επιλέξτε και τους δύο φακέλους")
             self.status_label.configure(foreground="red")
             return
-            
-        self.signals = []
-        self.scan_directory(Path(self.source_path))
+        
+        self.signals = self.scanner.scan(Path(self.source_path))
         
         if not self.signals:
             self.status_var.set("Δεν βρέθηκαν σήματα στον φάκελο")
@@ -236,7 +452,7 @@ class SignalTester:
         
         # Randomize the order of signals
         random.shuffle(self.signals)
-            
+        
         self.current_signal_index = 0
         self.update_display()
         self.update_buttons()
@@ -244,100 +460,6 @@ class SignalTester:
         # Update status to show scan results
         self.status_var.set(f"Βρέθηκαν {len(self.signals)} σήματα (τυχαία σειρά)")
         self.status_label.configure(foreground="green")
-        
-    def scan_directory(self, directory):
-        """Αναδρομική σάρωση φακέλου για σήματα"""
-        try:
-            for item in directory.iterdir():
-                if item.is_dir():
-                    # Έλεγχος αν ο φάκελος περιέχει σήμα
-                    signal_data = self.analyze_signal_folder(item)
-                    if signal_data:
-                        self.signals.append(signal_data)
-                    
-                    # Αναδρομική σάρωση υποφακέλων
-                    self.scan_directory(item)
-                    
-        except PermissionError:
-            pass  # Αγνοούμε φακέλους χωρίς δικαιώματα
-            
-    def analyze_signal_folder(self, folder_path):
-        """Ανάλυση φακέλου για εντοπισμό σήματος"""
-        pdf_files = list(folder_path.glob("*.pdf"))
-        
-        if not pdf_files:
-            return None
-            
-        # Βρίσκουμε το κύριο σήμα PDF
-        signal_pdf = self.identify_signal_pdf(pdf_files)
-        
-        if not signal_pdf:
-            return None
-            
-        # Βρίσκουμε τα συνημμένα αρχεία
-        all_files = [f for f in folder_path.iterdir() if f.is_file()]
-        
-        # Φιλτράρισμα συνημμένων: αποκλείουμε το κύριο PDF, JSON info files, και txt markers
-        attachments = [f for f in all_files 
-                      if f != signal_pdf 
-                      and not f.name.endswith('.txt')  # marker files
-                      and not f.name.endswith('_info.json')  # JSON info files
-                      and not f.name == 'sent_to_downloads.txt']
-        
-        # Έλεγχος αν έχει ήδη σταλεί
-        sent_marker = folder_path / "sent_to_downloads.txt"
-        is_sent = sent_marker.exists()
-        
-        return {
-            'folder_path': folder_path,
-            'folder_name': folder_path.name,
-            'signal_pdf': signal_pdf,
-            'attachments': attachments,
-            'is_sent': is_sent
-        }
-        
-    def identify_signal_pdf(self, pdf_files):
-        """Εντοπισμός του κύριου σήματος PDF"""
-        if len(pdf_files) == 1:
-            return pdf_files[0]
-            
-        # Προτεραιότητα 1: Σήματα με το τυπικό pattern ID σήματος
-        # Pattern: [R|P|O] DDHHMMZ [Month] YY (π.χ. "R 250417Z JUL 25.pdf")
-        signal_id_pattern = r'^[RPO]\s+\d{6}Z\s+[A-Z]{3}\s+\d{2}\.pdf$'
-        
-        for pdf in pdf_files:
-            if re.match(signal_id_pattern, pdf.name, re.IGNORECASE):
-                return pdf
-        
-        # Προτεραιότητα 2: Αρχεία που ταιριάζουν με το όνομα του φακέλου
-        # (π.χ. φάκελος "R 250417Z JUL 25" και αρχείο "R 250417Z JUL 25.pdf")
-        folder_name = pdf_files[0].parent.name
-        for pdf in pdf_files:
-            if pdf.stem == folder_name:  # stem είναι το όνομα χωρίς την επέκταση
-                return pdf
-        
-        # Προτεραιότητα 3: Αρχεία με συγκεκριμένα ονόματα
-        priority_patterns = [
-            r'signal', r'σήμα', r'message', r'μήνυμα',
-            r'pyrseia', r'πυρσεία'
-        ]
-        
-        for pattern in priority_patterns:
-            for pdf in pdf_files:
-                if re.search(pattern, pdf.name, re.IGNORECASE):
-                    return pdf
-        
-        # Προτεραιότητα 4: Αποκλεισμός UUID αρχείων (πιθανά συνημμένα)
-        # UUID pattern: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx.pdf
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\.pdf$'
-        non_uuid_pdfs = [pdf for pdf in pdf_files if not re.match(uuid_pattern, pdf.name, re.IGNORECASE)]
-        
-        if non_uuid_pdfs:
-            # Από τα μη-UUID αρχεία, επιλέγουμε το μεγαλύτερο
-            return max(non_uuid_pdfs, key=lambda x: x.stat().st_size)
-                    
-        # Τελευταία επιλογή: το μεγαλύτερο αρχείο
-        return max(pdf_files, key=lambda x: x.stat().st_size)
     
     def copy_theme(self, event=None):
         """Copy theme to clipboard when clicked"""
@@ -372,12 +494,12 @@ class SignalTester:
             self.status_var.set("Δεν είναι δυνατή η αντιγραφή του θέματος")
             self.status_label.configure(foreground="red")
             self.root.after(3000, lambda: self.update_display())
-        
+    
     def update_display(self):
         """Ενημέρωση της οθόνης με τα δεδομένα του τρέχοντος σήματος"""
         if not self.signals:
             return
-            
+        
         signal = self.signals[self.current_signal_index]
         
         # Counter
@@ -393,7 +515,7 @@ class SignalTester:
         self.attachments_listbox.delete(0, tk.END)
         for attachment in signal['attachments']:
             self.attachments_listbox.insert(tk.END, attachment.name)
-            
+        
         # Status
         if signal['is_sent']:
             self.status_var.set("Έχει σταλεί")
@@ -401,7 +523,7 @@ class SignalTester:
         else:
             self.status_var.set("Μη επεξεργασμένο")
             self.status_label.configure(foreground="green")
-            
+    
     def update_buttons(self):
         """Ενημέρωση κατάστασης κουμπιών"""
         if not self.signals:
@@ -410,19 +532,19 @@ class SignalTester:
             self.send_button.configure(state='disabled')
             self.reset_button.configure(state='disabled')
             return
-            
+        
         # Previous button
         if self.current_signal_index > 0:
             self.prev_button.configure(state='normal')
         else:
             self.prev_button.configure(state='disabled')
-            
+        
         # Next button
         if self.current_signal_index < len(self.signals) - 1:
             self.next_button.configure(state='normal')
         else:
             self.next_button.configure(state='disabled')
-            
+        
         # Send button - always enabled when signals are available
         self.send_button.configure(state='normal')
         
@@ -432,29 +554,29 @@ class SignalTester:
             self.reset_button.configure(state='normal')
         else:
             self.reset_button.configure(state='disabled')
-            
+    
     def prev_signal(self):
         """Μετάβαση στο προηγούμενο σήμα"""
         if self.current_signal_index > 0:
             self.current_signal_index -= 1
             self.update_display()
             self.update_buttons()
-            
+    
     def next_signal(self):
         """Μετάβαση στο επόμενο σήμα"""
         if self.current_signal_index < len(self.signals) - 1:
             self.current_signal_index += 1
             self.update_display()
             self.update_buttons()
-            
+    
     def send_signal(self):
         """Αποστολή/επαναποστολή του τρέχοντος σήματος στο downloads"""
         if not self.signals:
             return
-            
+        
         signal = self.signals[self.current_signal_index]
         is_resend = signal['is_sent']
-            
+        
         try:
             downloads_path = Path(self.downloads_path)
             
@@ -471,7 +593,7 @@ class SignalTester:
             for attachment in signal['attachments']:
                 attachment_dest = downloads_path / attachment.name
                 shutil.copy2(attachment, attachment_dest)
-                
+            
             # Ενημέρωση του marker file
             sent_marker = signal['folder_path'] / "sent_to_downloads.txt"
             
@@ -492,7 +614,7 @@ class SignalTester:
                     f.write(f"Συνημμένα: {len(signal['attachments'])}\n")
                     for attachment in signal['attachments']:
                         f.write(f"  - {attachment.name}\n")
-                    
+            
             # Ενημέρωση της κατάστασης
             signal['is_sent'] = True
             self.update_display()
@@ -503,24 +625,24 @@ class SignalTester:
             color = "blue" if is_resend else "green"
             self.status_var.set(f"Σήμα {action}: PDF + {len(signal['attachments'])} συνημμένα")
             self.status_label.configure(foreground=color)
-                              
+        
         except Exception as e:
             action = "επαναποστολής" if is_resend else "αποστολής"
             self.status_var.set(f"Σφάλμα {action}: {str(e)}")
             self.status_label.configure(foreground="red")
-
+    
     def reset_signal_status(self):
         """Επαναφορά κατάστασης σήματος σε 'μη επεξεργασμένο'"""
         if not self.signals:
             return
-            
+        
         signal = self.signals[self.current_signal_index]
         
         if not signal['is_sent']:
             self.status_var.set("Το σήμα δεν έχει σταλεί")
             self.status_label.configure(foreground="orange")
             return
-            
+        
         try:
             # Διαγραφή του marker file
             sent_marker = signal['folder_path'] / "sent_to_downloads.txt"
@@ -535,18 +657,438 @@ class SignalTester:
             # Update status
             self.status_var.set("Κατάσταση επαναφέρθηκε σε 'μη επεξεργασμένο'")
             self.status_label.configure(foreground="purple")
-                              
+        
         except Exception as e:
             self.status_var.set(f"Σφάλμα επαναφοράς: {str(e)}")
             self.status_label.configure(foreground="red")
-
+    
     def on_closing(self):
         """Χειρισμός κλεισίματος παραθύρου"""
         self.save_config()
         self.root.destroy()
 
+class SignalReplay:
+    """Αναπαραγωγή ενός corpus σημάτων στο downloads με μετρήσεις καθυστέρησης
+    
+    Κάθε σήμα αντιγράφεται όπως από τον browser: πρώτα τα συνημμένα και μετά
+    το PDF με προσωρινό όνομα και rename σε pyrseia_server.pdf. Τα αποτελέσματα
+    διαβάζονται από το JSONL της headless λειτουργίας (main.py --headless), οπότε
+    replay και εφαρμογή τρέχουν στο ίδιο μηχάνημα (κοινό ρολόι).
+    
+    Μετρήσεις ανά σήμα (δευτερόλεπτα):
+      detection - από την εμφάνιση του PDF μέχρι να το πάρει η ουρά intake
+      parse     - ανάλυση PDF, συνημμένα και έλεγχος διπλοτύπων
+      copy      - αντιγραφή στους παραλήπτες (στάδιο fanout)
+      total     - από την εμφάνιση του PDF μέχρι την καταγραφή του αποτελέσματος
+    """
+    
+    SIGNAL_PDF = "pyrseia_server.pdf"
+    
+    # Προσωρινό όνομα κατά την αντιγραφή - ο file watcher περιμένει όσο υπάρχει
+    PARTIAL_SUFFIX = ".part"
+    
+    METRICS = ('detection', 'parse', 'copy', 'total')
+    PERCENTILES = (50, 90, 95, 99)
+    
+    POLL_INTERVAL = 0.05
+    
+    # Αναμονή για συνημμένα με το ίδιο όνομα που δεν πήρε ακόμη η ουρά
+    ATTACHMENT_WAIT = 30.0
+    
+    def __init__(self, signals, downloads_path, results_file, interval=0.0, burst=1,
+                 burst_pause=0.0, timeout=300.0, process=None):
+        self.signals = signals
+        self.downloads_path = Path(downloads_path)
+        self.results_file = Path(results_file)
+        self.interval = interval
+        self.burst = max(1, burst)
+        self.burst_pause = burst_pause
+        self.timeout = timeout
+        self.process = process
+        
+        self.sends = []
+        self.unmatched = []
+        self.aborted = None
+        self._results_offset = 0
+        self._partial_line = b""
+    
+    def schedule(self, index):
+        """Χρονική θέση της index-οστής αποστολής από την αρχή του replay
+        
+        Ανά interval δευτερόλεπτα, με επιπλέον burst_pause μετά από κάθε ριπή burst σημάτων.
+        """
+        return index * self.interval + (index // self.burst) * self.burst_pause
+    
+    def run(self):
+        """Αποστολή όλων των σημάτων και αναμονή για τα αποτελέσματά τους (επιστρέφει σύνοψη)"""
+        self.downloads_path.mkdir(parents=True, exist_ok=True)
+        self._results_offset = self.results_file.stat().st_size if self.results_file.exists() else 0
+        self._clear_downloads()
+        
+        started = time.time()
+        for index, signal in enumerate(self.signals):
+            delay = started + self.schedule(index) - time.time()
+            if delay > 0:
+                self._sleep(delay)
+            
+            send = self._send(index, signal)
+            if send is None:
+                break
+            self.sends.append(send)
+            print(f"[{index + 1}/{len(self.signals)}] {signal['folder_name']}: "
+                  f"PDF + {send['attachments']} συνημμένα (αναμονή {send['backpressure']:.2f}s)")
+        
+        self._wait_for_results()
+        return self.summary(started)
+    
+    def _clear_downloads(self):
+        """Καθαρό downloads πριν την πρώτη αποστολή (όπως κάνει και το κουμπί Send)"""
+        for existing_file in self.downloads_path.glob("*"):
+            if existing_file.is_file():
+                existing_file.unlink()
+    
+    def _send(self, index, signal):
+        """Ένα σήμα στο downloads - None αν η εφαρμογή δεν πήρε το προηγούμενο PDF"""
+        signal_dest = self.downloads_path / self.SIGNAL_PDF
+        attachment_paths = [self.downloads_path / attachment.name for attachment in signal['attachments']]
+        
+        # Backpressure: ένα pyrseia_server.pdf τη φορά στο downloads
+        waiting_since = time.time()
+        if not self._wait_until_gone([signal_dest], self.timeout):
+            self.aborted = f"Το {self.SIGNAL_PDF} δεν μεταφέρθηκε στην ουρά για {self.timeout:.0f}s - τρέχει η εφαρμογή;"
+            print(f"Σφάλμα replay: {self.aborted}")
+            return None
+        if not self._wait_until_gone(attachment_paths, self.ATTACHMENT_WAIT):
+            print(f"Προσοχή: συνημμένα με το ίδιο όνομα παραμένουν στο downloads - αντικαθίστανται")
+        backpressure = time.time() - waiting_since
+        
+        for attachment, attachment_dest in zip(signal['attachments'], attachment_paths):
+            shutil.copy2(attachment, attachment_dest)
+        
+        partial = signal_dest.with_name(signal_dest.name + self.PARTIAL_SUFFIX)
+        shutil.copy2(signal['signal_pdf'], partial)
+        os.replace(partial, signal_dest)
+        
+        return {
+            'index': index,
+            'folder': str(signal['folder_path']),
+            'signal_pdf': signal['signal_pdf'].name,
+            'attachments': len(attachment_paths),
+            'sent_at': time.time(),
+            'backpressure': backpressure,
+            'record': None
+        }
+    
+    def _wait_until_gone(self, paths, timeout):
+        """Αναμονή μέχρι να μην υπάρχει κανένα από τα αρχεία (False αν έληξε ο χρόνος)"""
+        deadline = time.time() + timeout
+        while any(path.exists() for path in paths):
+            if time.time() >= deadline or not self._app_running():
+                return False
+            self._sleep(self.POLL_INTERVAL)
+        return True
+    
+    def _sleep(self, seconds):
+        """Αναμονή που συνεχίζει να διαβάζει αποτελέσματα"""
+        deadline = time.time() + seconds
+        while True:
+            self._poll_results()
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            time.sleep(min(self.POLL_INTERVAL, remaining))
+    
+    def _app_running(self):
+        return self.process is None or self.process.poll() is None
+    
+    def _wait_for_results(self):
+        """Αναμονή μέχρι κάθε αποστολή να έχει αποτέλεσμα (ή να λήξει το timeout)"""
+        deadline = time.time() + self.timeout
+        while any(send['record'] is None for send in self.sends):
+            if time.time() >= deadline or not self._app_running():
+                self._poll_results()
+                break
+            self._sleep(self.POLL_INTERVAL * 4)
+        
+        missing = sum(1 for send in self.sends if send['record'] is None)
+        if missing:
+            print(f"Προσοχή: {missing} σήματα χωρίς αποτέλεσμα στο {self.results_file}")
+    
+    def _poll_results(self):
+        """Νέες γραμμές του αρχείου αποτελεσμάτων από το σημείο που σταμάτησε η προηγούμενη ανάγνωση"""
+        try:
+            with open(self.results_file, 'rb') as f:
+                f.seek(self._results_offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Σφάλμα ανάγνωσης αποτελεσμάτων: {e}")
+            return
+        
+        if not chunk:
+            return
+        self._results_offset += len(chunk)
+        
+        # Η τελευταία γραμμή μπορεί να γράφεται ακόμη
+        lines = (self._partial_line + chunk).split(b"\n")
+        self._partial_line = lines.pop()
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line.decode('utf-8'))
+            except ValueError:
+                continue
+            self._match(record)
+    
+    def _match(self, record):
+        """Αντιστοίχιση αποτελέσματος με αποστολή: η τελευταία αποστολή πριν το claimed_at
+        
+        Το επόμενο PDF στέλνεται μόνο αφού η ουρά πάρει το προηγούμενο, οπότε κάθε
+        claimed_at πέφτει ανάμεσα στην αποστολή του και την επόμενη.
+        """
+        claimed_at = record.get('claimed_at')
+        if claimed_at is None or record.get('completed_at') is None:
+            self.unmatched.append(record)
+            return
+        
+        for send in reversed(self.sends):
+            if send['sent_at'] <= claimed_at:
+                if send['record'] is None:
+                    send['record'] = record
+                    return
+                break
+        self.unmatched.append(record)
+    
+    @staticmethod
+    def metrics(send):
+        """Καθυστερήσεις μιας αποστολής (δευτερόλεπτα) από το αποτέλεσμά της"""
+        record = send['record']
+        values = {
+            'detection': record['claimed_at'] - send['sent_at'],
+            'total': record['completed_at'] - send['sent_at']
+        }
+        if record.get('parsed_at'):
+            values['parse'] = record['parsed_at'] - record['claimed_at']
+        fanout = (record.get('stage_seconds') or {}).get('fanout')
+        if fanout is not None:
+            values['copy'] = fanout
+        return values
+    
+    @classmethod
+    def percentiles(cls, values):
+        if not values:
+            return {'count': 0}
+        ordered = sorted(values)
+        result = {'count': len(ordered)}
+        for percentile in cls.PERCENTILES:
+            index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+            result[f'p{percentile}'] = round(ordered[index], 4)
+        result['max'] = round(ordered[-1], 4)
+        return result
+    
+    def summary(self, started):
+        """Σύνοψη: καταστάσεις, throughput και εκατοστημόρια ανά μέτρηση"""
+        samples = {metric: [] for metric in self.METRICS}
+        statuses = {}
+        completed = []
+        for send in self.sends:
+            record = send['record']
+            status = record['status'] if record else 'missing'
+            statuses[status] = statuses.get(status, 0) + 1
+            if record:
+                completed.append(record['completed_at'])
+                for metric, value in self.metrics(send).items():
+                    samples[metric].append(value)
+        
+        elapsed = (max(completed) if completed else time.time()) - started
+        return {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'signals': len(self.sends),
+            'statuses': statuses,
+            'unmatched_results': len(self.unmatched),
+            'aborted': self.aborted,
+            'settings': {'interval': self.interval, 'burst': self.burst, 'burst_pause': self.burst_pause},
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_per_minute': round(len(completed) / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            'backpressure': self.percentiles([send['backpressure'] for send in self.sends]),
+            'latency': {metric: self.percentiles(values) for metric, values in samples.items()},
+            'samples': [
+                {'folder': send['folder'], 'signal_pdf': send['signal_pdf'],
+                 'status': send['record']['status'] if send['record'] else 'missing',
+                 **{metric: round(value, 4) for metric, value in
+                    (self.metrics(send).items() if send['record'] else [])}}
+                for send in self.sends
+            ]
+        }
+    
+    @classmethod
+    def print_summary(cls, summary):
+        print(f"Replay: {summary['signals']} σήματα σε {summary['elapsed_seconds']:.1f}s "
+              f"({summary['throughput_per_minute']:.1f} σήματα/λεπτό) - {summary['statuses']}")
+        rows = [('backpressure', summary['backpressure'])] + list(summary['latency'].items())
+        for name, stats in rows:
+            if not stats['count']:
+                print(f"  {name:<12} -")
+                continue
+            values = "  ".join(f"p{percentile} {stats[f'p{percentile}'] * 1000:>7.0f}"
+                               for percentile in cls.PERCENTILES)
+            print(f"  {name:<12} n={stats['count']:<4} {values}  max {stats['max'] * 1000:>7.0f} ms")
+        if summary['unmatched_results']:
+            print(f"  αποτελέσματα χωρίς αποστολή του replay: {summary['unmatched_results']}")
+    
+    @staticmethod
+    def compare(summary, baseline, tolerance):
+        """Regressions σε σχέση με προηγούμενη αναφορά (throughput και p95 συνολικής καθυστέρησης)"""
+        regressions = []
+        base_rate = baseline.get('throughput_per_minute') or 0.0
+        if base_rate and summary['throughput_per_minute'] < base_rate * (1 - tolerance):
+            regressions.append(f"throughput {summary['throughput_per_minute']:.1f} < {base_rate:.1f} σήματα/λεπτό")
+        
+        for metric in ('total', 'detection'):
+            base_p95 = baseline.get('latency', {}).get(metric, {}).get('p95')
+            p95 = summary['latency'][metric].get('p95')
+            if base_p95 and p95 is not None and p95 > base_p95 * (1 + tolerance):
+                regressions.append(f"{metric} p95 {p95 * 1000:.0f} > {base_p95 * 1000:.0f} ms")
+        return regressions
+
+
+def spawn_headless_app(app_dir, results_file, ready_timeout=60.0):
+    """Εκκίνηση του main.py --headless με φάκελο εφαρμογής app_dir (έξοδος στο logs/replay_app.log)"""
+    logs_folder = app_dir / "logs"
+    logs_folder.mkdir(parents=True, exist_ok=True)
+    log_path = logs_folder / "replay_app.log"
+    log_file = open(log_path, 'w', encoding='utf-8')
+    
+    main_script = Path(__file__).resolve().parent / "main.py"
+    process = subprocess.Popen(
+        [sys.executable, str(main_script), '--headless', '--stats-interval', '0', '--results', str(results_file)],
+        cwd=str(app_dir), stdout=log_file, stderr=subprocess.STDOUT,
+        env=dict(os.environ, PYTHONIOENCODING='utf-8', PYTHONUNBUFFERED='1')
+    )
+    log_file.close()
+    
+    # Η headless εφαρμογή τυπώνει το αρχείο αποτελεσμάτων λίγο πριν ξεκινήσει ο file watcher
+    deadline = time.time() + ready_timeout
+    while time.time() < deadline and process.poll() is None:
+        try:
+            if "autoPyrseia headless" in log_path.read_text(encoding='utf-8', errors='replace'):
+                break
+        except OSError:
+            pass
+        time.sleep(0.2)
+    print(f"Headless εφαρμογή στο {app_dir} (pid {process.pid}, έξοδος στο {log_path})")
+    return process
+
+
+def run_replay(args):
+    """Replay χωρίς Tk (επιστρέφει exit code)"""
+    source = Path(args.replay)
+    if not source.is_dir():
+        print(f"Σφάλμα: ο φάκελος σημάτων {source} δεν υπάρχει")
+        return 2
+    
+    app_dir = Path(args.spawn).resolve() if args.spawn else None
+    if args.downloads:
+        downloads_path = Path(args.downloads)
+    elif app_dir:
+        downloads_path = app_dir / "downloads"
+    else:
+        print("Σφάλμα: δώστε --downloads ή --spawn")
+        return 2
+    
+    # Ο φάκελος downloads της εφαρμογής είναι <φάκελος εφαρμογής>/downloads
+    results_file = Path(args.results) if args.results else \
+        (app_dir or downloads_path.parent) / "logs" / "headless_results.jsonl"
+    
+    manifest_file = None if args.no_manifest else Path("signal_tester_manifest.json")
+    signals = SignalCorpusScanner(manifest_file=manifest_file).scan(source)
+    signals.sort(key=lambda signal: str(signal['folder_path']))
+    if args.shuffle:
+        random.Random(args.seed).shuffle(signals)
+    if args.limit:
+        signals = signals[:args.limit]
+    if not signals:
+        print(f"Δεν βρέθηκαν σήματα στο {source}")
+        return 2
+    
+    interval = 60.0 / args.rate if args.rate else args.interval
+    print(f"Replay {len(signals)} σημάτων από {source} στο {downloads_path} "
+          f"(interval {interval:.2f}s, burst {args.burst}, παύση {args.burst_pause:.1f}s)")
+    
+    process = spawn_headless_app(app_dir, results_file) if app_dir else None
+    try:
+        replay = SignalReplay(signals, downloads_path, results_file, interval=interval, burst=args.burst,
+                              burst_pause=args.burst_pause, timeout=args.timeout, process=process)
+        summary = replay.run()
+    finally:
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+    
+    SignalReplay.print_summary(summary)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"Αναφορά στο {args.report}")
+    
+    failed = bool(summary['aborted']) or summary['statuses'].get('missing', 0) > 0
+    if args.compare:
+        try:
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except Exception as e:
+            print(f"Σφάλμα ανάγνωσης αναφοράς σύγκρισης: {e}")
+            return 2
+        regressions = SignalReplay.compare(summary, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="autoPyrseia Signal Tester")
+    parser.add_argument('--replay', metavar='SOURCE',
+                        help="replay χωρίς GUI: όλα τα σήματα του φακέλου στο downloads με μετρήσεις καθυστέρησης")
+    parser.add_argument('--downloads', metavar='PATH', help="replay: ο φάκελος downloads που παρακολουθεί η εφαρμογή")
+    parser.add_argument('--results', metavar='PATH',
+                        help="replay: JSONL αποτελεσμάτων της headless εφαρμογής (προεπιλογή logs/headless_results.jsonl)")
+    parser.add_argument('--spawn', metavar='APP_DIR',
+                        help="replay: εκκίνηση του main.py --headless με φάκελο εφαρμογής APP_DIR")
+    parser.add_argument('--interval', type=float, default=0.0, metavar='SECONDS',
+                        help="replay: δευτερόλεπτα ανάμεσα στα σήματα (0: μόλις η ουρά πάρει το προηγούμενο)")
+    parser.add_argument('--rate', type=float, default=None, metavar='PER_MINUTE',
+                        help="replay: σήματα ανά λεπτό (αντί για --interval)")
+    parser.add_argument('--burst', type=int, default=1, metavar='N', help="replay: σήματα ανά ριπή")
+    parser.add_argument('--burst-pause', type=float, default=0.0, metavar='SECONDS',
+                        help="replay: παύση μετά από κάθε ριπή")
+    parser.add_argument('--limit', type=int, default=None, help="replay: μόνο τα πρώτα N σήματα")
+    parser.add_argument('--shuffle', action='store_true', help="replay: τυχαία σειρά (με --seed)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--no-manifest', action='store_true',
+                        help="replay: πλήρης σάρωση του SOURCE χωρίς το signal_tester_manifest.json")
+    parser.add_argument('--timeout', type=float, default=300.0, metavar='SECONDS',
+                        help="replay: μέγιστη αναμονή για την εφαρμογή (ανά σήμα και για τα τελικά αποτελέσματα)")
+    parser.add_argument('--report', metavar='PATH', help="replay: σύνοψη και μετρήσεις ανά σήμα σε JSON")
+    parser.add_argument('--compare', metavar='REPORT', help="replay: σύγκριση με προηγούμενη αναφορά (--report)")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="replay: ανεκτή χειροτέρευση throughput/p95 στη σύγκριση")
+    return parser.parse_args()
+
 def main():
     """Κύρια συνάρτηση"""
+    args = parse_arguments()
+    if args.replay:
+        sys.exit(run_replay(args))
+    
+    if tk is None:
+        print("Σφάλμα: το tkinter δεν είναι διαθέσιμο - χρησιμοποιήστε --replay")
+        sys.exit(2)
     root = tk.Tk()
     app = SignalTester(root)
     root.mainloop()